@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_API_MIDDLEWARE"""
+"""
+Test: API Validation Middleware
+
+Tests the OpenAPI request/response middleware (tools/api_middleware.py):
+- The route trie prefers literal segments and backtracks into parameters
+- Parameters are coerced from strings and checked against their schemas
+- Request bodies, media types, 404 and 405 are answered before the app runs
+- ASGI and WSGI apps see the buffered body; response violations are reported
+- Per-operation counters and validation latency stay within budget
+"""
+
+import asyncio
+import io
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    import yaml  # noqa: F401
+    from api_middleware import (
+        ApiValidator,
+        AsgiValidationMiddleware,
+        RequestValidationError,
+        RouteTrie,
+        WsgiValidationMiddleware,
+        benchmark,
+    )
+except ImportError:
+    pytest.skip("jsonschema or PyYAML not installed", allow_module_level=True)
+
+
+BASE_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = BASE_DIR / 'docs' / 'examples'
+FIELD = json.loads((EXAMPLES_DIR / 'field.example.json').read_text(encoding='utf-8'))
+FIELD_ID = FIELD['id']
+MISSION_ID = 'mission_60a7f1b8c9d4e5f6a7b8c9d0'
+
+
+@pytest.fixture(scope='module')
+def api():
+    return ApiValidator('platform_public.v1')
+
+
+def asgi_call(app, method, path, body=b'', query=b'', headers=()):
+    """Run one request through an ASGI app; returns (status, headers, body)"""
+    sent = []
+    incoming = [{'type': 'http.request', 'body': body, 'more_body': False}]
+
+    async def receive():
+        return incoming.pop(0) if incoming else {'type': 'http.disconnect'}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        'type': 'http', 'method': method, 'path': path, 'query_string': query,
+        'headers': [(name.encode(), value.encode()) for name, value in headers],
+    }
+    asyncio.run(app(scope, receive, send))
+    start = next(m for m in sent if m['type'] == 'http.response.start')
+    payload = b''.join(m.get('body', b'') for m in sent if m['type'] == 'http.response.body')
+    return start['status'], dict(start['headers']), payload
+
+
+def json_app(status, document, seen=None):
+    """ASGI app answering with a fixed JSON document and recording the request body"""
+    async def app(scope, receive, send):
+        message = await receive()
+        if seen is not None:
+            seen.append(message['body'])
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'application/json')]})
+        await send({'type': 'http.response.body', 'body': json.dumps(document).encode()})
+    return app
+
+
+class TestRouteTrie:
+    """Test suite for RouteTrie"""
+
+    def test_literal_beats_parameter_and_backtracks(self):
+        """Test /a/b wins over /a/{x}, and /a/b/c falls back to /a/{x}/c"""
+        trie = RouteTrie()
+        trie.insert('/a/{x}', 'GET', 'param')
+        trie.insert('/a/b', 'GET', 'literal')
+        trie.insert('/a/{y}/c', 'GET', 'nested')
+        assert trie.match('/a/b') == ({'GET': 'literal'}, {})
+        assert trie.match('/a/z') == ({'GET': 'param'}, {'x': 'z'})
+        assert trie.match('/a/b/c') == ({'GET': 'nested'}, {'y': 'b'})
+        assert trie.match('/a/b/d') is None
+        assert trie.match('/a//c') is None
+
+    def test_spec_paths(self, api):
+        """Test templated platform paths resolve with decoded parameters"""
+        methods, params = api.trie.match(f'/missions/{MISSION_ID}/accept')
+        assert list(methods) == ['POST'] and params == {'mission_id': MISSION_ID}
+        methods, params = api.trie.match('/fields/field%5Fx')
+        assert set(methods) == {'GET', 'PUT', 'DELETE'} and params == {'field_id': 'field_x'}
+
+
+class TestApiValidator:
+    """Test suite for ApiValidator"""
+
+    def test_valid_requests(self, api):
+        """Test valid requests with query coercion and a contract body pass"""
+        op = api.validate_request('GET', '/v1/fields', 'page=2&page_size=100&crop_type=COTTON')
+        assert op.key == 'GET /fields'
+        body = json.dumps(FIELD).encode()
+        op = api.validate_request('PUT', f'/v1/fields/{FIELD_ID}', '', {}, body, 'application/json')
+        assert op.key == 'PUT /fields/{field_id}'
+
+    @pytest.mark.parametrize('query,parameter', [
+        ('page=0', 'page'),
+        ('page=abc', 'page'),
+        ('page_size=101', 'page_size'),
+        ('crop_type=RICE', 'crop_type'),
+    ])
+    def test_invalid_query(self, api, query, parameter):
+        """Test out-of-range, non-numeric and non-enum query values are rejected"""
+        with pytest.raises(RequestValidationError) as exc:
+            api.validate_request('GET', '/v1/fields', query)
+        assert exc.value.status == 400 and exc.value.details['parameter'] == parameter
+
+    def test_invalid_path_parameter(self, api):
+        """Test path parameters are checked against their ID pattern"""
+        with pytest.raises(RequestValidationError) as exc:
+            api.validate_request('GET', '/v1/fields/field_x')
+        assert exc.value.details['in'] == 'path'
+
+    def test_body_checks(self, api):
+        """Test missing, malformed, mistyped and invalid bodies"""
+        path = f'/v1/fields/{FIELD_ID}'
+        cases = [
+            (b'', 'application/json', 400),
+            (b'{"id": ', 'application/json', 400),
+            (b'<field/>', 'application/xml', 415),
+            (json.dumps({**FIELD, 'id': 'field_x'}).encode(), 'application/json', 400),
+        ]
+        for body, content_type, status in cases:
+            with pytest.raises(RequestValidationError) as exc:
+                api.validate_request('PUT', path, '', {}, body, content_type)
+            assert exc.value.status == status
+
+    def test_not_found_and_method_not_allowed(self, api):
+        """Test unknown paths are 404 and unknown methods 405 with the allowed list"""
+        with pytest.raises(RequestValidationError) as exc:
+            api.match('GET', '/v1/nope')
+        assert exc.value.status == 404
+        with pytest.raises(RequestValidationError) as exc:
+            api.match('PATCH', f'/v1/fields/{FIELD_ID}')
+        assert exc.value.status == 405
+        assert exc.value.details['allowed'] == ['DELETE', 'GET', 'PUT']
+
+    def test_stats(self):
+        """Test per-operation counters record passes and failures"""
+        api = ApiValidator('platform_public.v1')
+        api.validate_request('GET', f'/v1/fields/{FIELD_ID}')
+        with pytest.raises(RequestValidationError):
+            api.validate_request('GET', '/v1/fields/bad')
+        stats = api.stats()['GET /fields/{field_id}']
+        assert stats['requests'] == 2 and stats['request_failures'] == 1
+        assert stats['validation']['count'] == 2
+        assert stats['validation']['p99_us'] > 0
+
+    def test_overhead_budget(self, api):
+        """Test request validation stays well under a millisecond at p99"""
+        result = benchmark(2000, api)
+        assert result['p99_us'] < 2000, result
+
+
+class TestAsgiMiddleware:
+    """Test suite for AsgiValidationMiddleware"""
+
+    def test_valid_request_reaches_app_with_body(self, api):
+        """Test the buffered body is replayed to the app and a valid response passes"""
+        seen = []
+        app = AsgiValidationMiddleware(json_app(200, FIELD, seen), api)
+        body = json.dumps(FIELD).encode()
+        status, _, payload = asgi_call(app, 'PUT', f'/v1/fields/{FIELD_ID}', body,
+                                       headers=[('Content-Type', 'application/json')])
+        assert status == 200 and seen == [body]
+
+        status, _, payload = asgi_call(app, 'GET', f'/v1/fields/{FIELD_ID}')
+        assert status == 200 and json.loads(payload) == FIELD
+
+    def test_invalid_request_gets_error_response(self, api):
+        """Test rejected requests never reach the app and get an ErrorResponse body"""
+        seen = []
+        app = AsgiValidationMiddleware(json_app(200, {}, seen), api)
+        status, headers, payload = asgi_call(app, 'GET', '/v1/fields', query=b'page=0',
+                                             headers=[('X-Request-ID', 'req_test')])
+        assert status == 400 and seen == []
+        assert headers[b'content-type'] == b'application/json'
+        error = json.loads(payload)['error']
+        assert error['code'] == 'VALIDATION_ERROR' and error['request_id'] == 'req_test'
+        responses = (BASE_DIR / 'api' / 'components' / 'responses.yaml').as_uri()
+        schema = api.loader.validator(f'{responses}#/components/schemas/ErrorResponse')
+        assert schema.is_valid(json.loads(payload))
+
+    def test_unknown_routes(self, api):
+        """Test unknown paths pass through by default and 404 when not allowed"""
+        app = json_app(200, {'ok': True})
+        assert asgi_call(AsgiValidationMiddleware(app, api), 'GET', '/health')[0] == 200
+        strict = AsgiValidationMiddleware(app, api, allow_unknown=False)
+        assert asgi_call(strict, 'GET', '/health')[0] == 404
+
+    def test_response_violations(self, api):
+        """Test response violations are reported, and replaced with 500 when strict"""
+        reported = []
+        app = AsgiValidationMiddleware(json_app(200, {'id': 'nope'}), api,
+                                       on_response_error=reported.append)
+        status, _, payload = asgi_call(app, 'GET', f'/v1/fields/{FIELD_ID}')
+        assert status == 200 and json.loads(payload) == {'id': 'nope'}
+        assert reported[0].operation == 'GET /fields/{field_id}' and reported[0].status == 200
+
+        strict = AsgiValidationMiddleware(json_app(200, {'id': 'nope'}), api,
+                                          strict_responses=True)
+        status, _, payload = asgi_call(strict, 'GET', f'/v1/fields/{FIELD_ID}')
+        assert status == 500
+        assert json.loads(payload)['error']['code'] == 'RESPONSE_VALIDATION_FAILED'
+
+
+class TestWsgiMiddleware:
+    """Test suite for WsgiValidationMiddleware"""
+
+    def call(self, app, method, path, body=b'', query=''):
+        started = []
+        environ = {
+            'REQUEST_METHOD': method, 'PATH_INFO': path, 'QUERY_STRING': query,
+            'CONTENT_LENGTH': str(len(body)), 'CONTENT_TYPE': 'application/json',
+            'wsgi.input': io.BytesIO(body),
+        }
+        result = app(environ, lambda status, headers, exc_info=None: started.append(status))
+        payload = b''.join(result)  # like a server: start_response may run while iterating
+        if hasattr(result, 'close'):
+            result.close()
+        assert len(started) == 1
+        return started[0], payload
+
+    def test_wsgi_round_trip(self, api):
+        """Test valid requests reach the app with the body and invalid ones are rejected"""
+        seen = []
+
+        def app(environ, start_response):
+            seen.append(environ['wsgi.input'].read())
+            start_response('200 OK', [('Content-Type', 'application/json')])
+            return [json.dumps(FIELD).encode()]
+
+        middleware = WsgiValidationMiddleware(app, api, strict_responses=True)
+        body = json.dumps(FIELD).encode()
+        status, payload = self.call(middleware, 'PUT', f'/v1/fields/{FIELD_ID}', body)
+        assert status == '200 OK' and seen == [body]
+
+        status, payload = self.call(middleware, 'POST', f'/v1/missions/{MISSION_ID}/nope')
+        assert status == '200 OK'  # unknown route passes through
+        status, payload = self.call(middleware, 'PUT', f'/v1/fields/{FIELD_ID}', b'{}')
+        assert status == '400 Bad Request'
+        assert json.loads(payload)['error']['details']['error']
+
+    def test_wsgi_strict_response(self, api):
+        """Test an invalid JSON response becomes a 500 in strict mode"""
+        def app(environ, start_response):
+            start_response('200 OK', [('Content-Type', 'application/json')])
+            return [b'{"id": "nope"}']
+
+        middleware = WsgiValidationMiddleware(app, api, strict_responses=True)
+        status, payload = self.call(middleware, 'GET', f'/v1/fields/{FIELD_ID}')
+        assert status == '500 Internal Server Error'
+
+    def test_wsgi_generator_app(self, api):
+        """Test apps that call start_response lazily are checked or passed through intact"""
+        closed = []
+
+        def generator_app(status, content_type, body):
+            def app(environ, start_response):
+                try:
+                    start_response(status, [('Content-Type', content_type)])
+                    yield body
+                finally:
+                    closed.append(status)
+            return app
+
+        path = f'/v1/fields/{FIELD_ID}'
+        cases = [
+            (('200 OK', 'application/json', b'bad'), '500 Internal Server Error'),
+            (('200 OK', 'application/json', json.dumps(FIELD).encode()), '200 OK'),
+            (("418 I'm a teapot", 'text/plain', b'teapot'), "418 I'm a teapot"),
+        ]
+        before = api.stats()['GET /fields/{field_id}']['responses']
+        for response, expected in cases:
+            middleware = WsgiValidationMiddleware(generator_app(*response), api,
+                                                  strict_responses=True)
+            status, payload = self.call(middleware, 'GET', path)
+            assert status == expected
+            if expected == response[0]:
+                assert payload == response[2]
+        assert api.stats()['GET /fields/{field_id}']['responses'] - before == 2
+        assert closed == [response[0] for response, _ in cases]
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
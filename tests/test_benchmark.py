@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_BENCHMARK"""
+"""
+Test: Contract Benchmarks
+
+Tests the benchmark suite (tools/benchmark.py):
+- Latency percentiles and throughput are computed from timed calls
+- Synthetic corpora are valid for every payload size
+- Baselines are stored per CONTRACTS_VERSION and merged, not replaced
+- Throughput drops beyond the threshold are reported as regressions
+- `pytest -m benchmark` compares the whole suite with the recorded baseline
+"""
+
+import sys
+import time
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from benchmark import (
+        DEFAULT_BASELINE,
+        PAYLOAD_SIZES,
+        BenchResult,
+        BenchmarkSettings,
+        compare,
+        contracts_version,
+        load_baselines,
+        load_settings,
+        measure,
+        run_benchmarks,
+        save_baseline,
+        schema_cases,
+        tool_cases,
+    )
+    from contract_registry import get_registry
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+def result(name, ops_per_sec):
+    return BenchResult(name, 10, ops_per_sec, 1.0, 2.0)
+
+
+class TestMeasurement:
+    """Test suite for measure and the benchmark cases"""
+
+    def test_measure(self):
+        """Test every input is used, every round runs min_runs and percentiles are ordered"""
+        seen = []
+        outcome = measure('case', seen.append, ['a', 'b', 'c'], min_time=0.0, min_runs=4,
+                          repeat=2)
+        assert seen == ['a', 'b', 'c', 'a'] * 2 and outcome.runs == 8
+        assert outcome.p50_us <= outcome.p99_us and outcome.ops_per_sec > 0
+
+    def test_measure_runs_for_min_time(self):
+        """Test timing continues until min_time has elapsed"""
+        started = time.perf_counter()
+        outcome = measure('case', lambda _: None, [None], min_time=0.05)
+        assert time.perf_counter() - started >= 0.05 and outcome.runs > 1
+
+    @pytest.mark.parametrize('size', list(PAYLOAD_SIZES))
+    def test_schema_corpora_are_valid(self, size):
+        """Test every benchmarked document is valid, so the timings measure the pass path"""
+        registry = get_registry()
+        schemas = ['core/field.v1.schema.json', 'worker/analysis_result.v1.schema.json']
+        settings = BenchmarkSettings(corpus=3)
+        cases = list(schema_cases(registry, schemas, [size], settings))
+        assert [name for name, _, _ in cases] == [
+            f'schemas/{schema}:{size}' for schema in schemas
+        ]
+        for _, is_valid, documents in cases:
+            assert len(documents) == 3 and all(is_valid(document) for document in documents)
+
+    def test_large_payloads_use_size_knob(self):
+        """Test large results carry the configured number of layers"""
+        registry = get_registry()
+        cases = schema_cases(registry, ['worker/analysis_result.v1.schema.json'], ['large'],
+                             BenchmarkSettings(corpus=1))
+        _, _, documents = next(cases)
+        assert len(documents[0]['layers']) == PAYLOAD_SIZES['large']['sizes']['layers']
+
+    def test_tool_cases_run(self):
+        """Test the tooling cases run against the repository"""
+        cases = dict(tool_cases())
+        assert set(cases) == {
+            'tools:checksum', 'tools:breaking_change', 'tools:validate', 'tools:validate_api',
+        }
+        assert len(cases['tools:checksum'](None)) == 64
+        assert cases['tools:breaking_change'](None)['total'] == 0
+
+
+class TestBaselines:
+    """Test suite for baseline storage and comparison"""
+
+    def test_save_merges_per_version(self, tmp_path: Path):
+        """Test saving keeps other versions and other cases"""
+        path = tmp_path / 'baselines.json'
+        save_baseline([result('a', 100.0), result('b', 50.0)], '1.0.0', path)
+        save_baseline([result('a', 120.0)], '1.0.0', path)
+        save_baseline([result('a', 10.0)], '2.0.0', path)
+        baselines = load_baselines(path)
+        assert baselines['1.0.0']['a']['ops_per_sec'] == 120.0
+        assert baselines['1.0.0']['b']['ops_per_sec'] == 50.0
+        assert baselines['2.0.0'] == {'a': {'ops_per_sec': 10.0, 'p50_us': 1.0, 'p99_us': 2.0}}
+
+    def test_missing_or_corrupt_baseline(self, tmp_path: Path):
+        """Test unreadable baseline files load as empty"""
+        assert load_baselines(tmp_path / 'nope.json') == {}
+        (tmp_path / 'bad.json').write_text('{', encoding='utf-8')
+        assert load_baselines(tmp_path / 'bad.json') == {}
+
+    def test_compare_threshold(self):
+        """Test only drops beyond the threshold regress; unknown cases are ignored"""
+        baseline = {name: {'ops_per_sec': 100.0} for name in ('fast', 'slow', 'edge')}
+        regressions = compare(
+            [result('fast', 130.0), result('slow', 70.0), result('edge', 75.0),
+             result('new', 1.0)],
+            baseline, threshold=0.25,
+        )
+        assert [(r.name, round(r.change, 2)) for r in regressions] == [('slow', -0.3)]
+
+    def test_settings_from_pyproject(self, tmp_path: Path):
+        """Test [tool.tarlaanaliz.benchmark] overrides the defaults"""
+        pyproject = tmp_path / 'pyproject.toml'
+        pyproject.write_text('[tool.tarlaanaliz.benchmark]\nthreshold = 0.1\ncorpus = 5\n',
+                             encoding='utf-8')
+        settings = load_settings(pyproject)
+        assert settings.threshold == 0.1 and settings.corpus == 5
+        assert settings.min_time == BenchmarkSettings().min_time
+        assert contracts_version() != 'unversioned'
+
+
+@pytest.mark.benchmark
+class TestBenchmarkBaseline:
+    """Test suite comparing the full benchmark run with the recorded baseline"""
+
+    def test_no_regressions(self):
+        """Test no schema or tool case regressed beyond the configured threshold"""
+        version = contracts_version()
+        baseline = load_baselines(DEFAULT_BASELINE).get(version)
+        if not baseline:
+            pytest.skip(f'No baseline for {version}; run tools/benchmark.py --update')
+        settings = load_settings()
+        regressions = compare(run_benchmarks(settings=settings), baseline, settings.threshold)
+        assert regressions == [], '\n'.join(
+            f'{r.name}: {r.baseline:,.0f}/s -> {r.current:,.0f}/s ({r.change:+.0%})'
+            for r in regressions
+        )
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_BUNDLE_SCHEMAS"""
+"""
+Test: Schema Bundler
+
+Tests self-contained schema bundles (tools/bundle_schemas.py):
+- Bundles contain no external $refs and validate like the source schemas
+- Output is byte-for-byte deterministic and the manifest hashes match
+- Cross-file cycles and nested $defs are rewritten to local pointers
+"""
+
+import hashlib
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import ContractRegistry, get_registry
+    from bundle_schemas import (
+        MANIFEST_NAME,
+        build_bundles,
+        bundle_schema,
+        bundle_validator,
+        stale_bundles,
+        write_bundles,
+    )
+    from generate_validators import load_example_corpus
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+CORPUS = load_example_corpus()
+
+
+def external_refs(node) -> list:
+    if isinstance(node, dict):
+        found = [node['$ref']] if isinstance(node.get('$ref'), str) and not node['$ref'].startswith('#') else []
+        return found + [ref for value in node.values() for ref in external_refs(value)]
+    if isinstance(node, list):
+        return [ref for item in node for ref in external_refs(item)]
+    return []
+
+
+class TestBundleSchemas:
+    """Test suite for bundle_schemas"""
+
+    @pytest.mark.parametrize('schema_path', sorted(CORPUS))
+    def test_bundle_validates_like_source(self, schema_path: str):
+        """Test bundles are self-contained and agree with the registry validator"""
+        registry = get_registry()
+        bundle = bundle_schema(schema_path)
+        assert external_refs(bundle) == []
+
+        validator = bundle_validator(bundle)
+        for instance in CORPUS[schema_path]:
+            broken = dict(instance, unexpected_field=1) if isinstance(instance, dict) else instance
+            for candidate in (instance, broken):
+                assert validator.is_valid(candidate) == registry.is_valid(schema_path, candidate)
+
+    def test_enum_refs_are_embedded(self):
+        """Test payment_intent v2 embeds the v2 payment_status enum"""
+        bundle = bundle_schema('platform/payment_intent.v2.schema.json')
+        assert 'REFUNDED' in bundle['$defs']['payment_status.v2']['enum']
+        assert '$id' not in bundle['$defs']['payment_status.v2']
+        assert bundle['$id'] == get_registry().schema('platform/payment_intent.v2.schema.json')['$id']
+
+    def test_deterministic_output_and_manifest(self, tmp_path: Path):
+        """Test repeated builds are identical and the manifest hashes each bundle"""
+        first = build_bundles()
+        assert first == build_bundles()
+
+        assert write_bundles(first, tmp_path) == len(first)
+        assert write_bundles(first, tmp_path) == 0
+        assert stale_bundles(first, tmp_path) == []
+
+        manifest = json.loads(first[MANIFEST_NAME])
+        for path, entry in manifest['bundles'].items():
+            assert hashlib.sha256((tmp_path / path).read_bytes()).hexdigest() == entry['sha256']
+
+        (tmp_path / 'core' / 'field.v1.schema.json').write_text('{}', encoding='utf-8')
+        assert stale_bundles(first, tmp_path) == ['core/field.v1.schema.json']
+
+    def test_cross_file_cycle(self, tmp_path: Path):
+        """Test mutually recursive documents bundle into local refs"""
+        (tmp_path / 'schemas').mkdir()
+        (tmp_path / 'enums').mkdir()
+        node = {
+            '$schema': 'https://json-schema.org/draft/2020-12/schema',
+            '$id': 'https://example.com/schemas/node.json',
+            'type': 'object',
+            'properties': {
+                'leaf': {'$ref': 'leaf.json#/$defs/Leaf'},
+                'children': {'type': 'array', 'items': {'$ref': '#'}},
+            },
+        }
+        leaf = {
+            '$schema': 'https://json-schema.org/draft/2020-12/schema',
+            '$id': 'https://example.com/schemas/leaf.json',
+            '$defs': {'Leaf': {'type': 'object', 'properties': {
+                'name': {'$ref': '#/$defs/Name'},
+                'back': {'$ref': 'node.json'},
+            }}, 'Name': {'type': 'string'}},
+        }
+        (tmp_path / 'schemas' / 'node.json').write_text(json.dumps(node), encoding='utf-8')
+        (tmp_path / 'schemas' / 'leaf.json').write_text(json.dumps(leaf), encoding='utf-8')
+
+        bundle = bundle_schema('schemas/node.json', ContractRegistry(tmp_path))
+        assert bundle['properties']['leaf'] == {'$ref': '#/$defs/leaf/$defs/Leaf'}
+        leaf_props = bundle['$defs']['leaf']['$defs']['Leaf']['properties']
+        assert leaf_props == {'name': {'$ref': '#/$defs/leaf/$defs/Name'}, 'back': {'$ref': '#'}}
+
+        validator = bundle_validator(bundle)
+        assert validator.is_valid({'leaf': {'name': 'a', 'back': {'children': [{}]}}})
+        assert not validator.is_valid({'leaf': {'name': 1}})
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
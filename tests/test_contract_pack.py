@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_CONTRACT_PACK"""
+"""
+Test: Contract Pack
+
+Tests the precompiled binary contract pack (tools/contract_pack.py):
+- A pack round-trips the registry, enum index and event routes
+- Packed registries validate exactly like a cold-parsed registry
+- Stale, corrupt or missing packs fall back to a cold parse and are rebuilt
+- Editing a contract file without re-pinning makes the pack stale
+"""
+
+import pickle
+import shutil
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    import contract_registry
+    import enum_index
+    from compute_contracts_sha256 import compute_checksum
+    from contract_registry import BASE_DIR, get_registry
+    from contract_pack import (
+        HEADER_SIZE,
+        MAGIC,
+        build_pack,
+        dump_pack,
+        load_contracts,
+        pack_checksum,
+        read_pack,
+        write_pack,
+    )
+    from generate_validators import load_example_corpus
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+CORPUS = load_example_corpus()
+
+# Everything compute_checksum hashes, plus the version file
+MATERIAL = ('schemas', 'enums', 'api', 'ssot', 'docs', 'CONTRACTS_VERSION.md')
+
+
+def copy_contracts(target: Path, names=MATERIAL) -> None:
+    for name in names:
+        source = BASE_DIR / name
+        if source.is_dir():
+            shutil.copytree(source, target / name)
+        else:
+            shutil.copy(source, target / name)
+
+
+@pytest.fixture(scope='module')
+def pack():
+    return build_pack()
+
+
+class TestContractPack:
+    """Test suite for contract_pack"""
+
+    def test_header_is_keyed_by_computed_checksum(self, pack):
+        """Test the pack starts with the magic and the checksum of the files on disk"""
+        data = dump_pack(pack)
+        assert data.startswith(MAGIC)
+        assert data[len(MAGIC):HEADER_SIZE].decode('ascii') == pack_checksum()
+        assert pack_checksum() == compute_checksum(BASE_DIR)
+
+    def test_round_trip(self, pack, tmp_path: Path):
+        """Test documents, aliases, enums and routes survive the pack"""
+        path = tmp_path / 'contracts.pack'
+        write_pack(pack, path)
+        loaded = read_pack(path)
+        assert loaded is not None
+        assert loaded.registry.paths == pack.registry.paths
+        assert loaded.registry.schema_ids == pack.registry.schema_ids
+        assert set(loaded.registry.ref_registry) == set(pack.registry.ref_registry)
+        assert loaded.event_routes == pack.event_routes
+
+        enums = loaded.enums
+        assert enums.names == pack.enums.names
+        assert enums.threat_severity['HASH_MISMATCH'] == 'HIGH'
+        assert enums.has_permission('PILOT', 'flight:upload')
+        assert enums.can_transition('ASSIGNED', 'ACCEPTED')
+        with pytest.raises(TypeError):
+            enums.metadata('threat_type')['severityLevels'] = {}
+
+    @pytest.mark.parametrize('schema_path', sorted(CORPUS))
+    def test_packed_registry_validates_like_cold_parse(self, pack, schema_path: str):
+        """Test the unpickled registry gives the same verdicts, refs included"""
+        registry = pickle.loads(pickle.dumps(pack.registry))
+        for instance in CORPUS[schema_path]:
+            broken = dict(instance, unexpected_field=1) if isinstance(instance, dict) else instance
+            for candidate in (instance, broken):
+                assert registry.is_valid(schema_path, candidate) == \
+                    get_registry().is_valid(schema_path, candidate)
+
+    def test_fragment_validators_resolve(self, pack):
+        """Test `schema#/$defs/Name` lookups work without a crawl on load"""
+        registry = pickle.loads(pickle.dumps(pack.registry))
+        validator = registry.validator('schemas/edge/intake_manifest.v1.schema.json#/$defs/FileEntry')
+        assert not validator.is_valid({'path': 'a.tif'})
+
+    @pytest.mark.parametrize('damage', ['checksum', 'truncated', 'missing'])
+    def test_stale_pack_is_rebuilt(self, pack, tmp_path: Path, damage: str):
+        """Test unusable packs fall back to a cold parse and are rewritten"""
+        path = tmp_path / 'contracts.pack'
+        if damage == 'checksum':
+            write_pack(pack._replace(checksum='0' * 64), path)
+        elif damage == 'truncated':
+            path.write_bytes(dump_pack(pack)[:HEADER_SIZE + 100])
+        assert read_pack(path) is None
+
+        loaded = load_contracts(path, install_globals=False)
+        assert loaded.checksum == pack_checksum()
+        assert len(loaded.registry) == len(pack.registry)
+        assert read_pack(path) is not None
+
+    def test_unpinned_schema_edit_is_stale(self, tmp_path: Path):
+        """Test a schema edited without re-pinning CONTRACTS_VERSION.md invalidates the pack"""
+        copy_contracts(tmp_path, ('schemas', 'enums', 'CONTRACTS_VERSION.md'))
+        path = tmp_path / 'contracts.pack'
+        write_pack(build_pack(tmp_path), path)
+        assert read_pack(path, base_dir=tmp_path) is not None
+
+        field = tmp_path / 'schemas' / 'core' / 'field.v1.schema.json'
+        field.write_text(field.read_text(encoding='utf-8').replace(
+            '"type": "object"', '"type": "object", "minProperties": 1', 1), encoding='utf-8')
+        assert read_pack(path, base_dir=tmp_path) is None
+        loaded = load_contracts(path, base_dir=tmp_path, install_globals=False)
+        assert loaded.registry.schema('core/field.v1.schema.json')['minProperties'] == 1
+        assert read_pack(path, base_dir=tmp_path) is not None
+
+    def test_other_base_dir_is_stale(self, pack, tmp_path: Path):
+        """Test a pack built for another checkout is not reused"""
+        copy_contracts(tmp_path)
+        assert pack_checksum(tmp_path) == pack.checksum
+        path = tmp_path / 'contracts.pack'
+        write_pack(pack, path)
+        assert read_pack(path, base_dir=tmp_path) is None
+
+    def test_install_replaces_singletons(self, pack, tmp_path: Path):
+        """Test load_contracts installs the process-wide registry and enum index"""
+        path = tmp_path / 'contracts.pack'
+        write_pack(pack, path)
+        previous = contract_registry._registry, enum_index._index
+        try:
+            loaded = load_contracts(path)
+            assert contract_registry.get_registry() is loaded.registry
+            assert enum_index.get_enum_index() is loaded.enums
+        finally:
+            contract_registry._registry, enum_index._index = previous
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
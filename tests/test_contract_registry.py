@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_CONTRACT_REGISTRY"""
+"""
+Test: Contract Registry
+
+Tests the process-wide validator registry:
+- Every schema/enum is indexed by $id and relative path
+- Validators are compiled once and shared
+- Cross-file refs into enums/ resolve from the local store
+"""
+
+import json
+import sys
+import threading
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import ContractRegistry, get_registry
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+BASE_DIR = Path(__file__).parent.parent
+EXAMPLES_DIR = BASE_DIR / "docs" / "examples"
+
+EXAMPLE_SCHEMA_MAP = {
+    'field.example.json': 'core/field.v1.schema.json',
+    'mission.example.json': 'core/mission.v1.schema.json',
+    'intake_manifest.example.json': 'edge/intake_manifest.v1.schema.json',
+    'analysis_job.example.json': 'worker/analysis_job.v1.schema.json',
+    'analysis_result.example.json': 'worker/analysis_result.v1.schema.json',
+    'payment_intent.example.json': 'platform/payment_intent.v2.schema.json',
+}
+
+
+class TestContractRegistry:
+    """Test suite for ContractRegistry"""
+
+    @pytest.fixture(scope="class")
+    def registry(self) -> ContractRegistry:
+        """Shared registry instance"""
+        return get_registry()
+
+    def test_loads_all_contract_files(self, registry: ContractRegistry):
+        """Test that every schema and enum file is loaded"""
+        expected = len(list((BASE_DIR / "schemas").rglob("*.json"))) + \
+            len(list((BASE_DIR / "enums").rglob("*.json")))
+        assert len(registry) == expected
+
+    def test_lookup_by_id_and_path(self, registry: ContractRegistry):
+        """Test that $id, repo path and schema-relative path resolve to the same document"""
+        by_id = registry.schema("https://api.tarlaanaliz.com/schemas/core/field.v1.schema.json")
+        by_repo_path = registry.schema("schemas/core/field.v1.schema.json")
+        by_short_path = registry.schema("core/field.v1.schema.json")
+        assert by_id is by_repo_path is by_short_path
+
+    def test_unknown_schema_raises(self, registry: ContractRegistry):
+        """Test that unknown keys raise KeyError"""
+        with pytest.raises(KeyError):
+            registry.validator("core/does_not_exist.v1.schema.json")
+
+    def test_validator_is_cached(self, registry: ContractRegistry):
+        """Test that the same validator instance is returned for every alias"""
+        v1 = registry.validator("worker/analysis_result.v1.schema.json")
+        v2 = registry.validator("https://api.tarlaanaliz.com/schemas/worker/analysis_result.v1.schema.json")
+        assert v1 is v2
+
+    def test_get_registry_is_singleton(self):
+        """Test that get_registry returns the same instance"""
+        assert get_registry() is get_registry()
+
+    def test_concurrent_validator_access(self):
+        """Test that concurrent first access builds a single validator"""
+        registry = ContractRegistry()
+        seen = []
+
+        def worker():
+            seen.append(registry.validator("edge/intake_manifest.v1.schema.json"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(v) for v in seen}) == 1
+
+    @pytest.mark.parametrize("example_name,schema_path", EXAMPLE_SCHEMA_MAP.items())
+    def test_examples_validate(self, registry: ContractRegistry, example_name: str, schema_path: str):
+        """Test that docs/examples validate through the registry"""
+        with open(EXAMPLES_DIR / example_name, 'r', encoding='utf-8') as f:
+            example = json.load(f)
+
+        errors = list(registry.iter_errors(schema_path, example))
+        assert not errors, [e.message for e in errors]
+
+    def test_cross_file_enum_ref_resolves(self, registry: ContractRegistry):
+        """Test that ../../enums refs are resolved and enforced"""
+        with open(EXAMPLES_DIR / "payment_intent.example.json", 'r', encoding='utf-8') as f:
+            example = json.load(f)
+
+        example["status"] = "NOT_A_STATUS"
+        assert not registry.is_valid("platform/payment_intent.v2.schema.json", example)
+
+    def test_compile_all(self):
+        """Test that every loaded document compiles into a validator"""
+        registry = ContractRegistry()
+        assert registry.compile_all() == len(registry)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
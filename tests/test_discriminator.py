@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_DISCRIMINATOR"""
+"""
+Test: Tagged Union Dispatch
+
+Tests discriminator detection and dispatch (tools/discriminator.py) and its
+use in the contract validators:
+- The GeoJSON unions are discriminated by `type`, including the nested Geometry union
+- Untagged, ambiguous and optional tags fall back to full evaluation
+- The per-union discriminator cache stays bounded
+- The registry validator and generated predicates accept exactly what the stock
+  Draft 2020-12 validator accepts, on valid and broken GeoJSON
+"""
+
+import copy
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from jsonschema import Draft202012Validator
+    from contract_registry import ContractValidator, branch_chain, get_registry
+    import discriminator
+    from discriminator import (
+        cached_discriminator,
+        dispatch,
+        feature_collection,
+        find_discriminator,
+    )
+    from generate_validators import compile_validator
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+GEOJSON = 'shared/geojson.v1.schema.json'
+
+
+def tagged(name, **extra):
+    schema = {
+        'type': 'object',
+        'properties': {'kind': {'const': name}, 'value': {'type': 'integer'}},
+        'required': ['kind'],
+    }
+    schema.update(extra)
+    return schema
+
+
+def no_refs(branch):
+    return [branch]
+
+
+def all_messages(errors):
+    """Messages of errors and everything in their context, depth first"""
+    messages = []
+    for error in errors:
+        messages.append(error.message)
+        messages += all_messages(error.context)
+    return messages
+
+
+def geojson_variants():
+    """Valid and broken GeoJSON documents of every top-level kind"""
+    collection = feature_collection(4)
+    feature = collection['features'][1]
+    point = {'type': 'Point', 'coordinates': [40.0, 37.0]}
+    variants = [collection, feature, point, feature['geometry'], {'type': 'Nope'}, {}, 'Point', 1]
+
+    extra = copy.deepcopy(collection)
+    extra['name'] = 'not allowed'
+    variants.append(extra)
+    extra_geometry = copy.deepcopy(feature)
+    extra_geometry['geometry']['crs'] = 'EPSG:4326'
+    variants.append(extra_geometry)
+    wrong_tag = copy.deepcopy(collection)
+    wrong_tag['features'][2]['geometry']['type'] = 'Point'
+    variants.append(wrong_tag)
+    missing = copy.deepcopy(point)
+    del missing['coordinates']
+    variants.append(missing)
+    variants.append({**point, 'type': 'FeatureCollection'})
+    variants.append({'type': 'GeometryCollection', 'geometries': [point, feature['geometry']]})
+    variants.append({'type': ['Point'], 'coordinates': [1, 2]})
+    return variants
+
+
+class TestFindDiscriminator:
+    """Test suite for find_discriminator and dispatch"""
+
+    def test_geojson_unions(self):
+        """Test both GeoJSON unions dispatch on type, nested tags included"""
+        registry = get_registry()
+        schema = registry.schema(GEOJSON)
+        validator = registry.validator(GEOJSON)
+
+        def resolve(branch):
+            return branch_chain(validator, branch)
+
+        geometry = find_discriminator(schema['$defs']['Geometry']['oneOf'], resolve)
+        assert geometry.property == 'type'
+        assert geometry.branches['Point'] == 0 and geometry.branches['GeometryCollection'] == 6
+
+        root = find_discriminator(schema['oneOf'], resolve)
+        assert root.branches['Feature'] == 0
+        assert root.branches['FeatureCollection'] == 1
+        assert root.branches['MultiPolygon'] == 2
+
+    def test_untagged_unions(self):
+        """Test unions without a shared, required, distinct const are not dispatched"""
+        assert find_discriminator([{'type': 'string'}, {'type': 'number'}], no_refs) is None
+        assert find_discriminator([tagged('a'), tagged('a')], no_refs) is None
+        optional = tagged('b', required=[])
+        assert find_discriminator([tagged('a'), optional], no_refs) is None
+        assert find_discriminator([tagged('a')], no_refs) is None
+
+    def test_dispatch(self):
+        """Test only tagged objects dispatch; anything else needs full evaluation"""
+        found = find_discriminator([tagged('a'), tagged('b')], no_refs)
+        assert dispatch(found, {'kind': 'b'}) == 1
+        assert dispatch(found, {'kind': 'c'}) is None
+        assert dispatch(found, {'kind': ['a']}) is None
+        assert dispatch(found, {}) is None
+        assert dispatch(found, 'a') is None
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test cached_discriminator memoizes per union without growing past CACHE_LIMIT"""
+        monkeypatch.setattr(discriminator, 'CACHE_LIMIT', 4)
+        monkeypatch.setattr(discriminator, '_cache', {})
+        unions = [[tagged('a'), tagged(f'b{i}')] for i in range(10)]
+        for i, branches in enumerate(unions):
+            assert cached_discriminator(branches, no_refs).branches[f'b{i}'] == 1
+            assert len(discriminator._cache) <= 4
+        last = discriminator._cache[id(unions[-1])][1]
+        assert cached_discriminator(unions[-1], no_refs) is last
+
+
+class TestValidatorDispatch:
+    """Test suite for dispatch in the registry and generated validators"""
+
+    @pytest.fixture(scope='class')
+    def validators(self):
+        registry = get_registry()
+        stock = Draft202012Validator(
+            registry.schema(GEOJSON), registry=registry.ref_registry,
+            format_checker=registry.format_checker,
+        )
+        return stock, registry.validator(GEOJSON), compile_validator(GEOJSON, registry)
+
+    def test_geojson_parity(self, validators):
+        """Test registry and generated validators agree with the stock validator"""
+        stock, contract, generated = validators
+        for instance in geojson_variants():
+            expected = stock.is_valid(instance)
+            assert contract.is_valid(instance) == expected, instance
+            assert generated(instance) == expected, instance
+
+    def test_errors_name_the_tagged_branch(self, validators):
+        """Test a broken geometry reports the union error with the matching branch's details"""
+        _, contract, _ = validators
+        broken = feature_collection(3)
+        broken['features'][1]['geometry']['coordinates'] = 'nope'
+        errors = list(contract.iter_errors(broken))
+        assert len(errors) == 1
+        assert errors[0].message.endswith('is not valid under any of the given schemas')
+        context = errors[0].context
+        assert len(context) == 1 and list(context[0].schema_path)[0] == 1
+
+    def test_unevaluated_properties_still_enforced(self, validators):
+        """Test extra keys are rejected at the collection and geometry level"""
+        _, contract, _ = validators
+        for instance in geojson_variants()[8:10]:
+            messages = all_messages(contract.iter_errors(instance))
+            assert any('Unevaluated properties are not allowed' in m for m in messages)
+
+    def test_any_of_dispatch(self):
+        """Test anyOf over tagged branches validates through the matching branch"""
+        branches = [tagged('a'), tagged('b', required=['kind', 'value'])]
+        validator = ContractValidator({'anyOf': branches})
+        assert validator.is_valid({'kind': 'a'})
+        assert not validator.is_valid({'kind': 'b'})
+        assert validator.is_valid({'kind': 'b', 'value': 1})
+        assert not validator.is_valid({'kind': 'c'})
+        assert not validator.is_valid('not an object')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_ENUM_INDEX"""
+"""
+Test: Enum Index
+
+Tests the precomputed enum lookups (tools/enum_index.py):
+- Every enum file is indexed with frozenset membership
+- payment_status v1 and v2 are both addressable
+- Reverse maps match the enum metadata
+- The index is read-only
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from enum_index import get_enum_index
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+ENUMS_DIR = Path(__file__).parent.parent / 'enums'
+
+
+def load_enum(name: str) -> dict:
+    with open(ENUMS_DIR / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class TestEnumIndex:
+    """Test suite for enum_index"""
+
+    def test_every_enum_file_is_indexed(self):
+        """Test that membership sets match the `enum` list of each file"""
+        index = get_enum_index()
+        total = sum(len(index.versions(name)) for name in index.names)
+        assert total == len(list(ENUMS_DIR.glob('*.json')))
+        assert index.values('crop_type') == frozenset(load_enum('crop_type.enum.v1.json')['enum'])
+
+    def test_payment_status_versions(self):
+        """Test versioned access (v2 adds REFUNDED)"""
+        index = get_enum_index()
+        assert index.versions('payment_status') == (1, 2)
+        assert not index.is_member('payment_status', 'REFUNDED', version=1)
+        assert index.is_member('payment_status', 'REFUNDED')
+        assert index.entry('https://tarlaanaliz.com/enums/payment_status.v1.json').version == 1
+        with pytest.raises(KeyError):
+            index.entry('payment_status', version=3)
+
+    def test_threat_severity(self):
+        """Test threat -> severity reverse map covers every threat type"""
+        index = get_enum_index()
+        assert index.threat_severity['HASH_MISMATCH'] == 'HIGH'
+        assert index.threat_severity['SIZE_ANOMALY'] == 'MEDIUM'
+        assert set(index.threat_severity) == index.values('threat_type')
+
+    def test_role_permissions_and_ranks(self):
+        """Test role -> permission set and hierarchy ranks"""
+        index = get_enum_index()
+        assert index.has_permission('PILOT', 'flight:upload')
+        assert not index.has_permission('FARMER', 'mission:assign')
+        assert index.role_ranks['SYSTEM_ADMIN'] > index.role_ranks['FARMER']
+        assert 'fields:create' in index.permissions('role')['FARMER']
+        assert index.entry('role').ranks['PLATFORM_ADMIN'] > index.entry('role').ranks['VIEWER']
+
+    def test_status_transitions_are_declared(self):
+        """Test mission transitions are the `allowedTransitions` table of every status"""
+        index = get_enum_index()
+        descriptions = load_enum('mission_status.enum.v1.json')['metadata']['statusDescriptions']
+        assert index.status_transitions == {
+            status: frozenset(details['allowedTransitions'])
+            for status, details in descriptions.items()
+        }
+        assert index.can_transition('DRAFT', 'CANCELLED')
+        assert index.can_transition('ACCEPTED', 'REJECTED')
+        assert index.can_transition('COMPLETED', 'FAILED')
+        assert index.can_transition('FAILED', 'PLANNED')
+        assert not index.can_transition('DRAFT', 'COMPLETED')
+        assert index.status_transitions['DELIVERED'] == frozenset()
+
+    def test_status_transitions_fall_back_to_flows(self):
+        """Test enums without `allowedTransitions` use consecutive pairs of their flows"""
+        index = get_enum_index()
+        flow = load_enum('quarantine_decision.enum.v1.json')['metadata']['decisionFlow']
+        for current, target in zip(flow['threatDetectedFlow'], flow['threatDetectedFlow'][1:]):
+            assert index.can_transition(current, target, name='quarantine_decision')
+        assert not index.can_transition('QUARANTINED', 'PENDING_SCAN', name='quarantine_decision')
+
+    def test_index_is_read_only(self):
+        """Test that shared lookups cannot be mutated by callers"""
+        index = get_enum_index()
+        with pytest.raises(TypeError):
+            index.threat_severity['MALWARE'] = 'LOW'
+        with pytest.raises(TypeError):
+            index.metadata('mission_status')['statusFlow'] = {}
+        assert isinstance(index.metadata('crop_type')['displayNames'], type(index.threat_severity))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
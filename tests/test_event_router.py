@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_EVENT_ROUTER"""
+"""
+Test: Event Router
+
+Tests the event-type router for schemas/events/ (tools/event_router.py):
+- Envelope fields identical across event schemas are checked once, up front
+- Routes cover the remaining envelope fields and `data` per event type
+- Single and batch validation agree with the full registry validators
+- Batches keep input order; unroutable and malformed events get messages
+- --batch-size below 1 is rejected instead of validating nothing
+- Event schemas the envelope split cannot reproduce use whole-document checks
+"""
+
+import copy
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import ContractRegistry, get_registry
+    from event_router import ENVELOPE, EventRouter, get_event_router, main
+    from generate_fixtures import FixtureGenerator
+    from validate_data import UNROUTABLE, build_event_routes
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+@pytest.fixture(scope='module')
+def router():
+    return get_event_router()
+
+
+@pytest.fixture(scope='module')
+def events():
+    registry = get_registry()
+    generator = FixtureGenerator(registry, seed=8, optional=0.5)
+    schemas = sorted(build_event_routes(registry).values())
+    return [generator.generate(schemas[i % len(schemas)], i) for i in range(60)]
+
+
+def broken(events):
+    variants = []
+    for event in events[:12]:
+        for key in ('event_id', 'aggregate_id', 'occurred_at', 'data'):
+            variants.append({k: v for k, v in event.items() if k != key})
+            variants.append(dict(event, **{key: 'wrong'}))
+        variants.append(dict(event, unexpected=1))
+        variants.append(dict(event, aggregate_type='elsewhere'))
+        nested = copy.deepcopy(event)
+        nested['data'].pop(next(iter(nested['data'])))
+        variants.append(nested)
+    return variants
+
+
+class TestEnvelope:
+    """Test suite for the shared envelope derivation"""
+
+    def test_shared_fields(self, router):
+        """Test identical fields are shared and per-type fields keep only a type check"""
+        assert {'event_id', 'event_version', 'occurred_at'} <= set(router.shared)
+        assert {'aggregate_type', 'aggregate_id', 'actor', 'data'}.isdisjoint(router.shared)
+        assert router.field_types['data'] == 'object'
+        assert router.required >= {'event_id', 'event_type', 'data'}
+        assert router.fallbacks == []
+
+    def test_route_table(self, router):
+        """Test every events/ schema has a route checking its own data and aggregate"""
+        routes = build_event_routes(get_registry())
+        assert {key: route.schema for key, route in router.routes.items()} == routes
+        for route in router.routes.values():
+            fields = [field for field, _ in route.checks]
+            assert 'data' in fields and 'aggregate_id' in fields and 'event_id' not in fields
+
+
+class TestValidation:
+    """Test suite for single and batch validation"""
+
+    def test_agrees_with_registry(self, router, events):
+        """Test valid and broken events get the registry's verdict and messages"""
+        registry = get_registry()
+        for event in events + broken(events):
+            schema, errors = router.check(event)
+            expected = [f'{e.json_path}: {e.message}'
+                        for e in registry.iter_errors(schema, event)][:len(errors)]
+            assert (not errors) == registry.is_valid(schema, event)
+            assert errors == expected
+
+    def test_batch_matches_check(self, router, events):
+        """Test validate_batch groups by type but returns check() results in input order"""
+        mixed = broken(events) + events
+        mixed.insert(5, {'event_type': 'unknown.event', 'event_version': '1.0'})
+        assert router.validate_batch(mixed) == [router.check(event) for event in mixed]
+        assert all(not errors for _, errors in router.validate_batch(events))
+
+    def test_unroutable_and_malformed(self, router, events):
+        """Test unknown types, non-objects and extra keys are reported against the envelope"""
+        unknown = dict(events[0], event_type='harvest.planned')
+        assert router.check(unknown) == (UNROUTABLE, [
+            'No schema matches event_type/event_version'
+        ])
+        schema, errors = router.check(['not', 'an', 'event'])
+        assert schema == ENVELOPE and "is not of type 'object'" in errors[0]
+        schema, errors = router.check(dict(unknown, event_id='nope', surprise=True))
+        assert schema == ENVELOPE
+        assert any('event_id' in error for error in errors)
+        assert any("'surprise' was unexpected" in error for error in errors)
+
+    def test_non_string_routing_keys(self, router, events):
+        """Test unhashable event_type/event_version values are unroutable, not a crash"""
+        odd = [dict(events[0], event_type=['x']), dict(events[1], event_version={'v': 1}),
+               dict(events[2], event_type=None)]
+        results = router.validate_batch(odd + events[:3])
+        assert results == [router.check(event) for event in odd + events[:3]]
+        for schema, errors in results[:3]:
+            assert schema in (UNROUTABLE, ENVELOPE) and errors
+        assert all(not errors for _, errors in results[3:])
+
+    @pytest.mark.parametrize('size', ['0', '-5'])
+    def test_batch_size_must_be_positive(self, monkeypatch, size: str):
+        """Test the CLI refuses batch sizes that would validate no events"""
+        monkeypatch.setattr(sys, 'argv', ['event_router.py', '-', '--batch-size', size])
+        with pytest.raises(SystemExit) as exc:
+            main()
+        assert exc.value.code == 2
+
+
+class TestFallback:
+    """Test suite for event schemas outside the envelope split"""
+
+    def test_whole_document_fallback(self, tmp_path: Path):
+        """Test a schema with allOf is validated whole and relaxes the shared key set"""
+        def event_schema(name, **extra):
+            return {
+                '$schema': 'https://json-schema.org/draft/2020-12/schema',
+                'type': 'object',
+                'required': ['event_id', 'event_type', 'event_version', 'data'],
+                'properties': {
+                    'event_id': {'type': 'string', 'pattern': '^event_[0-9]+$'},
+                    'event_type': {'type': 'string', 'const': name},
+                    'event_version': {'type': 'string', 'const': '1.0'},
+                    'data': {'type': 'object', 'required': ['x']},
+                },
+                'unevaluatedProperties': False,
+                **extra,
+            }
+
+        events_dir = tmp_path / 'schemas' / 'events'
+        events_dir.mkdir(parents=True)
+        (tmp_path / 'enums').mkdir()
+        (events_dir / 'plain.v1.schema.json').write_text(
+            json.dumps(event_schema('plain')), encoding='utf-8')
+        (events_dir / 'mixed.v1.schema.json').write_text(json.dumps(event_schema(
+            'mixed', allOf=[{'properties': {'trace': {'type': 'string'}}}],
+        )), encoding='utf-8')
+        router = EventRouter(ContractRegistry(tmp_path))
+        assert router.fallbacks == ['schemas/events/mixed.v1.schema.json']
+        assert router.allowed is None
+        assert set(router.shared) == {'event_id', 'event_version', 'data'}
+
+        base = {'event_id': 'event_1', 'event_version': '1.0', 'data': {'x': 1}}
+        assert router.check(dict(base, event_type='mixed', trace='t'))[1] == []
+        assert router.check(dict(base, event_type='plain', trace='t'))[1]
+        assert router.check(dict(base, event_type='mixed', data={}))[1]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_FORMAT_CHECKS"""
+"""
+Test: Format Checks
+
+Tests the RFC 3339 format checkers (tools/format_checks.py):
+- date-time accepts offsets, fractions of any length, lowercase t/z and 23:59:60 UTC,
+  on every supported Python (3.10's fromisoformat rejects `Z` on its own)
+- date-time/date reject impossible calendar values and non-RFC layouts
+- Column checks report failing indices
+- Registry validators reject bad Timestamps
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import get_registry
+    from format_checks import FORMAT_CHECKER, check_column, is_date, is_date_time
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+VALID_DATE_TIMES = [
+    "2026-01-26T10:00:00Z",
+    "2026-01-26T10:00:00.123456+03:00",
+    "2026-01-26t10:00:00z",
+    "2024-02-29T00:00:00-05:30",
+    "1998-12-31T23:59:60Z",
+    "1998-12-31T15:59:60.123-08:00",
+    # Layouts Python 3.10's fromisoformat does not read on its own
+    "2026-01-26T10:00:00.1Z",
+    "2026-01-26T10:00:00.12345z",
+    "2026-01-26T10:00:00.123456789+00:00",
+    "2026-01-26T10:00:00-23:59",
+]
+
+INVALID_DATE_TIMES = [
+    "2026-01-26T10:00:00",
+    "2026-01-26 10:00:00Z",
+    "2026-02-29T10:00:00Z",
+    "2026-04-31T10:00:00Z",
+    "2026-01-26T24:00:00Z",
+    "2026-01-26T10:60:00Z",
+    "2026-01-26T10:00:00+24:00",
+    "2026-01-26T10:00:00+05:60",
+    "2026-01-26T10:00:00.123456789",
+    "2026-01-26T10:00:00.Z",
+    "1998-12-31T23:58:60Z",
+    "٢٠٢٦-01-26T10:00:00Z",
+    "20260126T100000Z",
+    "",
+]
+
+
+class TestFormatChecks:
+    """Test suite for format_checks"""
+
+    @pytest.mark.parametrize("value", VALID_DATE_TIMES)
+    def test_valid_date_times(self, value: str):
+        """Test RFC 3339 date-times are accepted"""
+        assert is_date_time(value)
+
+    @pytest.mark.parametrize("value", INVALID_DATE_TIMES)
+    def test_invalid_date_times(self, value: str):
+        """Test malformed or impossible date-times are rejected"""
+        assert not is_date_time(value)
+
+    def test_dates(self):
+        """Test full-date checking"""
+        assert is_date("2024-02-29")
+        assert not is_date("2026-02-29")
+        assert not is_date("20260126")
+        assert not is_date("2026-W04-1")
+        assert is_date(20260126)
+
+    def test_check_column(self):
+        """Test that a column check returns failing indices and skips non-strings"""
+        column = VALID_DATE_TIMES + INVALID_DATE_TIMES + [None]
+        bad = check_column(column)
+        assert bad == list(range(len(VALID_DATE_TIMES), len(column) - 1))
+        assert check_column(["2026-01-26", "2026-13-01"], "date") == [1]
+        with pytest.raises(ValueError):
+            check_column([], "uri")
+
+    def test_format_checker_keeps_other_formats(self):
+        """Test that the shared checker still covers the stock Draft 2020-12 formats"""
+        assert FORMAT_CHECKER.conforms("2026-01-26T10:00:00Z", "date-time")
+        assert not FORMAT_CHECKER.conforms("not-a-uuid", "uuid")
+
+    def test_registry_rejects_bad_timestamp(self):
+        """Test that shared validators check Timestamp fields"""
+        registry = get_registry()
+        rel = "schemas/events/analysis_completed.v1.schema.json"
+        example = registry.schema(rel)["examples"][0]
+        assert registry.is_valid(rel, example)
+        assert not registry.is_valid(rel, dict(example, occurred_at="2026-02-30T10:00:00Z"))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
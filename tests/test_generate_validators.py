@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_GENERATE_VALIDATORS"""
+"""
+Test: Generated Validator Parity
+
+Tests that specialized validators emitted by tools/generate_validators.py
+agree with Draft202012Validator on the docs/examples corpus and on
+systematically broken variants of it (missing keys, unknown keys,
+wrong types, bad patterns/enums).
+"""
+
+import copy
+import sys
+import pytest
+from pathlib import Path
+from typing import Any, Iterator
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import get_registry
+    from generate_validators import (
+        HOT_SCHEMAS,
+        UnsupportedSchemaError,
+        compile_validator,
+        generate_source,
+        load_example_corpus,
+        parity_mismatches,
+    )
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+CORPUS = load_example_corpus()
+
+WRONG_VALUES = [None, True, 0, -1, 1.5, "", "x" * 600, "not_an_id", [], {}]
+
+
+def mutations(instance: Any, depth: int = 0) -> Iterator[Any]:
+    """Yield broken variants of an instance, recursing into nested objects"""
+    if not isinstance(instance, dict) or depth > 3:
+        return
+    for key in list(instance):
+        dropped = dict(instance)
+        del dropped[key]
+        yield dropped
+
+        for wrong in WRONG_VALUES:
+            changed = dict(instance)
+            changed[key] = wrong
+            yield changed
+
+        value = instance[key]
+        nested_items = value if isinstance(value, list) else [value]
+        for index, item in enumerate(nested_items[:2]):
+            for variant in mutations(item, depth + 1):
+                changed = copy.copy(instance)
+                if isinstance(value, list):
+                    changed[key] = value[:index] + [variant] + value[index + 1:]
+                else:
+                    changed[key] = variant
+                yield changed
+
+    extra = dict(instance)
+    extra["unexpected_field"] = "x"
+    yield extra
+
+
+def corpus_with_mutations(rel: str) -> list:
+    instances = list(CORPUS.get(rel, []))
+    for instance in list(instances):
+        instances.extend(mutations(instance))
+    return instances
+
+
+class TestGeneratedValidators:
+    """Test suite for generated validator parity"""
+
+    @pytest.mark.parametrize("schema_path", sorted(CORPUS))
+    def test_parity_on_examples_and_mutations(self, schema_path: str):
+        """Test generated predicate matches jsonschema on examples and broken variants"""
+        instances = corpus_with_mutations(schema_path)
+        mismatches = parity_mismatches(schema_path, instances)
+        assert not mismatches, [
+            (index, got, expected, instances[index]) for index, got, expected in mismatches[:3]
+        ]
+
+    @pytest.mark.parametrize("schema_path", HOT_SCHEMAS)
+    def test_hot_schemas_accept_examples(self, schema_path: str):
+        """Test hot contracts generate and accept their own examples"""
+        rel = get_registry().resolve(schema_path)
+        validator = compile_validator(rel)
+        assert CORPUS[rel], f"No examples for {rel}"
+        assert all(validator(instance) for instance in CORPUS[rel])
+
+    def test_generated_module_is_importable(self):
+        """Test that emitted module source compiles and exposes VALIDATORS by $id"""
+        source = generate_source(HOT_SCHEMAS)
+        namespace: dict = {}
+        exec(compile(source, "<generated>", "exec"), namespace)
+
+        registry = get_registry()
+        for key in HOT_SCHEMAS:
+            assert registry.schema(key)["$id"] in namespace["VALIDATORS"]
+
+    def test_fragment_predicates(self):
+        """Test `schema#/pointer` keys generate predicates for that subschema"""
+        schema_path = 'schemas/events/analysis_completed.v1.schema.json'
+        key = f'{schema_path}#/properties/data'
+        data = [instance['data'] for instance in CORPUS[schema_path]]
+        instances = data + [variant for instance in data for variant in mutations(instance)]
+        assert data and not parity_mismatches(key, instances)
+
+        namespace: dict = {}
+        exec(compile(generate_source([key]), "<generated>", "exec"), namespace)
+        schema_id = get_registry().schema(schema_path)["$id"]
+        assert list(namespace["VALIDATORS"]) == [f'{schema_id}#/properties/data']
+        with pytest.raises(KeyError):
+            compile_validator(f'{schema_path}#/properties/missing')
+
+    def test_unsupported_keyword_is_rejected(self, tmp_path: Path):
+        """Test that schemas using unsupported keywords raise instead of generating wrong code"""
+        from contract_registry import ContractRegistry
+
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "enums").mkdir()
+        (tmp_path / "schemas" / "tuple.json").write_text(
+            '{"$schema": "https://json-schema.org/draft/2020-12/schema",'
+            ' "type": "array", "prefixItems": [{"type": "string"}]}',
+            encoding="utf-8",
+        )
+        registry = ContractRegistry(tmp_path)
+
+        with pytest.raises(UnsupportedSchemaError):
+            compile_validator("tuple.json", registry)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_GEOMETRY_CHECKS"""
+"""
+Test: Geometry Checks
+
+Tests semantic GeoJSON validation (tools/geometry_checks.py) on both the
+NumPy and the pure-Python backend:
+- Valid field boundaries and examples pass
+- Unclosed rings, short rings and out-of-range coordinates are errors
+- bbox mismatches are errors, wrong winding order is a warning
+"""
+
+import copy
+import json
+import math
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from geometry_checks import (
+    BBOX_MISMATCH,
+    OUT_OF_BOUNDS,
+    RING_NOT_CLOSED,
+    TOO_FEW_VERTICES,
+    WINDING_ORDER,
+    GeometryChecker,
+    check_field,
+    check_mission,
+    np,
+)
+
+BACKENDS = [False] + ([True] if np is not None else [])
+
+SQUARE = [[40.0, 37.0], [40.1, 37.0], [40.1, 37.1], [40.0, 37.1], [40.0, 37.0]]
+
+
+def codes(issues: list) -> list:
+    return sorted(issue.code for issue in issues)
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda use_numpy: 'numpy' if use_numpy else 'python')
+def checker(request) -> GeometryChecker:
+    return GeometryChecker(use_numpy=request.param)
+
+
+class TestGeometryChecks:
+    """Test suite for geometry_checks"""
+
+    def test_example_field_boundary_is_valid(self):
+        """Test the field example passes"""
+        example = Path(__file__).parent.parent / 'docs' / 'examples' / 'field.example.json'
+        field = json.loads(example.read_text(encoding='utf-8'))
+        assert check_field(field) == []
+
+    def test_large_polygon(self, checker: GeometryChecker):
+        """Test a 20k-vertex counterclockwise ring with a hole"""
+        n = 20000
+        ring = [[40 + 0.01 * math.cos(2 * math.pi * i / n), 37 + 0.01 * math.sin(2 * math.pi * i / n)]
+                for i in range(n)]
+        ring.append(ring[0])
+        hole = [[40.0, 37.0], [40.0, 37.001], [40.001, 37.001], [40.001, 37.0], [40.0, 37.0]]
+        polygon = {'type': 'Polygon', 'coordinates': [ring, hole], 'bbox': [39.98, 36.98, 40.02, 37.02]}
+        assert checker.check(polygon) == []
+
+    def test_ring_errors(self, checker: GeometryChecker):
+        """Test closure, vertex count and bounds errors with pointers"""
+        polygon = {'type': 'Polygon', 'coordinates': [
+            [[40.0, 37.0], [40.1, 37.0], [40.1, 37.1], [200.0, 37.1]],
+            [[40.0, 37.0], [40.0, 37.0]],
+        ]}
+        issues = checker.check(polygon, '/boundary')
+        pointers = {(issue.code, issue.pointer) for issue in issues}
+        assert (RING_NOT_CLOSED, '/boundary/coordinates/0') in pointers
+        assert (OUT_OF_BOUNDS, '/boundary/coordinates/0/3') in pointers
+        assert (TOO_FEW_VERTICES, '/boundary/coordinates/1') in pointers
+
+    def test_bbox_and_winding(self, checker: GeometryChecker):
+        """Test bbox containment error and clockwise exterior warning"""
+        clockwise = list(reversed(SQUARE))
+        feature = {
+            'type': 'Feature',
+            'properties': None,
+            'geometry': {'type': 'Polygon', 'coordinates': [clockwise], 'bbox': [40.0, 37.0, 40.05, 37.1]},
+        }
+        issues = checker.check(feature)
+        assert codes(issues) == [BBOX_MISMATCH, WINDING_ORDER]
+        assert [i.severity for i in issues if i.code == WINDING_ORDER] == ['warning']
+        assert GeometryChecker(winding=False).check(feature['geometry'] | {'bbox': [40, 37, 41, 38]}) == []
+
+    def test_collections_and_mixed_dimensions(self, checker: GeometryChecker):
+        """Test FeatureCollection/MultiPolygon traversal and 2D/3D positions"""
+        collection = {'type': 'FeatureCollection', 'bbox': [39, 36, 41, 38], 'features': [
+            {'type': 'Feature', 'properties': {}, 'geometry': {'type': 'LineString',
+             'coordinates': [[40.0, 37.0, 120.0], [40.1, 37.1]]}},
+            {'type': 'Feature', 'properties': {}, 'geometry': {'type': 'MultiPolygon',
+             'coordinates': [[SQUARE], [copy.deepcopy(SQUARE[:-1])]]}},
+        ]}
+        issues = checker.check(collection)
+        assert [(i.code, i.pointer) for i in issues] == [
+            (RING_NOT_CLOSED, '/features/1/geometry/coordinates/1/0'),
+        ]
+
+    def test_mission_waypoints(self):
+        """Test flight plan waypoints are bounds-checked"""
+        mission = {'flight_plan': {'waypoints': [
+            {'sequence': 1, 'coordinates': [40.0, 37.0]},
+            {'sequence': 2, 'coordinates': [40.0, 95.0, 50]},
+        ]}}
+        issues = check_mission(mission)
+        assert [(i.code, i.pointer) for i in issues] == [
+            (OUT_OF_BOUNDS, '/flight_plan/waypoints/1/coordinates'),
+        ]
+        assert check_mission({'flight_plan': {}}) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
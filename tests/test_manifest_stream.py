@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_MANIFEST_STREAM"""
+"""
+Test: Streaming Manifest Validator
+
+Tests incremental intake manifest validation (tools/manifest_stream.py):
+- Results match whole-document validation for valid and broken manifests
+- Tiny chunk sizes (values split across reads) parse identically
+- A missing or non-array `files` gets the whole-document error
+- The per-file callback sees every FileEntry in order
+- Malformed JSON raises ManifestStreamError
+- With --root, unreadable card files are reported without aborting the stream
+"""
+
+import copy
+import io
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import get_registry
+    from manifest_stream import (
+        FILE,
+        INTAKE_MANIFEST,
+        MEMBER,
+        ManifestStreamError,
+        _ChunkReader,
+        iter_manifest,
+        main,
+        validate_manifest_stream,
+    )
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+EXAMPLE = Path(__file__).parent.parent / 'docs' / 'examples' / 'intake_manifest.example.json'
+
+
+@pytest.fixture
+def manifest() -> dict:
+    """The example manifest with 200 file entries"""
+    doc = json.loads(EXAMPLE.read_text(encoding='utf-8'))
+    template = doc['files'][0]
+    doc['files'] = [dict(template, path=f"DCIM/100MEDIA/DJI_{i:04d}.JPG", size_bytes=1000 + i)
+                    for i in range(200)]
+    return doc
+
+
+def stream(doc: dict, chunk_size: int = 65536, **kwargs):
+    return validate_manifest_stream(io.StringIO(json.dumps(doc, indent=2)), chunk_size=chunk_size, **kwargs)
+
+
+class TestManifestStream:
+    """Test suite for manifest_stream"""
+
+    @pytest.mark.parametrize('chunk_size', [7, 100, 65536])
+    def test_events_match_json_load(self, manifest: dict, chunk_size: int):
+        """Test that streamed members and files rebuild the original document"""
+        rebuilt = {'files': []}
+        for kind, key, value in iter_manifest(io.StringIO(json.dumps(manifest)), chunk_size):
+            if kind == FILE:
+                assert key == len(rebuilt['files'])
+                rebuilt['files'].append(value)
+            else:
+                assert kind == MEMBER
+                rebuilt[key] = value
+        assert rebuilt == manifest
+
+    def test_valid_manifest(self, manifest: dict):
+        """Test a valid manifest and the per-file callback"""
+        seen = []
+        report = stream(manifest, chunk_size=512, on_file=lambda i, entry, errors: seen.append((i, errors)))
+        assert report.valid, report.errors
+        assert report.files == 200
+        assert seen == [(i, []) for i in range(200)]
+
+    def test_errors_match_full_validation(self, manifest: dict):
+        """Test that streamed errors equal whole-document validation errors"""
+        broken = copy.deepcopy(manifest)
+        broken['files'][3]['sha256'] = 'nope'
+        del broken['files'][150]['mime_type']
+        broken['kiosk_id'] = 'kiosk_BAD'
+        broken['unexpected'] = True
+
+        report = stream(broken, chunk_size=300)
+        full = get_registry().validator(INTAKE_MANIFEST).iter_errors(broken)
+        assert sorted(report.errors) == sorted((e.json_path, e.message) for e in full)
+        assert report.invalid_files == 2
+
+    @pytest.mark.parametrize('files', [[], 5, None, 'missing'])
+    def test_files_errors_match_full_validation(self, manifest: dict, files):
+        """Test an empty, non-array or missing files member is reported like json.load would"""
+        if files == 'missing':
+            del manifest['files']
+        else:
+            manifest['files'] = files
+        full = get_registry().validator(INTAKE_MANIFEST).iter_errors(manifest)
+        expected = sorted((e.json_path, e.message) for e in full)
+        assert expected and sorted(stream(manifest).errors) == expected
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 7, 11, 64, 257, 1285])
+    def test_scalars_split_across_chunks(self, manifest: dict, chunk_size: int):
+        """Test floats, exponents and strings cut at any chunk edge decode whole"""
+        manifest['files'] = manifest['files'][:20]
+        manifest['total_size_bytes'] = 15000000.0
+        manifest['files'][0]['size_bytes'] = 1.5e3
+        manifest['files'][1]['path'] = 'DCIM/ÇİFTLİK/\u00e7 "quoted" \\ path.JPG'
+        text = json.dumps(manifest, indent=2)
+        rebuilt = {'files': []}
+        for kind, key, value in iter_manifest(io.StringIO(text), chunk_size):
+            if kind == FILE:
+                rebuilt['files'].append(value)
+            else:
+                rebuilt[key] = value
+        assert rebuilt == json.loads(text)
+        assert not any(path == '$.total_size_bytes'
+                       for path, _ in stream(manifest, chunk_size=chunk_size).errors)
+
+    def test_empty_files_and_malformed_json(self, manifest: dict):
+        """Test minItems on files and malformed input"""
+        manifest['files'] = []
+        assert ('$.files', '[] should be non-empty') in stream(manifest).errors
+
+        for text in ['{"files": [{"path": "a"} {"path": "b"}]}', '{"id": 1', '[1, 2]', '{"id": 1} x',
+                     '{"id": 1.5.5}', '{"id": tru}']:
+            with pytest.raises(ManifestStreamError):
+                validate_manifest_stream(io.StringIO(text), chunk_size=4)
+
+    def test_malformed_value_is_not_buffered_to_eof(self):
+        """Test a bad token stops the read early and an unterminated string hits the size cap"""
+        class Counting(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                Counting.reads += 1
+                return super().read(size)
+
+        text = '{"id": {"a": 1 x' + ' ' * 100_000 + '}}'
+        with pytest.raises(ManifestStreamError):
+            validate_manifest_stream(Counting(text), chunk_size=16)
+        assert Counting.reads < 10
+
+        reader = _ChunkReader(io.StringIO('"' + 'a' * 10_000), chunk_size=64, max_value_size=1000)
+        with pytest.raises(ManifestStreamError, match='longer than 1000'):
+            reader.value()
+
+    def test_root_mode_reports_unreadable_files(self, manifest: dict, tmp_path: Path,
+                                                monkeypatch, capsys):
+        """Test --root turns an unreadable card path into a finding and checks the rest"""
+        root = tmp_path / 'card'
+        (root / 'DCIM').mkdir(parents=True)
+        (root / 'DCIM' / '100MEDIA').write_bytes(b'not a directory')
+        manifest['files'] = manifest['files'][:3]
+        manifest['total_files'] = 3
+        manifest['total_size_bytes'] = sum(entry['size_bytes'] for entry in manifest['files'])
+        path = tmp_path / 'manifest.json'
+        path.write_text(json.dumps(manifest), encoding='utf-8')
+
+        monkeypatch.setattr(sys, 'argv', ['manifest_stream.py', str(path), '--root', str(root),
+                                          '--workers', '1', '--json'])
+        assert main() == 1
+        integrity = json.loads(capsys.readouterr().out)['integrity']
+        assert sorted(finding['file_path'] for finding in integrity) == [
+            entry['path'] for entry in manifest['files']]
+        assert all(finding['threat_name'] == 'Cannot read file: Not a directory'
+                   for finding in integrity)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
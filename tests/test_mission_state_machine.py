@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_MISSION_STATE_MACHINE"""
+"""
+Test: Mission State Machine
+
+Tests the compiled mission status transition table (tools/mission_state_machine.py):
+- Every declared allowedTransitions pair and every documented flow is allowed
+- Skipped, reversed and unknown transitions are rejected
+- History, bulk and audit checks report the offending steps
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from mission_state_machine import UNKNOWN, InvalidTransitionError, MissionStateMachine
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+with open(Path(__file__).parent.parent / 'enums' / 'mission_status.enum.v1.json', 'r', encoding='utf-8') as f:
+    METADATA = json.load(f)['metadata']
+STATUS_FLOW = METADATA['statusFlow']
+
+
+@pytest.fixture(scope='module')
+def machine() -> MissionStateMachine:
+    return MissionStateMachine()
+
+
+class TestMissionStateMachine:
+    """Test suite for mission_state_machine"""
+
+    def test_documented_flows_are_valid(self, machine: MissionStateMachine):
+        """Test that every documented flow passes as a history"""
+        assert machine.history_violations(STATUS_FLOW['normalFlow']) == []
+        for flow in STATUS_FLOW['alternativeFlows'].values():
+            assert machine.history_violations(flow) == []
+
+    def test_declared_transitions_are_valid(self, machine: MissionStateMachine):
+        """Test the compiled table is exactly the allowedTransitions of each status"""
+        for status, details in METADATA['statusDescriptions'].items():
+            assert set(machine.targets(status)) == set(details['allowedTransitions'])
+        for current, target in [('DRAFT', 'CANCELLED'), ('COMPLETED', 'FAILED'),
+                                ('FAILED', 'PLANNED'), ('ACCEPTED', 'REJECTED')]:
+            assert machine.is_allowed(current, target)
+            machine.validate_transition(current, target)
+        history = ['DRAFT', 'PLANNED', 'ASSIGNED', 'ACCEPTED', 'IN_PROGRESS', 'COMPLETED',
+                   'FAILED', 'PLANNED', 'ON_HOLD', 'CANCELLED']
+        assert machine.history_violations(history) == []
+        assert machine.audit([history, ['DRAFT', 'CANCELLED']]) == {}
+
+    def test_single_transitions(self, machine: MissionStateMachine):
+        """Test allowed, skipped and unknown transitions"""
+        assert machine.is_allowed('ASSIGNED', 'ACCEPTED')
+        assert not machine.is_allowed('ACCEPTED', 'ASSIGNED')
+        assert not machine.is_allowed('DRAFT', 'COMPLETED')
+        assert not machine.is_allowed('DRAFT', 'ARCHIVED')
+        assert machine.targets('IN_PROGRESS') == ['COMPLETED', 'FAILED']
+
+        machine.validate_transition('IN_PROGRESS', 'FAILED')
+        with pytest.raises(InvalidTransitionError) as exc:
+            machine.validate_transition('DELIVERED', 'DRAFT')
+        assert (exc.value.current, exc.value.target) == ('DELIVERED', 'DRAFT')
+
+    def test_history_violations(self, machine: MissionStateMachine):
+        """Test that bad steps are reported by index"""
+        history = ['DRAFT', 'PLANNED', 'IN_PROGRESS', 'COMPLETED', 'UNKNOWN_STATUS']
+        assert machine.history_violations(history) == [1, 3]
+        assert machine.history_violations(['DRAFT']) == []
+
+    def test_bulk_and_audit(self, machine: MissionStateMachine):
+        """Test bulk code arrays and multi-history audits"""
+        sources = machine.encode(['DRAFT', 'PLANNED', 'VERIFIED', 'DRAFT'])
+        targets = machine.encode(['PLANNED', 'DRAFT', 'DELIVERED', 'NOPE'])
+        assert targets[3] == UNKNOWN
+        assert machine.bulk_violations(sources, targets) == [1, 3]
+        with pytest.raises(ValueError):
+            machine.bulk_violations(sources, targets[:2])
+
+        histories = [STATUS_FLOW['normalFlow'], ['DRAFT', 'DELIVERED'], [], ['PLANNED', 'ON_HOLD', 'DRAFT']]
+        assert machine.audit(histories) == {1: [0], 3: [1]}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_OPENAPI_LOADER"""
+"""
+Test: OpenAPI Loader
+
+Tests the Python OpenAPI 3.1 loader (tools/openapi_loader.py):
+- All api/*.yaml specs and shared components load and validate cleanly
+- Component refs resolve into one shared, cached object graph
+- Operations expose parameter/body/response schemas that compile and validate
+- Broken refs, undeclared path parameters and bad examples are reported
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    import yaml  # noqa: F401
+    from openapi_loader import API_SPECS, OpenApiError, OpenApiLoader, get_openapi_loader
+except ImportError:
+    pytest.skip("jsonschema or PyYAML not installed", allow_module_level=True)
+
+
+SPEC_HEADER = (
+    'openapi: 3.1.0\n'
+    'info: {title: Test, version: 1.0.0}\n'
+)
+
+
+def write_api(tmp_path: Path, spec: str, components: str = '') -> Path:
+    api_dir = tmp_path / 'api'
+    (api_dir / 'components').mkdir(parents=True)
+    (api_dir / 'test.v1.yaml').write_text(SPEC_HEADER + spec, encoding='utf-8')
+    if components:
+        (api_dir / 'components' / 'schemas.yaml').write_text(components, encoding='utf-8')
+    return api_dir
+
+
+def find_operation(loader, name: str, method: str, path: str):
+    return next(op for op in loader.operations(name) if op.method == method and op.path == path)
+
+
+class TestOpenApiLoader:
+    """Test suite for openapi_loader"""
+
+    def test_repository_specs_are_valid(self):
+        """Test every spec and components file passes validation"""
+        loader = get_openapi_loader()
+        assert set(API_SPECS) <= set(loader.names)
+        assert loader.validate_all() == []
+
+    def test_components_resolve_into_shared_graph(self):
+        """Test YAML refs are inlined once and reused across the spec"""
+        loader = get_openapi_loader()
+        spec = loader.spec('platform_public.v1')
+        assert loader.spec('platform_public.v1') is spec
+        page = spec['paths']['/fields']['get']['parameters'][0]
+        assert page['name'] == 'page' and '$ref' not in page
+        assert page is spec['paths']['/missions']['get']['parameters'][0]
+
+    def test_contract_refs_point_at_schema_ids(self):
+        """Test refs into contract JSON Schemas are rewritten to their $id"""
+        spec = get_openapi_loader().spec('platform_public.v1')
+        body = spec['paths']['/fields/{field_id}']['put']['requestBody']['content']
+        ref = body['application/json']['schema']['$ref']
+        assert ref == 'https://api.tarlaanaliz.com/schemas/core/field.v1.schema.json'
+
+    def test_operation_validators(self):
+        """Test request body and parameter schemas compile and validate"""
+        loader = get_openapi_loader()
+        login = find_operation(loader, 'platform_public.v1', 'POST', '/auth/login')
+        assert login.body_required
+        body = loader.validator(login.request_body['application/json'])
+        assert not body.is_valid({})
+
+        fields = find_operation(loader, 'platform_public.v1', 'GET', '/fields')
+        page = next(p for p in fields.parameters if p.name == 'page')
+        assert page.location == 'query' and not page.required
+        assert loader.validator(page.schema_ref).is_valid(1)
+        assert not loader.validator(page.schema_ref).is_valid(0)
+        assert loader.validator(page.schema_ref) is loader.validator(page.schema_ref)
+
+    def test_path_level_parameters(self):
+        """Test parameters declared on the path item apply to its operations"""
+        loader = get_openapi_loader()
+        scan = find_operation(loader, 'edge_local.v1', 'POST', '/batches/{batch_id}/scan')
+        assert [(p.name, p.location, p.required) for p in scan.parameters] == [
+            ('batch_id', 'path', True),
+        ]
+
+    def test_unresolvable_ref(self, tmp_path: Path):
+        """Test a ref to a missing component is reported with its pointer"""
+        api_dir = write_api(tmp_path, (
+            'paths:\n'
+            '  /things:\n'
+            '    get:\n'
+            '      responses:\n'
+            '        "200":\n'
+            '          description: ok\n'
+            '          content:\n'
+            '            application/json:\n'
+            '              schema:\n'
+            "                $ref: './components/schemas.yaml#/components/schemas/Missing'\n"
+        ), 'components:\n  schemas:\n    Thing: {type: object}\n')
+        issues = OpenApiLoader(api_dir).validate_spec('test.v1')
+        assert len(issues) == 1
+        assert issues[0].file == 'api/test.v1.yaml'
+        assert issues[0].pointer.endswith('/application~1json/schema')
+        assert 'Unresolvable $ref' in issues[0].message
+
+    def test_undeclared_path_parameter_and_duplicate_ids(self, tmp_path: Path):
+        """Test path templates need declared parameters and operationIds are unique"""
+        api_dir = write_api(tmp_path, (
+            'paths:\n'
+            '  /things/{thing_id}:\n'
+            '    get:\n'
+            '      operationId: getThing\n'
+            '      responses: {"200": {description: ok}}\n'
+            '  /other:\n'
+            '    get:\n'
+            '      operationId: getThing\n'
+            '      security: [{Nope: []}]\n'
+            '      responses: {"200": {description: ok}}\n'
+        ))
+        messages = [issue.message for issue in OpenApiLoader(api_dir).validate_spec('test.v1')]
+        assert messages == [
+            'Path parameter {thing_id} is not declared',
+            'Duplicate operationId getThing (also GET /things/{thing_id})',
+            'Unknown security scheme Nope',
+        ]
+
+    def test_bad_example_and_schema(self, tmp_path: Path):
+        """Test examples are checked against their schema and schemas against 2020-12"""
+        api_dir = write_api(tmp_path, 'paths: {}\n', (
+            'components:\n'
+            '  schemas:\n'
+            '    Count: {type: integer, minimum: 1, example: 0}\n'
+            '    Broken: {type: 12}\n'
+        ))
+        issues = OpenApiLoader(api_dir).validate_all()
+        assert [(issue.file, issue.pointer) for issue in issues] == [
+            ('api/components/schemas.yaml', '/components/schemas/Count/example'),
+            ('api/components/schemas.yaml', '/components/schemas/Broken'),
+        ]
+
+    def test_invalid_yaml(self, tmp_path: Path):
+        """Test YAML syntax errors raise OpenApiError"""
+        api_dir = write_api(tmp_path, 'paths:\n  description: a: b\n')
+        with pytest.raises(OpenApiError, match='Invalid YAML'):
+            OpenApiLoader(api_dir)
+
+    def test_unknown_spec(self):
+        """Test unknown spec names raise KeyError"""
+        with pytest.raises(KeyError, match='Unknown API spec'):
+            get_openapi_loader().spec('nope.v1')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_PATTERN_CHECKS"""
+"""
+Test: Pattern Checks
+
+Tests the cached `pattern` keyword support (tools/pattern_checks.py):
+- Fixed-shape ID patterns are decomposed into prefix/charset/length
+- Matchers agree with re.search, including edge cases
+- The registry validators report pattern errors like stock jsonschema
+"""
+
+import re
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from jsonschema import Draft202012Validator
+    from contract_registry import get_registry
+    from pattern_checks import compiled_pattern, fixed_shape_checker, parse_fixed_shape, pattern_matcher
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+PATTERNS = ["^job_[a-z0-9]{24}$", "^[a-f0-9]{64}$", "^event_[a-z0-9]{24}$", "^[A-Z]{2,4}$"]
+
+VALUES = [
+    "job_60a7f1b8c9d4e5f6a7b8c9d2",
+    "job_60a7f1b8c9d4e5f6a7b8c9d2\n",
+    "job_60A7F1B8C9D4E5F6A7B8C9D2",
+    "job_60a7f1b8c9d4e5f6a7b8c9d",
+    "job_60a7f1b8c9d4e5f6a7b8c9dé",
+    "event_60a7f1b8c9d4e5f6a7b8c9d2",
+    "a" * 64,
+    "a" * 63 + "g",
+    "TR",
+    "TURKEY",
+    "",
+]
+
+
+class TestPatternChecks:
+    """Test suite for pattern_checks"""
+
+    def test_parse_fixed_shape(self):
+        """Test ID and hash patterns are decomposed; other patterns are not"""
+        shape = parse_fixed_shape("^field_[a-z0-9]{24}$")
+        assert (shape.prefix, shape.min_len, shape.max_len) == ("field_", 24, 24)
+        assert shape.charset == "0123456789abcdefghijklmnopqrstuvwxyz"
+
+        assert parse_fixed_shape("^[a-f0-9]{64}$").charset == "0123456789abcdef"
+        assert parse_fixed_shape("^[0-9]+\\.[0-9]+$") is None
+        assert parse_fixed_shape("^[z-a]{3}$") is None
+
+    @pytest.mark.parametrize("pattern", PATTERNS)
+    def test_matchers_agree_with_re_search(self, pattern: str):
+        """Test cached and fixed-shape matchers give re.search results"""
+        matcher = pattern_matcher(pattern)
+        specialized = fixed_shape_checker(parse_fixed_shape(pattern), pattern)
+        for value in VALUES:
+            expected = re.search(pattern, value) is not None
+            assert bool(matcher(value)) is expected, value
+            assert specialized(value) is expected, value
+
+    def test_cache_is_shared(self):
+        """Test that each pattern is compiled once per process"""
+        assert compiled_pattern("^job_[a-z0-9]{24}$") is compiled_pattern("^job_[a-z0-9]{24}$")
+        assert pattern_matcher("^job_[a-z0-9]{24}$") is pattern_matcher("^job_[a-z0-9]{24}$")
+
+    def test_registry_errors_match_stock_validator(self):
+        """Test pattern errors from registry validators match Draft202012Validator"""
+        registry = get_registry()
+        rel = "schemas/worker/analysis_job.v1.schema.json"
+        stock = Draft202012Validator(
+            registry.schema(rel), registry=registry.ref_registry, format_checker=registry.format_checker
+        )
+        instance = {"id": "job_BAD", "field_id": "field_x"}
+
+        ours = sorted(e.message for e in registry.iter_errors(rel, instance))
+        theirs = sorted(e.message for e in stock.iter_errors(instance))
+        assert ours == theirs
+        assert any("does not match" in message for message in ours)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_RESPONSE_SAMPLING"""
+"""
+Test: Adaptive Response Sampling
+
+Tests the sampled response validation layer (tools/response_sampling.py):
+- Sampling is deterministic at the configured rate per key
+- Violations raise the rate and clean samples decay it back to the base rate
+- Settings and per-key rates are read from [tool.tarlaanaliz.sampling]
+- The API middleware only checks sampled responses and feeds back violations
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from response_sampling import AdaptiveSampler, ResponseSampler, SamplingPolicy, load_sampler
+
+
+BASE_DIR = Path(__file__).parent.parent
+FIELD = json.loads(
+    (BASE_DIR / 'docs' / 'examples' / 'field.example.json').read_text(encoding='utf-8')
+)
+
+
+class TestAdaptiveSampler:
+    """Test suite for AdaptiveSampler"""
+
+    def test_fixed_rate(self):
+        """Test a 0.1 rate samples the first payload and then one in ten"""
+        sampler = AdaptiveSampler(SamplingPolicy(rate=0.1))
+        picks = [sampler.should_sample() for _ in range(100)]
+        assert picks[0] is True
+        assert sum(picks) == 10
+        assert sampler.snapshot() == {'seen': 100, 'sampled': 10, 'violations': 0, 'rate': 0.1}
+
+    def test_zero_rate_only_checks_first(self):
+        """Test rate 0 disables sampling after the first payload"""
+        sampler = AdaptiveSampler(SamplingPolicy(rate=0.0))
+        assert [sampler.should_sample() for _ in range(5)] == [True, False, False, False, False]
+
+    def test_violation_boosts_and_clean_decays(self):
+        """Test the rate rises to max on violations and decays back when clean"""
+        sampler = AdaptiveSampler(SamplingPolicy(rate=0.01, boost=10.0, decay=0.5))
+        sampler.should_sample()
+        sampler.record(violated=True)
+        assert sampler.rate == pytest.approx(0.1)
+        assert sampler.should_sample() is True  # the next payload is checked too
+        sampler.record(violated=True)
+        assert sampler.rate == pytest.approx(1.0)
+        assert all(sampler.should_sample() for _ in range(5))
+
+        for _ in range(20):
+            sampler.record(violated=False)
+        assert sampler.rate == 0.01
+        assert sampler.violations == 2
+
+    def test_invalid_rates(self):
+        """Test rates outside [0, max_rate] are rejected"""
+        with pytest.raises(ValueError):
+            AdaptiveSampler(SamplingPolicy(rate=1.5))
+        with pytest.raises(ValueError):
+            ResponseSampler(rates={'GET /results': -0.1})
+
+
+class TestResponseSampler:
+    """Test suite for ResponseSampler"""
+
+    def test_per_key_rates(self):
+        """Test keys get their configured base rate and independent counters"""
+        sampler = ResponseSampler(SamplingPolicy(rate=0.5), {'GET /results': 0.25})
+        for _ in range(8):
+            sampler.should_sample('GET /results')
+            sampler.should_sample('GET /fields')
+        stats = sampler.stats()
+        assert stats['GET /results']['sampled'] == 2
+        assert stats['GET /fields']['sampled'] == 4
+
+    def test_validate_contract_schema(self):
+        """Test sampled registry validation reports violations and raises the rate"""
+        sampler = ResponseSampler(SamplingPolicy(rate=0.2))
+        key = 'core/field.v1.schema.json'
+        assert sampler.validate(key, FIELD) is None
+        assert sampler.validate(key, {**FIELD, 'id': 'x'}) is None  # not sampled
+        for _ in range(3):
+            sampler.validate(key, FIELD)
+        error = sampler.validate(key, {**FIELD, 'id': 'x'})
+        assert error is not None and error.startswith('$.id')
+        stats = sampler.stats()[key]
+        assert stats['sampled'] == 2 and stats['violations'] == 1
+        assert stats['rate'] == 1.0
+
+    def test_load_from_pyproject(self, tmp_path: Path):
+        """Test the repository block and a custom file are read"""
+        sampler = load_sampler()
+        assert sampler.default.rate == 0.05
+        assert sampler.rates['GET /results'] == 0.01
+
+        pyproject = tmp_path / 'pyproject.toml'
+        pyproject.write_text(
+            '[tool.tarlaanaliz.sampling]\n'
+            'rate = 0.5\n'
+            'boost = 2\n'
+            '[tool.tarlaanaliz.sampling.rates]\n'
+            '"core/field.v1.schema.json" = 1.0\n',
+            encoding='utf-8',
+        )
+        custom = load_sampler(pyproject)
+        assert custom.default == SamplingPolicy(rate=0.5, boost=2.0)
+        assert custom.sampler('core/field.v1.schema.json').rate == 1.0
+        assert load_sampler(tmp_path / 'missing.toml').default == SamplingPolicy()
+
+    def test_middleware_samples_responses(self):
+        """Test the ASGI middleware checks only sampled responses and adapts"""
+        try:
+            from api_middleware import ApiValidator, AsgiValidationMiddleware
+            from test_api_middleware import asgi_call, json_app
+        except ImportError:
+            pytest.skip('PyYAML not installed')
+
+        path = f"/v1/fields/{FIELD['id']}"
+        reported = []
+        sampler = ResponseSampler(SamplingPolicy(rate=0.25))
+        clean = AsgiValidationMiddleware(json_app(200, FIELD), ApiValidator(), sampler=sampler)
+        for _ in range(8):
+            assert asgi_call(clean, 'GET', path)[0] == 200
+        assert sampler.stats()['GET /fields/{field_id}'] == {
+            'seen': 8, 'sampled': 2, 'violations': 0, 'rate': 0.25,
+        }
+
+        drifted = AsgiValidationMiddleware(json_app(200, {'id': 'nope'}), ApiValidator(),
+                                           sampler=sampler, on_response_error=reported.append)
+        for _ in range(4):
+            assert asgi_call(drifted, 'GET', path)[0] == 200
+        stats = sampler.stats()['GET /fields/{field_id}']
+        assert stats['sampled'] == 6 and stats['violations'] == len(reported) == 4
+        assert stats['rate'] == 1.0
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
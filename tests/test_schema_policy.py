@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_SCHEMA_POLICY"""
+"""
+Test: Schema Policy Linter
+
+Tests the single-pass policy linter (tools/schema_policy.py):
+- Policy settings are read from [tool.tarlaanaliz.schema] in pyproject.toml
+- Forbidden fields match property names only, never descriptions or data
+- unevaluatedProperties is checked in nested objects and $defs
+- Every repository schema satisfies the policy (no errors)
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from schema_policy import (
+    ERROR,
+    RULES,
+    WARNING,
+    SchemaPolicy,
+    iter_subschemas,
+    lint_file,
+    lint_schema,
+    load_policy,
+)
+
+
+BASE_DIR = Path(__file__).parent.parent
+SCHEMA_FILES = sorted((BASE_DIR / 'schemas').rglob('*.json'))
+
+
+def closed_schema(**extra) -> dict:
+    schema = {
+        '$schema': 'https://json-schema.org/draft/2020-12/schema',
+        '$id': 'https://example.com/test.schema.json',
+        'title': 'Test',
+        'type': 'object',
+        'unevaluatedProperties': False,
+    }
+    schema.update(extra)
+    return schema
+
+
+def rules_hit(findings, severity=ERROR) -> list:
+    return [(finding.rule, finding.pointer) for finding in findings if finding.severity == severity]
+
+
+class TestSchemaPolicy:
+    """Test suite for schema_policy"""
+
+    def test_policy_from_pyproject(self):
+        """Test the repository policy block is loaded"""
+        policy = load_policy()
+        assert policy.required_properties == ('$schema', '$id', 'title', 'type')
+        assert policy.warning_features == ('additionalProperties',)
+        assert policy.fail_on_warning is False
+        assert {'email', 'tckn', 'otp', 'tc_kimlik_no'} <= policy.forbidden_fields
+
+    def test_policy_overrides(self, tmp_path: Path):
+        """Test custom settings and extra forbidden fields in a pyproject file"""
+        pyproject = tmp_path / 'pyproject.toml'
+        pyproject.write_text(
+            '[tool.tarlaanaliz.schema]\n'
+            'forbidden_fields = ["Phone"]\n'
+            'required_properties = ["$id"]\n'
+            'fail_on_warning = true\n',
+            encoding='utf-8',
+        )
+        policy = load_policy(pyproject)
+        assert policy.required_properties == ('$id',)
+        assert policy.fail_on_warning is True
+        assert 'phone' in policy.forbidden_fields
+        assert 'email' in policy.forbidden_fields
+
+    def test_missing_pyproject_uses_defaults(self, tmp_path: Path):
+        """Test defaults apply without a pyproject file"""
+        assert load_policy(tmp_path / 'pyproject.toml') == SchemaPolicy()
+
+    def test_clean_schema(self):
+        """Test a compliant schema has no findings"""
+        assert lint_schema(closed_schema(properties={'name': {'type': 'string'}})) == []
+
+    def test_required_root_keywords(self):
+        """Test missing $id and title are reported at the root"""
+        schema = closed_schema()
+        del schema['$id'], schema['title']
+        messages = [finding.message for finding in lint_schema(schema)]
+        assert messages == ['Missing required keyword $id', 'Missing required keyword title']
+
+    def test_wrong_draft(self):
+        """Test $schema must be Draft 2020-12"""
+        schema = closed_schema()
+        schema['$schema'] = 'http://json-schema.org/draft-07/schema#'
+        assert rules_hit(lint_schema(schema)) == [('schema-standard', '/$schema')]
+
+    def test_forbidden_property_names(self):
+        """Test forbidden names are found in nested properties, required and $defs"""
+        schema = closed_schema(
+            properties={'contact': {
+                'type': 'object',
+                'unevaluatedProperties': False,
+                'properties': {'Email': {'type': 'string'}},
+                'required': ['Email'],
+            }},
+            **{'$defs': {'Login': {
+                'type': 'object',
+                'unevaluatedProperties': False,
+                'properties': {'otp': {'type': 'string'}},
+            }}},
+        )
+        assert rules_hit(lint_schema(schema)) == [
+            ('forbidden-field', '/properties/contact/properties/Email'),
+            ('forbidden-field', '/properties/contact/required/0'),
+            ('forbidden-field', '/$defs/Login/properties/otp'),
+        ]
+
+    def test_forbidden_words_in_text_and_data_are_allowed(self):
+        """Test descriptions, enum values and substrings are not property names"""
+        schema = closed_schema(
+            description='No "email" or "tckn" is stored',
+            properties={
+                'channel': {'enum': ['email', 'sms']},
+                'email_opt_in': {'type': 'boolean', 'default': False},
+            },
+        )
+        assert lint_schema(schema) == []
+
+    def test_nested_unevaluated_properties(self):
+        """Test $defs types error and inline objects warn when not closed"""
+        schema = closed_schema(
+            properties={'range': {'type': 'object', 'properties': {'min': {'type': 'number'}}}},
+            **{'$defs': {'Open': {'type': 'object'}, 'Loose': {
+                'type': 'object', 'unevaluatedProperties': True,
+            }}},
+        )
+        findings = lint_schema(schema)
+        assert rules_hit(findings) == [
+            ('unevaluated-properties', '/$defs/Open'),
+            ('unevaluated-properties', '/$defs/Loose/unevaluatedProperties'),
+        ]
+        assert rules_hit(findings, WARNING) == [('unevaluated-properties', '/properties/range')]
+
+    def test_additional_properties_is_a_warning(self):
+        """Test declared maps are not unclosed objects but warn per warning_features"""
+        schema = closed_schema(properties={
+            'metadata': {'type': 'object', 'additionalProperties': True},
+        })
+        findings = lint_schema(schema)
+        assert rules_hit(findings) == []
+        assert rules_hit(findings, WARNING) == [
+            ('warning-features', '/properties/metadata/additionalProperties'),
+        ]
+
+    def test_single_traversal_skips_data_keywords(self):
+        """Test the visitor yields schema positions only, once each"""
+        schema = closed_schema(
+            examples=[{'type': 'object'}],
+            properties={'a': {'anyOf': [{'type': 'string'}, {'const': {'type': 'object'}}]}},
+        )
+        pointers = [pointer for pointer, _ in iter_subschemas(schema)]
+        assert pointers == ['', '/properties/a', '/properties/a/anyOf/0', '/properties/a/anyOf/1']
+        assert len(pointers) == len(set(pointers))
+
+    def test_custom_rule_set(self):
+        """Test linting with an explicit subset of the registered rules"""
+        schema = closed_schema()
+        del schema['title']
+        only = {'schema-standard': RULES['schema-standard']}
+        assert lint_schema(schema, rules=only) == []
+
+    def test_parse_error(self, tmp_path: Path):
+        """Test unreadable JSON is reported as a finding"""
+        path = tmp_path / 'broken.schema.json'
+        path.write_text('{"type": ', encoding='utf-8')
+        assert [finding.rule for finding in lint_file(path)] == ['parse']
+
+    @pytest.mark.parametrize('schema_file', SCHEMA_FILES, ids=lambda p: p.name)
+    def test_repository_schemas_have_no_errors(self, schema_file: Path):
+        """Test every contract schema satisfies the policy"""
+        errors = rules_hit(lint_file(schema_file, load_policy()))
+        assert errors == [], f"{schema_file.name}: {errors}"
+
+    def test_validate_tool_uses_policy(self):
+        """Test tools/validate.py reports through the linter"""
+        from validate import validate_json_schema
+
+        schema_file = BASE_DIR / 'schemas' / 'core' / 'field.v1.schema.json'
+        errors, warnings = validate_json_schema(schema_file)
+        assert errors == []
+        assert all(warning.startswith('[') for warning in warnings)
+        assert json.loads(schema_file.read_text(encoding='utf-8'))['type'] == 'object'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
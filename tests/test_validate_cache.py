@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_VALIDATE_CACHE"""
+"""
+Test: Validator Result Cache
+
+Tests the content-hash cache in tools/validate.py:
+- Unchanged files are served from the cache, edited files are re-checked
+- The cache key changes with the policy
+- Parallel checking gives the same results as the serial path
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import validate
+from schema_policy import SchemaPolicy, load_policy
+from validate import cache_key, load_cache, save_cache, validate_files
+
+
+BASE_DIR = Path(__file__).parent.parent
+SCHEMA_FILES = sorted((BASE_DIR / 'schemas').rglob('*.json'))
+
+
+@pytest.fixture
+def contracts(tmp_path: Path, monkeypatch):
+    """A scratch copy of three schemas with validate.BASE_DIR pointing at it"""
+    files = []
+    for source in SCHEMA_FILES[:3]:
+        target = tmp_path / source.relative_to(BASE_DIR)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(source.read_bytes())
+        files.append(target)
+    monkeypatch.setattr(validate, 'BASE_DIR', tmp_path)
+    return files
+
+
+class TestValidateCache:
+    """Test suite for the validate.py result cache"""
+
+    def test_hits_and_misses(self, contracts, tmp_path: Path):
+        """Test a second run is all hits and an edited file is a miss"""
+        policy = load_policy()
+        key = cache_key(policy)
+        cache_file = tmp_path / 'build' / 'validate_cache.json'
+
+        entries, hits = validate_files(contracts, policy, load_cache(cache_file, key))
+        assert hits == 0
+        save_cache(cache_file, key, entries)
+
+        cached = load_cache(cache_file, key)
+        again, hits = validate_files(contracts, policy, cached)
+        assert hits == len(contracts)
+        assert again == entries
+
+        contracts[0].write_text('{"type": ', encoding='utf-8')
+        edited, hits = validate_files(contracts, policy, cached)
+        assert hits == len(contracts) - 1
+        rel = contracts[0].relative_to(tmp_path).as_posix()
+        assert edited[rel]['errors'][0].startswith('[parse]')
+
+    def test_key_tracks_policy(self, tmp_path: Path):
+        """Test a policy change invalidates the whole cache"""
+        cache_file = tmp_path / 'validate_cache.json'
+        save_cache(cache_file, cache_key(SchemaPolicy()), {'a.json': {'sha256': '0'}})
+        assert load_cache(cache_file, cache_key(SchemaPolicy())) != {}
+        stricter = SchemaPolicy(fail_on_warning=True)
+        assert load_cache(cache_file, cache_key(stricter)) == {}
+
+    def test_key_is_stable(self):
+        """Test the key does not depend on set ordering"""
+        assert cache_key(load_policy()) == cache_key(load_policy())
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path):
+        """Test an unreadable cache file means a full run"""
+        cache_file = tmp_path / 'validate_cache.json'
+        cache_file.write_text('not json', encoding='utf-8')
+        assert load_cache(cache_file, cache_key(SchemaPolicy())) == {}
+
+    def test_parallel_matches_serial(self, contracts):
+        """Test the process pool path returns the same entries"""
+        policy = load_policy()
+        serial, _ = validate_files(contracts, policy, {})
+        parallel, _ = validate_files(contracts, policy, {}, jobs=2)
+        assert parallel == serial
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_VALIDATE_DATA"""
+"""
+Test: Contract Data Validator
+
+Tests streaming payload validation (tools/validate_data.py):
+- Event records are routed by event_type/event_version
+- Valid/invalid splits and the error histogram are written
+- Unparseable and unroutable records are reported, not fatal
+- Process-pool mode preserves input ordering
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import get_registry
+    from validate_data import (
+        UNPARSEABLE,
+        UNROUTABLE,
+        DataValidator,
+        SplitWriter,
+        build_event_routes,
+        check_records,
+        iter_records,
+        validate_batch,
+        validate_stream,
+    )
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def event_example(name: str) -> dict:
+    with open(BASE_DIR / "schemas" / "events" / name, 'r', encoding='utf-8') as f:
+        return json.load(f)["examples"][0]
+
+
+class TestValidateData:
+    """Test suite for validate_data"""
+
+    @pytest.fixture
+    def events_file(self, tmp_path: Path) -> Path:
+        """NDJSON file mixing valid, invalid, unroutable and unparseable records"""
+        completed = event_example("analysis_completed.v1.schema.json")
+        created = event_example("field_created.v1.schema.json")
+        broken = dict(completed, event_id="event_bad")
+
+        path = tmp_path / "events.ndjson"
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in (completed, created, broken, {"event_type": "unknown"}):
+                f.write(json.dumps(record) + "\n")
+            f.write("\n{not json\n")
+        return path
+
+    def test_event_routes_cover_events_directory(self):
+        """Test that every events/ schema gets an (event_type, event_version) route"""
+        routes = build_event_routes(get_registry())
+        assert routes[("analysis.completed", "1.0")] == "schemas/events/analysis_completed.v1.schema.json"
+        assert len(routes) == len(list((BASE_DIR / "schemas" / "events").glob("*.json")))
+
+    def test_stream_report(self, events_file: Path):
+        """Test counts and histogram for a mixed stream"""
+        report = validate_stream(iter_records([str(events_file)]), DataValidator())
+
+        assert report.total == 5
+        assert report.valid == 2
+        stats = report.schemas["schemas/events/analysis_completed.v1.schema.json"]
+        assert stats == {"valid": 1, "invalid": 1, "errors": {"pattern at $.event_id": 1}}
+        assert report.schemas[UNROUTABLE]["invalid"] == 1
+        assert report.schemas[UNPARSEABLE]["invalid"] == 1
+
+    def test_split_outputs(self, events_file: Path, tmp_path: Path):
+        """Test that valid/invalid splits, errors and report.json are written"""
+        out_dir = tmp_path / "out"
+        report = validate_stream(
+            iter_records([str(events_file)]), DataValidator(), SplitWriter(out_dir)
+        )
+
+        valid_lines = (out_dir / "valid.ndjson").read_text(encoding='utf-8').splitlines()
+        invalid_lines = (out_dir / "invalid.ndjson").read_text(encoding='utf-8').splitlines()
+        assert len(valid_lines) == report.valid
+        assert len(invalid_lines) == report.invalid
+
+        errors_text = (out_dir / "errors.ndjson").read_text(encoding='utf-8')
+        errors = [json.loads(line) for line in errors_text.splitlines()]
+        assert errors[0]["source"].endswith("events.ndjson:3")
+
+        summary = json.loads((out_dir / "report.json").read_text(encoding='utf-8'))
+        assert summary["total"] == 5
+
+    def test_explicit_schema_and_json_directory(self, tmp_path: Path):
+        """Test --schema mode over a directory of pretty-printed JSON documents"""
+        example = BASE_DIR / "docs" / "examples" / "analysis_result.example.json"
+        (tmp_path / "a.json").write_text(example.read_text(encoding='utf-8'), encoding='utf-8')
+        (tmp_path / "b.json").write_text('{"id": "result_x"}', encoding='utf-8')
+
+        validator = DataValidator(schema="worker/analysis_result.v1.schema.json")
+        out_dir = tmp_path / "out"
+        records = iter_records([str(tmp_path)], exclude=out_dir)
+        report = validate_stream(records, validator, SplitWriter(out_dir))
+
+        assert (report.valid, report.invalid) == (1, 1)
+        valid_lines = (out_dir / "valid.ndjson").read_text(encoding='utf-8').splitlines()
+        assert json.loads(valid_lines[0])["id"].startswith("result_")
+
+    def test_malformed_routing_keys_and_unparseable_json(self, tmp_path: Path):
+        """Test non-string routing keys are unroutable and broken .json documents are kept"""
+        validator = DataValidator()
+        for record in ({"event_type": ["x"], "event_version": "1.0"},
+                       {"event_type": "field.created", "event_version": {"v": 1}}):
+            assert validator.check(json.dumps(record).encode())[0] == UNROUTABLE
+
+        (tmp_path / "broken.json").write_text('{\n  "id": \n', encoding='utf-8')
+        out_dir = tmp_path / "out"
+        records = iter_records([str(tmp_path)], exclude=out_dir)
+        report = validate_stream(records, validator, SplitWriter(out_dir))
+
+        assert report.schemas[UNPARSEABLE]["invalid"] == 1
+        invalid_lines = (out_dir / "invalid.ndjson").read_text(encoding='utf-8').splitlines()
+        assert invalid_lines == ['{\\n  "id": \\n']
+
+
+class TestParallelValidation:
+    """Test suite for the process-pool engine"""
+
+    @pytest.fixture
+    def jobs(self) -> list:
+        """analysis_job documents with every third one broken"""
+        with open(BASE_DIR / "docs" / "examples" / "analysis_job.example.json", 'r', encoding='utf-8') as f:
+            job = json.load(f)
+        return [job if i % 3 else dict(job, id=f"bad_{i}") for i in range(40)]
+
+    def test_parallel_matches_serial_order(self, jobs: list):
+        """Test that worker results come back in input order"""
+        records = [(f"doc:{i}", json.dumps(job).encode()) for i, job in enumerate(jobs)]
+        validator = DataValidator(schema="worker/analysis_job.v1.schema.json")
+
+        serial = list(check_records(records, validator))
+        parallel = list(check_records(records, validator, workers=2, chunk_size=7))
+
+        assert parallel == serial
+        assert [source for source, *_ in parallel] == [f"doc:{i}" for i in range(len(jobs))]
+
+    @pytest.mark.parametrize('chunk_size', [0, -1])
+    def test_chunk_size_must_be_positive(self, jobs: list, chunk_size: int):
+        """Test a chunk size below 1 is an error instead of validating nothing"""
+        records = [(f"doc:{i}", json.dumps(job).encode()) for i, job in enumerate(jobs)]
+        validator = DataValidator(schema="worker/analysis_job.v1.schema.json")
+        with pytest.raises(ValueError):
+            list(check_records(records, validator, workers=2, chunk_size=chunk_size))
+        with pytest.raises(ValueError):
+            validate_batch(jobs, "worker/analysis_job.v1.schema.json", workers=2,
+                           chunk_size=chunk_size)
+
+    def test_validate_batch(self, jobs: list):
+        """Test batch API over parsed documents"""
+        schema = "worker/analysis_job.v1.schema.json"
+        serial = validate_batch(jobs, schema=schema)
+        parallel = validate_batch(jobs, schema=schema, workers=2, chunk_size=5)
+
+        assert parallel == serial
+        assert [bool(errors) for _, errors in parallel] == [i % 3 == 0 for i in range(len(jobs))]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_VALIDATION_METRICS"""
+"""
+Test: Validation Metrics
+
+Tests the validation metrics exporter (tools/validation_metrics.py):
+- Validations are counted per schema $id, contract version and outcome
+- Histogram buckets are cumulative and end with +Inf == count
+- Per-thread shards add up exactly under concurrent updates
+- Prometheus text and the dict snapshot are served over HTTP
+"""
+
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import get_registry
+    from generate_fixtures import FixtureGenerator
+    from jsonschema import ValidationError
+    from validation_metrics import (
+        COUNTER_NAME,
+        HISTOGRAM_NAME,
+        Histogram,
+        ValidationMetrics,
+        start_http_server,
+    )
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+FIELD = 'core/field.v1.schema.json'
+FIELD_ID = 'https://api.tarlaanaliz.com/schemas/core/field.v1.schema.json'
+
+
+@pytest.fixture
+def metrics():
+    return ValidationMetrics(get_registry(), version='1.2.3')
+
+
+def series(metrics):
+    return {(s['schema'], s['outcome']): s for s in metrics.snapshot()['series']}
+
+
+class TestValidationMetrics:
+    """Test suite for ValidationMetrics"""
+
+    def test_outcomes(self, metrics):
+        """Test valid, invalid and error outcomes are labeled by $id and version"""
+        field = FixtureGenerator(get_registry(), seed=1).generate(FIELD)
+        assert metrics.is_valid(FIELD, field)
+        assert not metrics.is_valid(FIELD, {})
+        assert metrics.first_error(FIELD, {}).startswith('$:')
+        with pytest.raises(ValidationError):
+            metrics.validate(FIELD, {})
+        with pytest.raises(KeyError):
+            metrics.is_valid('core/missing.v1.schema.json', {})
+        counts = {key: s['count'] for key, s in series(metrics).items()}
+        assert counts == {
+            (FIELD_ID, 'valid'): 1,
+            (FIELD_ID, 'invalid'): 3,
+            ('core/missing.v1.schema.json', 'error'): 1,
+        }
+        assert {s['version'] for s in metrics.snapshot()['series']} == {'1.2.3'}
+
+    def test_track_and_fragments(self, metrics):
+        """Test track() records custom validators and fragment keys keep their pointer"""
+        key = f'{FIELD}#/$defs/CadastralInfo'
+        with metrics.track(key) as outcome:
+            outcome.valid = False
+        with metrics.track(key):
+            pass
+        labels = series(metrics)
+        assert labels[(f'{FIELD_ID}#/$defs/CadastralInfo', 'invalid')]['count'] == 1
+        assert labels[(f'{FIELD_ID}#/$defs/CadastralInfo', 'valid')]['count'] == 1
+        with pytest.raises(ValueError, match='outcome'):
+            metrics.observe(FIELD, 'skipped', 0.1)
+
+    def test_histogram_buckets(self):
+        """Test buckets are cumulative, bounds inclusive and +Inf equals the count"""
+        histogram = Histogram((0.001, 0.01))
+        for seconds in (0.0005, 0.001, 0.005, 2.0):
+            histogram.observe(seconds)
+        snapshot = histogram.snapshot()
+        assert snapshot['buckets'] == {'0.001': 2, '0.01': 3, '+Inf': 4}
+        assert snapshot['count'] == 4 and snapshot['sum_seconds'] == pytest.approx(2.0065)
+
+    def test_concurrent_updates(self):
+        """Test shards from many threads add up and finished threads are folded"""
+        histogram = Histogram()
+
+        def work():
+            for _ in range(2000):
+                histogram.observe(0.0001)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert histogram.snapshot()['count'] == 16000
+        histogram.observe(0.0001)
+        assert histogram.snapshot()['count'] == 16001 and len(histogram._shards) == 1
+
+    def test_render(self, metrics):
+        """Test the Prometheus exposition has HELP/TYPE headers and consistent samples"""
+        metrics.observe(FIELD, 'valid', 0.0003)
+        metrics.observe(FIELD, 'valid', 0.2)
+        lines = metrics.render().splitlines()
+        assert f'# TYPE {COUNTER_NAME} counter' in lines
+        assert f'# TYPE {HISTOGRAM_NAME} histogram' in lines
+        labels = f'schema="{FIELD_ID}",version="1.2.3",outcome="valid"'
+        assert f'{COUNTER_NAME}{{{labels}}} 2' in lines
+        assert f'{HISTOGRAM_NAME}_bucket{{{labels},le="0.0005"}} 1' in lines
+        assert f'{HISTOGRAM_NAME}_bucket{{{labels},le="+Inf"}} 2' in lines
+        assert f'{HISTOGRAM_NAME}_count{{{labels}}} 2' in lines
+
+    def test_http_endpoint(self, metrics):
+        """Test /metrics, /metrics.json and 404 for other paths"""
+        metrics.observe(FIELD, 'invalid', 0.001)
+        server = start_http_server(metrics, port=0)
+        base = f'http://127.0.0.1:{server.server_address[1]}'
+        try:
+            with urllib.request.urlopen(f'{base}/metrics', timeout=5) as response:
+                assert response.headers['Content-Type'].startswith('text/plain; version=0.0.4')
+                assert COUNTER_NAME in response.read().decode()
+            with urllib.request.urlopen(f'{base}/metrics.json', timeout=5) as response:
+                assert json.load(response) == metrics.snapshot()
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f'{base}/other', timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
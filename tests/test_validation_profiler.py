@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_VALIDATION_PROFILER"""
+"""
+Test: Validation Profiler
+
+Tests the per-keyword validation profiler (tools/validation_profiler.py):
+- Instrumented validators give the same results as the registry validators
+- Calls and timings are recorded per keyword and per JSON pointer
+- Self time excludes nested keywords; recursion does not double count totals
+- Collapsed stacks are written in the flamegraph.pl format
+- Registry validators stay uninstrumented (no cost when profiling is off)
+"""
+
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import ContractValidator, get_registry
+    from generate_fixtures import FixtureGenerator
+    from validation_profiler import ValidationProfiler
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+RESULT = 'worker/analysis_result.v1.schema.json'
+
+
+class FakeClock:
+    """Clock advancing one nanosecond per reading"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture(scope='module')
+def documents():
+    generator = FixtureGenerator(get_registry(), seed=7, optional=1.0, sizes={'layers': 3})
+    return list(generator.iter_fixtures(RESULT, 3))
+
+
+class TestValidationProfiler:
+    """Test suite for ValidationProfiler"""
+
+    def test_same_results(self, documents):
+        """Test instrumented validation agrees with the registry, errors included"""
+        registry = get_registry()
+        validator = ValidationProfiler(registry).validator(RESULT)
+        broken = dict(documents[0], analysis_id='not an id', layers='nope')
+        for document in documents + [broken, {}]:
+            assert validator.is_valid(document) == registry.is_valid(RESULT, document)
+            assert sorted(e.message for e in validator.iter_errors(document)) == sorted(
+                e.message for e in registry.iter_errors(RESULT, document)
+            )
+
+    def test_keywords_and_pointers(self, documents):
+        """Test calls are recorded per keyword and per $defs pointer"""
+        profiler = ValidationProfiler()
+        validator = profiler.validator(RESULT)
+        for document in documents:
+            validator.is_valid(document)
+        keywords = {row.name: row for row in profiler.stats('keyword')}
+        assert {'$ref', 'properties', 'pattern', 'type', 'unevaluatedProperties'} <= set(keywords)
+        assert keywords['properties'].total_ns >= keywords['properties'].self_ns > 0
+        locations = {row.name for row in profiler.stats('location')}
+        assert f'{RESULT}#/$defs/LayerRef' in locations
+        assert any(name.startswith(f'{RESULT}#/$defs/') and '/properties/' in name
+                   for name in locations)
+        frames = {row.name: row.calls for row in profiler.stats()}
+        assert frames[f'{RESULT}#/properties'] == len(documents)
+
+    def test_self_time_excludes_children(self):
+        """Test with a fake clock that self times add up and nested totals are counted once"""
+        profiler = ValidationProfiler(clock=FakeClock())
+        field = FixtureGenerator(get_registry(), seed=1).generate('core/field.v1.schema.json')
+        assert profiler.validator('core/field.v1.schema.json').is_valid(field)
+        rows = profiler.stats()
+        root = next(row for row in rows if row.name.endswith('.schema.json#/properties'))
+        assert root.total_ns > root.self_ns
+        assert all(row.self_ns > 0 and row.total_ns >= row.self_ns for row in rows)
+        assert profiler.snapshot()[0].keys() == {'name', 'calls', 'self_us', 'total_us'}
+
+    def test_report_and_reset(self, documents):
+        """Test the report lists rows by self time and reset clears them"""
+        profiler = ValidationProfiler()
+        profiler.validator(RESULT).is_valid(documents[0])
+        report = profiler.report('keyword', top=3).splitlines()
+        assert report[0].split()[:2] == ['keyword', 'calls'] and len(report) == 5
+        with pytest.raises(ValueError, match='grouping'):
+            profiler.stats('schema')
+        profiler.reset()
+        assert profiler.stats() == []
+
+    def test_write_collapsed(self, documents, tmp_path: Path):
+        """Test collapsed stacks are `frame;frame weight` lines rooted at the schema"""
+        profiler = ValidationProfiler()
+        for document in documents:
+            profiler.validator(RESULT).is_valid(document)
+        path = tmp_path / 'out' / 'result.folded'
+        count = profiler.write_collapsed(path)
+        lines = path.read_text(encoding='utf-8').splitlines()
+        assert count == len(lines) > 0
+        for line in lines:
+            stack, weight = line.rsplit(' ', 1)
+            assert int(weight) > 0 and stack.startswith(f'{RESULT}#/')
+        assert any(f'{RESULT}#/$defs/' in line.split(';', 3)[-1] for line in lines)
+
+    def test_registry_validators_untouched(self):
+        """Test profiling never swaps the keyword functions of shared validators"""
+        registry = get_registry()
+        ValidationProfiler(registry).validator(RESULT)
+        shared = registry.validator(RESULT)
+        assert type(shared).VALIDATORS is ContractValidator.VALIDATORS
+        assert all(shared.VALIDATORS[k] is f for k, f in ContractValidator.VALIDATORS.items())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_VALIDATION_SIDECAR"""
+"""
+Test: Validation Sidecar
+
+Tests the local validation HTTP service (tools/validation_sidecar.py):
+- POST /validate/{schema} answers valid/invalid with error messages
+- POST /validate-batch streams one NDJSON result per record, in order
+- Connections are kept alive across requests; chunked bodies are accepted
+- A full queue answers 503 with Retry-After instead of queueing forever
+- GET /status reports totals and throughput
+- A dead worker pool is replaced once, even when several chunks fail on it
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from urllib.parse import quote
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from contract_registry import get_registry
+    from generate_fixtures import FixtureGenerator
+    from validate_data import build_event_routes
+    from validation_sidecar import SidecarError, ValidationSidecar, parse_head
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+FIELD = 'core/field.v1.schema.json'
+
+
+@pytest.fixture(scope='module')
+def sidecar():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    service = ValidationSidecar(workers=1, max_pending=2, chunk_size=7, queue_timeout=0.2)
+    asyncio.run_coroutine_threadsafe(service.start('127.0.0.1', 0), loop).result(timeout=60)
+    service.loop = loop
+    yield service
+    asyncio.run_coroutine_threadsafe(service.close(), loop).result(timeout=60)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    loop.close()
+
+
+@pytest.fixture
+def client(sidecar):
+    connection = http.client.HTTPConnection('127.0.0.1', sidecar.port, timeout=30)
+    yield connection
+    connection.close()
+
+
+def call(client, method, path, body=None, **kwargs):
+    client.request(method, path, body, **kwargs)
+    response = client.getresponse()
+    return response, response.read()
+
+
+class TestValidateEndpoint:
+    """Test suite for POST /validate/{schema}"""
+
+    def test_valid_and_invalid(self, client):
+        """Test results for a valid and an invalid document on one kept-alive connection"""
+        field = FixtureGenerator(get_registry(), seed=1).generate(FIELD)
+        response, body = call(client, 'POST', f'/validate/{FIELD}', json.dumps(field))
+        assert response.status == 200 and response.getheader('Connection') == 'keep-alive'
+        assert json.loads(body) == {'schema': f'schemas/{FIELD}', 'valid': True, 'errors': []}
+        socket = client.sock
+        response, body = call(client, 'POST', f'/validate/{FIELD}', b'{}')
+        result = json.loads(body)
+        assert client.sock is socket
+        assert not result['valid'] and "$: 'id' is a required property" in result['errors']
+
+    def test_schema_by_id(self, client):
+        """Test the schema may be given as a URL-encoded $id"""
+        schema_id = get_registry().schema(FIELD)['$id']
+        response, body = call(client, 'POST', f"/validate/{quote(schema_id, safe='')}", b'{}')
+        assert response.status == 200 and json.loads(body)['schema'] == f'schemas/{FIELD}'
+
+    @pytest.mark.parametrize('method,path,body,status', [
+        ('POST', '/validate/core/missing.v1.schema.json', b'{}', 404),
+        ('POST', f'/validate/{FIELD}', b'{not json', 400),
+        ('GET', f'/validate/{FIELD}', None, 405),
+        ('POST', '/elsewhere', b'{}', 404),
+    ])
+    def test_errors(self, client, method, path, body, status):
+        """Test unknown schemas, bad JSON, wrong methods and unknown routes"""
+        response, payload = call(client, method, path, body)
+        assert response.status == status and 'error' in json.loads(payload)
+
+
+class TestBatchEndpoint:
+    """Test suite for POST /validate-batch"""
+
+    def test_event_routing(self, client):
+        """Test records are routed by event type, results keep line numbers and order"""
+        registry = get_registry()
+        generator = FixtureGenerator(registry, seed=2)
+        events = [
+            generator.generate(rel, index)
+            for index, rel in enumerate(sorted(build_event_routes(registry).values()) * 3)
+        ]
+        lines = [json.dumps(event) for event in events]
+        lines[4] = json.dumps(dict(events[4], event_id='bad'))
+        body = '\n'.join(lines[:6] + ['', 'not json'] + lines[6:]) + '\n'
+        response, payload = call(client, 'POST', '/validate-batch', body)
+        results = [json.loads(line) for line in payload.splitlines()]
+        assert response.status == 200
+        assert response.getheader('Content-Type') == 'application/x-ndjson'
+        assert [r['line'] for r in results] == list(range(1, 7)) + list(range(8, len(lines) + 3))
+        assert [r['valid'] for r in results].count(False) == 2
+        assert not results[4]['valid'] and results[4]['schema'].startswith('schemas/events/')
+        assert results[6]['schema'] == '<unparseable>'
+
+    def test_chunked_with_schema(self, client):
+        """Test a chunked request body validated against ?schema="""
+        generator = FixtureGenerator(get_registry(), seed=3)
+        documents = list(generator.iter_fixtures(FIELD, 20))
+        chunks = (json.dumps(document).encode() + b'\n' for document in documents)
+        client.request('POST', f'/validate-batch?schema={FIELD}', chunks, encode_chunked=True,
+                       headers={'Transfer-Encoding': 'chunked'})
+        response = client.getresponse()
+        results = [json.loads(line) for line in response.read().splitlines()]
+        assert len(results) == 20 and all(r['valid'] for r in results)
+        assert call(client, 'GET', '/status')[0].status == 200
+
+
+class TestBackpressureAndStatus:
+    """Test suite for queue limits and GET /status"""
+
+    def test_full_queue_rejects(self, sidecar, client):
+        """Test requests get 503 with Retry-After while every slot is taken"""
+        loop = sidecar.loop
+        for _ in range(sidecar.max_pending):
+            asyncio.run_coroutine_threadsafe(sidecar._slots.acquire(), loop).result(timeout=5)
+        try:
+            response, _ = call(client, 'POST', f'/validate/{FIELD}', b'{}')
+            assert response.status == 503 and response.getheader('Retry-After') == '1'
+            response, _ = call(client, 'POST', '/validate-batch', b'{}\n')
+            assert response.status == 503
+        finally:
+            for _ in range(sidecar.max_pending):
+                loop.call_soon_threadsafe(sidecar._slots.release)
+        assert call(client, 'POST', f'/validate/{FIELD}', b'{}')[0].status == 200
+
+    def test_status(self, sidecar, client):
+        """Test the status endpoint reports totals, queue state and throughput"""
+        call(client, 'POST', f'/validate/{FIELD}', b'{}')
+        response, body = call(client, 'GET', '/status')
+        status = json.loads(body)
+        assert response.status == 200 and status['status'] == 'ok'
+        assert status['records'] == status['valid'] + status['invalid'] > 0
+        assert status['queue']['max_pending'] == 2 and status['queue']['rejected'] >= 0
+        assert status['records_per_second'] > 0 and status['recent_records_per_second'] > 0
+        assert status['schemas'][f'schemas/{FIELD}']['invalid'] >= 1
+
+    def test_broken_pool_is_replaced_once(self, sidecar, client):
+        """Test chunks failing with BrokenProcessPool replace the pool, but only once"""
+        loop = sidecar.loop
+        broken = sidecar._pool
+
+        async def fail_chunks():
+            # Every chunk in flight on a dead pool fails; mid-stream nobody else restarts it
+            for _ in range(sidecar.max_pending):
+                await sidecar._slots.acquire()
+                sidecar.in_flight += 1
+            replacements = []
+            for _ in range(sidecar.max_pending):
+                future = loop.create_future()
+                future.set_exception(BrokenProcessPool())
+                sidecar._release(broken, future)
+                replacements.append(sidecar._pool)
+            # Fork the new worker before this test's client socket exists, or the child
+            # inherits it and the server never sees the client hang up
+            await loop.run_in_executor(sidecar._pool, os.getpid)
+            return replacements
+
+        replacements = asyncio.run_coroutine_threadsafe(fail_chunks(), loop).result(timeout=5)
+        assert replacements[0] is not broken
+        assert all(pool is replacements[0] for pool in replacements)
+        assert sidecar.in_flight == 0
+        assert call(client, 'POST', f'/validate/{FIELD}', b'{}')[0].status == 200
+
+
+class TestParseHead:
+    """Test suite for request parsing"""
+
+    def test_keep_alive_rules(self):
+        """Test HTTP/1.1 defaults to keep-alive and HTTP/1.0 needs it requested"""
+        assert parse_head(b'GET /status HTTP/1.1\r\nHost: x\r\n\r\n').keep_alive
+        assert not parse_head(b'GET /status HTTP/1.1\r\nConnection: close\r\n\r\n').keep_alive
+        assert not parse_head(b'GET /status HTTP/1.0\r\n\r\n').keep_alive
+        assert parse_head(b'GET /status HTTP/1.0\r\nConnection: Keep-Alive\r\n\r\n').keep_alive
+
+    def test_query_and_malformed(self):
+        """Test query parsing and 400 for malformed request lines"""
+        request = parse_head(b'POST /validate-batch?schema=a%2Fb HTTP/1.1\r\n\r\n')
+        assert request.path == '/validate-batch' and request.query == {'schema': ['a/b']}
+        with pytest.raises(SidecarError) as excinfo:
+            parse_head(b'garbage\r\n\r\n')
+        assert excinfo.value.status == 400
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""BOUND:TESTS_VERIFY_INTAKE"""
+"""
+Test: Intake Integrity Verifier
+
+Tests manifest-vs-card verification (tools/verify_intake.py):
+- Matching files pass with read and mmap hashing
+- Hash, size, missing-file and path-escape problems become ThreatDetails
+- Unreadable files and malformed FileEntries are findings, not exceptions
+- total_files / total_size_bytes inconsistencies are reported
+- Progress is streamed for every file
+"""
+
+import hashlib
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+try:
+    from jsonschema import Draft202012Validator
+    from contract_registry import get_registry
+    import verify_intake
+    from verify_intake import hash_file, verify_manifest
+except ImportError:
+    pytest.skip("jsonschema not installed", allow_module_level=True)
+
+
+@pytest.fixture
+def card(tmp_path: Path) -> tuple:
+    """A fake memory card with a matching manifest"""
+    root = tmp_path / 'card'
+    files = {
+        'DCIM/100MEDIA/DJI_0001.JPG': b'\xff\xd8' + bytes(range(256)) * 5000,
+        'DCIM/100MEDIA/DJI_0002.JPG': b'\xff\xd8' + b'x' * 3000,
+        'FLIGHT_LOGS/FLIGHT_001.txt': b'',
+    }
+    entries = []
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        entries.append({
+            'path': rel,
+            'name': path.name,
+            'size_bytes': len(data),
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'mime_type': 'image/jpeg',
+        })
+    manifest = {
+        'id': 'manifest_60a7f1b8c9d4e5f6a7b8c9d1',
+        'files': entries,
+        'total_files': len(entries),
+        'total_size_bytes': sum(len(data) for data in files.values()),
+    }
+    return root, manifest
+
+
+class TestVerifyIntake:
+    """Test suite for verify_intake"""
+
+    def test_hash_file_modes(self, card: tuple):
+        """Test block reads and mmap give hashlib's digest"""
+        root, manifest = card
+        for entry in manifest['files']:
+            path = root / entry['path']
+            assert hash_file(path, block_size=4096) == entry['sha256']
+            assert hash_file(path, use_mmap=True) == entry['sha256']
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def test_clean_card(self, card: tuple, workers: int):
+        """Test that a matching card passes and progress covers every file"""
+        root, manifest = card
+        seen = []
+        report = verify_manifest(manifest, root, workers=workers, progress=seen.append)
+        assert report.ok, report.threats
+        assert report.files_checked == 3
+        assert seen[-1].files_done == 3
+        assert seen[-1].bytes_done == manifest['total_size_bytes']
+
+    def test_findings(self, card: tuple):
+        """Test hash/size/missing/escape/total problems map to threat types"""
+        root, manifest = card
+        (root / 'DCIM/100MEDIA/DJI_0002.JPG').write_bytes(b'\xff\xd8' + b'y' * 3000)
+        (root / 'FLIGHT_LOGS/FLIGHT_001.txt').write_bytes(b'extra')
+        manifest['files'].append(dict(manifest['files'][0], path='DCIM/100MEDIA/DJI_0003.JPG'))
+        manifest['files'].append(dict(manifest['files'][0], path='../outside.JPG'))
+
+        report = verify_manifest(manifest, root, workers=2)
+        found = {(t['file_path'], t['threat_type'], t['severity']) for t in report.threats}
+        assert found == {
+            ('', 'SIZE_ANOMALY', 'MEDIUM'),
+            ('DCIM/100MEDIA/DJI_0002.JPG', 'HASH_MISMATCH', 'HIGH'),
+            ('FLIGHT_LOGS/FLIGHT_001.txt', 'SIZE_ANOMALY', 'MEDIUM'),
+            ('DCIM/100MEDIA/DJI_0003.JPG', 'FAILED_INTEGRITY_CHECK', 'LOW'),
+            ('../outside.JPG', 'POLICY_VIOLATION', 'HIGH'),
+        }
+        assert len([t for t in report.threats if t['file_path'] == '']) == 2
+
+    def test_unreadable_paths_are_findings(self, card: tuple, monkeypatch):
+        """Test OSErrors from stat/hash become FAILED_INTEGRITY_CHECK naming the error"""
+        root, manifest = card
+        # DJI_0001.JPG is a regular file, so stat() of a child raises NotADirectoryError
+        manifest['files'].append(dict(manifest['files'][1],
+                                      path='DCIM/100MEDIA/DJI_0001.JPG/nested.JPG'))
+        real_hash_file = verify_intake.hash_file
+
+        def failing_hash_file(path, *args, **kwargs):
+            if path.name == 'DJI_0002.JPG':
+                raise OSError(5, 'Input/output error')
+            return real_hash_file(path, *args, **kwargs)
+
+        monkeypatch.setattr(verify_intake, 'hash_file', failing_hash_file)
+        report = verify_manifest(manifest, root, workers=2)
+        found = {(t['file_path'], t['threat_type'], t['threat_name'])
+                 for t in report.threats if t['file_path']}
+        assert found == {
+            ('DCIM/100MEDIA/DJI_0001.JPG/nested.JPG', 'FAILED_INTEGRITY_CHECK',
+             'Cannot read file: Not a directory'),
+            ('DCIM/100MEDIA/DJI_0002.JPG', 'FAILED_INTEGRITY_CHECK',
+             'Cannot read file: Input/output error'),
+        }
+        assert report.files_checked == 4
+
+    @pytest.mark.parametrize('missing', ['path', 'size_bytes', 'sha256'])
+    def test_malformed_entry_is_a_finding(self, card: tuple, missing: str):
+        """Test a FileEntry without path/size_bytes/sha256 is reported, not raised"""
+        root, manifest = card
+        entry = dict(manifest['files'][1])
+        del entry[missing]
+        manifest['files'][1] = entry
+
+        report = verify_manifest(manifest, root, workers=2)
+        integrity = [t for t in report.threats if t['threat_type'] == 'FAILED_INTEGRITY_CHECK']
+        assert len(integrity) == 1
+        assert missing in integrity[0]['threat_name']
+        assert report.files_checked == 3
+
+    def test_threats_are_valid_threat_details(self, card: tuple):
+        """Test report entries validate as intake_manifest ThreatDetail objects"""
+        root, manifest = card
+        manifest['total_files'] = 99
+        report = verify_manifest(manifest, root)
+        registry = get_registry()
+        schema = registry.schema('edge/intake_manifest.v1.schema.json')
+        detail_schema = dict(schema['$defs']['ThreatDetail'], **{'$schema': schema['$schema']})
+        for threat in report.threats:
+            Draft202012Validator(detail_schema).validate(threat)
+        assert json.loads(json.dumps(report.to_dict()))['ok'] is False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,835 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz API Validation Middleware
+
+Validates HTTP requests and responses against an OpenAPI spec in api/
+(default: platform_public.v1) as ASGI or WSGI middleware.
+
+Everything is compiled once at startup:
+
+- the spec's paths go into a `RouteTrie` keyed by path segment, so matching
+  `/v1/missions/mission_.../accept` walks one node per segment instead of
+  trying every templated path; literal segments win over `{param}` segments
+- each operation gets its parameter checks (with query/path/header string
+  coercion to the declared `integer` / `number` / `boolean` type) and one
+  validator per request/response media type; bodies that are plain contract
+  schemas use the generated fast predicate (`generate_validators`) first and
+  fall back to the registry validator only for error details
+- every operation keeps `OperationStats`: request/response counts, failures
+  and a bucketed histogram of the time spent validating
+
+Invalid requests get a 4xx `ErrorResponse` (api/components/responses.yaml)
+without reaching the app. Response violations are counted and passed to
+`on_response_error`; with `strict_responses=True` they become a 500. With a
+`sampler` (response_sampling.py) only sampled responses are buffered and
+checked, at an adaptive rate per operation.
+
+Usage:
+    from api_middleware import ApiValidator, AsgiValidationMiddleware
+
+    app = AsgiValidationMiddleware(app)                  # platform_public.v1
+    app = WsgiValidationMiddleware(app, ApiValidator("edge_local.v1"))
+
+    python3 tools/api_middleware.py --routes             # compiled route table
+    python3 tools/api_middleware.py --benchmark 20000    # per-request overhead
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timezone
+from http.cookies import SimpleCookie
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs, unquote, urldefrag, urlsplit
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import BASE_DIR  # noqa: E402
+from generate_validators import UnsupportedSchemaError, compile_validator  # noqa: E402
+from openapi_loader import OpenApiLoader, Operation, get_openapi_loader  # noqa: E402
+from response_sampling import ResponseSampler  # noqa: E402
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+DEFAULT_SPEC = "platform_public.v1"
+
+# Upper bounds (µs) of the validation latency histogram; the last bucket is unbounded
+LATENCY_BUCKETS_US = (25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 50_000)
+
+# Keyword type -> parser for parameters that arrive as strings
+_COERCE: dict[str, Callable[[str], Any]] = {
+    "integer": int,
+    "number": float,
+    "boolean": lambda value: {"true": True, "false": False}[value.lower()],
+}
+
+SchemaCheck = Callable[[Any], "str | None"]
+
+
+class RequestValidationError(ValueError):
+    """A request that does not match the spec; carries the HTTP status to answer with"""
+
+    def __init__(self, status: int, code: str, message: str, details: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.details = details or {}
+
+
+class ResponseValidationError(ValueError):
+    """A response body that does not match its documented schema"""
+
+    def __init__(self, operation: str, status: int, message: str):
+        super().__init__(f"{operation} -> {status}: {message}")
+        self.operation = operation
+        self.status = status
+
+
+class LatencyCounter:
+    """Count, total and bucketed histogram of durations"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_US) + 1)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[bisect_left(LATENCY_BUCKETS_US, seconds * 1e6)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound in µs of the bucket holding the q-th percentile (max when unbounded)"""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_US, self.buckets):
+            seen += count
+            if seen >= rank:
+                return float(bound)
+        return self.max * 1e6
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count * 1e6 if self.count else 0.0,
+            "p50_us": self.percentile(50),
+            "p99_us": self.percentile(99),
+            "max_us": self.max * 1e6,
+        }
+
+
+class OperationStats:
+    """Per-operation counters, updated under one small lock"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.request_failures = 0
+        self.responses = 0
+        self.response_failures = 0
+        self.latency = LatencyCounter()
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, response: bool, failed: bool) -> None:
+        with self._lock:
+            if response:
+                self.responses += 1
+                self.response_failures += failed
+            else:
+                self.requests += 1
+                self.request_failures += failed
+            self.latency.record(seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "request_failures": self.request_failures,
+                "responses": self.responses,
+                "response_failures": self.response_failures,
+                "validation": self.latency.snapshot(),
+            }
+
+
+class ParameterCheck(NamedTuple):
+    """A compiled Parameter Object"""
+
+    name: str
+    location: str
+    required: bool
+    coerce: Callable[[str], Any] | None
+    check: SchemaCheck | None
+
+
+class CompiledOperation(NamedTuple):
+    """One operation with every check it needs, built once at startup"""
+
+    key: str                                   # "GET /fields/{field_id}"
+    operation: Operation
+    parameters: tuple[ParameterCheck, ...]
+    body: dict[str, SchemaCheck]               # media type -> check
+    responses: dict[str, dict[str, SchemaCheck]]
+    stats: OperationStats
+
+
+class _Node:
+    __slots__ = ("literals", "param", "names", "methods")
+
+    def __init__(self) -> None:
+        self.literals: dict[str, _Node] = {}
+        self.param: _Node | None = None
+        self.names: tuple[str, ...] = ()           # template parameter names, on leaves
+        self.methods: dict[str, CompiledOperation] = {}
+
+
+class RouteTrie:
+    """Templated paths in a trie keyed by `/`-separated segment"""
+
+    def __init__(self) -> None:
+        self._root = _Node()
+
+    def insert(self, path: str, method: str, operation: CompiledOperation) -> None:
+        node = self._root
+        names = []
+        for segment in path.strip("/").split("/"):
+            if segment.startswith("{") and segment.endswith("}"):
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+                names.append(segment[1:-1])
+            else:
+                node = node.literals.setdefault(segment, _Node())
+        if node.methods and node.names != tuple(names):
+            raise ValueError(f"Ambiguous path template {path}")
+        node.names = tuple(names)
+        node.methods[method] = operation
+
+    def match(self, path: str) -> tuple[dict[str, CompiledOperation], dict[str, str]] | None:
+        """(operations by method, path parameters) for a concrete path, or None"""
+        values: list[str] = []
+        node = self._find(self._root, path.strip("/").split("/"), 0, values)
+        if node is None:
+            return None
+        return node.methods, dict(zip(node.names, reversed(values)))
+
+    def _find(self, node: _Node, segments: list[str], i: int, values: list[str]) -> _Node | None:
+        """Depth-first match, literal segments before parameters; values collect leaf-first"""
+        if i == len(segments):
+            return node if node.methods else None
+        child = node.literals.get(segments[i])
+        if child is not None:
+            found = self._find(child, segments, i + 1, values)
+            if found is not None:
+                return found
+        if node.param is not None and segments[i]:
+            found = self._find(node.param, segments, i + 1, values)
+            if found is not None:
+                values.append(unquote(segments[i]))
+                return found
+        return None
+
+
+def _media_type(content_type: str | None) -> str:
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def _is_json(media_type: str) -> bool:
+    return media_type == "application/json" or media_type.endswith("+json")
+
+
+class ApiValidator:
+    """Compiled routes and checks for one OpenAPI spec"""
+
+    def __init__(self, spec: str = DEFAULT_SPEC, loader: OpenApiLoader | None = None,
+                 base_path: str | None = None, fast: bool = True):
+        self.loader = loader or get_openapi_loader()
+        self.spec = spec
+        self.fast = fast
+        if base_path is None:
+            servers = self.loader.spec(spec).get("servers") or [{}]
+            base_path = urlsplit(servers[0].get("url", "")).path
+        self.base_path = base_path.rstrip("/")
+        self.trie = RouteTrie()
+        self.operations: dict[str, CompiledOperation] = {}
+        self._checks: dict[str, SchemaCheck] = {}
+
+        for operation in self.loader.operations(spec):
+            compiled = self._compile(operation)
+            self.trie.insert(operation.path, operation.method, compiled)
+            self.operations[compiled.key] = compiled
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _target(self, schema_ref: str) -> tuple[Any, str]:
+        """Schema node behind a ref, following YAML-to-YAML and YAML-to-contract refs"""
+        return self.loader.follow(self.loader.lookup(schema_ref), schema_ref)
+
+    def _schema_check(self, schema_ref: str) -> SchemaCheck:
+        """Fast predicate for plain contract schemas, registry validator for details"""
+        cached = self._checks.get(schema_ref)
+        if cached is not None:
+            return cached
+
+        validator = self.loader.validator(schema_ref)
+        predicate = None
+        _, uri = self._target(schema_ref)
+        doc_uri, fragment = urldefrag(uri)
+        if self.fast and not fragment and doc_uri in self.loader.registry:
+            try:
+                predicate = compile_validator(doc_uri, self.loader.registry)
+            except UnsupportedSchemaError:
+                predicate = None
+
+        def check(instance: Any) -> str | None:
+            if predicate is not None and predicate(instance):
+                return None
+            error = next(validator.iter_errors(instance), None)
+            return None if error is None else f"{error.json_path}: {error.message}"
+
+        self._checks[schema_ref] = check
+        return check
+
+    def _compile(self, operation: Operation) -> CompiledOperation:
+        parameters = []
+        for p in operation.parameters:
+            coerce = None
+            param_check: SchemaCheck | None = None
+            if p.schema_ref is not None:
+                schema, _ = self._target(p.schema_ref)
+                # A list-valued `type` (e.g. ["integer", "null"]) gets no coercion
+                if isinstance(schema, dict) and isinstance(schema.get("type"), str):
+                    coerce = _COERCE.get(schema["type"])
+                param_check = self._schema_check(p.schema_ref)
+            name = p.name.lower() if p.location == "header" else p.name
+            parameters.append(ParameterCheck(name, p.location, p.required, coerce, param_check))
+
+        body = {
+            media_type: self._schema_check(ref)
+            for media_type, ref in operation.request_body.items()
+        }
+        responses = {
+            status: {media_type: self._schema_check(ref) for media_type, ref in content.items()}
+            for status, content in operation.responses.items()
+        }
+        return CompiledOperation(
+            f"{operation.method} {operation.path}", operation, tuple(parameters), body,
+            responses, OperationStats(),
+        )
+
+    # ------------------------------------------------------------------
+    # Matching and validation
+    # ------------------------------------------------------------------
+
+    def match(self, method: str, path: str) -> tuple[CompiledOperation, dict[str, str]]:
+        """Operation and path parameters for a request; 404/405 as RequestValidationError"""
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path):] or "/"
+        found = self.trie.match(path)
+        if found is None:
+            raise RequestValidationError(404, "NOT_FOUND", f"No operation for path {path}")
+        methods, params = found
+        operation = methods.get(method.upper())
+        if operation is None:
+            raise RequestValidationError(
+                405, "METHOD_NOT_ALLOWED", f"{method.upper()} is not allowed on {path}",
+                {"allowed": sorted(methods)},
+            )
+        return operation, params
+
+    def _check_parameters(self, operation: CompiledOperation,
+                          sources: dict[str, Mapping[str, Any]]) -> None:
+        for p in operation.parameters:
+            raw = sources[p.location].get(p.name)
+            if raw is None:
+                if p.required:
+                    raise RequestValidationError(
+                        400, "VALIDATION_ERROR",
+                        f"Missing required {p.location} parameter {p.name}",
+                        {"parameter": p.name, "in": p.location},
+                    )
+                continue
+            value: Any = raw
+            if p.coerce is not None:
+                try:
+                    value = p.coerce(raw)
+                except (ValueError, KeyError):
+                    value = raw  # keep the string; the schema reports the type error
+            message = p.check(value) if p.check is not None else None
+            if message is not None:
+                raise RequestValidationError(
+                    400, "VALIDATION_ERROR", f"Invalid {p.location} parameter {p.name}",
+                    {"parameter": p.name, "in": p.location, "error": message},
+                )
+
+    def validate_request(
+        self,
+        method: str,
+        path: str,
+        query: str = "",
+        headers: Mapping[str, str] | None = None,
+        body: bytes = b"",
+        content_type: str | None = None,
+    ) -> CompiledOperation:
+        """Check a request (header names lower-case); raises RequestValidationError"""
+        started = time.perf_counter()
+        operation, path_params = self.match(method, path)
+        headers = headers or {}
+        failed = True
+        try:
+            query_params = {
+                name: values[0]
+                for name, values in parse_qs(query, keep_blank_values=True).items()
+            } if query else {}
+            cookies: dict[str, str] = {}
+            if "cookie" in headers and any(p.location == "cookie" for p in operation.parameters):
+                jar: SimpleCookie = SimpleCookie()
+                jar.load(headers["cookie"])
+                cookies = {name: morsel.value for name, morsel in jar.items()}
+            self._check_parameters(operation, {
+                "path": path_params, "query": query_params, "header": headers, "cookie": cookies,
+            })
+            self._check_body(operation, body, content_type)
+            failed = False
+        finally:
+            operation.stats.record(time.perf_counter() - started, False, failed)
+        return operation
+
+    def _check_body(self, operation: CompiledOperation, body: bytes,
+                    content_type: str | None) -> None:
+        if not body:
+            if operation.operation.body_required:
+                raise RequestValidationError(400, "VALIDATION_ERROR", "Request body is required")
+            return
+        if not operation.body:
+            return
+        media_type = _media_type(content_type)
+        check = operation.body.get(media_type)
+        if check is None:
+            raise RequestValidationError(
+                415, "UNSUPPORTED_MEDIA_TYPE", f"Unsupported media type {media_type or '(none)'}",
+                {"supported": sorted(operation.body)},
+            )
+        if not _is_json(media_type):
+            return
+        try:
+            document = _loads(body)
+        except ValueError as exc:
+            raise RequestValidationError(
+                400, "VALIDATION_ERROR", f"Invalid JSON body: {exc}",
+            ) from None
+        message = check(document)
+        if message is not None:
+            raise RequestValidationError(
+                400, "VALIDATION_ERROR", "Request body does not match schema", {"error": message},
+            )
+
+    def response_check(self, operation: CompiledOperation, status: int,
+                       content_type: str | None) -> SchemaCheck | None:
+        """Check for a response (exact status, then `4XX`, then `default`), None if undocumented"""
+        responses = operation.responses
+        content = (
+            responses.get(str(status))
+            or responses.get(f"{str(status)[0]}XX")
+            or responses.get("default")
+        )
+        if not content:
+            return None
+        media_type = _media_type(content_type)
+        return content.get(media_type) if _is_json(media_type) else None
+
+    def validate_response(self, operation: CompiledOperation, status: int,
+                          content_type: str | None, body: bytes) -> None:
+        """Check a response body; raises ResponseValidationError"""
+        check = self.response_check(operation, status, content_type)
+        if check is None:
+            return
+        started = time.perf_counter()
+        message = None
+        try:
+            try:
+                message = check(_loads(body))
+            except ValueError as exc:
+                message = f"Invalid JSON body: {exc}"
+        finally:
+            operation.stats.record(time.perf_counter() - started, True, message is not None)
+        if message is not None:
+            raise ResponseValidationError(operation.key, status, message)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Counters and validation latency per operation key"""
+        return {key: operation.stats.snapshot() for key, operation in self.operations.items()}
+
+
+def error_body(exc: RequestValidationError, request_id: str | None = None) -> bytes:
+    """`ErrorResponse` JSON for a rejected request"""
+    return json.dumps({"error": {
+        "code": exc.code,
+        "message": str(exc),
+        "details": exc.details,
+        "request_id": request_id or f"req_{uuid.uuid4().hex[:12]}",
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+    }}).encode("utf-8")
+
+
+def _response_failure(exc: ResponseValidationError) -> RequestValidationError:
+    return RequestValidationError(
+        500, "RESPONSE_VALIDATION_FAILED", "Response does not match the API contract",
+        {"operation": exc.operation, "status": exc.status},
+    )
+
+
+class _MiddlewareBase:
+    def __init__(
+        self,
+        app: Any,
+        validator: ApiValidator | None = None,
+        *,
+        validate_responses: bool = True,
+        strict_responses: bool = False,
+        allow_unknown: bool = True,
+        on_response_error: Callable[[ResponseValidationError], None] | None = None,
+        sampler: ResponseSampler | None = None,
+    ):
+        self.app = app
+        self.validator = validator or ApiValidator()
+        self.validate_responses = validate_responses
+        self.strict_responses = strict_responses
+        self.allow_unknown = allow_unknown
+        self.on_response_error = on_response_error
+        self.sampler = sampler
+
+    def _route(self, method: str,
+               path: str) -> tuple[CompiledOperation | None, RequestValidationError | None]:
+        """Matched operation, or the 404/405 to answer (None, None passes through)"""
+        try:
+            return self.validator.match(method, path)[0], None
+        except RequestValidationError as exc:
+            return None, None if self.allow_unknown else exc
+
+    def _should_check(self, operation: CompiledOperation, status: int,
+                      content_type: str | None) -> bool:
+        """True when the response is documented and, with a sampler, picked for checking"""
+        if self.validator.response_check(operation, status, content_type) is None:
+            return False
+        return self.sampler is None or self.sampler.should_sample(operation.key)
+
+    def _check_response(self, operation: CompiledOperation, status: int,
+                        content_type: str | None, body: bytes) -> RequestValidationError | None:
+        try:
+            self.validator.validate_response(operation, status, content_type, body)
+        except ResponseValidationError as exc:
+            if self.sampler is not None:
+                self.sampler.record(operation.key, True)
+            if self.on_response_error is not None:
+                self.on_response_error(exc)
+            if self.strict_responses:
+                return _response_failure(exc)
+            return None
+        if self.sampler is not None:
+            self.sampler.record(operation.key, False)
+        return None
+
+
+class AsgiValidationMiddleware(_MiddlewareBase):
+    """ASGI 3 middleware; buffers request bodies and JSON response bodies it must check"""
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable[[], Awaitable[dict]],
+                       send: Callable[[dict], Awaitable[None]]) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+        operation, rejected = self._route(method, path)
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", ())
+        }
+        if rejected is not None:
+            await self._send_error(send, rejected, headers.get("x-request-id"))
+            return
+        if operation is None:
+            await self.app(scope, receive, send)
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+
+        try:
+            self.validator.validate_request(
+                method, path, scope.get("query_string", b"").decode("latin-1"), headers, body,
+                headers.get("content-type"),
+            )
+        except RequestValidationError as exc:
+            await self._send_error(send, exc, headers.get("x-request-id"))
+            return
+
+        replayed = False
+
+        async def replay() -> dict:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        if not self.validate_responses:
+            await self.app(scope, replay, send)
+            return
+
+        start: dict[str, Any] = {}
+        buffered: list[bytes] = []
+        checking = False
+
+        async def capture(message: dict) -> None:
+            nonlocal checking
+            if message["type"] == "http.response.start":
+                start.update(message)
+                response_headers = {
+                    name.decode("latin-1").lower(): value.decode("latin-1")
+                    for name, value in message.get("headers", ())
+                }
+                start["content_type"] = response_headers.get("content-type")
+                checking = self._should_check(operation, message["status"], start["content_type"])
+                if not checking:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or not checking:
+                await send(message)
+                return
+            buffered.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            payload = b"".join(buffered)
+            failure = self._check_response(
+                operation, start["status"], start["content_type"], payload,
+            )
+            if failure is not None:
+                await self._send_error(send, failure, headers.get("x-request-id"))
+                return
+            await send({key: value for key, value in start.items() if key != "content_type"})
+            await send({"type": "http.response.body", "body": payload, "more_body": False})
+
+        await self.app(scope, replay, capture)
+
+    @staticmethod
+    async def _send_error(send: Callable[[dict], Awaitable[None]], exc: RequestValidationError,
+                          request_id: str | None) -> None:
+        payload = error_body(exc, request_id)
+        await send({
+            "type": "http.response.start",
+            "status": exc.status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": payload, "more_body": False})
+
+
+class _ResumedBody:
+    """Pass-through WSGI body whose first chunk the middleware already pulled"""
+
+    def __init__(self, head: list[bytes], rest: Iterator[bytes], result: Iterable[bytes]):
+        self._chunks = chain(head, rest)
+        self._result = result
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._chunks
+
+    def close(self) -> None:
+        if hasattr(self._result, "close"):
+            self._result.close()
+
+
+class WsgiValidationMiddleware(_MiddlewareBase):
+    """WSGI middleware; buffers request bodies and JSON response bodies it must check"""
+
+    def __call__(self, environ: dict[str, Any],
+                 start_response: Callable[..., Any]) -> Iterable[bytes]:
+        method = environ["REQUEST_METHOD"]
+        path = environ.get("PATH_INFO", "") or "/"
+        request_id = environ.get("HTTP_X_REQUEST_ID")
+        operation, rejected = self._route(method, path)
+        if rejected is not None:
+            return self._error(start_response, rejected, request_id)
+        if operation is None:
+            return self.app(environ, start_response)  # type: ignore[no-any-return]
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        body = environ["wsgi.input"].read(length) if length > 0 else b""
+        environ["wsgi.input"] = io.BytesIO(body)
+
+        headers = {
+            key[5:].replace("_", "-").lower(): value
+            for key, value in environ.items()
+            if key.startswith("HTTP_")
+        }
+        if environ.get("CONTENT_TYPE"):
+            headers["content-type"] = environ["CONTENT_TYPE"]
+        try:
+            self.validator.validate_request(
+                method, path, environ.get("QUERY_STRING", ""), headers, body,
+                headers.get("content-type"),
+            )
+        except RequestValidationError as exc:
+            return self._error(start_response, exc, request_id)
+
+        if not self.validate_responses:
+            return self.app(environ, start_response)  # type: ignore[no-any-return]
+
+        captured: dict[str, Any] = {}
+        passed: list[bool] = []
+        buffered: list[bytes] = []
+
+        def capture(status: str, response_headers: list[tuple[str, str]],
+                    exc_info: Any = None) -> Callable[[bytes], Any]:
+            content_type = next(
+                (value for name, value in response_headers if name.lower() == "content-type"), None,
+            )
+            code = int(status.split(" ", 1)[0])
+            if not self._should_check(operation, code, content_type):
+                passed.append(True)
+                return start_response(  # type: ignore[no-any-return]
+                    status, response_headers, exc_info,
+                )
+            captured.update(status=status, headers=response_headers, code=code,
+                            content_type=content_type)
+            return buffered.append
+
+        result = self.app(environ, capture)
+        if passed:
+            return result  # type: ignore[no-any-return]
+        head: list[bytes] = []
+        chunks = iter(result)
+        if not captured:
+            # PEP 3333 lets an app (any generator) call start_response on its first iteration
+            try:
+                head.extend(islice(chunks, 1))
+            except BaseException:
+                if hasattr(result, "close"):
+                    result.close()
+                raise
+            if not captured:
+                return _ResumedBody(head, chunks, result)
+        try:
+            buffered.extend(head)
+            buffered.extend(chunks)
+        finally:
+            if hasattr(result, "close"):
+                result.close()
+        payload = b"".join(buffered)
+        failure = self._check_response(
+            operation, captured["code"], captured["content_type"], payload,
+        )
+        if failure is not None:
+            return self._error(start_response, failure, request_id)
+        start_response(captured["status"], captured["headers"])
+        return [payload]
+
+    @staticmethod
+    def _error(start_response: Callable[..., Any], exc: RequestValidationError,
+               request_id: str | None) -> list[bytes]:
+        payload = error_body(exc, request_id)
+        reason = {400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                  415: "Unsupported Media Type", 500: "Internal Server Error"}
+        start_response(f"{exc.status} {reason.get(exc.status, 'Error')}", [
+            ("Content-Type", "application/json"),
+            ("Content-Length", str(len(payload))),
+        ])
+        return [payload]
+
+
+def benchmark(requests: int, validator: ApiValidator | None = None) -> dict[str, float]:
+    """Per-request validation overhead (µs) over a mix of platform_public.v1 calls"""
+    validator = validator or ApiValidator()
+    field = (BASE_DIR / "docs" / "examples" / "field.example.json").read_bytes()
+    field_id = json.loads(field)["id"]
+    calls = [
+        ("GET", f"{validator.base_path}/fields", "page=2&page_size=50&crop_type=COTTON", b"", None),
+        ("GET", f"{validator.base_path}/fields/{field_id}", "", b"", None),
+        ("PUT", f"{validator.base_path}/fields/{field_id}", "", field, "application/json"),
+        ("POST", f"{validator.base_path}/missions/mission_60a7f1b8c9d4e5f6a7b8c9d0/accept",
+         "", b"", None),
+    ]
+    headers = {"content-type": "application/json"}
+    for call in calls:
+        validator.validate_request(call[0], call[1], call[2], headers, call[3], call[4])
+
+    timings = []
+    for i in range(requests):
+        method, path, query, body, content_type = calls[i % len(calls)]
+        started = time.perf_counter()
+        validator.validate_request(method, path, query, headers, body, content_type)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "requests": requests,
+        "p50_us": timings[len(timings) // 2] * 1e6,
+        "p99_us": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1e6,
+        "max_us": timings[-1] * 1e6,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile an OpenAPI spec into validation middleware",
+    )
+    parser.add_argument("--spec", default=DEFAULT_SPEC, help="Spec name in api/")
+    parser.add_argument("--routes", action="store_true", help="List compiled operations")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Time N request validations")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    validator = ApiValidator(args.spec)
+    elapsed = time.perf_counter() - started
+    print(f"🔍 {args.spec}: {len(validator.operations)} operations compiled "
+          f"in {elapsed * 1000:.1f} ms (base path {validator.base_path or '/'})")
+
+    if args.routes:
+        for key, operation in validator.operations.items():
+            print(f"  {key}: {len(operation.parameters)} params, "
+                  f"body {sorted(operation.body) or '-'}, responses {sorted(operation.responses)}")
+
+    if args.benchmark:
+        result = benchmark(args.benchmark, validator)
+        print(f"⏱  {result['requests']} requests: p50 {result['p50_us']:.0f} µs, "
+              f"p99 {result['p99_us']:.0f} µs, max {result['max_us']:.0f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Contract Benchmarks
+
+Measures validation throughput and latency for every schema in schemas/, plus
+the tooling hot paths, and compares them with stored baselines so validator
+regressions fail CI instead of shipping unnoticed.
+
+- Schemas: each is validated with its registry validator on a corpus of
+  synthetic documents (tools/generate_fixtures.py) in three sizes:
+  `small` (required properties only, shortest arrays), `typical` (half the
+  optional properties, a few items per array) and `large` (every property,
+  10 items per array; 1000 manifest files, 100 result layers and features,
+  500-vertex rings). Reported as docs/s, p50 and p99 latency.
+- Tools: contracts checksum (compute_contracts_sha256.py), breaking-change
+  detection of the tree against itself, and validate.py's policy lint over
+  schemas/ and enums/ (uncached) plus the OpenAPI specs.
+
+Baselines are stored as JSON keyed by the pinned CONTRACTS_VERSION, one entry
+per case. A case regresses when its throughput falls more than `threshold`
+below the baseline. Settings come from `[tool.tarlaanaliz.benchmark]` in
+pyproject.toml. Numbers are machine-specific, so baselines default to
+build/ and should be recorded on the machine (or CI runner) that compares.
+
+Usage:
+    python3 tools/benchmark.py --update        # record the baseline for this version
+    python3 tools/benchmark.py                 # compare; exit 1 on regression
+    python3 tools/benchmark.py --schema core/field.v1.schema.json --sizes small,large
+    python3 tools/benchmark.py --no-tools --json build/benchmark.json
+
+    pytest -m benchmark                        # same comparison as a test
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import tomllib  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        tomllib = None
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import BASE_DIR, ContractRegistry, contracts_lock, get_registry  # noqa: E402
+from generate_fixtures import FixtureGenerator  # noqa: E402
+
+# Fixture settings per payload size
+PAYLOAD_SIZES = {
+    "small": {"optional": 0.0, "array_size": 0},
+    "typical": {"optional": 0.5, "array_size": None},
+    "large": {
+        "optional": 1.0, "array_size": 10,
+        "sizes": {"files": 1000, "layers": 100, "features": 100, "coordinates": 500},
+    },
+}
+
+DEFAULT_BASELINE = BASE_DIR / "build" / "benchmark_baselines.json"
+
+
+class BenchmarkSettings(NamedTuple):
+    """Measurement and comparison settings"""
+
+    threshold: float = 0.25     # allowed throughput drop before a case regresses
+    min_time: float = 0.2       # seconds spent timing each case
+    corpus: int = 20            # distinct documents per schema and size
+    seed: int = 0
+
+
+class BenchResult(NamedTuple):
+    """Throughput and latency of one case"""
+
+    name: str
+    runs: int
+    ops_per_sec: float
+    p50_us: float
+    p99_us: float
+
+
+class Regression(NamedTuple):
+    """A case whose throughput fell below its baseline by more than the threshold"""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1.0
+
+
+def load_settings(pyproject: Path = BASE_DIR / "pyproject.toml") -> BenchmarkSettings:
+    """Settings from `[tool.tarlaanaliz.benchmark]`; defaults when absent"""
+    config: dict[str, Any] = {}
+    if tomllib is not None and pyproject.exists():
+        with open(pyproject, "rb") as f:
+            config = tomllib.load(f).get("tool", {}).get("tarlaanaliz", {}).get("benchmark", {})
+    defaults = BenchmarkSettings()
+    return BenchmarkSettings(**{
+        name: type(getattr(defaults, name))(config.get(name, getattr(defaults, name)))
+        for name in BenchmarkSettings._fields
+    })
+
+
+def _percentile(ordered: Sequence[int], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] / 1000.0
+
+
+def measure(
+    name: str,
+    call: Callable[[Any], Any],
+    inputs: Sequence[Any],
+    min_time: float,
+    min_runs: int = 1,
+    repeat: int = 5,
+) -> BenchResult:
+    """Call `call` on the inputs round-robin for at least `min_time` seconds
+
+    The time is split into `repeat` rounds of at least `min_runs` calls each,
+    and throughput is that of the fastest round, as `timeit` recommends:
+    slower rounds measure interference from the rest of the machine, not the
+    code. Percentiles pool every call.
+    The garbage collector is paused while timing, so results do not depend on
+    how many objects the host process happens to hold.
+    """
+    clock = time.perf_counter_ns
+    latencies: list[int] = []
+    best = 0.0
+    count = len(inputs)
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            round_latencies: list[int] = []
+            deadline = clock() + int(min_time / repeat * 1e9)
+            while len(round_latencies) < min_runs or clock() < deadline:
+                item = inputs[len(round_latencies) % count]
+                started = clock()
+                call(item)
+                round_latencies.append(clock() - started)
+            total = sum(round_latencies)
+            best = max(best, len(round_latencies) / (total / 1e9) if total else 0.0)
+            latencies += round_latencies
+    finally:
+        if gc_enabled:
+            gc.enable()
+    latencies.sort()
+    return BenchResult(
+        name, len(latencies), best, _percentile(latencies, 0.50), _percentile(latencies, 0.99),
+    )
+
+
+def schema_cases(
+    registry: ContractRegistry,
+    schemas: Sequence[str],
+    sizes: Sequence[str],
+    settings: BenchmarkSettings,
+) -> Iterator[tuple[str, Callable[[Any], Any], list[Any]]]:
+    """(name, validate, documents) per schema and payload size"""
+    for size in sizes:
+        generator = FixtureGenerator(registry, settings.seed, **PAYLOAD_SIZES[size])
+        for key in schemas:
+            rel = registry.resolve(key)
+            validator = registry.validator(rel)
+            documents = list(generator.iter_fixtures(rel, settings.corpus))
+            validator.is_valid(documents[0])  # build lazily compiled state before timing
+            yield f"{rel}:{size}", validator.is_valid, documents
+
+
+def tool_cases(base_dir: Path = BASE_DIR) -> list[tuple[str, Callable[[Any], Any]]]:
+    """(name, run) for the tooling hot paths over the whole tree"""
+    from breaking_change_detector import BreakingChangeDetector
+    from compute_contracts_sha256 import compute_checksum
+    from schema_policy import load_policy
+    from validate import CONTRACT_DIRS, check_api_specs, validate_files
+
+    policy = load_policy(base_dir / "pyproject.toml")
+    files = [path for name in CONTRACT_DIRS for path in sorted((base_dir / name).rglob("*.json"))]
+    schemas = base_dir / "schemas"
+    return [
+        ("tools:checksum", lambda _: compute_checksum(base_dir)),
+        ("tools:breaking_change",
+         lambda _: BreakingChangeDetector(schemas, schemas).detect_changes()),
+        ("tools:validate", lambda _: validate_files(files, policy, {})),
+        ("tools:validate_api", lambda _: check_api_specs(base_dir / "api")),
+    ]
+
+
+def run_benchmarks(
+    registry: ContractRegistry | None = None,
+    schemas: Sequence[str] | None = None,
+    sizes: Sequence[str] = tuple(PAYLOAD_SIZES),
+    tools: bool = True,
+    settings: BenchmarkSettings = BenchmarkSettings(),
+    progress: Callable[[BenchResult], None] | None = None,
+) -> list[BenchResult]:
+    """Measure the schema cases (every schema in schemas/ by default) and the tool cases"""
+    registry = registry if registry is not None else get_registry()
+    if schemas is None:
+        schemas = [rel for rel in registry.paths if rel.startswith("schemas/")]
+    results = []
+
+    def record(result: BenchResult) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    for name, call, documents in schema_cases(registry, schemas, sizes, settings):
+        record(measure(name, call, documents, settings.min_time, len(documents)))
+    if tools:
+        for name, run in tool_cases(registry.base_dir):
+            run(None)  # warm imports and the OpenAPI loader cache
+            record(measure(name, run, [None], settings.min_time))
+    return results
+
+
+def contracts_version(base_dir: Path = BASE_DIR) -> str:
+    return contracts_lock(base_dir)["version"] or "unversioned"
+
+
+def load_baselines(path: Path = DEFAULT_BASELINE) -> dict[str, dict[str, dict[str, Any]]]:
+    """CONTRACTS_VERSION -> case name -> recorded result"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_baseline(results: Sequence[BenchResult], version: str,
+                  path: Path = DEFAULT_BASELINE) -> None:
+    """Merge results into the baseline of `version` (other cases and versions are kept)"""
+    baselines = load_baselines(path)
+    entries = baselines.setdefault(version, {})
+    for result in results:
+        entries[result.name] = {
+            "ops_per_sec": round(result.ops_per_sec, 1),
+            "p50_us": round(result.p50_us, 1),
+            "p99_us": round(result.p99_us, 1),
+        }
+    baselines[version] = dict(sorted(entries.items()))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(baselines, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def compare(
+    results: Sequence[BenchResult], baseline: dict[str, dict[str, Any]], threshold: float
+) -> list[Regression]:
+    """Cases slower than `(1 - threshold) * baseline`; cases without a baseline are skipped"""
+    regressions = []
+    for result in results:
+        entry = baseline.get(result.name)
+        if entry is None:
+            continue
+        expected = float(entry["ops_per_sec"])
+        if result.ops_per_sec < expected * (1.0 - threshold):
+            regressions.append(Regression(result.name, expected, result.ops_per_sec))
+    return regressions
+
+
+def format_result(result: BenchResult, baseline: dict[str, Any] | None = None) -> str:
+    line = (f"{result.name:<62} {result.ops_per_sec:>11,.0f}/s "
+            f"p50 {result.p50_us:>10,.1f}µs  p99 {result.p99_us:>10,.1f}µs")
+    if baseline:
+        line += f"  ({result.ops_per_sec / baseline['ops_per_sec'] - 1.0:+.0%})"
+    return line
+
+
+def main() -> int:
+    settings = load_settings()
+    parser = argparse.ArgumentParser(description="Benchmark contract validation and tooling")
+    parser.add_argument("--schema", action="append", dest="schemas",
+                        help="Schema to benchmark (repeatable; default: all of schemas/)")
+    parser.add_argument("--sizes", default=",".join(PAYLOAD_SIZES),
+                        help="Comma-separated payload sizes (default: small,typical,large)")
+    parser.add_argument("--no-tools", action="store_true", help="Skip the tooling benchmarks")
+    parser.add_argument("--min-time", type=float, default=settings.min_time,
+                        help=f"Seconds per case (default: {settings.min_time})")
+    parser.add_argument("--threshold", type=float, default=settings.threshold,
+                        help=f"Allowed throughput drop (default: {settings.threshold:.0%})")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline file (default: build/benchmark_baselines.json)")
+    parser.add_argument("--update", action="store_true",
+                        help="Record the results as the baseline for this contracts version")
+    parser.add_argument("--json", type=Path, help="Also write the results here")
+    args = parser.parse_args()
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = sorted(set(sizes) - set(PAYLOAD_SIZES))
+    if unknown:
+        parser.error(f"Unknown payload size(s): {', '.join(unknown)}")
+
+    version = contracts_version()
+    baseline = load_baselines(args.baseline).get(version, {})
+    print(f"⏱  TarlaAnaliz Contract Benchmarks (contracts {version})\n")
+
+    results = run_benchmarks(
+        schemas=args.schemas, sizes=sizes, tools=not args.no_tools,
+        settings=settings._replace(min_time=args.min_time),
+        progress=lambda result: print(format_result(result, baseline.get(result.name))),
+    )
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps({
+            "version": version,
+            "results": [result._asdict() for result in results],
+        }, indent=1) + "\n", encoding="utf-8")
+
+    if args.update:
+        save_baseline(results, version, args.baseline)
+        print(f"\n✅ Baseline for {version} updated ({len(results)} case(s)): {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"\n⚠️  No baseline for {version}; record one with --update")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} case(s) regressed more than {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  • {regression.name}: {regression.baseline:,.0f}/s -> "
+                  f"{regression.current:,.0f}/s ({regression.change:+.0%})")
+        return 1
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Schema Bundler
+
+Resolves every schema in schemas/ into one self-contained bundle so that
+consumers (and the validators) load a single file with zero network or
+filesystem `$ref` lookups.
+
+Bundling rules:
+- local refs (`#/$defs/Timestamp`) stay as they are; recursive refs and
+  cycles are preserved because they remain local JSON pointers
+- every external document a schema reaches (e.g. `../../enums/payment_status.v2.json`)
+  is embedded once under the root `$defs`, keyed by its file stem, with its
+  `$id`/`$schema` removed; refs to it and into it are rewritten to
+  `#/$defs/<stem>...`
+- output is deterministic (original key order, embedded `$defs` sorted,
+  2-space indent), so the same sources always give byte-identical bundles
+
+Bundles are written to build/schemas/ mirroring schemas/, together with a
+manifest.json listing each bundle's SHA-256 plus the pinned contracts
+version and checksum from CONTRACTS_VERSION.md.
+
+Usage:
+    python3 tools/bundle_schemas.py                # write build/schemas/
+    python3 tools/bundle_schemas.py --check        # fail if bundles are stale
+    python3 tools/bundle_schemas.py --out-dir dist/schemas
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path, PurePosixPath
+from typing import Any
+from urllib.parse import urldefrag, urljoin
+
+from jsonschema.protocols import Validator
+from referencing import Registry
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import (  # noqa: E402
+    BASE_DIR,
+    ContractRegistry,
+    ContractValidator,
+    contracts_lock,
+    get_registry,
+)
+
+DEFAULT_OUT_DIR = BASE_DIR / "build" / "schemas"
+MANIFEST_NAME = "manifest.json"
+
+# Keywords whose values are instance data, not subschemas; never rewrite refs inside them
+DATA_KEYWORDS = frozenset({"const", "enum", "default", "examples"})
+
+# Keywords whose values map arbitrary names (which may collide with DATA_KEYWORDS) to subschemas
+NAMED_SCHEMA_MAPS = frozenset({"properties", "patternProperties", "$defs", "dependentSchemas"})
+
+
+class BundleError(ValueError):
+    """Raised when a schema cannot be bundled (e.g. anchor refs)"""
+
+
+class SchemaBundler:
+    """Builds one self-contained bundle for a root schema"""
+
+    def __init__(self, rel: str, registry: ContractRegistry):
+        self.registry = registry
+        self.rel = registry.resolve(rel)
+        self.root_uri = self._uri(self.rel)
+        self._embedded: dict[str, str] = {}       # document URI -> $defs key
+        self._bodies: dict[str, Any] = {}         # $defs key -> rewritten document
+
+    def _uri(self, rel: str) -> str:
+        doc = self.registry.schema(rel)
+        return doc.get("$id") or (self.registry.base_dir / rel).as_uri()
+
+    def _key_for(self, doc_uri: str) -> str:
+        key = self._embedded.get(doc_uri)
+        if key is not None:
+            return key
+
+        rel = self.registry.resolve(doc_uri)
+        stem = PurePosixPath(rel).name.removesuffix(".json").removesuffix(".schema")
+        taken = set(self._bodies) | set(self.registry.schema(self.rel).get("$defs", {}))
+        key = stem
+        suffix = 2
+        while key in taken:
+            key = f"{stem}_{suffix}"
+            suffix += 1
+
+        self._embedded[doc_uri] = key
+        self._bodies[key] = None  # reserve before recursing so cycles terminate
+        body = self._rewrite(self.registry.schema(rel), doc_uri, f"/$defs/{key}")
+        body = {k: v for k, v in body.items() if k not in ("$id", "$schema")}
+        self._bodies[key] = body
+        return key
+
+    def _ref(self, ref: str, base_uri: str, prefix: str) -> str:
+        doc_uri, fragment = urldefrag(urljoin(base_uri, ref))
+        if fragment and not fragment.startswith("/"):
+            raise BundleError(f"Anchor refs are not supported: {ref} in {self.rel}")
+        if doc_uri == base_uri:
+            return f"#{prefix}{fragment}"
+        if doc_uri == self.root_uri:
+            return f"#{fragment}"
+        if doc_uri not in self.registry:
+            raise BundleError(f"Unresolvable $ref {ref!r} in {self.rel}")
+        return f"#/$defs/{self._key_for(doc_uri)}{fragment}"
+
+    def _rewrite(self, node: Any, base_uri: str, prefix: str) -> Any:
+        if isinstance(node, list):
+            return [self._rewrite(item, base_uri, prefix) for item in node]
+        if not isinstance(node, dict):
+            return node
+        out: dict[str, Any] = {}
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str):
+                out[key] = self._ref(value, base_uri, prefix)
+            elif key in DATA_KEYWORDS:
+                out[key] = value
+            elif key in NAMED_SCHEMA_MAPS and isinstance(value, dict):
+                out[key] = {
+                    name: self._rewrite(sub, base_uri, prefix) for name, sub in value.items()
+                }
+            else:
+                out[key] = self._rewrite(value, base_uri, prefix)
+        return out
+
+    def bundle(self) -> dict[str, Any]:
+        """Return the self-contained schema document"""
+        root = self._rewrite(self.registry.schema(self.rel), self.root_uri, "")
+        if self._bodies:
+            defs = dict(root.get("$defs", {}))
+            defs.update((key, self._bodies[key]) for key in sorted(self._bodies))
+            root["$defs"] = defs
+        return root
+
+
+def bundle_schema(key: str, registry: ContractRegistry | None = None) -> dict[str, Any]:
+    """Bundle one schema (by path or `$id`)"""
+    return SchemaBundler(key, registry or get_registry()).bundle()
+
+
+def dump_bundle(bundle: dict[str, Any]) -> bytes:
+    """Canonical on-disk form of a bundle"""
+    return (json.dumps(bundle, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def bundle_validator(bundle: dict[str, Any]) -> Validator:
+    """Validator for a bundle with an empty ref registry (any external lookup fails)"""
+    format_checker = get_registry().format_checker
+    return ContractValidator(bundle, registry=Registry(), format_checker=format_checker)
+
+
+def build_bundles(registry: ContractRegistry | None = None) -> dict[str, bytes]:
+    """Bundle every schema under schemas/; returns output relative path -> bytes"""
+    registry = registry or get_registry()
+    outputs: dict[str, bytes] = {}
+    for rel in sorted(registry.paths):
+        if rel.startswith("schemas/"):
+            outputs[rel.removeprefix("schemas/")] = dump_bundle(bundle_schema(rel, registry))
+
+    lock = contracts_lock(registry.base_dir)
+    manifest = {
+        "contracts_version": lock["version"],
+        "contracts_checksum": lock["checksum"],
+        "bundles": {
+            path: {
+                "$id": json.loads(data).get("$id"),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size_bytes": len(data),
+            }
+            for path, data in outputs.items()
+        },
+    }
+    outputs[MANIFEST_NAME] = (json.dumps(manifest, indent=2) + "\n").encode("utf-8")
+    return outputs
+
+
+def write_bundles(outputs: dict[str, bytes], out_dir: Path) -> int:
+    """Write bundles, skipping files whose bytes are unchanged; returns files written"""
+    written = 0
+    for path, data in outputs.items():
+        target = out_dir / path
+        if target.exists() and target.read_bytes() == data:
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        written += 1
+    return written
+
+
+def stale_bundles(outputs: dict[str, bytes], out_dir: Path) -> list[str]:
+    """Paths whose on-disk bundle is missing or differs from `outputs`"""
+    return [
+        path for path, data in outputs.items()
+        if not (out_dir / path).exists() or (out_dir / path).read_bytes() != data
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bundle schemas into self-contained files")
+    parser.add_argument("--out-dir", type=Path, default=DEFAULT_OUT_DIR, help="Output directory")
+    parser.add_argument("--check", action="store_true", help="Fail if bundles on disk are stale")
+    args = parser.parse_args()
+
+    outputs = build_bundles()
+    count = len(outputs) - 1
+
+    if args.check:
+        stale = stale_bundles(outputs, args.out_dir)
+        if stale:
+            print(f"❌ {len(stale)} stale bundle file(s) in {args.out_dir}:")
+            for path in stale:
+                print(f"  - {path}")
+            return 1
+        print(f"✅ {count} bundles up to date")
+        return 0
+
+    written = write_bundles(outputs, args.out_dir)
+    print(f"✅ {count} bundles in {args.out_dir} ({written} file(s) written)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -35,15 +35,9 @@ def file_sha256(p: Path) -> str:
             h.update(chunk)
     return h.hexdigest()
 
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--root", default=".", help="repo root")
-    ap.add_argument("--no-docs", action="store_true", help="exclude docs/** from material set")
-    args = ap.parse_args()
-
-    root = Path(args.root).resolve()
+def compute_checksum(root: Path, include_docs: bool = True) -> str:
     globs = list(DEFAULT_GLOBS)
-    if args.no_docs:
+    if not include_docs:
         globs = [g for g in globs if not g.startswith("docs/")]
 
     files: list[Path] = []
@@ -61,8 +55,15 @@ def main() -> int:
         h.update(b"\n")
         h.update(file_sha256(p).encode("utf-8"))
         h.update(b"\n")
+    return h.hexdigest()
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", default=".", help="repo root")
+    ap.add_argument("--no-docs", action="store_true", help="exclude docs/** from material set")
+    args = ap.parse_args()
 
-    print(h.hexdigest())
+    print(compute_checksum(Path(args.root).resolve(), include_docs=not args.no_docs))
     return 0
 
 if __name__ == "__main__":
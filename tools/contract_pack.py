@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Contract Pack
+
+Serializes the loaded contract set into one binary file so worker processes
+start without scanning schemas/ and enums/ or parsing any JSON:
+
+- every parsed schema and enum document (the contract registry)
+- the enum index (membership sets, threat severities, role permissions and
+  ranks, status transitions)
+- precomputed lookup tables (event type/version -> event schema routes)
+
+The pack is a short header (magic + the contracts checksum) followed by a
+pickle. The checksum is computed from the contract files on every load
+(`compute_contracts_sha256.compute_checksum`, the value `pin-version` writes
+to CONTRACTS_VERSION.md), never read from the pinned value, so a schema
+edited without re-pinning still invalidates the pack. Loading is a single
+read: the header is checked first and the payload is only unpickled when the
+checksum matches. When it does not (contracts edited, pack missing or written
+by another format version), `load_contracts()` falls back to a cold parse and
+rewrites the pack.
+
+The pack is a local build artefact (build/contracts.pack, like build/schemas/);
+it is only ever read from the repository's own build directory.
+
+Usage:
+    from contract_pack import load_contracts
+
+    pack = load_contracts()          # installs the registry / enum index singletons
+    pack.registry.validate("core/field.v1.schema.json", field)
+
+    python3 tools/contract_pack.py               # build build/contracts.pack
+    python3 tools/contract_pack.py --check       # fail if the pack is stale
+    python3 tools/contract_pack.py --benchmark   # pack load vs cold parse
+"""
+from __future__ import annotations
+
+import argparse
+import copyreg
+import io
+import os
+import pickle
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import contract_registry  # noqa: E402
+import enum_index  # noqa: E402
+from compute_contracts_sha256 import compute_checksum  # noqa: E402
+from contract_registry import BASE_DIR, ContractRegistry  # noqa: E402
+from enum_index import EnumIndex, _freeze  # noqa: E402
+
+DEFAULT_PACK = BASE_DIR / "build" / "contracts.pack"
+
+PACK_FORMAT = 1
+MAGIC = b"TAPACK" + PACK_FORMAT.to_bytes(2, "big")
+CHECKSUM_SIZE = 64
+HEADER_SIZE = len(MAGIC) + CHECKSUM_SIZE
+
+# The enum index is built from mappingproxies, which pickle cannot handle natively;
+# they are rebuilt through enum_index._freeze (a stable module path, unlike this script)
+_DISPATCH_TABLE = copyreg.dispatch_table.copy()
+_DISPATCH_TABLE[MappingProxyType] = lambda proxy: (_freeze, (dict(proxy),))
+
+
+class ContractPack(NamedTuple):
+    """Everything a worker needs at startup, keyed by the contracts checksum"""
+
+    checksum: str
+    registry: ContractRegistry
+    enums: EnumIndex
+    event_routes: dict[tuple[str, str], str]
+
+
+def pack_checksum(base_dir: Path = BASE_DIR) -> str:
+    """Key for the pack: the checksum of the contract files as they are on disk now"""
+    return compute_checksum(Path(base_dir).resolve())
+
+
+def build_pack(base_dir: Path = BASE_DIR) -> ContractPack:
+    """Cold path: parse every contract file and precompute the lookup tables"""
+    from validate_data import build_event_routes
+
+    registry = ContractRegistry(base_dir)
+    return ContractPack(
+        pack_checksum(base_dir), registry, EnumIndex(registry), build_event_routes(registry),
+    )
+
+
+def dump_pack(pack: ContractPack) -> bytes:
+    """Serialize a pack: header, then the pickled payload"""
+    buffer = io.BytesIO()
+    buffer.write(MAGIC)
+    buffer.write(pack.checksum.encode("ascii"))
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = _DISPATCH_TABLE
+    pickler.dump({
+        "registry": pack.registry,
+        "enums": pack.enums,
+        "event_routes": pack.event_routes,
+    })
+    return buffer.getvalue()
+
+
+def write_pack(pack: ContractPack, path: Path = DEFAULT_PACK) -> int:
+    """Write a pack atomically (concurrent workers may rebuild at once); returns its size"""
+    data = dump_pack(pack)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+def read_pack(path: Path = DEFAULT_PACK, base_dir: Path = BASE_DIR) -> ContractPack | None:
+    """Load a pack with one read; None when it is missing, stale or unreadable"""
+    checksum = pack_checksum(base_dir)
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):HEADER_SIZE] != checksum.encode("ascii"):
+        return None
+
+    try:
+        payload = pickle.loads(memoryview(data)[HEADER_SIZE:])
+    except Exception:
+        # Truncated file or classes renamed since the pack was written; rebuild instead
+        return None
+    registry = payload["registry"]
+    if registry.base_dir != Path(base_dir).resolve():
+        return None
+    return ContractPack(checksum, registry, payload["enums"], payload["event_routes"])
+
+
+def install(pack: ContractPack) -> None:
+    """Make the pack's registry and enum index the process-wide instances"""
+    with contract_registry._registry_lock:
+        contract_registry._registry = pack.registry
+    with enum_index._index_lock:
+        enum_index._index = pack.enums
+
+
+def load_contracts(
+    path: Path = DEFAULT_PACK,
+    base_dir: Path = BASE_DIR,
+    rebuild: bool = True,
+    install_globals: bool = True,
+) -> ContractPack:
+    """Load the pack, falling back to a cold parse (and rewriting the pack) when stale"""
+    pack = read_pack(path, base_dir)
+    if pack is None:
+        pack = build_pack(base_dir)
+        if rebuild:
+            try:
+                write_pack(pack, path)
+            except OSError:
+                pass  # read-only deployments still start, just without the fast path
+    if install_globals:
+        install(pack)
+    return pack
+
+
+def benchmark(runs: int = 20, path: Path = DEFAULT_PACK,
+              base_dir: Path = BASE_DIR) -> dict[str, float]:
+    """Median startup time in ms: cold parse vs pack load (writes the pack first)"""
+    size = write_pack(build_pack(base_dir), path)
+
+    def median_ms(func: Any) -> float:
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    cold = median_ms(lambda: build_pack(base_dir))
+    packed = median_ms(lambda: read_pack(path, base_dir))
+    return {"cold_ms": cold, "pack_ms": packed, "speedup": cold / packed, "pack_bytes": size}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the binary contract pack")
+    parser.add_argument("--pack", type=Path, default=DEFAULT_PACK, help="Pack file path")
+    parser.add_argument("--check", action="store_true", help="Fail if the pack is missing or stale")
+    parser.add_argument("--benchmark", action="store_true", help="Compare pack load vs cold parse")
+    parser.add_argument("--runs", type=int, default=20, help="Benchmark repetitions")
+    args = parser.parse_args()
+
+    if args.check:
+        if read_pack(args.pack) is None:
+            print(f"❌ {args.pack} is missing or stale")
+            return 1
+        print(f"✅ {args.pack} matches checksum {pack_checksum()}")
+        return 0
+
+    if args.benchmark:
+        result = benchmark(args.runs, args.pack)
+        print(f"⏱  cold parse  {result['cold_ms']:8.2f} ms")
+        print(f"⏱  pack load   {result['pack_ms']:8.2f} ms  ({result['speedup']:.1f}x faster)")
+        print(f"✅ {args.pack} ({result['pack_bytes']} bytes)")
+        return 0
+
+    pack = build_pack()
+    size = write_pack(pack, args.pack)
+    print(f"✅ {args.pack}: {len(pack.registry)} contracts, {len(pack.enums.names)} enums, "
+          f"{size} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
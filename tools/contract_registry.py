@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Contract Registry
+
+Loads every JSON Schema under schemas/ and enums/ once, indexes the documents
+by `$id` and by repo-relative path, and hands out one compiled Draft 2020-12
+validator per schema. Cross-file refs (e.g. `../../enums/payment_status.v2.json`)
+are resolved from the in-memory store, never from disk or network.
+
+Validators are built lazily on first use and then shared by every caller;
+`get_registry()` returns the process-wide instance. Formats are checked with
+`format_checks.FORMAT_CHECKER` (fast RFC 3339 `date-time` / `date`).
+
+Usage:
+    from contract_registry import get_registry
+
+    registry = get_registry()
+    registry.validate("worker/analysis_result.v1.schema.json", payload)
+    validator = registry.validator("https://api.tarlaanaliz.com/schemas/core/field.v1.schema.json")
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator, FormatChecker, ValidationError, validators
+from jsonschema.protocols import Validator
+from referencing import Registry, Resource
+from referencing.exceptions import Unresolvable
+from referencing.jsonschema import DRAFT202012
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from discriminator import cached_discriminator, dispatch  # noqa: E402
+from format_checks import FORMAT_CHECKER  # noqa: E402
+from pattern_checks import pattern_matcher  # noqa: E402
+
+BASE_DIR = TOOLS_DIR.parent
+
+# Directories (relative to the repo root) whose JSON files form the contract set
+CONTRACT_DIRS = ("schemas", "enums")
+
+CONTRACTS_VERSION_FILE = "CONTRACTS_VERSION.md"
+
+
+def _pattern(validator, patrn, instance, schema):
+    """`pattern` keyword backed by the process-wide compiled-regex cache"""
+    if validator.is_type(instance, "string") and not pattern_matcher(patrn)(instance):
+        yield ValidationError(f"{instance!r} does not match {patrn!r}")
+
+
+_STOCK_KEYWORDS = Draft202012Validator.VALIDATORS
+
+
+def _is_valid(errors: Iterator[ValidationError]) -> bool:
+    return next(errors, None) is None
+
+
+def branch_chain(validator: Any, branch: Any) -> list[Any]:
+    """A union branch followed by every schema its `$ref` chain points at"""
+    chain = [branch]
+    resolver = validator._resolver
+    while isinstance(branch, dict) and isinstance(branch.get("$ref"), str):
+        try:
+            resolved = resolver.lookup(branch["$ref"])
+        except Unresolvable:
+            break
+        resolver, branch = resolved.resolver, resolved.contents
+        if any(branch is seen for seen in chain):
+            break
+        chain.append(branch)
+    return chain
+
+
+def _dispatch(validator: Any, branches: list[Any], instance: Any) -> int | None:
+    """The only branch a tagged object can satisfy (see discriminator.py), else None"""
+    if not isinstance(instance, dict):
+        return None
+    found = cached_discriminator(branches, lambda branch: branch_chain(validator, branch))
+    return None if found is None else dispatch(found, instance)
+
+
+def _union(keyword: str) -> Callable[..., Iterator[ValidationError]]:
+    """`oneOf` / `anyOf` that descends only into the tagged branch when there is one"""
+    stock = _STOCK_KEYWORDS[keyword]
+
+    def union(validator, branches, instance, schema):
+        index = _dispatch(validator, branches, instance)
+        if index is None:
+            yield from stock(validator, branches, instance, schema)
+            return
+        errors = list(validator.descend(instance, branches[index], schema_path=index))
+        if errors:
+            yield ValidationError(
+                f"{instance!r} is not valid under any of the given schemas", context=errors,
+            )
+
+    return union
+
+
+def _evaluated_keys(validator, instance: dict[str, Any], schema: Any) -> set[str]:
+    """Property names evaluated at this location; jsonschema's algorithm with union dispatch"""
+    if not isinstance(schema, dict):
+        return set()
+    keys: set[str] = set()
+
+    for keyword in ("$ref", "$dynamicRef"):
+        ref = schema.get(keyword)
+        if ref is not None:
+            resolved = validator._resolver.lookup(ref)
+            keys |= _evaluated_keys(
+                validator.evolve(schema=resolved.contents, _resolver=resolved.resolver),
+                instance,
+                resolved.contents,
+            )
+
+    properties = schema.get("properties")
+    if isinstance(properties, dict):
+        keys |= properties.keys() & instance.keys()
+
+    for keyword in ("additionalProperties", "unevaluatedProperties"):
+        subschema = schema.get(keyword)
+        if subschema is not None:
+            keys.update(
+                name for name, value in instance.items()
+                if _is_valid(validator.descend(value, subschema))
+            )
+
+    for pattern in schema.get("patternProperties", ()):
+        matches = pattern_matcher(pattern)
+        keys.update(name for name in instance if matches(name))
+
+    for name, subschema in schema.get("dependentSchemas", {}).items():
+        if name in instance:
+            keys |= _evaluated_keys(validator, instance, subschema)
+
+    for keyword in ("allOf", "oneOf", "anyOf"):
+        branches = schema.get(keyword, [])
+        index = _dispatch(validator, branches, instance) if keyword != "allOf" else None
+        if index is not None:
+            # Like then/else below, not re-validated: if the tagged branch fails, the union
+            # keyword at this same location already fails the instance
+            keys |= _evaluated_keys(validator, instance, branches[index])
+            continue
+        for subschema in branches:
+            if _is_valid(validator.descend(instance, subschema)):
+                keys |= _evaluated_keys(validator, instance, subschema)
+
+    if "if" in schema:
+        if validator.evolve(schema=schema["if"]).is_valid(instance):
+            keys |= _evaluated_keys(validator, instance, schema["if"])
+            if "then" in schema:
+                keys |= _evaluated_keys(validator, instance, schema["then"])
+        elif "else" in schema:
+            keys |= _evaluated_keys(validator, instance, schema["else"])
+
+    return keys
+
+
+def _unevaluated_properties(validator, unevaluated, instance, schema):
+    """`unevaluatedProperties` whose annotation pass dispatches tagged unions too"""
+    if not validator.is_type(instance, "object"):
+        return
+    evaluated = _evaluated_keys(validator, instance, schema)
+    extras = [
+        name for name in instance
+        if name not in evaluated
+        and not _is_valid(validator.descend(instance[name], unevaluated, path=name,
+                                            schema_path=name))
+    ]
+    if not extras:
+        return
+    listed = ", ".join(repr(extra) for extra in sorted(extras, key=str))
+    verb = "was" if len(extras) == 1 else "were"
+    if unevaluated is False:
+        yield ValidationError(
+            f"Unevaluated properties are not allowed ({listed} {verb} unexpected)"
+        )
+    else:
+        yield ValidationError(
+            "Unevaluated properties are not valid under the given schema "
+            f"({listed} {verb} unevaluated and invalid)"
+        )
+
+
+# Draft 2020-12 with the cached `pattern` keyword and tagged-union dispatch for
+# `oneOf` / `anyOf` / `unevaluatedProperties`; accepts exactly what Draft202012Validator accepts.
+# A runtime class: annotate its instances as `jsonschema.protocols.Validator`.
+ContractValidator: type[Validator] = validators.extend(Draft202012Validator, {
+    "pattern": _pattern,
+    "oneOf": _union("oneOf"),
+    "anyOf": _union("anyOf"),
+    "unevaluatedProperties": _unevaluated_properties,
+})
+
+
+class ContractRegistry:
+    """In-memory store of contract schemas with cached, shareable validators"""
+
+    def __init__(self, base_dir: Path = BASE_DIR, format_checker: FormatChecker | None = None):
+        self.base_dir = Path(base_dir).resolve()
+        self.format_checker = (
+            format_checker if format_checker is not None else FORMAT_CHECKER
+        )
+        self._documents: dict[str, dict[str, Any]] = {}
+        self._aliases: dict[str, str] = {}
+        self._validators: dict[str, Validator] = {}
+        self._lock = threading.Lock()
+        self._registry = self._load()
+
+    def _load(self) -> Registry:
+        """Read every contract file once and build the `$ref` registry"""
+        for dirname in CONTRACT_DIRS:
+            root = self.base_dir / dirname
+            for path in sorted(root.rglob("*.json")):
+                with open(path, "r", encoding="utf-8") as f:
+                    self._documents[path.relative_to(self.base_dir).as_posix()] = json.load(f)
+        return self._index(crawl=True)
+
+    def _index(self, crawl: bool) -> Registry:
+        """Alias the loaded documents and build the `$ref` registry from memory"""
+        resources: list[tuple[str, Resource]] = []
+
+        for rel, doc in self._documents.items():
+            uri = (self.base_dir / rel).as_uri()
+            self._aliases[rel] = rel
+            self._aliases[rel.split("/", 1)[1]] = rel
+            self._aliases[uri] = rel
+
+            resource = Resource.from_contents(doc, default_specification=DRAFT202012)
+            resources.append((uri, resource))
+
+            doc_id = doc.get("$id")
+            if isinstance(doc_id, str) and doc_id:
+                self._aliases[doc_id] = rel
+                resources.append((doc_id, resource))
+
+        if crawl:
+            return Registry().with_resources(resources).crawl()
+        # Nothing for crawl() to discover; register the resources as already crawled
+        return Registry(resources=resources)
+
+    def _needs_crawl(self) -> bool:
+        """True when any document has anchors or nested `$id`s that only crawl() finds"""
+        stack = [
+            Resource.from_contents(doc, default_specification=DRAFT202012)
+            for doc in self._documents.values()
+        ]
+        while stack:
+            resource = stack.pop()
+            if next(iter(resource.anchors()), None) is not None:
+                return True
+            for subresource in resource.subresources():
+                if subresource.id() is not None:
+                    return True
+                stack.append(subresource)
+        return False
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Parsed documents only; validators, locks and the ref registry are rebuilt on load"""
+        return {
+            "base_dir": self.base_dir,
+            "format_checker": (
+                None if self.format_checker is FORMAT_CHECKER else self.format_checker
+            ),
+            "documents": self._documents,
+            "crawl": self._needs_crawl(),
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.base_dir = state["base_dir"]
+        self.format_checker = state["format_checker"] or FORMAT_CHECKER
+        self._documents = state["documents"]
+        self._aliases = {}
+        self._validators = {}
+        self._lock = threading.Lock()
+        self._registry = self._index(crawl=state["crawl"])
+
+    def resolve(self, key: str) -> str:
+        """Map a `$id`, file URI or relative path to the canonical repo-relative path"""
+        try:
+            return self._aliases[key]
+        except KeyError:
+            raise KeyError(f"Unknown contract schema: {key}") from None
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self._aliases
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    @property
+    def paths(self) -> list[str]:
+        """Repo-relative paths of all loaded contract files"""
+        return list(self._documents)
+
+    @property
+    def schema_ids(self) -> dict[str, str]:
+        """`$id` -> repo-relative path for every document that declares one"""
+        return {
+            doc["$id"]: rel
+            for rel, doc in self._documents.items()
+            if isinstance(doc.get("$id"), str)
+        }
+
+    @property
+    def ref_registry(self) -> Registry:
+        """The immutable `referencing` registry shared by all validators"""
+        return self._registry
+
+    def schema(self, key: str) -> dict[str, Any]:
+        """Return the parsed schema document (shared, do not mutate)"""
+        return self._documents[self.resolve(key)]
+
+    def _fragment_schema(self, rel: str, fragment: str) -> dict[str, Any]:
+        """Wrap `rel#fragment` (e.g. `#/$defs/FileEntry`) as a `$ref` schema"""
+        doc = self._documents[rel]
+        ref = f"{doc.get('$id') or (self.base_dir / rel).as_uri()}#{fragment}"
+        try:
+            self._registry.resolver().lookup(ref)
+        except Unresolvable:
+            raise KeyError(f"Unknown contract schema: {rel}#{fragment}") from None
+        return {"$ref": ref}
+
+    def validator(self, key: str) -> Validator:
+        """Return the compiled validator for a schema or `schema#/$defs/Name`, built on first use"""
+        base, _, fragment = key.partition("#")
+        rel = self.resolve(base)
+        cache_key = f"{rel}#{fragment}" if fragment else rel
+        validator = self._validators.get(cache_key)
+        if validator is not None:
+            return validator
+
+        with self._lock:
+            validator = self._validators.get(cache_key)
+            if validator is None:
+                validator = ContractValidator(
+                    self._fragment_schema(rel, fragment) if fragment else self._documents[rel],
+                    registry=self._registry,
+                    format_checker=self.format_checker,
+                )
+                self._validators[cache_key] = validator
+        return validator
+
+    def compile_all(self) -> int:
+        """Build validators for every loaded schema up front; returns the count"""
+        for rel in self._documents:
+            self.validator(rel)
+        return len(self._validators)
+
+    def iter_errors(self, key: str, instance: Any) -> Iterator[ValidationError]:
+        """Yield every validation error for `instance` against a schema"""
+        return self.validator(key).iter_errors(instance)
+
+    def is_valid(self, key: str, instance: Any) -> bool:
+        """Return True when `instance` satisfies the schema"""
+        return self.validator(key).is_valid(instance)
+
+    def validate(self, key: str, instance: Any) -> None:
+        """Raise `ValidationError` (best match) when `instance` is invalid"""
+        self.validator(key).validate(instance)
+
+
+def contracts_lock(base_dir: Path = BASE_DIR) -> dict[str, str | None]:
+    """Pinned `version` and `checksum` from CONTRACTS_VERSION.md (None when absent)"""
+    try:
+        content = (Path(base_dir) / CONTRACTS_VERSION_FILE).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        content = ""
+    version = re.search(r"## Version: (\d+\.\d+\.\d+)", content)
+    checksum = re.search(r"Contracts Checksum \(SHA-256\):\*\* `([a-f0-9]{64})`", content)
+    return {
+        "version": version.group(1) if version else None,
+        "checksum": checksum.group(1) if checksum else None,
+    }
+
+
+_registry: ContractRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ContractRegistry:
+    """Return the process-wide registry, loading the contracts on first call"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ContractRegistry()
+    return _registry
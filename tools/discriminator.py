@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Union Discriminators
+
+Finds `oneOf` / `anyOf` unions whose branches are tagged by a required
+string `const` property, e.g. the GeoJSON unions in
+schemas/shared/geojson.v1.schema.json:
+
+    Geometry.oneOf: [Point, LineString, ...]        -> "type": "Point" | "LineString" | ...
+    oneOf: [Feature, FeatureCollection, Geometry]   -> "type": "Feature" | "FeatureCollection"
+                                                       | any Geometry tag
+
+For an object instance only the branch whose tag equals the instance's value
+can be valid, so validators descend into that one branch instead of trying
+every branch and collecting errors from all the failed ones. Instances that
+are not objects, lack the tag or carry an unknown value get the full
+evaluation, so error reporting for invalid data is unchanged.
+
+A branch's tags come from its own `properties`/`required`, every schema its
+`$ref` chain points at, and the tags of a tagged union nested in it (so the
+Geometry branch above carries all seven geometry types). A property is a
+discriminator when every branch tags it and no two branches share a value
+(`type` is preferred).
+
+Usage:
+    from discriminator import cached_discriminator, dispatch
+
+    found = cached_discriminator(schema["oneOf"], resolve)   # resolve(branch) -> [schemas]
+    index = dispatch(found, instance) if found else None       # None: evaluate every branch
+
+    python3 tools/discriminator.py               # list discriminated unions in the contracts
+    python3 tools/discriminator.py --benchmark   # FeatureCollection validation, dispatch vs stock
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Preferred tag names, tried before any other common property
+PREFERRED_TAGS = ("type", "kind", "event_type")
+
+
+class Discriminator(NamedTuple):
+    """The tag property of a union and the branch index for each tag value"""
+
+    property: str
+    branches: dict[str, int]
+
+
+def _tags(schema: Any) -> dict[str, set[str]]:
+    """Required properties pinned to a string `const`"""
+    if not isinstance(schema, dict):
+        return {}
+    required = schema.get("required") or ()
+    properties = schema.get("properties") or {}
+    return {
+        name: {subschema["const"]}
+        for name, subschema in properties.items()
+        if name in required
+        and isinstance(subschema, dict)
+        and isinstance(subschema.get("const"), str)
+    }
+
+
+def _branch_tags(
+    branch: Any, resolve: Callable[[Any], list[Any]], depth: int = 0
+) -> dict[str, set[str]]:
+    """Tag values a branch allows, including those of a tagged union nested in it"""
+    tags: dict[str, set[str]] = {}
+    for schema in resolve(branch):
+        for name, values in _tags(schema).items():
+            tags[name] = tags[name] & values if name in tags else values
+        for keyword in ("oneOf", "anyOf"):
+            nested = schema.get(keyword) if isinstance(schema, dict) and depth < 8 else None
+            if not isinstance(nested, list) or not nested:
+                continue
+            # An instance must satisfy one nested branch, so it carries one of their tags
+            nested_tags = [_branch_tags(item, resolve, depth + 1) for item in nested]
+            for name in set(nested_tags[0]).intersection(*nested_tags[1:]):
+                values = set().union(*(item[name] for item in nested_tags))
+                tags[name] = tags[name] & values if name in tags else values
+    return tags
+
+
+def find_discriminator(
+    branches: list[Any], resolve: Callable[[Any], list[Any]]
+) -> Discriminator | None:
+    """Discriminator of a union; `resolve(branch)` returns the branch and its `$ref` targets"""
+    if not isinstance(branches, list) or len(branches) < 2:
+        return None
+    tag_sets = []
+    for branch in branches:
+        tags = _branch_tags(branch, resolve)
+        if not tags:
+            return None
+        tag_sets.append(tags)
+
+    common = set(tag_sets[0]).intersection(*tag_sets[1:])
+    ranked = sorted(common, key=lambda name: (
+        PREFERRED_TAGS.index(name) if name in PREFERRED_TAGS else len(PREFERRED_TAGS), name,
+    ))
+    for name in ranked:
+        mapping: dict[str, int] = {}
+        for index, tags in enumerate(tag_sets):
+            for value in tags[name]:
+                if mapping.setdefault(value, index) != index:
+                    break
+            else:
+                continue
+            break
+        else:
+            return Discriminator(name, mapping)
+    return None
+
+
+# id(branch list) -> (the list itself, its discriminator); holding the list keeps the id unique
+_cache: dict[int, tuple[list[Any], Discriminator | None]] = {}
+# The bundled contracts have a few dozen unions; the cap only matters for processes that keep
+# loading new schema documents, whose old unions would otherwise be pinned here forever
+CACHE_LIMIT = 4096
+
+
+def cached_discriminator(
+    branches: list[Any], resolve: Callable[[Any], list[Any]]
+) -> Discriminator | None:
+    """`find_discriminator` memoized per union (schema documents are shared, never copied)"""
+    entry = _cache.get(id(branches))
+    if entry is None or entry[0] is not branches:
+        entry = (branches, find_discriminator(branches, resolve))
+        if len(_cache) >= CACHE_LIMIT:
+            # Rebuilding is cheap next to validation; clearing keeps this lock-free
+            _cache.clear()
+        _cache[id(branches)] = entry
+    return entry[1]
+
+
+def dispatch(discriminator: Discriminator, instance: Any) -> int | None:
+    """Index of the only branch `instance` can satisfy; None when every branch must be tried"""
+    if not isinstance(instance, dict):
+        return None
+    value = instance.get(discriminator.property)
+    if not isinstance(value, str):
+        return None
+    return discriminator.branches.get(value)
+
+
+def iter_unions(schema: Any, pointer: str = "") -> Iterator[tuple[str, str, list[Any]]]:
+    """(pointer, keyword, branches) for every oneOf/anyOf in a schema document"""
+    if isinstance(schema, list):
+        for index, item in enumerate(schema):
+            yield from iter_unions(item, f"{pointer}/{index}")
+    elif isinstance(schema, dict):
+        for keyword in ("oneOf", "anyOf"):
+            if isinstance(schema.get(keyword), list):
+                yield pointer, keyword, schema[keyword]
+        for key, value in schema.items():
+            if key not in ("const", "enum", "default", "examples"):
+                yield from iter_unions(value, f"{pointer}/{key}")
+
+
+def feature_collection(features: int) -> dict[str, Any]:
+    """A valid FeatureCollection alternating Polygon and MultiPolygon geometries"""
+    ring = [[40.0, 37.0], [40.001, 37.0], [40.001, 37.001], [40.0, 37.001], [40.0, 37.0]]
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "id": i,
+                "geometry": (
+                    {"type": "MultiPolygon", "coordinates": [[ring]]} if i % 2
+                    else {"type": "Polygon", "coordinates": [ring]}
+                ),
+                "properties": {"index": i},
+            }
+            for i in range(features)
+        ],
+    }
+
+
+def main() -> int:
+    tools_dir = Path(__file__).resolve().parent
+    if str(tools_dir) not in sys.path:
+        sys.path.insert(0, str(tools_dir))
+    from contract_registry import branch_chain, get_registry
+    from jsonschema import Draft202012Validator
+
+    parser = argparse.ArgumentParser(description="Find discriminated oneOf/anyOf unions")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Time FeatureCollection validation with and without dispatch")
+    parser.add_argument("--features", type=int, default=500, help="Features in the benchmark")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    if args.benchmark:
+        key = "shared/geojson.v1.schema.json"
+        document = feature_collection(args.features)
+        stock = Draft202012Validator(
+            registry.schema(key), registry=registry.ref_registry,
+            format_checker=registry.format_checker,
+        )
+        timings = {}
+        for name, validator in (("dispatch", registry.validator(key)), ("stock", stock)):
+            started = time.perf_counter()
+            assert validator.is_valid(document)
+            timings[name] = time.perf_counter() - started
+        print(f"⏱  FeatureCollection with {args.features} features: "
+              f"dispatch {timings['dispatch'] * 1000:.1f} ms, "
+              f"stock {timings['stock'] * 1000:.1f} ms "
+              f"({timings['stock'] / timings['dispatch']:.0f}x)")
+        return 0
+
+    found = 0
+    for rel in registry.paths:
+        validator = registry.validator(rel)
+        for pointer, keyword, branches in iter_unions(registry.schema(rel)):
+            discriminator = find_discriminator(
+                branches, lambda branch: branch_chain(validator, branch),  # noqa: B023
+            )
+            if discriminator is not None:
+                found += 1
+                tags = sorted(discriminator.branches, key=lambda tag: (
+                    discriminator.branches[tag], tag,
+                ))
+                print(f"🔍 {rel}#{pointer}/{keyword}: {discriminator.property} -> "
+                      f"{', '.join(tags)}")
+    print(f"✅ {found} discriminated union(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
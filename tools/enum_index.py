@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Enum Index
+
+Builds an immutable index over enums/ once so request-path lookups are
+dictionary hits instead of re-parsing JSON and scanning lists:
+
+- frozenset membership per enum and version (payment_status v1 vs v2)
+- threat type -> severity level (threat_type `severityLevels`)
+- role -> permission set and role -> rank (user_role `permissions` /
+  `hierarchy`, role `permissions` / `roleHierarchy`)
+- status -> allowed next statuses, from the per-status `allowedTransitions`
+  lists in metadata (mission_status `statusDescriptions`); enums that do not
+  declare them fall back to the consecutive pairs of their `*Flow` sequences
+  (quarantine_decision `decisionFlow`)
+- read-only enum metadata (descriptions, display names, layer mapping)
+
+Enum documents come from the contract registry, so the files are read once
+per process. `get_enum_index()` returns the process-wide instance.
+
+Usage:
+    from enum_index import get_enum_index
+
+    enums = get_enum_index()
+    enums.is_member("payment_status", "REFUNDED", version=1)   # False
+    enums.threat_severity["HASH_MISMATCH"]                      # "HIGH"
+    enums.has_permission("PILOT", "flight:upload")              # True
+    "IN_PROGRESS" in enums.status_transitions["ACCEPTED"]       # True
+
+    python3 tools/enum_index.py
+"""
+from __future__ import annotations
+
+import re
+import sys
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, get_registry  # noqa: E402
+
+# enums/<name>[.enum].v<N>.json
+_ENUM_FILE_RE = re.compile(r"^enums/(?P<name>[a-z0-9_]+?)(?:\.enum)?\.v(?P<version>\d+)\.json$")
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _freeze(value: Any) -> Any:
+    """Deep read-only copy: dicts become mappingproxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _flow_sequences(flow: Any) -> list[list[str]]:
+    """Collect every list of status names nested under a `*Flow` metadata block"""
+    if isinstance(flow, list):
+        return [flow] if all(isinstance(item, str) for item in flow) else []
+    if isinstance(flow, dict):
+        return [seq for value in flow.values() for seq in _flow_sequences(value)]
+    return []
+
+
+def _declared_transitions(metadata: dict[str, Any]) -> dict[str, list[str]] | None:
+    """Collect `<status>.allowedTransitions` lists from a metadata block, if any"""
+    for block in metadata.values():
+        if not isinstance(block, dict):
+            continue
+        declared = {
+            status: details["allowedTransitions"]
+            for status, details in block.items()
+            if isinstance(details, dict) and isinstance(details.get("allowedTransitions"), list)
+        }
+        if declared:
+            return declared
+    return None
+
+
+def _permission_set(entry: Any) -> frozenset[str]:
+    """Normalize `["field:create", ...]` or `{"fields": ["create", ...]}` to a frozenset"""
+    if isinstance(entry, list):
+        return frozenset(entry)
+    if isinstance(entry, dict):
+        return frozenset(
+            f"{resource}:{action}" for resource, actions in entry.items() for action in actions
+        )
+    return frozenset()
+
+
+class EnumEntry:
+    """One enum document (name + version) with its precomputed lookups"""
+
+    def __init__(self, name: str, version: int, rel: str, doc: dict[str, Any]):
+        self.name = name
+        self.version = version
+        self.path = rel
+        self.schema_id: str | None = doc.get("$id")
+        self.ordered: tuple[str, ...] = tuple(doc.get("enum", ()))
+        self.values: frozenset[str] = frozenset(self.ordered)
+        self.positions: Mapping[str, int] = MappingProxyType(
+            {value: i for i, value in enumerate(self.ordered)}
+        )
+        self.metadata: Mapping[str, Any] = _freeze(doc.get("metadata", {}))
+        self.transitions = self._transitions(doc.get("metadata", {}))
+        self.permissions = self._permissions(doc)
+        self.ranks = self._ranks(doc)
+
+    def _transitions(self, metadata: dict[str, Any]) -> Mapping[str, frozenset[str]]:
+        edges: dict[str, set[str]] = {value: set() for value in self.ordered}
+        declared = _declared_transitions(metadata)
+        if declared is not None:
+            for src, targets in declared.items():
+                if src in self.values:
+                    edges[src].update(dst for dst in targets if dst in self.values)
+            return MappingProxyType({src: frozenset(dsts) for src, dsts in edges.items()})
+        for key, flow in metadata.items():
+            if not key.endswith("Flow"):
+                continue
+            for seq in _flow_sequences(flow):
+                for src, dst in zip(seq, seq[1:]):
+                    if src in self.values and dst in self.values and src != dst:
+                        edges[src].add(dst)
+        if not any(edges.values()):
+            return _EMPTY
+        return MappingProxyType({src: frozenset(dsts) for src, dsts in edges.items()})
+
+    def _permissions(self, doc: dict[str, Any]) -> Mapping[str, frozenset[str]]:
+        raw = doc.get("permissions") or doc.get("metadata", {}).get("permissions")
+        if not isinstance(raw, dict):
+            return _EMPTY
+        return MappingProxyType({role: _permission_set(entry) for role, entry in raw.items()})
+
+    def _ranks(self, doc: dict[str, Any]) -> Mapping[str, int]:
+        hierarchy = doc.get("hierarchy")
+        if isinstance(hierarchy, dict):
+            return MappingProxyType(dict(hierarchy))
+        order = doc.get("metadata", {}).get("roleHierarchy", {}).get("order")
+        if isinstance(order, list):
+            # Listed highest privilege first; higher rank = more privilege, as in user_role
+            return MappingProxyType({role: len(order) - i for i, role in enumerate(order)})
+        return _EMPTY
+
+    def __repr__(self) -> str:
+        return f"EnumEntry({self.name!r}, v{self.version}, {len(self.values)} values)"
+
+
+class EnumIndex:
+    """Immutable, precomputed lookups over every enum in enums/"""
+
+    def __init__(self, registry: ContractRegistry | None = None):
+        registry = registry or get_registry()
+        entries: dict[tuple[str, int], EnumEntry] = {}
+        for rel in registry.paths:
+            m = _ENUM_FILE_RE.match(rel)
+            if m is None:
+                continue
+            name, version = m.group("name"), int(m.group("version"))
+            entries[(name, version)] = EnumEntry(name, version, rel, registry.schema(rel))
+
+        self._entries: Mapping[tuple[str, int], EnumEntry] = MappingProxyType(entries)
+        latest: dict[str, EnumEntry] = {}
+        for (name, version), entry in sorted(entries.items()):
+            latest[name] = entry
+        self._latest: Mapping[str, EnumEntry] = MappingProxyType(latest)
+        self._by_id: Mapping[str, EnumEntry] = MappingProxyType(
+            {entry.schema_id: entry for entry in entries.values() if entry.schema_id}
+        )
+
+        self.threat_severity: Mapping[str, str] = self._threat_severity()
+        self.role_permissions: Mapping[str, frozenset[str]] = self.entry("user_role").permissions
+        self.role_ranks: Mapping[str, int] = self.entry("user_role").ranks
+        self.status_transitions: Mapping[str, frozenset[str]] = (
+            self.entry("mission_status").transitions
+        )
+
+    def _threat_severity(self) -> Mapping[str, str]:
+        levels = self.entry("threat_type").metadata.get("severityLevels", _EMPTY)
+        return MappingProxyType({
+            threat: severity for severity, level in levels.items() for threat in level["threats"]
+        })
+
+    @property
+    def names(self) -> list[str]:
+        """Enum names (file stem without `.enum` / version suffix)"""
+        return sorted(self._latest)
+
+    def versions(self, name: str) -> tuple[int, ...]:
+        """Available versions of an enum, ascending"""
+        return tuple(sorted(version for n, version in self._entries if n == name))
+
+    def entry(self, name: str, version: int | None = None) -> EnumEntry:
+        """Return an enum by name (latest version unless given) or by `$id`"""
+        try:
+            if version is None:
+                return self._latest.get(name) or self._by_id[name]
+            return self._entries[(name, version)]
+        except KeyError:
+            suffix = "" if version is None else f" v{version}"
+            raise KeyError(f"Unknown enum: {name}{suffix}") from None
+
+    def values(self, name: str, version: int | None = None) -> frozenset[str]:
+        """Member set of an enum"""
+        return self.entry(name, version).values
+
+    def is_member(self, name: str, value: Any, version: int | None = None) -> bool:
+        """O(1) membership test"""
+        return value in self.entry(name, version).values
+
+    def metadata(self, name: str, version: int | None = None) -> Mapping[str, Any]:
+        """Read-only `metadata` block of an enum"""
+        return self.entry(name, version).metadata
+
+    def permissions(self, name: str = "user_role") -> Mapping[str, frozenset[str]]:
+        """role -> permission set for a role enum (`role` flattens to `resource:action`)"""
+        return self.entry(name).permissions
+
+    def has_permission(self, role: str, permission: str, name: str = "user_role") -> bool:
+        """Return True when a role grants a permission"""
+        return permission in self.entry(name).permissions.get(role, ())
+
+    def transitions(self, name: str, version: int | None = None) -> Mapping[str, frozenset[str]]:
+        """status -> allowed next statuses (`allowedTransitions`, else `*Flow` metadata)"""
+        return self.entry(name, version).transitions
+
+    def can_transition(self, current: str, target: str, name: str = "mission_status") -> bool:
+        """Return True when `current -> target` is a documented transition of the enum"""
+        return target in self.entry(name).transitions.get(current, ())
+
+
+_index: EnumIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_enum_index() -> EnumIndex:
+    """Return the process-wide enum index, building it on first call"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = EnumIndex()
+    return _index
+
+
+def main() -> int:
+    index = get_enum_index()
+    print("🔍 Enum index")
+    for name in index.names:
+        entry = index.entry(name)
+        versions = ", ".join(f"v{v}" for v in index.versions(name))
+        extras = [
+            label
+            for label, table in (
+                ("transitions", entry.transitions),
+                ("permissions", entry.permissions),
+                ("ranks", entry.ranks),
+            )
+            if table
+        ]
+        suffix = f" [{', '.join(extras)}]" if extras else ""
+        print(f"  {name:<22} {len(entry.values):>3} values ({versions}){suffix}")
+    print(f"✅ {len(index.names)} enums, {len(index.threat_severity)} threat severities")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Event Router
+
+Validates mixed domain-event streams against schemas/events/ without the
+consumer knowing the schema of each event up front.
+
+Every event schema shares one envelope (`event_id`, `event_type`,
+`event_version`, `aggregate_type`, `aggregate_id`, `occurred_at`, `actor`,
+`data`, `metadata`). At startup the router compares the envelope fields
+across all event schemas:
+
+- fields whose schema is the same everywhere (`event_id`, `occurred_at`,
+  ...) go into one shared envelope predicate, checked once per event
+- fields that differ per event type (the `aggregate_type` const, the
+  `aggregate_id` pattern, the `actor` variant) and `data` become the checks
+  of that event's route
+
+Routes live in a precomputed (`event_type`, `event_version`) -> route table
+(`validate_data.build_event_routes`). All checks are generated predicates
+(`generate_validators`); events that fail get full error messages from the
+registry validator. Event schemas with top-level keywords beyond the
+envelope (`allOf`, `if`, ...) are checked with their whole-document
+predicate instead.
+
+`validate_batch()` checks every envelope first, then groups events by route
+and runs each group in one tight loop. Results keep the input order.
+
+Usage:
+    from event_router import get_event_router
+
+    router = get_event_router()
+    schema, errors = router.check(event)
+    results = router.validate_batch(events)       # [(schema, [messages]), ...]
+
+    python3 tools/event_router.py events.ndjson
+    python3 tools/event_router.py archive/ --batch-size 5000 --report build/events.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from jsonschema.protocols import Validator
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, ContractValidator, get_registry  # noqa: E402
+from generate_validators import UnsupportedSchemaError, compile_validator  # noqa: E402
+from validate_data import (  # noqa: E402
+    MAX_ERRORS_PER_RECORD,
+    UNPARSEABLE,
+    UNROUTABLE,
+    _positive_int,
+    build_event_routes,
+    iter_records,
+)
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+ENVELOPE = "<envelope>"
+
+# Fields of the common event envelope, in schema order
+ENVELOPE_FIELDS = (
+    "event_id", "event_type", "event_version", "aggregate_type", "aggregate_id",
+    "occurred_at", "actor", "data", "metadata",
+)
+
+# Top-level keywords the envelope/route split reproduces exactly
+_SPLITTABLE = frozenset({
+    "$schema", "$id", "$defs", "$comment", "title", "description", "examples", "notes",
+    "type", "required", "properties", "additionalProperties", "unevaluatedProperties",
+})
+
+# Keywords ignored when comparing field schemas across event types
+_ANNOTATIONS = frozenset({"$comment", "title", "description", "examples", "default", "notes"})
+
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+}
+
+DEFAULT_BATCH_SIZE = 5000
+
+Check = tuple[str, Callable[[Any], bool]]
+
+
+class EventRoute(NamedTuple):
+    """Checks of one (event_type, event_version) beyond the shared envelope"""
+
+    event_type: str
+    event_version: str
+    schema: str
+    required: frozenset[str]
+    allowed: frozenset[str] | None          # None: the envelope's key set already applies
+    checks: tuple[Check, ...]               # (field, predicate), or ("", whole-event predicate)
+
+
+def _normalize(node: Any, doc: dict[str, Any], seen: frozenset[str] = frozenset()) -> Any:
+    """Schema with local `$ref`s inlined and annotations dropped, for comparison"""
+    if isinstance(node, list):
+        return [_normalize(item, doc, seen) for item in node]
+    if not isinstance(node, dict):
+        return node
+    ref = node.get("$ref")
+    merged: dict[str, Any] = {}
+    if isinstance(ref, str) and ref.startswith("#/") and ref not in seen:
+        target = doc
+        for token in ref[2:].split("/"):
+            target = target[token.replace("~1", "/").replace("~0", "~")]
+        merged.update(_normalize(target, doc, seen | {ref}))
+        node = {key: value for key, value in node.items() if key != "$ref"}
+    for key, value in node.items():
+        if key not in _ANNOTATIONS:
+            merged[key] = _normalize(value, doc, seen)
+    return merged
+
+
+def _closed(schema: dict[str, Any]) -> bool:
+    """True when the schema's own `properties` are the only keys it allows"""
+    return False in (schema.get("unevaluatedProperties"), schema.get("additionalProperties"))
+
+
+class EventRouter:
+    """Shared envelope predicate plus a (event_type, event_version) -> EventRoute table"""
+
+    def __init__(self, registry: ContractRegistry | None = None):
+        self.registry = registry or get_registry()
+        self.routes: dict[tuple[str, str], EventRoute] = {}
+        self._envelope_validator: Validator | None = None
+        table = build_event_routes(self.registry)
+        docs = {rel: self.registry.schema(rel) for rel in sorted(set(table.values()))}
+        splittable = {
+            rel for rel, doc in docs.items()
+            if set(doc) <= _SPLITTABLE and doc.get("type") == "object"
+            and doc.get("additionalProperties", False) is False
+            and doc.get("unevaluatedProperties", False) is False
+        }
+        # Event schemas checked with their whole-document predicate
+        self.fallbacks = sorted(set(docs) - splittable)
+        self._build_envelope(docs)
+        for (event_type, event_version), rel in sorted(table.items()):
+            self.routes[(event_type, event_version)] = self._route(
+                event_type, event_version, rel, docs[rel], rel in splittable,
+            )
+
+    # -- construction -------------------------------------------------------
+
+    def _predicate(self, key: str) -> Callable[[Any], bool]:
+        """Generated predicate for a schema or fragment; the registry validator if unsupported"""
+        try:
+            return compile_validator(key, self.registry)
+        except UnsupportedSchemaError:
+            return self.registry.validator(key).is_valid
+
+    def _build_envelope(self, docs: dict[str, dict[str, Any]]) -> None:
+        """Derive the shared checks from the fields every event schema agrees on"""
+        self.shared: dict[str, str] = {}                 # field -> schema key of its predicate
+        self.field_types: dict[str, str] = {}            # field -> JSON type common to all events
+        self._shared_checks: tuple[Check, ...] = ()
+        self.required: frozenset[str] = frozenset()
+        self.allowed: frozenset[str] | None = None
+        if not docs:
+            return
+        properties = {rel: doc.get("properties", {}) for rel, doc in docs.items()}
+        self.required = frozenset.intersection(
+            *(frozenset(doc.get("required", [])) for doc in docs.values())
+        )
+        union = frozenset().union(*properties.values())
+        # A fallback schema may allow keys outside its `properties` (e.g. through allOf)
+        closed = not self.fallbacks and all(_closed(doc) for doc in docs.values())
+        self.allowed = union if closed else None
+
+        checks: list[Check] = []
+        first = next(iter(docs))
+        for field in ENVELOPE_FIELDS:
+            if not all(field in props for props in properties.values()):
+                continue
+            forms = [_normalize(properties[rel][field], docs[rel]) for rel in docs]
+            kinds = {form.get("type") if isinstance(form, dict) else None for form in forms}
+            if all(form == forms[0] for form in forms):
+                key = f"{first.split('/', 1)[1]}#/properties/{field}"
+                self.shared[field] = key
+                checks.append((field, self._predicate(key)))
+            elif len(kinds) == 1 and (kind := kinds.pop()) in _TYPE_CHECKS:
+                self.field_types[field] = kind
+                checks.append((field, _TYPE_CHECKS[kind]))
+        self._shared_checks = tuple(checks)
+
+    def _route(self, event_type: str, event_version: str, rel: str, doc: dict[str, Any],
+               splittable: bool) -> EventRoute:
+        if not splittable:
+            return EventRoute(event_type, event_version, rel, frozenset(), None,
+                              (("", self._predicate(rel)),))
+        props = doc.get("properties", {})
+        allowed = frozenset(props) if _closed(doc) else None
+        checks = tuple(
+            (field, self._predicate(f"{rel.split('/', 1)[1]}#/properties/{field}"))
+            for field in props if field not in self.shared
+        )
+        return EventRoute(
+            event_type, event_version, rel,
+            frozenset(doc.get("required", [])) - self.required,
+            None if allowed == self.allowed else allowed,
+            checks,
+        )
+
+    # -- validation ---------------------------------------------------------
+
+    def envelope_valid(self, event: Any) -> bool:
+        """Shared envelope check: required/allowed keys and the fields common to all events"""
+        if not isinstance(event, dict):
+            return False
+        keys = event.keys()
+        if not self.required <= keys or (self.allowed is not None and not keys <= self.allowed):
+            return False
+        for field, check in self._shared_checks:
+            if field in event and not check(event[field]):
+                return False
+        return True
+
+    @staticmethod
+    def route_valid(route: EventRoute, event: dict[str, Any]) -> bool:
+        """Route-specific checks of an event whose envelope is valid"""
+        keys = event.keys()
+        if not route.required <= keys or (route.allowed is not None and not keys <= route.allowed):
+            return False
+        for field, check in route.checks:
+            if not field:
+                if not check(event):
+                    return False
+            elif field in event and not check(event[field]):
+                return False
+        return True
+
+    @staticmethod
+    def route_key(event: Any) -> tuple[str, str] | None:
+        """(event_type, event_version) of an event; None unless both are strings"""
+        if not isinstance(event, dict):
+            return None
+        event_type, event_version = event.get("event_type"), event.get("event_version")
+        if isinstance(event_type, str) and isinstance(event_version, str):
+            return event_type, event_version
+        return None
+
+    def route(self, event: Any) -> EventRoute | None:
+        key = self.route_key(event)
+        return None if key is None else self.routes.get(key)
+
+    def envelope_validator(self) -> Validator:
+        """Full validator of the shared envelope, for error messages of unroutable events"""
+        if self._envelope_validator is None:
+            properties: dict[str, Any] = {field: True for field in self.allowed or ()}
+            for field, key in self.shared.items():
+                properties[field] = self.registry.validator(key).schema
+            for field, kind in self.field_types.items():
+                properties[field] = {"type": kind}
+            schema: dict[str, Any] = {
+                "type": "object", "required": sorted(self.required), "properties": properties,
+            }
+            if self.allowed is not None:
+                schema["additionalProperties"] = False
+            self._envelope_validator = ContractValidator(
+                schema, registry=self.registry.ref_registry,
+                format_checker=self.registry.format_checker,
+            )
+        return self._envelope_validator
+
+    def explain(self, event: Any) -> tuple[str, list[str]]:
+        """(schema, error messages) from the full validators; slow, for failed events only"""
+        route = self.route(event)
+        if route is not None:
+            rel, errors = route.schema, self.registry.iter_errors(route.schema, event)
+        else:
+            rel, errors = ENVELOPE, self.envelope_validator().iter_errors(event)
+        messages = [
+            f"{error.json_path}: {error.message}"
+            for error in islice(errors, MAX_ERRORS_PER_RECORD)
+        ]
+        if route is None and not messages:
+            return UNROUTABLE, ["No schema matches event_type/event_version"]
+        return rel, messages
+
+    def check(self, event: Any) -> tuple[str, list[str]]:
+        """Validate one event; returns (schema path, error messages)"""
+        if self.envelope_valid(event):
+            route = self.route(event)
+            if route is not None and self.route_valid(route, event):
+                return route.schema, []
+        return self.explain(event)
+
+    def validate_batch(self, events: Iterable[Any]) -> list[tuple[str, list[str]]]:
+        """Validate events grouped by route; results in input order"""
+        events = list(events)
+        results: list[tuple[str, list[str]] | None] = [None] * len(events)
+        groups: dict[tuple[str, str] | None, list[int]] = {}
+        envelope_valid, route_key = self.envelope_valid, self.route_key
+        for index, event in enumerate(events):
+            if envelope_valid(event):
+                key = route_key(event)
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = []
+                group.append(index)
+            else:
+                results[index] = self.explain(event)
+
+        route_valid = self.route_valid
+        for key, indices in groups.items():
+            route = None if key is None else self.routes.get(key)
+            if route is None:
+                for index in indices:
+                    results[index] = (UNROUTABLE, ["No schema matches event_type/event_version"])
+                continue
+            passed: tuple[str, list[str]] = (route.schema, [])
+            for index in indices:
+                event = events[index]
+                results[index] = passed if route_valid(route, event) else self.explain(event)
+        return results  # type: ignore[return-value]
+
+
+_event_router: EventRouter | None = None
+_event_router_lock = threading.Lock()
+
+
+def get_event_router() -> EventRouter:
+    """Return the process-wide router over the shared registry"""
+    global _event_router
+    if _event_router is None:
+        with _event_router_lock:
+            if _event_router is None:
+                _event_router = EventRouter()
+    return _event_router
+
+
+def _batches(records: Iterable[tuple[str, bytes]], size: int) -> Iterator[list[tuple[str, bytes]]]:
+    iterator = iter(records)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Route and validate mixed event streams")
+    parser.add_argument("inputs", nargs="+",
+                        help="NDJSON/JSON files, directories, or '-' for stdin")
+    parser.add_argument("--batch-size", type=_positive_int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Events per validate_batch call (default: {DEFAULT_BATCH_SIZE})")
+    parser.add_argument("--report", type=Path, help="Write per-schema counts as JSON here")
+    parser.add_argument("--show", type=int, default=10, help="Invalid events to print")
+    args = parser.parse_args()
+
+    print("🔍 TarlaAnaliz Event Router\n")
+    router = get_event_router()
+    print(f"Routes: {len(router.routes)}, shared envelope fields: {', '.join(router.shared)}")
+
+    counts: dict[str, dict[str, int]] = {}
+    shown = total = 0
+    started = time.perf_counter()
+    for batch in _batches(iter_records(args.inputs), args.batch_size):
+        sources: list[str] = []
+        events: list[Any] = []
+        for source, raw in batch:
+            total += 1
+            try:
+                events.append(_loads(raw))
+                sources.append(source)
+            except ValueError as e:
+                counts.setdefault(UNPARSEABLE, {"valid": 0, "invalid": 0})["invalid"] += 1
+                print(f"❌ {source}: JSON parse error: {e}")
+        for source, (schema, errors) in zip(sources, router.validate_batch(events)):
+            stats = counts.setdefault(schema, {"valid": 0, "invalid": 0})
+            stats["invalid" if errors else "valid"] += 1
+            if errors and shown < args.show:
+                shown += 1
+                print(f"❌ {source} ({schema}): {errors[0]}")
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*60}")
+    for schema, stats in sorted(counts.items()):
+        print(f"{schema}: {stats['valid']} valid, {stats['invalid']} invalid")
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"\n⏱  {total} events in {elapsed:.2f}s, {rate:,.0f} events/second")
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(counts, indent=2), encoding="utf-8")
+
+    invalid = sum(stats["invalid"] for stats in counts.values())
+    if invalid:
+        print(f"\n❌ {invalid} INVALID EVENT(S)")
+        return 1
+    print("\n✅ ALL EVENTS VALID")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,643 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Fixture Generator
+
+Generates valid instances of any contract schema for benchmarks and load
+tests; docs/examples/ only has a handful of hand-written documents.
+
+Instances are built by walking the schema (through `$ref`s into shared
+schemas and enums/) and respecting:
+
+- `required` (optional properties are included with probability `optional`),
+  `if`/`then`/`else` conditions and `allOf` members
+- `const` / `enum` values, including enum documents in enums/
+- ID and other `pattern`s (fixed shapes via `pattern_checks.parse_fixed_shape`,
+  other simple patterns via a small generator)
+- `minimum` / `maximum` / exclusive bounds / `multipleOf`, string and array
+  lengths, `uniqueItems`
+- `date-time` (`#/$defs/Timestamp`), `date`, `uuid`, `uri` and `email` formats
+- GeoJSON geometries: closed, counterclockwise rings with a matching `bbox`
+  in the GAP region, so `geometry_checks` passes too
+
+A size knob fixes the length of arrays by property name, e.g. `files` in an
+intake manifest or `layers` in an analysis result (`coordinates` sets the
+vertex count of generated rings); `array_size` applies to every other array. Record *i* is seeded from `(seed, i)`, so a
+corpus is reproducible and any slice of it can be regenerated on its own.
+Records are serialized one at a time as NDJSON, so corpus size is bounded by
+disk, not memory.
+
+Usage:
+    from generate_fixtures import FixtureGenerator
+
+    generator = FixtureGenerator(seed=7, sizes={"files": 5000})
+    manifest = generator.generate("edge/intake_manifest.v1.schema.json")
+    for document in generator.iter_fixtures("worker/analysis_result.v1.schema.json", 1000):
+        ...
+
+    python3 tools/generate_fixtures.py worker/analysis_result.v1.schema.json -n 100000 \\
+        --size layers=20 --seed 7 -o results.ndjson
+    python3 tools/generate_fixtures.py edge/intake_manifest.v1.schema.json -n 10 \\
+        --size files=20000 --validate
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from random import Random
+from typing import IO, Any
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def _dumps(document: Any) -> bytes:
+        return orjson.dumps(document)
+except ImportError:
+    def _dumps(document: Any) -> bytes:
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, get_registry  # noqa: E402
+from jsonschema import Draft202012Validator  # noqa: E402
+from pattern_checks import parse_fixed_shape  # noqa: E402
+
+# Timestamps fall in the year after this instant
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+YEAR_SECONDS = 365 * 24 * 3600
+
+# Longitude/latitude box for generated geometries (GAP region, southeastern Türkiye)
+GEO_BOUNDS = (36.5, 36.5, 41.5, 38.5)
+
+GEOMETRY_TYPES = frozenset({
+    "Point", "LineString", "Polygon", "MultiPoint", "MultiLineString", "MultiPolygon",
+    "GeometryCollection",
+})
+GEOJSON_TYPES = GEOMETRY_TYPES | {"Feature", "FeatureCollection"}
+
+# Default extent of unconstrained values
+MAX_ITEMS = 3
+MAX_TEXT = 16
+MAX_NUMBER = 1000
+
+_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+_WORD = frozenset(_ALPHABET + _ALPHABET.upper() + "0123456789_")
+_DIGITS = "0123456789"
+_CLASS_ESCAPES = {"d": _DIGITS, "w": "".join(sorted(_WORD)), "s": " "}
+_ANNOTATIONS = frozenset({"title", "description", "examples", "default", "$comment"})
+
+
+class FixtureError(ValueError):
+    """Raised when a schema uses a construct the generator cannot satisfy"""
+
+
+# ---------------------------------------------------------------------------
+# Patterns
+# ---------------------------------------------------------------------------
+
+# A compiled pattern: (alphabet, min repeats, max repeats) per atom
+_Atoms = list[tuple[str, int, int]]
+_pattern_cache: dict[str, _Atoms] = {}
+
+
+def _class_chars(body: str, pattern: str) -> str:
+    """Characters of a `[...]` class body (ranges and escapes, no negation)"""
+    if body.startswith("^"):
+        raise FixtureError(f"Negated character class in pattern {pattern!r}")
+    chars: set[str] = set()
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\" and i + 1 < len(body):
+            chars.update(_CLASS_ESCAPES.get(body[i + 1], body[i + 1]))
+            i += 2
+        elif i + 2 < len(body) and body[i + 1] == "-":
+            chars.update(chr(c) for c in range(ord(char), ord(body[i + 2]) + 1))
+            i += 3
+        else:
+            chars.add(char)
+            i += 1
+    return "".join(sorted(chars))
+
+
+def compile_pattern(pattern: str) -> _Atoms:
+    """Split an anchored, group-free pattern into atoms with repeat counts"""
+    atoms = _pattern_cache.get(pattern)
+    if atoms is not None:
+        return atoms
+    shape = parse_fixed_shape(pattern)
+    if shape is not None:
+        atoms = [(char, 1, 1) for char in shape.prefix]
+        atoms.append((shape.charset, shape.min_len, shape.max_len))
+        _pattern_cache[pattern] = atoms
+        return atoms
+
+    if not pattern.startswith("^"):
+        raise FixtureError(f"Pattern is not anchored: {pattern!r}")
+    atoms = []
+    i, end = 1, len(pattern) - 1 if pattern.endswith("$") else len(pattern)
+    while i < end:
+        char = pattern[i]
+        if char == "[":
+            close = pattern.index("]", i + 1)
+            alphabet = _class_chars(pattern[i + 1:close], pattern)
+            i = close + 1
+        elif char == "\\":
+            alphabet = _CLASS_ESCAPES.get(pattern[i + 1], pattern[i + 1])
+            i += 2
+        elif char == ".":
+            alphabet = _ALPHABET
+            i += 1
+        elif char in "()|":
+            raise FixtureError(f"Groups and alternation are not supported: {pattern!r}")
+        else:
+            alphabet = char
+            i += 1
+
+        low, high = 1, 1
+        if i < end and pattern[i] in "?*+":
+            low, high = {"?": (0, 1), "*": (0, MAX_ITEMS), "+": (1, MAX_ITEMS)}[pattern[i]]
+            i += 1
+        elif i < end and pattern[i] == "{":
+            close = pattern.index("}", i)
+            bounds = pattern[i + 1:close].split(",")
+            low = int(bounds[0])
+            high = low if len(bounds) == 1 else int(bounds[1] or low + MAX_ITEMS)
+            i = close + 1
+        atoms.append((alphabet, low, high))
+    _pattern_cache[pattern] = atoms
+    return atoms
+
+
+def pattern_string(pattern: str, rng: Random) -> str:
+    """A random string matching `pattern`"""
+    parts = []
+    for alphabet, low, high in compile_pattern(pattern):
+        count = low if low == high else rng.randint(low, high)
+        if len(alphabet) == 1:
+            parts.append(alphabet * count)
+        else:
+            parts.append("".join(rng.choices(alphabet, k=count)))
+    return "".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Geometry
+# ---------------------------------------------------------------------------
+
+def _ring(rng: Random, lon: float, lat: float, vertices: int) -> list[list[float]]:
+    """Closed counterclockwise ring of a star-shaped polygon around (lon, lat)"""
+    radius = rng.uniform(0.002, 0.01)
+    angles = sorted(rng.uniform(0.0, 2 * math.pi) for _ in range(vertices))
+    ring = [
+        [round(lon + radius * rng.uniform(0.6, 1.0) * math.cos(a), 7),
+         round(lat + radius * rng.uniform(0.6, 1.0) * math.sin(a), 7)]
+        for a in angles
+    ]
+    ring.append(list(ring[0]))
+    return ring
+
+
+def _center(rng: Random) -> tuple[float, float]:
+    west, south, east, north = GEO_BOUNDS
+    return rng.uniform(west, east), rng.uniform(south, north)
+
+
+def geometry_coordinates(kind: str, rng: Random, vertices: int | None = None) -> Any:
+    """`coordinates` of a GeoJSON geometry of the given type"""
+    lon, lat = _center(rng)
+    if kind == "Point":
+        return [round(lon, 7), round(lat, 7)]
+    if kind in ("LineString", "MultiPoint"):
+        return _ring(rng, lon, lat, vertices or rng.randint(2, 6))[:-1]
+    if kind == "MultiLineString":
+        return [geometry_coordinates("LineString", rng, vertices) for _ in range(rng.randint(1, 3))]
+    if kind == "Polygon":
+        return [_ring(rng, lon, lat, max(3, vertices or rng.randint(4, 12)))]
+    if kind == "MultiPolygon":
+        return [geometry_coordinates("Polygon", rng, vertices) for _ in range(rng.randint(1, 3))]
+    raise FixtureError(f"No coordinates for geometry type {kind}")
+
+
+def _positions(coordinates: Any) -> Iterator[list[float]]:
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        yield coordinates
+    else:
+        for part in coordinates:
+            yield from _positions(part)
+
+
+def bounding_box(obj: Any) -> list[float] | None:
+    """[west, south, east, north] of a GeoJSON object; None when it has no positions"""
+    if not isinstance(obj, dict):
+        return None
+    kind = obj.get("type")
+    if kind in ("Feature", "FeatureCollection", "GeometryCollection"):
+        parts = (
+            [obj.get("geometry")] if kind == "Feature"
+            else obj.get("features" if kind == "FeatureCollection" else "geometries") or []
+        )
+        boxes = [box for box in map(bounding_box, parts) if box is not None]
+        if not boxes:
+            return None
+        return [min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes)]
+    positions = list(_positions(obj.get("coordinates") or []))
+    if not positions:
+        return None
+    return [min(p[0] for p in positions), min(p[1] for p in positions),
+            max(p[0] for p in positions), max(p[1] for p in positions)]
+
+
+# ---------------------------------------------------------------------------
+# Document-level consistency
+# ---------------------------------------------------------------------------
+
+def _manifest_totals(manifest: dict[str, Any]) -> None:
+    """Totals must agree with the `files` list (checked by verify_intake.py)"""
+    files = manifest.get("files", [])
+    manifest["total_files"] = len(files)
+    manifest["total_size_bytes"] = sum(entry.get("size_bytes", 0) for entry in files)
+
+
+# Repo-relative schema path -> fix-up applied to each generated document
+CONSISTENCY: dict[str, Callable[[dict[str, Any]], None]] = {
+    "schemas/edge/intake_manifest.v1.schema.json": _manifest_totals,
+}
+
+
+# ---------------------------------------------------------------------------
+# Generator
+# ---------------------------------------------------------------------------
+
+class FixtureGenerator:
+    """Seeded generator of schema-valid contract documents"""
+
+    def __init__(
+        self,
+        registry: ContractRegistry | None = None,
+        seed: int = 0,
+        sizes: Mapping[str, int] | None = None,
+        optional: float = 0.5,
+        max_depth: int = 12,
+        array_size: int | None = None,
+    ):
+        if not 0.0 <= optional <= 1.0:
+            raise ValueError(f"optional must be within 0..1, got {optional}")
+        self.registry = registry if registry is not None else get_registry()
+        self.seed = seed
+        self.sizes = dict(sizes or {})
+        self.optional = optional
+        self.max_depth = max_depth
+        self.array_size = array_size
+        self._conditions: dict[int, tuple[dict[str, Any], Draft202012Validator]] = {}
+
+    # -- entry points -------------------------------------------------------
+
+    def rng(self, index: int = 0) -> Random:
+        """The random stream of record `index`"""
+        return Random(f"{self.seed}:{index}")
+
+    def generate(self, key: str, index: int = 0) -> Any:
+        """Record `index` of the corpus for a schema (path, `$id` or `path#/$defs/Name`)"""
+        base, _, fragment = key.partition("#")
+        rel = self.registry.resolve(base)
+        document = self.registry.schema(rel)
+        uri = document.get("$id") or (self.registry.base_dir / rel).as_uri()
+        resolver = self.registry.ref_registry.resolver(base_uri=uri)
+        schema: Any = document
+        if fragment:
+            resolved = resolver.lookup(f"#{fragment}")
+            schema, resolver = resolved.contents, resolved.resolver
+        instance = self._value(schema, resolver, self.rng(index), None, 0)
+        fixup = None if fragment else CONSISTENCY.get(rel)
+        if fixup is not None:
+            fixup(instance)
+        return instance
+
+    def iter_fixtures(self, key: str, count: int, start: int = 0) -> Iterator[Any]:
+        """Records `start` .. `start + count - 1`, generated lazily"""
+        for index in range(start, start + count):
+            yield self.generate(key, index)
+
+    # -- schema walking -----------------------------------------------------
+
+    def _resolve(self, schema: Any, resolver: Any) -> tuple[Any, Any]:
+        """Follow a `$ref` chain; sibling keywords of a `$ref` are merged on top"""
+        while isinstance(schema, dict) and "$ref" in schema:
+            resolved = resolver.lookup(schema["$ref"])
+            siblings = {k: v for k, v in schema.items() if k not in ("$ref", "description")}
+            schema, resolver = resolved.contents, resolved.resolver
+            if siblings and isinstance(schema, dict):
+                schema = {**schema, **siblings}
+        return schema, resolver
+
+    def _value(self, schema: Any, resolver: Any, rng: Random, name: str | None, depth: int) -> Any:
+        schema, resolver = self._resolve(schema, resolver)
+        if schema is True or schema == {}:
+            return rng.choice((rng.randint(0, MAX_NUMBER), self._text(rng, 1, 8), True))
+        if not isinstance(schema, dict):
+            raise FixtureError(f"Cannot generate from schema {schema!r}")
+        if depth > self.max_depth:
+            raise FixtureError(f"Schema nesting deeper than {self.max_depth} at {name!r}")
+
+        if "const" in schema:
+            return schema["const"]
+        if "enum" in schema:
+            return rng.choice(schema["enum"])
+        for keyword in ("oneOf", "anyOf"):
+            if keyword in schema:
+                rest = {k: v for k, v in schema.items() if k not in _ANNOTATIONS and k != keyword}
+                branch, branch_resolver = self._resolve(rng.choice(schema[keyword]), resolver)
+                if isinstance(branch, dict) and all(
+                    rest[k] == branch[k] for k in rest.keys() & branch.keys()
+                ):
+                    return self._value({**rest, **branch}, branch_resolver, rng, name, depth + 1)
+                return self._value({**rest, "allOf": [*rest.get("allOf", []), branch]},
+                                   resolver, rng, name, depth + 1)
+
+        kind = self._type(schema, resolver, rng)
+        if kind == "object":
+            return self._object(schema, resolver, rng, depth)
+        if kind == "array":
+            return self._array(schema, resolver, rng, name, depth)
+        if kind == "string":
+            return self._string(schema, rng)
+        if kind in ("number", "integer"):
+            return self._number(schema, rng, kind == "integer")
+        if kind == "boolean":
+            return rng.random() < 0.5
+        if kind == "null":
+            return None
+        raise FixtureError(f"Unsupported type {kind!r}")
+
+    def _type(self, schema: dict[str, Any], resolver: Any, rng: Random) -> str:
+        kind = schema.get("type")
+        if isinstance(kind, list):
+            choices = [k for k in kind if k != "null"] or kind
+            return rng.choice(choices)
+        if kind is not None:
+            return kind
+        for member in schema.get("allOf", ()):
+            member, _ = self._resolve(member, resolver)
+            if isinstance(member, dict) and "type" in member:
+                return self._type(member, resolver, rng)
+        if "properties" in schema or "required" in schema:
+            return "object"
+        if "items" in schema:
+            return "array"
+        return "string"
+
+    # -- objects ------------------------------------------------------------
+
+    def _members(
+        self, schema: dict[str, Any], resolver: Any
+    ) -> Iterator[tuple[dict[str, Any], Any]]:
+        """The schema and its (resolved, nested) `allOf` members"""
+        yield schema, resolver
+        for member in schema.get("allOf", ()):
+            member, member_resolver = self._resolve(member, resolver)
+            if isinstance(member, dict):
+                yield from self._members(member, member_resolver)
+
+    def _condition(self, schema: dict[str, Any], resolver: Any) -> Draft202012Validator:
+        entry = self._conditions.get(id(schema))
+        if entry is None or entry[0] is not schema:
+            validator = Draft202012Validator(schema, registry=self.registry.ref_registry,
+                                             _resolver=resolver)
+            entry = (schema, validator)
+            self._conditions[id(schema)] = entry
+        return entry[1]
+
+    def _object(self, schema: dict[str, Any], resolver: Any, rng: Random, depth: int) -> Any:
+        properties: dict[str, tuple[Any, Any]] = {}
+        required: list[str] = []
+        conditions = []
+        for member, member_resolver in self._members(schema, resolver):
+            for prop, subschema in (member.get("properties") or {}).items():
+                properties.setdefault(prop, (subschema, member_resolver))
+            required += [prop for prop in member.get("required", ()) if prop not in required]
+            if "if" in member:
+                conditions.append((member, member_resolver))
+
+        instance: dict[str, Any] = {}
+        geometry = self._geometry_type(properties)
+        for prop, (subschema, prop_resolver) in properties.items():
+            if prop in required or rng.random() < self.optional:
+                instance[prop] = self._property(prop, subschema, prop_resolver, rng, depth,
+                                                geometry)
+
+        # Conditional requirements depend on generated values, so settle them afterwards
+        for member, member_resolver in conditions:
+            matched = self._condition(member["if"], member_resolver).is_valid(instance)
+            branch = member.get("then" if matched else "else")
+            if not isinstance(branch, dict):
+                continue
+            branch, branch_resolver = self._resolve(branch, member_resolver)
+            for prop, subschema in (branch.get("properties") or {}).items():
+                properties.setdefault(prop, (subschema, branch_resolver))
+            for prop in branch.get("required", ()):
+                if prop not in instance:
+                    subschema, prop_resolver = properties.get(prop, (True, branch_resolver))
+                    instance[prop] = self._property(prop, subschema, prop_resolver, rng, depth,
+                                                    geometry)
+
+        if "bbox" in instance and instance.get("type") in GEOJSON_TYPES:
+            box = bounding_box(instance)
+            if box is None:
+                del instance["bbox"]
+            else:
+                instance["bbox"] = box
+        minimum = schema.get("minProperties", 0)
+        for prop, (subschema, prop_resolver) in properties.items():
+            if len(instance) >= minimum:
+                break
+            if prop not in instance:
+                instance[prop] = self._property(prop, subschema, prop_resolver, rng, depth,
+                                                geometry)
+        return instance
+
+    @staticmethod
+    def _geometry_type(properties: dict[str, tuple[Any, Any]]) -> str | None:
+        """The GeoJSON geometry type an object schema is pinned to, if any"""
+        tag = properties.get("type", ({}, None))[0]
+        kind = tag.get("const") if isinstance(tag, dict) else None
+        if kind in GEOMETRY_TYPES and ("coordinates" in properties or "geometries" in properties):
+            return kind
+        return None
+
+    def _property(self, prop: str, schema: Any, resolver: Any, rng: Random, depth: int,
+                  geometry: str | None) -> Any:
+        if geometry is not None and prop == "coordinates":
+            return geometry_coordinates(geometry, rng, self.sizes.get("coordinates"))
+        if geometry is not None and prop == "geometries":
+            return [
+                {"type": kind, "coordinates": geometry_coordinates(kind, rng)}
+                for kind in rng.choices(("Point", "LineString", "Polygon"), k=rng.randint(1, 3))
+            ]
+        return self._value(schema, resolver, rng, prop, depth + 1)
+
+    # -- arrays, strings, numbers -------------------------------------------
+
+    def _array(self, schema: dict[str, Any], resolver: Any, rng: Random, name: str | None,
+               depth: int) -> list[Any]:
+        low = schema.get("minItems", 0)
+        high = schema.get("maxItems", sys.maxsize)
+        size = self.sizes.get(name, self.array_size) if name is not None else self.array_size
+        if size is None:
+            size = rng.randint(low, max(low, MAX_ITEMS))
+        count = min(max(size, low), high)
+        items = schema.get("items", True)
+
+        if not schema.get("uniqueItems"):
+            return [self._value(items, resolver, rng, None, depth + 1) for _ in range(count)]
+        resolved, _ = self._resolve(items, resolver)
+        if isinstance(resolved, dict) and "enum" in resolved:
+            return rng.sample(resolved["enum"], min(count, len(resolved["enum"])))
+        values: list[Any] = []
+        seen: set[str] = set()
+        for _ in range(count * 10):
+            if len(values) == count:
+                break
+            value = self._value(items, resolver, rng, None, depth + 1)
+            encoded = json.dumps(value, sort_keys=True)
+            if encoded not in seen:
+                seen.add(encoded)
+                values.append(value)
+        if len(values) < low:
+            raise FixtureError(f"Cannot generate {low} unique items for {name!r}")
+        return values
+
+    @staticmethod
+    def _text(rng: Random, low: int, high: int) -> str:
+        return "".join(rng.choices(_ALPHABET, k=rng.randint(low, high)))
+
+    def _string(self, schema: dict[str, Any], rng: Random) -> str:
+        if "pattern" in schema:
+            return pattern_string(schema["pattern"], rng)
+        form = schema.get("format")
+        if form == "date-time":
+            moment = EPOCH + timedelta(seconds=rng.randrange(YEAR_SECONDS))
+            return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+        if form == "date":
+            return (EPOCH + timedelta(days=rng.randrange(365))).strftime("%Y-%m-%d")
+        if form == "uuid":
+            return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        if form == "uri":
+            return f"https://example.com/{self._text(rng, 4, 12)}/{rng.getrandbits(32):08x}"
+        if form == "email":
+            return f"{self._text(rng, 3, 10)}@example.com"
+        low = schema.get("minLength", 1)
+        high = schema.get("maxLength", max(low, MAX_TEXT))
+        return self._text(rng, low, min(high, max(low, MAX_TEXT)))
+
+    @staticmethod
+    def _number(schema: dict[str, Any], rng: Random, integer: bool) -> int | float:
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        high = schema.get("maximum", schema.get("exclusiveMaximum", low + MAX_NUMBER))
+        step = schema.get("multipleOf")
+        if integer or (isinstance(step, int) and step):
+            step = step or 1
+            first = math.ceil(low / step) + ("exclusiveMinimum" in schema and low % step == 0)
+            last = math.floor(high / step) - ("exclusiveMaximum" in schema and high % step == 0)
+            if first > last:
+                raise FixtureError(f"No multiple of {step} within {low}..{high}")
+            return rng.randint(first, last) * step
+        for _ in range(100):
+            value = round(rng.uniform(low, high), 6)
+            if step:
+                value = round(round(value / step) * step, 10)
+                # jsonschema checks float multiples by exact division
+                if value / step != int(value / step):
+                    continue
+            if (("exclusiveMinimum" in schema and value <= low)
+                    or ("exclusiveMaximum" in schema and value >= high)
+                    or not low <= value <= high):
+                continue
+            return value
+        raise FixtureError(f"No number satisfies {schema!r}")
+
+
+# ---------------------------------------------------------------------------
+# NDJSON
+# ---------------------------------------------------------------------------
+
+def write_ndjson(documents: Iterable[Any], fp: IO[bytes]) -> tuple[int, int]:
+    """Write one JSON document per line; returns (records, bytes)"""
+    records = written = 0
+    for document in documents:
+        line = _dumps(document) + b"\n"
+        fp.write(line)
+        records += 1
+        written += len(line)
+    return records, written
+
+
+def _size(text: str) -> tuple[str, int]:
+    name, sep, value = text.partition("=")
+    if not sep or not value.isdigit():
+        raise argparse.ArgumentTypeError(f"Expected NAME=COUNT, got {text!r}")
+    return name, int(value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate valid contract fixtures as NDJSON")
+    parser.add_argument("schema", help="Schema path or $id (optionally #/$defs/Name)")
+    parser.add_argument("-n", "--count", type=int, default=1, help="Records to generate")
+    parser.add_argument("--start", type=int, default=0, help="Index of the first record")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+    parser.add_argument("--size", type=_size, action="append", default=[], metavar="NAME=COUNT",
+                        help="Length of arrays under this property, e.g. files=5000")
+    parser.add_argument("--optional", type=float, default=0.5,
+                        help="Probability of including each optional property")
+    parser.add_argument("-o", "--output", type=Path, help="NDJSON file (default: stdout)")
+    parser.add_argument("--validate", action="store_true",
+                        help="Validate every record against the schema while generating")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    generator = FixtureGenerator(registry, args.seed, dict(args.size), args.optional)
+    documents = generator.iter_fixtures(args.schema, args.count, args.start)
+    invalid = 0
+    if args.validate:
+        validator = registry.validator(args.schema)
+
+        def checked(items: Iterator[Any]) -> Iterator[Any]:
+            nonlocal invalid
+            for index, document in enumerate(items, args.start):
+                error = next(validator.iter_errors(document), None)
+                if error is not None:
+                    invalid += 1
+                    print(f"❌ record {index}: {error.json_path}: {error.message}",
+                          file=sys.stderr)
+                yield document
+
+        documents = checked(documents)
+
+    started = time.perf_counter()
+    if args.output is None:
+        records, written = write_ndjson(documents, sys.stdout.buffer)
+        sys.stdout.flush()
+    else:
+        with open(args.output, "wb") as fp:
+            records, written = write_ndjson(documents, fp)
+    elapsed = time.perf_counter() - started
+
+    print(f"⏱  {records} record(s), {written / 1e6:.1f} MB in {elapsed:.2f}s "
+          f"({records / elapsed if elapsed else 0:.0f} records/s)", file=sys.stderr)
+    if invalid:
+        print(f"❌ {invalid} invalid record(s)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
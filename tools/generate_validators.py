@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Specialized Validator Generator
+
+Turns Draft 2020-12 contract schemas into plain Python predicate functions.
+Instead of interpreting keywords at runtime, the generated code inlines
+required-key checks, uses precomputed property frozensets, compiled patterns
+and enum sets, and handles `unevaluatedProperties: false` as a key-set
+difference computed once at generation time.
+
+Generated functions answer "is this payload valid?" only. When one returns
+False, use the registry validator (`contract_registry`) to get detailed errors.
+
+Usage:
+    python3 tools/generate_validators.py                     # hot contracts
+    python3 tools/generate_validators.py --schema core/field.v1.schema.json
+    python3 tools/generate_validators.py --all --output generated/python/validators.py
+    python3 tools/generate_validators.py --check-parity      # compare on docs/examples
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urldefrag, urljoin
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import BASE_DIR, ContractRegistry, get_registry  # noqa: E402
+from discriminator import find_discriminator  # noqa: E402
+
+# Contracts on the validation hot path; generated by default
+HOT_SCHEMAS = [
+    "worker/analysis_result.v1.schema.json",
+    "edge/intake_manifest.v1.schema.json",
+    "events/analysis_completed.v1.schema.json",
+]
+
+DEFAULT_OUTPUT = BASE_DIR / "generated" / "python" / "contract_validators.py"
+
+# Keywords the generator does not implement; schemas using them are rejected
+UNSUPPORTED_KEYWORDS = frozenset({
+    "$dynamicRef", "$dynamicAnchor", "$recursiveRef", "contains", "dependentRequired",
+    "dependentSchemas", "maxContains", "minContains", "patternProperties", "prefixItems",
+    "propertyNames", "unevaluatedItems",
+})
+
+TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+# Runtime support emitted once at the top of every generated module
+RUNTIME_HELPERS = '''\
+_MISSING = object()
+
+
+def _freeze(v):
+    """Hashable form with JSON equality semantics (bools never equal numbers)"""
+    if isinstance(v, bool):
+        return (bool, v)
+    if isinstance(v, dict):
+        return (dict, frozenset((k, _freeze(x)) for k, x in v.items()))
+    if isinstance(v, list):
+        return (list, tuple(_freeze(x) for x in v))
+    return v
+
+
+def _unique(items):
+    seen = set()
+    for item in items:
+        key = _freeze(item)
+        if key in seen:
+            return False
+        seen.add(key)
+    return True
+
+
+def _multiple_of(v, divisor):
+    if isinstance(divisor, float):
+        quotient = v / divisor
+        try:
+            return int(quotient) == quotient
+        except OverflowError:
+            return False
+    return not v % divisor
+'''
+
+
+class UnsupportedSchemaError(Exception):
+    """Raised when a schema uses constructs the generator cannot specialize"""
+
+
+class _AllEvaluated:
+    """Marker: every instance property is evaluated (additional/unevaluatedProperties present)"""
+
+
+ALL_EVALUATED = _AllEvaluated()
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^0-9a-zA-Z]+", "_", text).strip("_").lower()
+
+
+def _schema_slug(rel_path: str) -> str:
+    """'schemas/worker/analysis_result.v1.schema.json' -> 'worker_analysis_result_v1'"""
+    name = rel_path.split("/", 1)[1] if rel_path.startswith(("schemas/", "enums/")) else rel_path
+    for suffix in (".schema.json", ".json"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    return _slug(name)
+
+
+def _resolve_pointer(doc: Any, fragment: str) -> Any:
+    """Resolve a JSON pointer fragment ('/$defs/Timestamp') inside a document"""
+    node = doc
+    if not fragment:
+        return node
+    for token in fragment.lstrip("/").split("/"):
+        token = unquote(token).replace("~1", "/").replace("~0", "~")
+        node = node[int(token)] if isinstance(node, list) else node[token]
+    return node
+
+
+class ValidatorGenerator:
+    """Emits Python source for specialized schema predicates"""
+
+    def __init__(self, registry: ContractRegistry | None = None):
+        self.registry = registry or get_registry()
+        self._constants: dict[str, str] = {}
+        self._functions: list[str] = []
+        self._ref_names: dict[str, str] = {}
+        self._roots: dict[str, str] = {}
+        self._counter = 0
+
+    # ------------------------------------------------------------------
+    # Naming helpers
+    # ------------------------------------------------------------------
+
+    def _next(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _const(self, prefix: str, source: str) -> str:
+        """Register a module-level constant, reusing identical definitions"""
+        name = self._constants.get(source)
+        if name is None:
+            name = self._next(prefix)
+            self._constants[source] = name
+        return name
+
+    def _base_uri(self, rel: str) -> str:
+        doc = self.registry.schema(rel)
+        doc_id = doc.get("$id")
+        if isinstance(doc_id, str) and doc_id:
+            return doc_id
+        return (self.registry.base_dir / rel).as_uri()
+
+    def _lookup(self, base_uri: str, ref: str) -> tuple[str, Any, str]:
+        """Resolve a $ref to (absolute uri, target schema, base uri of target document)"""
+        target = urljoin(base_uri, ref)
+        doc_uri, fragment = urldefrag(target)
+        try:
+            doc = self.registry.schema(doc_uri)
+        except KeyError:
+            raise UnsupportedSchemaError(f"Unresolvable $ref {ref!r} from {base_uri}") from None
+        return target, _resolve_pointer(doc, fragment), doc_uri
+
+    # ------------------------------------------------------------------
+    # Functions
+    # ------------------------------------------------------------------
+
+    def _define(self, name: str, schema: Any, base_uri: str) -> str:
+        body = self._emit(schema, "v", base_uri, "    ")
+        self._functions.append(f"def {name}(v):\n" + "".join(body) + "    return True\n")
+        return name
+
+    def _ref_function(self, base_uri: str, ref: str) -> str:
+        target, schema, doc_uri = self._lookup(base_uri, ref)
+        name = self._ref_names.get(target)
+        if name is None:
+            doc_rel = self.registry.resolve(doc_uri)
+            fragment = urldefrag(target)[1]
+            name = self._next(f"_ref_{_schema_slug(doc_rel)}_{_slug(fragment.split('/')[-1])}_")
+            # Register before emitting the body so recursive refs terminate
+            self._ref_names[target] = name
+            self._define(name, schema, doc_uri)
+        return name
+
+    def _branch(self, schema: Any, base_uri: str) -> str:
+        return self._define(self._next("_branch"), schema, base_uri)
+
+    def add_schema(self, key: str) -> str:
+        """Generate the root predicate for a schema or `schema#/json/pointer`; returns its name"""
+        base, _, fragment = key.partition("#")
+        rel = self.registry.resolve(base)
+        root = f"{rel}#{fragment}" if fragment else rel
+        if root in self._roots:
+            return self._roots[root]
+        try:
+            schema = _resolve_pointer(self.registry.schema(rel), fragment)
+        except (KeyError, IndexError, ValueError):
+            raise KeyError(f"Unknown contract schema: {key}") from None
+        name = f"is_valid_{_schema_slug(rel)}" + (f"_{_slug(fragment)}" if fragment else "")
+        snapshot = (dict(self._constants), len(self._functions), dict(self._ref_names))
+        try:
+            self._define(name, schema, self._base_uri(rel))
+        except UnsupportedSchemaError:
+            # Drop partially generated helpers so the module stays consistent
+            self._constants, self._ref_names = snapshot[0], snapshot[2]
+            del self._functions[snapshot[1]:]
+            raise
+        self._roots[root] = name
+        return name
+
+    @property
+    def roots(self) -> dict[str, str]:
+        """Schema path (with `#fragment` for fragments) -> generated root function name"""
+        return dict(self._roots)
+
+    def _root_id(self, root: str) -> str:
+        rel, sep, fragment = root.partition("#")
+        return f"{self.registry.schema(rel).get('$id', rel)}{sep}{fragment}"
+
+    # ------------------------------------------------------------------
+    # unevaluatedProperties analysis
+    # ------------------------------------------------------------------
+
+    def _evaluated_keys(
+        self, schema: Any, base_uri: str, seen: frozenset[str], top: bool = False
+    ) -> frozenset[str] | _AllEvaluated:
+        """Statically compute the property names evaluated at this instance location"""
+        static, dynamic = self._collect_evaluated(schema, base_uri, seen, top)
+        if static is ALL_EVALUATED:
+            return ALL_EVALUATED
+        for branch in dynamic:
+            # Conditional branches may only annotate keys that are evaluated anyway
+            if branch is ALL_EVALUATED or not branch <= static:  # type: ignore[operator]
+                raise UnsupportedSchemaError(
+                    "anyOf/oneOf/if branches evaluate properties dynamically"
+                )
+        return frozenset(static)  # type: ignore[arg-type]
+
+    def _collect_evaluated(
+        self, schema: Any, base_uri: str, seen: frozenset[str], top: bool
+    ) -> tuple[set[str] | _AllEvaluated, list[set[str] | _AllEvaluated]]:
+        """Split evaluated keys into always-applied (static) and conditional (dynamic) sets"""
+        if not isinstance(schema, dict):
+            return set(), []
+        if "additionalProperties" in schema or (not top and "unevaluatedProperties" in schema):
+            return ALL_EVALUATED, []
+
+        keys = set(schema.get("properties", {}))
+        dynamic: list[set[str] | _AllEvaluated] = []
+
+        applied: list[tuple[Any, str]] = [(sub, base_uri) for sub in schema.get("allOf", [])]
+        if "$ref" in schema:
+            target, sub, doc_uri = self._lookup(base_uri, schema["$ref"])
+            if target not in seen:
+                seen = seen | {target}
+                applied.append((sub, doc_uri))
+        for sub, uri in applied:
+            sub_static, sub_dynamic = self._collect_evaluated(sub, uri, seen, False)
+            if sub_static is ALL_EVALUATED:
+                return ALL_EVALUATED, []
+            keys |= sub_static  # type: ignore[operator]
+            dynamic += sub_dynamic
+
+        for keyword in ("anyOf", "oneOf"):
+            branches = [
+                self._collect_evaluated(b, base_uri, seen, False) for b in schema.get(keyword, [])
+            ]
+            if branches and all(b_static is ALL_EVALUATED for b_static, _ in branches):
+                # Every branch closes the object itself, so any passing branch evaluates all keys
+                return ALL_EVALUATED, []
+            for b_static, b_dynamic in branches:
+                dynamic += [b_static, *b_dynamic]
+
+        for keyword in ("if", "then", "else"):
+            if keyword in schema:
+                b_static, b_dynamic = self._collect_evaluated(schema[keyword], base_uri, seen, False)
+                dynamic += [b_static, *b_dynamic]
+        return keys, dynamic
+
+    # ------------------------------------------------------------------
+    # Keyword emission
+    # ------------------------------------------------------------------
+
+    def _emit(self, schema: Any, v: str, base_uri: str, ind: str) -> list[str]:
+        """Return source lines that `return False` when `v` violates `schema`"""
+        if schema is True:
+            return []
+        if schema is False:
+            return [f"{ind}return False\n"]
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"Invalid subschema: {schema!r}")
+
+        unsupported = UNSUPPORTED_KEYWORDS.intersection(schema)
+        if unsupported:
+            raise UnsupportedSchemaError(f"Unsupported keywords: {sorted(unsupported)}")
+        if schema.get("unevaluatedProperties", False) is not False:
+            raise UnsupportedSchemaError("Only unevaluatedProperties: false is supported")
+        if "items" in schema and isinstance(schema["items"], list):
+            raise UnsupportedSchemaError("Tuple-form items is not supported")
+
+        lines: list[str] = []
+        fail = f"{ind}    return False\n"
+
+        if "$ref" in schema:
+            lines += [f"{ind}if not {self._ref_function(base_uri, schema['$ref'])}({v}):\n", fail]
+
+        known = None
+        types = schema.get("type")
+        if types is not None:
+            if isinstance(types, str):
+                known = types
+                types = [types]
+            checks = " or ".join(TYPE_CHECKS[t].format(v=v) for t in types)
+            if len(types) > 1:
+                checks = f"({checks})"
+            lines += [f"{ind}if not {checks}:\n", fail]
+
+        if "enum" in schema:
+            values = schema["enum"]
+            if all(isinstance(x, str) for x in values):
+                name = self._const("_E", f"frozenset({sorted(values)!r})")
+                guard = "" if known == "string" else f"not isinstance({v}, str) or "
+                lines += [f"{ind}if {guard}{v} not in {name}:\n", fail]
+            else:
+                name = self._const("_E", f"frozenset(_freeze(x) for x in {values!r})")
+                lines += [f"{ind}if _freeze({v}) not in {name}:\n", fail]
+
+        if "const" in schema:
+            value = schema["const"]
+            if isinstance(value, str):
+                lines += [f"{ind}if {v} != {value!r}:\n", fail]
+            else:
+                name = self._const("_C", f"_freeze({value!r})")
+                lines += [f"{ind}if _freeze({v}) != {name}:\n", fail]
+
+        if "format" in schema:
+            lines += [f"{ind}if not _conforms({v}, {schema['format']!r}):\n", fail]
+
+        lines += self._guarded(known, "string", f"isinstance({v}, str)", ind,
+                               lambda i: self._emit_string(schema, v, i))
+        lines += self._guarded(known, ("number", "integer"), TYPE_CHECKS["number"].format(v=v),
+                               ind, lambda i: self._emit_number(schema, v, i))
+        lines += self._guarded(known, "array", f"isinstance({v}, list)", ind,
+                               lambda i: self._emit_array(schema, v, base_uri, i))
+        lines += self._guarded(known, "object", f"isinstance({v}, dict)", ind,
+                               lambda i: self._emit_object(schema, v, base_uri, i))
+
+        lines += self._emit_applicators(schema, v, base_uri, ind)
+        return lines
+
+    def _guarded(
+        self, known: str | None, kinds: str | tuple[str, ...], check: str, ind: str,
+        emit: Callable[[str], list[str]],
+    ) -> list[str]:
+        """Emit type-specific checks, wrapped in an isinstance guard unless the type is known"""
+        if known is not None and known in ((kinds,) if isinstance(kinds, str) else kinds):
+            return emit(ind)
+        body = emit(ind + "    ")
+        if not body:
+            return []
+        return [f"{ind}if {check}:\n", *body]
+
+    def _emit_string(self, schema: dict[str, Any], v: str, ind: str) -> list[str]:
+        lines: list[str] = []
+        fail = f"{ind}    return False\n"
+        if "minLength" in schema:
+            lines += [f"{ind}if len({v}) < {schema['minLength']!r}:\n", fail]
+        if "maxLength" in schema:
+            lines += [f"{ind}if len({v}) > {schema['maxLength']!r}:\n", fail]
+        if "pattern" in schema:
+            name = self._const("_P", f"re.compile({schema['pattern']!r})")
+            lines += [f"{ind}if not {name}.search({v}):\n", fail]
+        return lines
+
+    def _emit_number(self, schema: dict[str, Any], v: str, ind: str) -> list[str]:
+        lines: list[str] = []
+        fail = f"{ind}    return False\n"
+        for keyword, op in (("minimum", "<"), ("maximum", ">"),
+                            ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+            if keyword in schema:
+                lines += [f"{ind}if {v} {op} {schema[keyword]!r}:\n", fail]
+        if "multipleOf" in schema:
+            lines += [f"{ind}if not _multiple_of({v}, {schema['multipleOf']!r}):\n", fail]
+        return lines
+
+    def _emit_array(self, schema: dict[str, Any], v: str, base_uri: str, ind: str) -> list[str]:
+        lines: list[str] = []
+        fail = f"{ind}    return False\n"
+        if "minItems" in schema:
+            lines += [f"{ind}if len({v}) < {schema['minItems']!r}:\n", fail]
+        if "maxItems" in schema:
+            lines += [f"{ind}if len({v}) > {schema['maxItems']!r}:\n", fail]
+        if schema.get("uniqueItems"):
+            lines += [f"{ind}if not _unique({v}):\n", fail]
+        if "items" in schema:
+            item = self._next("v")
+            body = self._emit(schema["items"], item, base_uri, ind + "    ")
+            if body:
+                lines += [f"{ind}for {item} in {v}:\n", *body]
+        return lines
+
+    def _emit_object(self, schema: dict[str, Any], v: str, base_uri: str, ind: str) -> list[str]:
+        lines: list[str] = []
+        fail = f"{ind}    return False\n"
+
+        required = schema.get("required", [])
+        if required:
+            checks = " and ".join(f"{key!r} in {v}" for key in required)
+            lines += [f"{ind}if not ({checks}):\n", fail]
+
+        properties = schema.get("properties", {})
+        for key, subschema in properties.items():
+            value = self._next("v")
+            body = self._emit(subschema, value, base_uri, ind + "    ")
+            if body:
+                lines += [
+                    f"{ind}{value} = {v}.get({key!r}, _MISSING)\n",
+                    f"{ind}if {value} is not _MISSING:\n",
+                    *body,
+                ]
+
+        if "minProperties" in schema:
+            lines += [f"{ind}if len({v}) < {schema['minProperties']!r}:\n", fail]
+        if "maxProperties" in schema:
+            lines += [f"{ind}if len({v}) > {schema['maxProperties']!r}:\n", fail]
+
+        additional = schema.get("additionalProperties", True)
+        if additional is not True:
+            names = self._const("_K", f"frozenset({sorted(properties)!r})")
+            if additional is False:
+                lines += [f"{ind}if not {names}.issuperset({v}):\n", fail]
+            else:
+                key, value = self._next("k"), self._next("v")
+                body = self._emit(additional, value, base_uri, ind + "        ")
+                if body:
+                    lines += [
+                        f"{ind}for {key}, {value} in {v}.items():\n",
+                        f"{ind}    if {key} not in {names}:\n",
+                        *body,
+                    ]
+        elif "unevaluatedProperties" in schema:
+            evaluated = self._evaluated_keys(schema, base_uri, frozenset(), top=True)
+            if evaluated is not ALL_EVALUATED:
+                names = self._const("_K", f"frozenset({sorted(evaluated)!r})")  # type: ignore[arg-type]
+                lines += [f"{ind}if not {names}.issuperset({v}):\n", fail]
+        return lines
+
+    def _chain(self, branch: Any, base_uri: str) -> list[Any]:
+        """A union branch followed by every schema its `$ref` chain points at"""
+        chain = [branch]
+        seen: set[str] = set()
+        while isinstance(branch, dict) and isinstance(branch.get("$ref"), str):
+            target, branch, base_uri = self._lookup(base_uri, branch["$ref"])
+            if target in seen:
+                break
+            seen.add(target)
+            chain.append(branch)
+        return chain
+
+    def _emit_union(self, keyword: str, branches: list[Any], v: str, base_uri: str,
+                    ind: str) -> list[str]:
+        """anyOf/oneOf; tagged unions (discriminator.py) test only the branch named by the tag"""
+        fail = f"{ind}    return False\n"
+        names = [self._branch(b, base_uri) for b in branches]
+        if keyword == "anyOf":
+            check = [f"{ind}if not ({' or '.join(f'{name}({v})' for name in names)}):\n", fail]
+        else:
+            calls = ", ".join(f"{name}({v})" for name in names)
+            check = [f"{ind}if [{calls}].count(True) != 1:\n", fail]
+
+        found = find_discriminator(branches, lambda branch: self._chain(branch, base_uri))
+        if found is None:
+            return check
+        values: dict[int, list[str]] = {}
+        for value, index in sorted(found.branches.items()):
+            values.setdefault(index, []).append(value)
+        tag = self._next("t")
+        lines = [f"{ind}{tag} = {v}.get({found.property!r}) if isinstance({v}, dict) else None\n"]
+        for n, (index, tags) in enumerate(sorted(values.items())):
+            condition = f"{tag} == {tags[0]!r}" if len(tags) == 1 else f"{tag} in {tuple(tags)!r}"
+            lines += [
+                f"{ind}{'elif' if n else 'if'} {condition}:\n",
+                f"{ind}    if not {names[index]}({v}):\n",
+                f"{ind}        return False\n",
+            ]
+        lines.append(f"{ind}else:\n")
+        lines += [f"    {line}" for line in check]
+        return lines
+
+    def _emit_applicators(self, schema: dict[str, Any], v: str, base_uri: str, ind: str) -> list[str]:
+        lines: list[str] = []
+        fail = f"{ind}    return False\n"
+
+        for subschema in schema.get("allOf", []):
+            lines += self._emit(subschema, v, base_uri, ind)
+
+        for keyword in ("anyOf", "oneOf"):
+            if keyword in schema:
+                lines += self._emit_union(keyword, schema[keyword], v, base_uri, ind)
+
+        if "not" in schema:
+            lines += [f"{ind}if {self._branch(schema['not'], base_uri)}({v}):\n", fail]
+
+        if "if" in schema and ("then" in schema or "else" in schema):
+            then_lines = self._emit(schema.get("then", True), v, base_uri, ind + "    ")
+            else_lines = self._emit(schema.get("else", True), v, base_uri, ind + "    ")
+            condition = f"{self._branch(schema['if'], base_uri)}({v})"
+            if then_lines:
+                lines += [f"{ind}if {condition}:\n", *then_lines]
+                if else_lines:
+                    lines += [f"{ind}else:\n", *else_lines]
+            elif else_lines:
+                lines += [f"{ind}if not {condition}:\n", *else_lines]
+        return lines
+
+    # ------------------------------------------------------------------
+    # Module output
+    # ------------------------------------------------------------------
+
+    def source(self) -> str:
+        """Return the complete generated module"""
+        sources = "\n".join(f"    {root}" for root in self._roots)
+        header = (
+            '"""\n'
+            "Generated contract validators -- DO NOT EDIT.\n\n"
+            f"Source schemas:\n{sources}\n\n"
+            "Regenerate with: python3 tools/generate_validators.py\n"
+            '"""\n'
+            "import re\n\n"
+            "try:\n"
+            "    from format_checks import FORMAT_CHECKER as _FORMAT_CHECKER\n"
+            "except ImportError:\n"
+            "    from jsonschema import Draft202012Validator\n\n"
+            "    _FORMAT_CHECKER = Draft202012Validator.FORMAT_CHECKER\n\n"
+            "_conforms = _FORMAT_CHECKER.conforms\n"
+        )
+        constants = "".join(f"{name} = {src}\n" for src, name in self._constants.items())
+        table = "".join(
+            f"    {self._root_id(root)!r}: {name},\n" for root, name in self._roots.items()
+        )
+        return (
+            f"{header}{RUNTIME_HELPERS}\n\n{constants}\n\n"
+            + "\n\n".join(self._functions)
+            + f"\n\nVALIDATORS = {{\n{table}}}\n"
+        )
+
+
+def generate_source(keys: Iterable[str], registry: ContractRegistry | None = None) -> str:
+    """Generate one module containing predicates for all given schemas"""
+    generator = ValidatorGenerator(registry)
+    for key in keys:
+        generator.add_schema(key)
+    return generator.source()
+
+
+def compile_validator(key: str, registry: ContractRegistry | None = None) -> Callable[[Any], bool]:
+    """Generate and load a predicate in-process, sharing the registry's format checker"""
+    registry = registry or get_registry()
+    generator = ValidatorGenerator(registry)
+    name = generator.add_schema(key)
+    namespace: dict[str, Any] = {"__name__": f"generated_{name}"}
+    exec(compile(generator.source(), f"<generated {key}>", "exec"), namespace)
+    namespace["_conforms"] = registry.format_checker.conforms
+    return namespace[name]  # type: ignore[no-any-return]
+
+
+def parity_mismatches(
+    key: str, instances: Iterable[Any], registry: ContractRegistry | None = None
+) -> list[tuple[int, bool, bool]]:
+    """Return (index, generated, reference) for every instance where the two disagree"""
+    registry = registry or get_registry()
+    fast = compile_validator(key, registry)
+    reference = registry.validator(key)
+    mismatches = []
+    for index, instance in enumerate(instances):
+        got, expected = fast(instance), reference.is_valid(instance)
+        if got != expected:
+            mismatches.append((index, got, expected))
+    return mismatches
+
+
+def load_example_corpus(base_dir: Path = BASE_DIR) -> dict[str, list[Any]]:
+    """Map schema path -> instances from docs/examples and each schema's own `examples`"""
+    registry = get_registry()
+    corpus: dict[str, list[Any]] = {}
+    for rel in registry.paths:
+        examples = registry.schema(rel).get("examples")
+        if rel.startswith("schemas/") and isinstance(examples, list):
+            corpus.setdefault(rel, []).extend(examples)
+
+    example_map = {
+        "field.example.json": "schemas/core/field.v1.schema.json",
+        "mission.example.json": "schemas/core/mission.v1.schema.json",
+        "intake_manifest.example.json": "schemas/edge/intake_manifest.v1.schema.json",
+        "analysis_job.example.json": "schemas/worker/analysis_job.v1.schema.json",
+        "analysis_result.example.json": "schemas/worker/analysis_result.v1.schema.json",
+        "payment_intent.example.json": "schemas/platform/payment_intent.v2.schema.json",
+    }
+    for name, rel in example_map.items():
+        path = base_dir / "docs" / "examples" / name
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                corpus.setdefault(rel, []).append(json.load(f))
+    return corpus
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate specialized contract validators")
+    parser.add_argument("--schema", action="append", help="Schema key ($id or path); repeatable")
+    parser.add_argument("--all", action="store_true", help="Generate every supported schema")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Output module path")
+    parser.add_argument("--check-parity", action="store_true",
+                        help="Compare generated validators with jsonschema on docs/examples")
+    args = parser.parse_args()
+
+    registry = get_registry()
+    if args.all:
+        keys = [rel for rel in registry.paths if rel.startswith("schemas/")]
+    else:
+        keys = args.schema or HOT_SCHEMAS
+
+    if args.check_parity:
+        corpus = load_example_corpus(registry.base_dir)
+        failed = False
+        for key in keys:
+            rel = registry.resolve(key)
+            mismatches = parity_mismatches(rel, corpus.get(rel, []), registry)
+            status = "✅" if not mismatches else "❌"
+            print(f"{status} {rel}: {len(corpus.get(rel, []))} instances, "
+                  f"{len(mismatches)} mismatches")
+            failed = failed or bool(mismatches)
+        return 1 if failed else 0
+
+    generator = ValidatorGenerator(registry)
+    for key in keys:
+        try:
+            generator.add_schema(key)
+        except UnsupportedSchemaError as e:
+            if not args.all:
+                print(f"❌ {key}: {e}")
+                return 1
+            print(f"⚠️  Skipping {key}: {e}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(generator.source(), encoding="utf-8")
+    print(f"✅ Generated {len(generator.roots)} validators -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Geometry Checks
+
+Semantic validation for GeoJSON geometries that JSON Schema cannot express.
+schemas/shared/geojson.v1.schema.json and the field `boundary` only check
+shape, so this stage runs after schema validation and checks:
+
+- ring closure (first position == last position)
+- minimum vertex count (4 per linear ring)
+- coordinate bounds (longitude -180..180, latitude -90..90)
+- `bbox` consistency (every position inside the declared bbox)
+- winding order (RFC 7946: exterior rings counterclockwise, holes clockwise;
+  reported as a warning because RFC 7946 parsers must not reject it)
+
+Each ring or position list is converted to a NumPy array once and checked
+with vectorized min/max/shoelace reductions, so cadastral polygons with tens
+of thousands of vertices stay in the millisecond range. NumPy is optional;
+without it the same checks run as plain Python loops.
+
+Usage:
+    from geometry_checks import check_geometry, check_field
+
+    issues = check_field(field_document)
+    errors = [issue for issue in issues if issue.severity == "error"]
+
+    python3 tools/geometry_checks.py docs/examples/field.example.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:
+    np = None
+
+RING_NOT_CLOSED = "RING_NOT_CLOSED"
+TOO_FEW_VERTICES = "TOO_FEW_VERTICES"
+OUT_OF_BOUNDS = "OUT_OF_BOUNDS"
+BBOX_MISMATCH = "BBOX_MISMATCH"
+WINDING_ORDER = "WINDING_ORDER"
+BAD_COORDINATES = "BAD_COORDINATES"
+
+MIN_RING_VERTICES = 4
+
+
+class GeometryIssue(NamedTuple):
+    """One problem found in a geometry, addressed by JSON pointer"""
+
+    pointer: str
+    code: str
+    message: str
+    severity: str = "error"
+
+
+class _Extent(NamedTuple):
+    """Reductions over one position list"""
+
+    points: int
+    west: float
+    south: float
+    east: float
+    north: float
+    in_bounds: bool
+    signed_area: float
+
+
+def _extent_numpy(positions: Sequence[Sequence[float]], ring: bool) -> _Extent:
+    try:
+        coords = np.asarray(positions, dtype=np.float64)
+    except ValueError:
+        # Mixed 2D/3D positions are ragged; only lon/lat matter here
+        coords = np.asarray([p[:2] for p in positions], dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] < 2 or not np.isfinite(coords).all():
+        raise ValueError("positions must be finite [lon, lat(, alt)] arrays")
+
+    lon = coords[:, 0]
+    lat = coords[:, 1]
+    west, east = float(lon.min()), float(lon.max())
+    south, north = float(lat.min()), float(lat.max())
+    in_bounds = west >= -180 and east <= 180 and south >= -90 and north <= 90
+    area = 0.0
+    if ring:
+        area = float(np.dot(lon[:-1], lat[1:]) - np.dot(lon[1:], lat[:-1])) / 2
+    return _Extent(len(coords), west, south, east, north, in_bounds, area)
+
+
+def _extent_python(positions: Sequence[Sequence[float]], ring: bool) -> _Extent:
+    lon = [float(p[0]) for p in positions]
+    lat = [float(p[1]) for p in positions]
+    if not all(math.isfinite(v) for v in lon) or not all(math.isfinite(v) for v in lat):
+        raise ValueError("positions must be finite [lon, lat(, alt)] arrays")
+
+    west, east = min(lon), max(lon)
+    south, north = min(lat), max(lat)
+    in_bounds = west >= -180 and east <= 180 and south >= -90 and north <= 90
+    area = 0.0
+    if ring:
+        area = sum(x0 * y1 - x1 * y0 for x0, y0, x1, y1 in zip(lon, lat, lon[1:], lat[1:])) / 2
+    return _Extent(len(lon), west, south, east, north, in_bounds, area)
+
+
+class GeometryChecker:
+    """Walks a GeoJSON object and collects GeometryIssues"""
+
+    def __init__(self, winding: bool = True, use_numpy: bool | None = None):
+        if use_numpy and np is None:
+            raise RuntimeError("NumPy is not installed")
+        self.winding = winding
+        numpy_backend = np is not None and use_numpy is not False
+        self._extent = _extent_numpy if numpy_backend else _extent_python
+
+    def check(self, obj: Any, pointer: str = "") -> list[GeometryIssue]:
+        """Check a Geometry, Feature or FeatureCollection"""
+        issues: list[GeometryIssue] = []
+        self._visit(obj, pointer, issues)
+        return issues
+
+    def _visit(self, obj: Any, pointer: str, issues: list[GeometryIssue]) -> _Extent | None:
+        if not isinstance(obj, dict):
+            return None
+        kind = obj.get("type")
+        coords = obj.get("coordinates")
+        at = f"{pointer}/coordinates"
+
+        if kind == "Feature":
+            extent = self._visit(obj.get("geometry"), f"{pointer}/geometry", issues)
+        elif kind == "FeatureCollection":
+            extent = self._merge(
+                self._visit(feature, f"{pointer}/features/{i}", issues)
+                for i, feature in enumerate(obj.get("features") or [])
+            )
+        elif kind == "GeometryCollection":
+            extent = self._merge(
+                self._visit(geometry, f"{pointer}/geometries/{i}", issues)
+                for i, geometry in enumerate(obj.get("geometries") or [])
+            )
+        elif kind == "Point":
+            extent = self._positions([coords], at, issues, single=True)
+        elif kind in ("LineString", "MultiPoint"):
+            extent = self._positions(coords, at, issues)
+        elif kind == "MultiLineString":
+            extent = self._merge(
+                self._positions(line, f"{at}/{i}", issues) for i, line in enumerate(coords or [])
+            )
+        elif kind == "Polygon":
+            extent = self._polygon(coords, at, issues)
+        elif kind == "MultiPolygon":
+            extent = self._merge(
+                self._polygon(polygon, f"{at}/{i}", issues)
+                for i, polygon in enumerate(coords or [])
+            )
+        else:
+            return None
+
+        if extent is not None and "bbox" in obj:
+            self._check_bbox(obj["bbox"], extent, f"{pointer}/bbox", issues)
+        return extent
+
+    def _positions(
+        self, positions: Any, pointer: str, issues: list[GeometryIssue], single: bool = False
+    ) -> _Extent | None:
+        if not positions:
+            return None
+        try:
+            extent = self._extent(positions, False)
+        except (ValueError, TypeError, IndexError):
+            issues.append(GeometryIssue(pointer, BAD_COORDINATES, "Positions must be numeric"))
+            return None
+        if not extent.in_bounds:
+            target = pointer if single else self._first_out_of_bounds(positions, pointer)
+            issues.append(GeometryIssue(target, OUT_OF_BOUNDS, "Longitude/latitude out of range"))
+        return extent
+
+    def _polygon(self, rings: Any, pointer: str, issues: list[GeometryIssue]) -> _Extent | None:
+        extents = []
+        for i, ring in enumerate(rings or []):
+            at = f"{pointer}/{i}"
+            if not ring:
+                issues.append(GeometryIssue(at, TOO_FEW_VERTICES, "Linear ring is empty"))
+                continue
+            try:
+                extent = self._extent(ring, True)
+            except (ValueError, TypeError, IndexError):
+                issues.append(GeometryIssue(at, BAD_COORDINATES, "Positions must be numeric"))
+                continue
+            extents.append(extent)
+
+            if extent.points < MIN_RING_VERTICES:
+                issues.append(GeometryIssue(
+                    at, TOO_FEW_VERTICES,
+                    f"Linear ring has {extent.points} positions, needs at least {MIN_RING_VERTICES}",
+                ))
+            if list(ring[0]) != list(ring[-1]):
+                issues.append(GeometryIssue(at, RING_NOT_CLOSED, "First and last positions differ"))
+            if not extent.in_bounds:
+                issues.append(GeometryIssue(
+                    self._first_out_of_bounds(ring, at), OUT_OF_BOUNDS,
+                    "Longitude/latitude out of range",
+                ))
+            if self.winding and extent.signed_area:
+                exterior = i == 0
+                if (extent.signed_area > 0) != exterior:
+                    expected = "counterclockwise" if exterior else "clockwise"
+                    issues.append(GeometryIssue(
+                        at, WINDING_ORDER,
+                        f"{'Exterior ring' if exterior else 'Hole'} should be {expected}",
+                        "warning",
+                    ))
+        return self._merge(extents)
+
+    @staticmethod
+    def _first_out_of_bounds(positions: Sequence[Sequence[float]], pointer: str) -> str:
+        for i, p in enumerate(positions):
+            if not (-180 <= p[0] <= 180 and -90 <= p[1] <= 90):
+                return f"{pointer}/{i}"
+        return pointer
+
+    @staticmethod
+    def _merge(extents: Any) -> _Extent | None:
+        parts = [extent for extent in extents if extent is not None]
+        if not parts:
+            return None
+        return _Extent(
+            sum(e.points for e in parts),
+            min(e.west for e in parts),
+            min(e.south for e in parts),
+            max(e.east for e in parts),
+            max(e.north for e in parts),
+            all(e.in_bounds for e in parts),
+            0.0,
+        )
+
+    @staticmethod
+    def _check_bbox(bbox: Any, extent: _Extent, pointer: str, issues: list[GeometryIssue]) -> None:
+        if not isinstance(bbox, list) or len(bbox) not in (4, 6):
+            return
+        half = len(bbox) // 2
+        west, south, east, north = bbox[0], bbox[1], bbox[half], bbox[half + 1]
+        if west > east:
+            # Crosses the antimeridian; containment needs the split-box rules from RFC 7946 5.2
+            return
+        if extent.west < west or extent.east > east or extent.south < south or extent.north > north:
+            issues.append(GeometryIssue(
+                pointer, BBOX_MISMATCH,
+                f"bbox {bbox} does not contain coordinates spanning "
+                f"[{extent.west}, {extent.south}, {extent.east}, {extent.north}]",
+            ))
+
+
+def check_geometry(obj: Any, pointer: str = "", winding: bool = True) -> list[GeometryIssue]:
+    """Check a GeoJSON Geometry, Feature or FeatureCollection"""
+    return GeometryChecker(winding=winding).check(obj, pointer)
+
+
+def check_field(field: dict[str, Any], winding: bool = True) -> list[GeometryIssue]:
+    """Check a core/field.v1 document's `boundary` polygon"""
+    return check_geometry(field.get("boundary"), "/boundary", winding)
+
+
+def check_mission(mission: dict[str, Any]) -> list[GeometryIssue]:
+    """Check a core/mission.v1 document's flight plan waypoints"""
+    waypoints = (mission.get("flight_plan") or {}).get("waypoints") or []
+    positions = [w.get("coordinates") for w in waypoints if isinstance(w, dict)]
+    if not positions:
+        return []
+    issues: list[GeometryIssue] = []
+    GeometryChecker(winding=False)._positions(positions, "/flight_plan/waypoints", issues)
+    # Point at the offending waypoint's coordinates, not its index in the position list
+    return [
+        issue._replace(pointer=f"{issue.pointer}/coordinates")
+        if issue.pointer != "/flight_plan/waypoints" else issue
+        for issue in issues
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check GeoJSON geometry semantics")
+    parser.add_argument("files", nargs="+", type=Path, help="Field, mission or GeoJSON documents")
+    parser.add_argument("--no-winding", action="store_true", help="Skip winding order warnings")
+    args = parser.parse_args()
+
+    failed = 0
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+        if "boundary" in doc:
+            issues = check_field(doc, winding=not args.no_winding)
+        elif "flight_plan" in doc:
+            issues = check_mission(doc)
+        else:
+            issues = check_geometry(doc, winding=not args.no_winding)
+
+        errors = [issue for issue in issues if issue.severity == "error"]
+        status = "❌" if errors else "✅"
+        print(f"{status} {path}")
+        for issue in issues:
+            icon = "❌" if issue.severity == "error" else "⚠️ "
+            print(f"   {icon} {issue.pointer or '/'}: {issue.code} - {issue.message}")
+        failed += bool(errors)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Streaming Manifest Validator
+
+Validates an edge/intake_manifest.v1 document without ever holding its
+`files` array in memory. A multispectral flight can list tens of thousands
+of FileEntry objects (with `exif_data`); `json.load` plus whole-document
+validation spikes memory on 4 GB kiosks.
+
+The document is read in fixed-size chunks. Top-level members are decoded one
+at a time; inside `files`, each FileEntry is decoded, validated against
+`#/$defs/FileEntry` and handed to an optional callback, then dropped. The
+remaining top-level members are validated against the manifest schema once
+the closing brace is reached. Integrity checks (tools/verify_intake.py) can
+start from the callback while parsing continues.
+
+Usage:
+    from manifest_stream import validate_manifest_stream
+
+    report = validate_manifest_stream("manifest.json", on_file=lambda i, entry, errors: ...)
+
+    python3 tools/manifest_stream.py manifest.json
+    python3 tools/manifest_stream.py manifest.json --root /media/card
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import IO, Any
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, get_registry  # noqa: E402
+
+INTAKE_MANIFEST = "schemas/edge/intake_manifest.v1.schema.json"
+CHUNK_SIZE = 64 * 1024
+MAX_ERRORS = 1000
+# Largest single JSON value (one FileEntry or top-level member) buffered, in characters
+MAX_VALUE_SIZE = 16 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters a number may continue with in the next chunk (`15000000` + `.0`)
+_NUMBER_TAIL = re.compile(r"[0-9+\-.eE]*")
+# A decode error this close to the end of the buffer may be a token cut by the chunk edge
+_TRUNCATION_MARGIN = 8
+_decoder = json.JSONDecoder()
+
+# Events yielded by iter_manifest
+MEMBER = "member"
+FILE = "file"
+
+
+class ManifestStreamError(ValueError):
+    """Raised when the manifest is not well-formed JSON of the expected shape"""
+
+
+class _ChunkReader:
+    """Buffered cursor over a text stream that decodes one JSON value at a time"""
+
+    def __init__(self, fp: IO[str], chunk_size: int = CHUNK_SIZE,
+                 max_value_size: int = MAX_VALUE_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.max_value_size = max_value_size
+        self.buf = ""
+        self.pos = 0
+        self.consumed = 0
+        self.eof = False
+
+    def _fill(self) -> None:
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return
+        self.consumed += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+
+    def error(self, message: str) -> ManifestStreamError:
+        return ManifestStreamError(f"{message} at offset {self.consumed + self.pos}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it; '' at end of input"""
+        while True:
+            blank = _WHITESPACE.match(self.buf, self.pos)
+            assert blank is not None  # the pattern also matches the empty string
+            self.pos = blank.end()
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos:self.pos + 1]
+            self._fill()
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as exc:
+                truncated = (exc.msg.startswith("Unterminated string")
+                             or len(self.buf) - exc.pos < _TRUNCATION_MARGIN)
+                if self.eof or not truncated:
+                    raise self.error(f"Invalid JSON ({exc.msg})") from None
+                self._refill()
+                continue
+            # A scalar running up to the buffer edge may continue in the next chunk
+            tail = _NUMBER_TAIL.match(self.buf, end)
+            assert tail is not None  # the pattern also matches the empty string
+            if (not self.eof and not isinstance(obj, (dict, list, str))
+                    and tail.end() == len(self.buf)):
+                self._refill()
+                continue
+            self.pos = end
+            return obj
+
+    def _refill(self) -> None:
+        """Read more of a value that does not fit the buffer yet, up to max_value_size"""
+        if len(self.buf) - self.pos > self.max_value_size:
+            raise self.error(f"JSON value longer than {self.max_value_size} characters")
+        self._fill()
+
+
+def iter_manifest(fp: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[tuple[str, Any, Any]]:
+    """Yield (MEMBER, key, value) for top-level members and (FILE, index, entry) per file
+
+    A non-empty `files` array yields FILE events only; any other `files` value,
+    including `[]`, is an ordinary member.
+    """
+    reader = _ChunkReader(fp, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise reader.error("Expected a member name")
+            reader.expect(":")
+
+            if key == "files" and reader.peek() == "[":
+                reader.pos += 1
+                index = 0
+                if reader.peek() == "]":
+                    reader.pos += 1
+                    yield MEMBER, key, []
+                else:
+                    while True:
+                        yield FILE, index, reader.value()
+                        index += 1
+                        separator = reader.peek()
+                        reader.pos += 1
+                        if separator == "]":
+                            break
+                        if separator != ",":
+                            raise reader.error("Expected ',' or ']' in files")
+            else:
+                yield MEMBER, key, reader.value()
+
+            separator = reader.peek()
+            reader.pos += 1
+            if separator == "}":
+                break
+            if separator != ",":
+                raise reader.error("Expected ',' or '}'")
+
+    if reader.peek() != "":
+        raise reader.error("Trailing data after manifest")
+
+
+class StreamReport:
+    """Outcome of a streaming manifest validation"""
+
+    def __init__(self, max_errors: int = MAX_ERRORS):
+        self.files = 0
+        self.invalid_files = 0
+        self.error_count = 0
+        self.errors: list[tuple[str, str]] = []
+        self.max_errors = max_errors
+
+    def add_error(self, path: str, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((path, message))
+
+    @property
+    def valid(self) -> bool:
+        return self.error_count == 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "valid": self.valid,
+            "files": self.files,
+            "invalid_files": self.invalid_files,
+            "error_count": self.error_count,
+            "errors": [{"path": path, "message": message} for path, message in self.errors],
+        }
+
+
+def validate_manifest_stream(
+    source: str | Path | IO[str],
+    on_file: Callable[[int, dict[str, Any], list[str]], None] | None = None,
+    registry: ContractRegistry | None = None,
+    chunk_size: int = CHUNK_SIZE,
+    max_errors: int = MAX_ERRORS,
+) -> StreamReport:
+    """Validate a manifest incrementally; `on_file(index, entry, errors)` runs per FileEntry"""
+    registry = registry or get_registry()
+    manifest_validator = registry.validator(INTAKE_MANIFEST)
+    entry_validator = registry.validator(f"{INTAKE_MANIFEST}#/$defs/FileEntry")
+    report = StreamReport(max_errors)
+    members: dict[str, Any] = {}
+    streamed_files = False
+
+    def run(fp: IO[str]) -> None:
+        nonlocal streamed_files
+        for kind, key, value in iter_manifest(fp, chunk_size):
+            if kind == MEMBER:
+                members[key] = value
+                continue
+
+            streamed_files = True
+            report.files += 1
+            messages = []
+            for error in entry_validator.iter_errors(value):
+                path = f"$.files[{key}]{error.json_path[1:]}"
+                report.add_error(path, error.message)
+                messages.append(error.message)
+            report.invalid_files += bool(messages)
+            if on_file is not None:
+                on_file(key, value, messages)
+
+    if isinstance(source, (str, Path)):
+        with open(source, "r", encoding="utf-8") as f:
+            run(f)
+    else:
+        run(source)
+
+    # Validate the small top-level part. A streamed (non-empty) `files` array
+    # stands in as `[]`, and the errors that placeholder causes are dropped:
+    # its items were checked above. Any other `files` value is validated as is.
+    if streamed_files:
+        members["files"] = []
+    for error in manifest_validator.iter_errors(members):
+        if streamed_files and error.absolute_path and error.absolute_path[0] == "files":
+            continue
+        report.add_error(error.json_path, error.message)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stream-validate an intake manifest")
+    parser.add_argument("manifest", type=Path, help="IntakeManifest JSON document")
+    parser.add_argument("--root", type=Path, help="Card mount point; verify files while parsing")
+    parser.add_argument("--workers", type=int, default=4, help="Hashing threads with --root")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    findings: list[tuple[str, str, str]] = []
+    on_file = None
+    pool = None
+    pending: set[Future[Any]] = set()
+
+    if args.root is not None:
+        from verify_intake import check_entry
+
+        pool = ThreadPoolExecutor(max_workers=args.workers)
+        root = args.root.resolve()
+
+        def collect(done: set[Future[Any]]) -> None:
+            for future in done:
+                result = future.result()
+                if result.threat_type is not None:
+                    findings.append((result.path, result.threat_type, result.threat_name))
+
+        def on_file(index: int, entry: dict[str, Any], errors: list[str]) -> None:
+            nonlocal pending
+            if errors:
+                return
+            pending.add(pool.submit(check_entry, entry, root))
+            if len(pending) >= args.workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+    try:
+        report = validate_manifest_stream(args.manifest, on_file)
+    except ManifestStreamError as exc:
+        print(f"❌ {args.manifest}: {exc}")
+        return 1
+    finally:
+        if pool is not None:
+            done, pending = wait(pending)
+            collect(done)
+            pool.shutdown()
+
+    if args.json:
+        summary = report.to_dict()
+        summary["integrity"] = [
+            {"file_path": path, "threat_type": threat, "threat_name": name}
+            for path, threat, name in findings
+        ]
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+    else:
+        print(f"🔍 {args.manifest}: {report.files} file entries, {report.invalid_files} invalid")
+        for path, message in report.errors[:50]:
+            print(f"  ❌ {path}: {message}")
+        for path, threat, name in sorted(findings):
+            print(f"  ❌ {threat} {path}: {name}")
+        if report.valid and not findings:
+            print("✅ Manifest valid")
+
+    return 0 if report.valid and not findings else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Mission State Machine
+
+Compiles the per-status `allowedTransitions` lists in
+enums/mission_status.enum.v1.json (`metadata.statusDescriptions`) into a
+transition table and checks transitions against it:
+
+- single transitions (`is_allowed`, `validate_transition`)
+- a whole status history (`history_violations`)
+- bulk checks over parallel arrays of status codes (`bulk_violations`), for
+  nightly audits of millions of historical transitions
+
+Statuses are numbered in enum order; the table is an n*n byte matrix (one
+flat `bytes`, indexed `src * n + dst`) plus one bitmask per source status.
+With NumPy installed, bulk checks run as a single fancy-indexing lookup over
+the matrix; without it they fall back to a tight loop over the same table.
+
+Usage:
+    from mission_state_machine import MissionStateMachine
+
+    machine = MissionStateMachine()
+    machine.is_allowed("ASSIGNED", "ACCEPTED")          # True
+    machine.history_violations(["DRAFT", "COMPLETED"])  # [0]
+
+    python3 tools/mission_state_machine.py audit.ndjson
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:
+    np = None
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from enum_index import EnumIndex, get_enum_index  # noqa: E402
+
+# Code used for statuses that are not part of the enum; never a valid endpoint
+UNKNOWN = 255
+
+
+class InvalidTransitionError(ValueError):
+    """Raised when a status change is not a documented transition"""
+
+    def __init__(self, current: str, target: str):
+        super().__init__(f"Invalid mission status transition: {current} -> {target}")
+        self.current = current
+        self.target = target
+
+
+class MissionStateMachine:
+    """Transition table compiled from a status enum's `allowedTransitions` metadata"""
+
+    def __init__(self, index: EnumIndex | None = None, name: str = "mission_status"):
+        index = index or get_enum_index()
+        entry = index.entry(name)
+        transitions = entry.transitions
+
+        self.states: tuple[str, ...] = entry.ordered
+        if len(self.states) >= UNKNOWN:
+            raise ValueError(f"Too many statuses in {name} for byte codes")
+        self.codes: dict[str, int] = dict(entry.positions)
+
+        n = len(self.states)
+        matrix = bytearray(n * n)
+        masks = [0] * n
+        for src, targets in transitions.items():
+            s = self.codes[src]
+            for dst in targets:
+                d = self.codes[dst]
+                matrix[s * n + d] = 1
+                masks[s] |= 1 << d
+        self._n = n
+        self._matrix = bytes(matrix)
+        self.masks: tuple[int, ...] = tuple(masks)
+        self._np_matrix = (
+            np.frombuffer(self._matrix, dtype=np.uint8).reshape(n, n).astype(bool)
+            if np is not None else None
+        )
+
+    def encode(self, statuses: Iterable[str]) -> array:
+        """Map status names to byte codes; unknown names become UNKNOWN"""
+        codes = self.codes
+        return array("B", [codes.get(status, UNKNOWN) for status in statuses])
+
+    def targets(self, current: str) -> list[str]:
+        """Allowed next statuses, in enum order"""
+        mask = self.masks[self.codes[current]]
+        return [state for i, state in enumerate(self.states) if mask >> i & 1]
+
+    def is_allowed(self, current: str, target: str) -> bool:
+        """Return True when `current -> target` is a documented transition"""
+        s = self.codes.get(current)
+        d = self.codes.get(target)
+        return s is not None and d is not None and bool(self.masks[s] >> d & 1)
+
+    def validate_transition(self, current: str, target: str) -> None:
+        """Raise InvalidTransitionError unless `current -> target` is allowed"""
+        if not self.is_allowed(current, target):
+            raise InvalidTransitionError(current, target)
+
+    def history_violations(self, history: Sequence[str]) -> list[int]:
+        """Indices i where `history[i] -> history[i + 1]` is not allowed"""
+        codes = self.encode(history)
+        return self.bulk_violations(codes[:-1], codes[1:])
+
+    def bulk_violations(self, sources: Sequence[int], targets: Sequence[int]) -> list[int]:
+        """Indices of invalid pairs in parallel arrays of status codes"""
+        if len(sources) != len(targets):
+            raise ValueError("sources and targets must have the same length")
+        n = self._n
+        if self._np_matrix is not None:
+            src = np.asarray(sources, dtype=np.intp)
+            dst = np.asarray(targets, dtype=np.intp)
+            known = (src < n) & (dst < n)
+            ok = np.zeros(len(src), dtype=bool)
+            ok[known] = self._np_matrix[src[known], dst[known]]
+            return np.flatnonzero(~ok).tolist()
+
+        matrix = self._matrix
+        return [
+            i for i, (s, d) in enumerate(zip(sources, targets))
+            if s >= n or d >= n or not matrix[s * n + d]
+        ]
+
+    def audit(self, histories: Iterable[Sequence[str]]) -> dict[int, list[int]]:
+        """Check many histories at once; returns history index -> bad step indices"""
+        sources = array("B")
+        targets = array("B")
+        starts: list[int] = []
+        for history in histories:
+            codes = self.encode(history)
+            starts.append(len(sources))
+            sources.extend(codes[:-1])
+            targets.extend(codes[1:])
+
+        violations: dict[int, list[int]] = {}
+        for i in self.bulk_violations(sources, targets):
+            h = bisect_right(starts, i) - 1
+            violations.setdefault(h, []).append(i - starts[h])
+        return violations
+
+
+def _load_histories(path: Path) -> list[list[str]]:
+    """NDJSON lines of either `["DRAFT", ...]` or `{"history": [...]}`"""
+    histories = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record: Any = json.loads(line)
+            histories.append(record["history"] if isinstance(record, dict) else record)
+    return histories
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Audit mission status histories")
+    parser.add_argument("histories", type=Path, help="NDJSON file of status histories")
+    args = parser.parse_args()
+
+    machine = MissionStateMachine()
+    histories = _load_histories(args.histories)
+
+    print(f"🔍 Auditing {len(histories)} mission histories")
+    started = time.perf_counter()
+    violations = machine.audit(histories)
+    elapsed = time.perf_counter() - started
+
+    for h, steps in sorted(violations.items())[:20]:
+        history = histories[h]
+        pairs = ", ".join(f"{history[s]} -> {history[s + 1]}" for s in steps)
+        print(f"  ❌ history {h + 1}: {pairs}")
+
+    print(f"⏱  {elapsed:.3f}s ({'numpy' if np is not None else 'pure python'})")
+    if violations:
+        print(f"❌ {len(violations)} histories with invalid transitions")
+        return 1
+    print("✅ All transitions valid")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz OpenAPI Loader
+
+Loads the OpenAPI 3.1 specs in api/ (platform_public.v1, platform_internal.v1,
+edge_local.v1) and their shared `./components/*.yaml` files in Python:
+
+- every YAML file is parsed once, with PyYAML's libyaml-backed CSafeLoader
+  when available
+- `$ref`s are resolved once into a cached in-memory graph (`spec()`); refs to
+  other YAML files are followed, refs into contract JSON Schemas
+  (`../../schemas/...`) are rewritten to the contract `$id` so they resolve
+  through the contract registry
+- `operations()` lists each path/method with its parameters, request body and
+  response schemas as absolute `$ref` URIs, and `validator()` compiles any of
+  them with the same Draft 2020-12 validator class as the contract schemas
+
+`validate_spec()` checks a spec in the same process as the JSON Schema checks:
+OpenAPI version and required fields, that every `$ref` resolves, path template
+parameters, unique operationIds, security scheme names, that embedded schemas
+are valid Draft 2020-12, and that `example` values satisfy their schemas.
+
+Usage:
+    from openapi_loader import get_openapi_loader
+
+    loader = get_openapi_loader()
+    spec = loader.spec("platform_public.v1")
+    for operation in loader.operations("platform_public.v1"):
+        ...
+
+    python3 tools/openapi_loader.py              # validate every spec in api/
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import unquote, urldefrag, urljoin
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from referencing import Registry, Resource
+from referencing.exceptions import Unresolvable
+from referencing.jsonschema import DRAFT202012
+
+try:
+    import yaml  # type: ignore[import-untyped]
+except ImportError:
+    yaml = None
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import (  # noqa: E402
+    BASE_DIR,
+    ContractRegistry,
+    ContractValidator,
+    get_registry,
+)
+
+API_DIR = BASE_DIR / "api"
+API_SPECS = ("platform_public.v1", "platform_internal.v1", "edge_local.v1")
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+PARAMETER_LOCATIONS = ("query", "header", "path", "cookie")
+
+# Keywords holding instance data; `$ref`s inside them are not references
+DATA_KEYWORDS = frozenset({"example", "examples", "default", "const", "enum"})
+
+# One metaschema validator for every embedded schema (check_schema rebuilds it per call)
+_META_VALIDATOR = Draft202012Validator(Draft202012Validator.META_SCHEMA)
+
+_OPENAPI_VERSION = re.compile(r"3\.1\.\d+")
+_PATH_TEMPLATE = re.compile(r"\{([^{}]+)\}")
+
+
+class OpenApiError(ValueError):
+    """Raised when a spec cannot be loaded or a `$ref` cannot be resolved"""
+
+
+class SpecIssue(NamedTuple):
+    """One problem in a spec, addressed by file and JSON pointer"""
+
+    file: str
+    pointer: str
+    message: str
+
+
+class Parameter(NamedTuple):
+    """A resolved Parameter Object"""
+
+    name: str
+    location: str
+    required: bool
+    schema_ref: str | None
+
+
+class Operation(NamedTuple):
+    """One path/method with absolute `$ref` URIs for every schema it uses"""
+
+    method: str
+    path: str
+    operation_id: str | None
+    parameters: tuple[Parameter, ...]
+    body_required: bool
+    request_body: dict[str, str]              # media type -> schema ref
+    responses: dict[str, dict[str, str]]      # status -> media type -> schema ref
+    security: list[dict[str, list[str]]] | None
+
+
+def _load_yaml(path: Path) -> Any:
+    if yaml is None:
+        raise OpenApiError("PyYAML is not installed")
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=loader)  # noqa: S506 (safe loader)
+    except yaml.YAMLError as exc:
+        raise OpenApiError(f"Invalid YAML in {path}: {exc}") from None
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _walk(node: Any, pointer: str) -> Any:
+    """Follow a JSON pointer (`/components/schemas/Field`) into a parsed document"""
+    for token in pointer.split("/")[1:]:
+        token = unquote(token).replace("~1", "/").replace("~0", "~")
+        if isinstance(node, dict) and token in node:
+            node = node[token]
+        elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+            node = node[int(token)]
+        else:
+            raise KeyError(token)
+    return node
+
+
+class OpenApiLoader:
+    """Parsed API specs with refs resolved once and shared schema validators"""
+
+    def __init__(self, api_dir: Path = API_DIR, registry: ContractRegistry | None = None):
+        self.api_dir = Path(api_dir).resolve()
+        self.registry = registry or get_registry()
+        self._documents: dict[str, Any] = {}       # file URI -> parsed YAML
+        self._graphs: dict[str, Any] = {}
+        self._validators: dict[str, Validator] = {}
+        self._lock = threading.Lock()
+
+        for path in sorted(self.api_dir.rglob("*.yaml")):
+            self._documents[path.as_uri()] = _load_yaml(path)
+
+        # YAML files join the contract resources so schema refs resolve across both
+        self._ref_registry: Registry = self.registry.ref_registry.with_resources(
+            (uri, Resource.from_contents(doc, default_specification=DRAFT202012))
+            for uri, doc in self._documents.items()
+            if isinstance(doc, dict)
+        )
+
+    @property
+    def names(self) -> list[str]:
+        """Spec names (top-level api/*.yaml stems)"""
+        return sorted(
+            path.name.removesuffix(".yaml") for path in self.api_dir.glob("*.yaml")
+        )
+
+    def spec_uri(self, name: str) -> str:
+        uri = (self.api_dir / f"{name}.yaml").as_uri()
+        if uri not in self._documents:
+            raise KeyError(f"Unknown API spec: {name}")
+        return uri
+
+    def document(self, name: str) -> dict[str, Any]:
+        """Raw parsed YAML of a spec (refs unresolved; shared, do not mutate)"""
+        return self._documents[self.spec_uri(name)]
+
+    def _rel(self, uri: str) -> str:
+        path = Path(unquote(urldefrag(uri)[0].removeprefix("file://")))
+        try:
+            return path.relative_to(self.api_dir.parent).as_posix()
+        except ValueError:
+            return uri
+
+    def lookup(self, uri: str) -> Any:
+        """Node addressed by an absolute `file.yaml#/pointer` or contract URI"""
+        doc_uri, fragment = urldefrag(uri)
+        if doc_uri in self._documents:
+            doc = self._documents[doc_uri]
+        elif doc_uri in self.registry:
+            doc = self.registry.schema(doc_uri)
+        else:
+            raise OpenApiError(f"Unresolvable $ref: {uri}")
+        try:
+            return _walk(doc, fragment)
+        except KeyError:
+            raise OpenApiError(f"Unresolvable $ref: {uri}") from None
+
+    def follow(self, node: Any, uri: str) -> tuple[Any, str]:
+        """Follow a chain of `$ref`s; returns (target node, its absolute URI)"""
+        seen = set()
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+            uri = urljoin(uri, node["$ref"])
+            if uri in seen:
+                raise OpenApiError(f"Circular $ref: {uri}")
+            seen.add(uri)
+            node = self.lookup(uri)
+        return node, uri
+
+    def _contract_ref(self, uri: str) -> str | None:
+        """Canonical `$id#fragment` for refs into contract JSON Schemas"""
+        doc_uri, fragment = urldefrag(uri)
+        if doc_uri in self._documents or doc_uri not in self.registry:
+            return None
+        doc = self.registry.schema(doc_uri)
+        base = doc.get("$id") or doc_uri
+        return f"{base}#{fragment}" if fragment else base
+
+    def _resolve(self, node: Any, base_uri: str, memo: dict[str, Any]) -> Any:
+        if isinstance(node, list):
+            return [self._resolve(item, base_uri, memo) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            target = urljoin(base_uri, ref)
+            contract = self._contract_ref(target)
+            if contract is not None:
+                return {**node, "$ref": contract}
+            if target in memo:
+                return memo[target]
+            placeholder: dict[str, Any] = {}
+            memo[target] = placeholder  # shared before recursing, so cycles close on it
+            resolved = self._resolve(self.lookup(target), urldefrag(target)[0], memo)
+            if isinstance(resolved, dict):
+                placeholder.update(resolved)
+                placeholder.update((k, v) for k, v in node.items() if k != "$ref")
+                return placeholder
+            memo[target] = resolved
+            return resolved
+
+        return {
+            key: value if key in DATA_KEYWORDS else self._resolve(value, base_uri, memo)
+            for key, value in node.items()
+        }
+
+    def spec(self, name: str) -> dict[str, Any]:
+        """The spec as one object graph with every YAML `$ref` replaced by its target"""
+        graph = self._graphs.get(name)
+        if graph is None:
+            uri = self.spec_uri(name)
+            with self._lock:
+                graph = self._graphs.get(name)
+                if graph is None:
+                    graph = self._resolve(self._documents[uri], uri, {})
+                    self._graphs[name] = graph
+        return graph
+
+    def _schema_ref(self, holder: dict[str, Any], uri: str) -> str | None:
+        """Absolute ref to `holder['schema']`, addressed where it is defined"""
+        if "schema" not in holder:
+            return None
+        return f"{uri}/schema"
+
+    def _parameter(self, node: Any, uri: str) -> Parameter:
+        node, uri = self.follow(node, uri)
+        return Parameter(
+            node.get("name", ""),
+            node.get("in", ""),
+            bool(node.get("required", False)),
+            self._schema_ref(node, uri),
+        )
+
+    def _content(self, node: Any, uri: str) -> dict[str, str]:
+        content = node.get("content") or {}
+        return {
+            media_type: f"{uri}/content/{_escape(media_type)}/schema"
+            for media_type, media in content.items()
+            if isinstance(media, dict) and "schema" in media
+        }
+
+    def operations(self, name: str) -> list[Operation]:
+        """Every path/method of a spec, in document order"""
+        uri = self.spec_uri(name)
+        doc = self._documents[uri]
+        top_security = doc.get("security")
+        operations = []
+        for path, item in (doc.get("paths") or {}).items():
+            item_uri = f"{uri}#/paths/{_escape(path)}"
+            item, item_uri = self.follow(item, item_uri)
+            shared = {
+                (p.name, p.location): p
+                for i, raw in enumerate(item.get("parameters") or [])
+                for p in [self._parameter(raw, f"{item_uri}/parameters/{i}")]
+            }
+            for method in HTTP_METHODS:
+                op = item.get(method)
+                if not isinstance(op, dict):
+                    continue
+                op_uri = f"{item_uri}/{method}"
+                parameters = dict(shared)
+                for i, raw in enumerate(op.get("parameters") or []):
+                    p = self._parameter(raw, f"{op_uri}/parameters/{i}")
+                    parameters[(p.name, p.location)] = p
+
+                body_required = False
+                request_body: dict[str, str] = {}
+                if "requestBody" in op:
+                    body, body_uri = self.follow(op["requestBody"], f"{op_uri}/requestBody")
+                    body_required = bool(body.get("required", False))
+                    request_body = self._content(body, body_uri)
+
+                responses = {}
+                for status, raw in (op.get("responses") or {}).items():
+                    response, response_uri = self.follow(
+                        raw, f"{op_uri}/responses/{_escape(str(status))}"
+                    )
+                    responses[str(status)] = self._content(response, response_uri)
+
+                operations.append(Operation(
+                    method.upper(), path, op.get("operationId"), tuple(parameters.values()),
+                    body_required, request_body, responses, op.get("security", top_security),
+                ))
+        return operations
+
+    def validator(self, schema_ref: str) -> Validator:
+        """Compiled validator for a schema addressed by absolute URI, built on first use"""
+        validator = self._validators.get(schema_ref)
+        if validator is None:
+            with self._lock:
+                validator = self._validators.get(schema_ref)
+                if validator is None:
+                    validator = ContractValidator(
+                        {"$ref": schema_ref},
+                        registry=self._ref_registry,
+                        format_checker=self.registry.format_checker,
+                    )
+                    self._validators[schema_ref] = validator
+        return validator
+
+    def _iter_refs(self, node: Any, pointer: str = "") -> Iterator[tuple[str, str]]:
+        if isinstance(node, list):
+            for i, item in enumerate(node):
+                yield from self._iter_refs(item, f"{pointer}/{i}")
+        elif isinstance(node, dict):
+            if isinstance(node.get("$ref"), str):
+                yield pointer, node["$ref"]
+            for key, value in node.items():
+                if key not in DATA_KEYWORDS:
+                    yield from self._iter_refs(value, f"{pointer}/{_escape(str(key))}")
+
+    def _iter_schemas(self, doc: Any, uri: str) -> Iterator[tuple[str, Any]]:
+        """(absolute URI, schema) for component schemas and every parameter/media schema"""
+        for schema_name, schema in ((doc.get("components") or {}).get("schemas") or {}).items():
+            yield f"{uri}#/components/schemas/{_escape(schema_name)}", schema
+
+        def visit(node: Any, pointer: str) -> Iterator[tuple[str, Any]]:
+            if isinstance(node, list):
+                for i, item in enumerate(node):
+                    yield from visit(item, f"{pointer}/{i}")
+            elif isinstance(node, dict):
+                for key, value in node.items():
+                    at = f"{pointer}/{_escape(str(key))}"
+                    if key == "schema" and isinstance(value, dict):
+                        yield f"{uri}#{at}", value
+                    elif key not in DATA_KEYWORDS and key != "schemas":
+                        yield from visit(value, at)
+
+        yield from visit({k: v for k, v in doc.items() if k != "components"}, "")
+        components = doc.get("components") or {}
+        for section in ("parameters", "responses", "requestBodies", "headers"):
+            if section in components:
+                yield from visit(components[section], f"/components/{section}")
+
+    def _check_document(self, uri: str) -> list[SpecIssue]:
+        """Refs, embedded schemas and examples of one YAML file"""
+        issues = []
+        rel = self._rel(uri)
+        doc = self._documents[uri]
+
+        for pointer, ref in self._iter_refs(doc):
+            try:
+                self.lookup(urljoin(uri, ref))
+            except OpenApiError as exc:
+                issues.append(SpecIssue(rel, pointer, str(exc)))
+
+        for schema_uri, schema in self._iter_schemas(doc, uri):
+            pointer = urldefrag(schema_uri)[1]
+            bare_ref = isinstance(schema, dict) and schema.keys() == {"$ref"}
+            if not bare_ref and not _META_VALIDATOR.is_valid(schema):
+                error = best_match(_META_VALIDATOR.iter_errors(schema))
+                issues.append(SpecIssue(rel, pointer, f"Invalid schema: {error.message}"))
+                continue
+            example = schema.get("example") if isinstance(schema, dict) else None
+            if example is None:
+                continue
+            try:
+                error = next(self.validator(schema_uri).iter_errors(example), None)
+            except Unresolvable as exc:
+                issues.append(SpecIssue(rel, pointer, f"Unresolvable $ref in schema: {exc}"))
+                continue
+            if error is not None:
+                issues.append(SpecIssue(rel, f"{pointer}/example",
+                                        f"Example does not match schema: {error.message}"))
+        return issues
+
+    def validate_spec(self, name: str) -> list[SpecIssue]:
+        """Structural OpenAPI 3.1 checks plus refs, schemas and examples of a spec"""
+        uri = self.spec_uri(name)
+        rel = self._rel(uri)
+        doc = self._documents[uri]
+        issues: list[SpecIssue] = []
+
+        if not isinstance(doc, dict):
+            return [SpecIssue(rel, "", "Spec must be a mapping")]
+        if not _OPENAPI_VERSION.fullmatch(str(doc.get("openapi", ""))):
+            issues.append(SpecIssue(rel, "/openapi", "openapi must be 3.1.x"))
+        info = doc.get("info") or {}
+        for field in ("title", "version"):
+            if not info.get(field):
+                issues.append(SpecIssue(rel, f"/info/{field}", f"Missing info.{field}"))
+        if not isinstance(doc.get("paths"), dict):
+            issues.append(SpecIssue(rel, "/paths", "paths must be a mapping"))
+
+        issues.extend(self._check_document(uri))
+        if issues:
+            return issues
+
+        schemes = self.spec(name).get("components", {}).get("securitySchemes", {})
+        operation_ids: dict[str, str] = {}
+        for op in self.operations(name):
+            at = f"/paths/{_escape(op.path)}/{op.method.lower()}"
+            if not op.path.startswith("/"):
+                issues.append(SpecIssue(rel, f"/paths/{_escape(op.path)}",
+                                        "Path must start with /"))
+            if not op.responses:
+                issues.append(SpecIssue(rel, f"{at}/responses", "Operation has no responses"))
+            if op.operation_id is not None:
+                if op.operation_id in operation_ids:
+                    issues.append(SpecIssue(rel, f"{at}/operationId",
+                                            f"Duplicate operationId {op.operation_id} "
+                                            f"(also {operation_ids[op.operation_id]})"))
+                operation_ids.setdefault(op.operation_id, f"{op.method} {op.path}")
+
+            declared = {p.name for p in op.parameters if p.location == "path"}
+            for template in _PATH_TEMPLATE.findall(op.path):
+                if template not in declared:
+                    issues.append(SpecIssue(rel, at,
+                                            f"Path parameter {{{template}}} is not declared"))
+            for p in op.parameters:
+                if p.location not in PARAMETER_LOCATIONS or not p.name:
+                    issues.append(SpecIssue(rel, f"{at}/parameters",
+                                            f"Invalid parameter {p.name!r} in {p.location!r}"))
+                elif p.location == "path" and not p.required:
+                    issues.append(SpecIssue(rel, f"{at}/parameters",
+                                            f"Path parameter {p.name} must be required"))
+                elif p.location == "path" and f"{{{p.name}}}" not in op.path:
+                    issues.append(SpecIssue(rel, f"{at}/parameters",
+                                            f"Path parameter {p.name} is not in the path"))
+
+            for requirement in op.security or []:
+                for scheme in requirement:
+                    if scheme not in schemes:
+                        issues.append(SpecIssue(rel, f"{at}/security",
+                                                f"Unknown security scheme {scheme}"))
+        return issues
+
+    def validate_all(self) -> list[SpecIssue]:
+        """Validate every spec plus every shared components file"""
+        issues = []
+        spec_uris = {self.spec_uri(name) for name in self.names}
+        for name in self.names:
+            issues.extend(self.validate_spec(name))
+        for uri in self._documents:
+            if uri not in spec_uris:
+                issues.extend(self._check_document(uri))
+        return issues
+
+
+_loader: OpenApiLoader | None = None
+_loader_lock = threading.Lock()
+
+
+def get_openapi_loader() -> OpenApiLoader:
+    """Return the process-wide loader, parsing api/ on first call"""
+    global _loader
+    if _loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = OpenApiLoader()
+    return _loader
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load and validate the OpenAPI specs in api/")
+    parser.add_argument("--api-dir", type=Path, default=API_DIR, help="Directory of specs")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        loader = OpenApiLoader(args.api_dir)
+    except OpenApiError as exc:
+        print(f"❌ {exc}")
+        return 1
+    issues = loader.validate_all()
+    elapsed = time.perf_counter() - started
+
+    for name in loader.names:
+        count = len(loader.operations(name)) if not issues else 0
+        print(f"🔍 {name}" + (f": {count} operations" if count else ""))
+    for issue in issues:
+        print(f"  ❌ {issue.file}#{issue.pointer}: {issue.message}")
+    print(f"⏱  {elapsed * 1000:.1f} ms "
+          f"({'libyaml' if hasattr(yaml, 'CSafeLoader') else 'pure-Python YAML'})")
+    if issues:
+        print(f"❌ {len(issues)} OpenAPI issue(s)")
+        return 1
+    print(f"✅ {len(loader.names)} OpenAPI specs valid")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
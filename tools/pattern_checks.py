@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Pattern Checks
+
+Fast `pattern` keyword support for the contract validators. Almost every
+contract repeats fixed-shape ID patterns such as `^field_[a-z0-9]{24}$`,
+`^job_[a-z0-9]{24}$` or `^[a-f0-9]{64}$` (SHA-256), and jsonschema's stock
+keyword calls `re.search(pattern_string, value)` for each of them, paying a
+regex-cache lookup on every call.
+
+`pattern_matcher()` hands out matchers from a process-wide compiled-regex
+cache. Fixed shapes are also recognized (`parse_fixed_shape`) and a
+specialized checker (length + prefix compare + ASCII charset test via
+`bytes.translate`) is available; the bundled micro-benchmark compares all
+three. On CPython the compiled regex wins for these short IDs (the `sre`
+charset loop runs in C, while the specialized checker pays several Python
+calls), so the matcher uses the compiled regex for every pattern and the
+fixed-shape decomposition is kept for tooling that needs to reason about IDs.
+
+Usage:
+    from pattern_checks import pattern_matcher
+
+    matches = pattern_matcher("^job_[a-z0-9]{24}$")
+    bool(matches("job_60a7f1b8c9d4e5f6a7b8c9d2"))  # True
+
+    python3 tools/pattern_checks.py --benchmark
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import threading
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+# ^<literal prefix>[<ascii class>]{n} or {m,n}$
+_FIXED_SHAPE_RE = re.compile(
+    r"^\^(?P<prefix>[A-Za-z0-9_\-]*)"
+    r"\[(?P<charset>(?:[A-Za-z0-9]-[A-Za-z0-9]|[A-Za-z0-9_])+)\]"
+    r"\{(?P<min>\d+)(?:,(?P<max>\d+))?\}\$$"
+)
+
+_regex_cache: dict[str, re.Pattern[str]] = {}
+_matcher_cache: dict[str, Callable[[str], object]] = {}
+_cache_lock = threading.Lock()
+
+
+class FixedShape:
+    """A `^<prefix>[<charset>]{min,max}$` pattern decomposed for direct checking"""
+
+    def __init__(self, prefix: str, charset: str, min_len: int, max_len: int):
+        self.prefix = prefix
+        self.charset = charset
+        self.min_len = min_len
+        self.max_len = max_len
+
+    def __repr__(self) -> str:
+        return (f"FixedShape(prefix={self.prefix!r}, charset={self.charset!r}, "
+                f"min_len={self.min_len}, max_len={self.max_len})")
+
+
+def _expand_charset(spec: str) -> str:
+    chars: list[str] = []
+    i = 0
+    while i < len(spec):
+        if i + 2 < len(spec) and spec[i + 1] == "-":
+            start, end = ord(spec[i]), ord(spec[i + 2])
+            if start > end:
+                raise ValueError(f"Bad range in character class: {spec!r}")
+            chars.extend(chr(c) for c in range(start, end + 1))
+            i += 3
+        else:
+            chars.append(spec[i])
+            i += 1
+    return "".join(sorted(set(chars)))
+
+
+def parse_fixed_shape(pattern: str) -> FixedShape | None:
+    """Recognize `^<prefix>[<class>]{n}$` patterns; returns None for anything else"""
+    m = _FIXED_SHAPE_RE.match(pattern)
+    if m is None:
+        return None
+    try:
+        charset = _expand_charset(m.group("charset"))
+    except ValueError:
+        return None
+    min_len = int(m.group("min"))
+    max_len = int(m.group("max")) if m.group("max") is not None else min_len
+    if max_len < min_len:
+        return None
+    return FixedShape(m.group("prefix"), charset, min_len, max_len)
+
+
+def compiled_pattern(pattern: str) -> re.Pattern[str]:
+    """Return the process-wide compiled regex for a pattern"""
+    compiled = _regex_cache.get(pattern)
+    if compiled is None:
+        with _cache_lock:
+            compiled = _regex_cache.get(pattern)
+            if compiled is None:
+                compiled = _regex_cache[pattern] = re.compile(pattern)
+    return compiled
+
+
+def fixed_shape_checker(shape: FixedShape, pattern: str) -> Callable[[str], bool]:
+    """Specialized `str -> bool` checker for a fixed shape, equivalent to re.search(pattern)"""
+    prefix = shape.prefix
+    start = len(prefix)
+    min_total = start + shape.min_len
+    max_total = start + shape.max_len
+    allowed = shape.charset.encode("ascii")
+    search = compiled_pattern(pattern).search
+
+    def matches(s: str) -> bool:
+        if (
+            min_total <= len(s) <= max_total
+            and s.startswith(prefix)
+            and s.isascii()
+            and not s.encode("ascii")[start:].translate(None, allowed)
+        ):
+            return True
+        # Rare path: let the regex decide so edge cases (e.g. `$` before a trailing newline)
+        # keep re.search semantics
+        return search(s) is not None
+
+    return matches
+
+
+def pattern_matcher(pattern: str) -> Callable[[str], object]:
+    """Return a cached matcher whose result is truthy exactly when re.search(pattern, s) is"""
+    matcher = _matcher_cache.get(pattern)
+    if matcher is None:
+        matcher = compiled_pattern(pattern).search
+        with _cache_lock:
+            matcher = _matcher_cache.setdefault(pattern, matcher)
+    return matcher
+
+
+def benchmark(number: int = 200_000) -> list[tuple[str, str, float, float, float]]:
+    """Per-call ns for re.match(str), the cached compiled regex and the fixed-shape checker"""
+    cases = [
+        ("^job_[a-z0-9]{24}$", "job_60a7f1b8c9d4e5f6a7b8c9d2"),
+        ("^field_[a-z0-9]{24}$", "field_507f1f77bcf86cd799439011"),
+        ("^user_[a-z0-9]{24}$", "user_60a7f1b8c9d4e5f6a7b8c9d3"),
+        ("^[a-f0-9]{64}$", "a3f2b8c9d4e5f6a7b8c9d0e1f2a3b4c5d6e7f8a9b0c1d2e3f4a5b6c7d8e9f0a1"),
+        ("^job_[a-z0-9]{24}$", "mission_60a7f1b8c9d4e5f6a7b8c9"),
+    ]
+
+    def per_call(func: Callable[[], object]) -> float:
+        return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+
+    rows = []
+    for pattern, value in cases:
+        matcher = pattern_matcher(pattern)
+        shape = parse_fixed_shape(pattern)
+        assert shape is not None
+        specialized = fixed_shape_checker(shape, pattern)
+        # partial binds this iteration's values now, unlike a closure over the loop variables
+        rows.append((
+            pattern,
+            value,
+            per_call(partial(re.match, pattern, value)),
+            per_call(partial(matcher, value)),
+            per_call(partial(specialized, value)),
+        ))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pattern checker micro-benchmark")
+    parser.add_argument("--benchmark", action="store_true", help="Run the micro-benchmark")
+    parser.add_argument("--number", type=int, default=200_000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return 0
+
+    print(f"{'pattern':<22} {'value':<16} {'re.match':>10} {'matcher':>10} {'fixed':>10}")
+    for pattern, value, plain, cached, fixed in benchmark(args.number):
+        print(f"{pattern:<22} {value[:14] + '..':<16} {plain:>8.0f}ns {cached:>8.0f}ns "
+              f"{fixed:>8.0f}ns")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Adaptive Response Sampling
+
+Keeps contract enforcement on in production at a bounded CPU cost by
+validating only a sample of response payloads per schema or operation:
+
+- each key (an operation such as `GET /results`, or a contract schema path
+  or `$id`) has its own `AdaptiveSampler` with a base sample rate
+- sampling is deterministic (a credit accumulator, not random draws), so a
+  rate of 0.05 checks exactly one payload in twenty; the first payload of a
+  key is always checked
+- a violation multiplies the key's rate by `boost` (up to `max_rate`); every
+  clean sampled payload decays it by `decay` back towards the base rate
+- counters per key: payloads seen, sampled and violating, plus the current rate
+
+Settings come from `[tool.tarlaanaliz.sampling]` in pyproject.toml, with
+per-key base rates under `[tool.tarlaanaliz.sampling.rates]`.
+
+Usage:
+    from response_sampling import load_sampler
+
+    sampler = load_sampler()
+    if sampler.should_sample("GET /results"):
+        sampler.record("GET /results", violated=not validator.is_valid(body))
+
+    # or for contract schemas, sampling and validation in one call
+    error = sampler.validate("worker/analysis_result.v1.schema.json", payload)
+
+    app = AsgiValidationMiddleware(app, sampler=sampler)    # see api_middleware.py
+"""
+from __future__ import annotations
+
+import sys
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import tomllib  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        tomllib = None
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import BASE_DIR, ContractRegistry, get_registry  # noqa: E402
+
+# Tolerance for accumulated float error in the sampling credit
+_EPSILON = 1e-9
+
+
+class SamplingPolicy(NamedTuple):
+    """Sample rate and adaptation settings for one key"""
+
+    rate: float = 0.05          # base fraction of payloads validated
+    max_rate: float = 1.0       # ceiling while violations are being seen
+    boost: float = 10.0         # rate multiplier per violation
+    decay: float = 0.9          # rate multiplier per clean sampled payload, down to `rate`
+
+
+class AdaptiveSampler:
+    """Deterministic sampler whose rate rises on violations and decays when clean"""
+
+    def __init__(self, policy: SamplingPolicy = SamplingPolicy()):
+        if not 0.0 <= policy.rate <= policy.max_rate <= 1.0:
+            raise ValueError(f"Invalid sample rates: {policy.rate} / {policy.max_rate}")
+        self.policy = policy
+        self.rate = policy.rate
+        self.seen = 0
+        self.sampled = 0
+        self.violations = 0
+        self._credit = 1.0 - self.rate  # the first payload is always checked
+        self._lock = threading.Lock()
+
+    def should_sample(self) -> bool:
+        """Count one payload; True when it should be validated"""
+        with self._lock:
+            self.seen += 1
+            self._credit += self.rate
+            if self._credit < 1.0 - _EPSILON:
+                return False
+            self._credit -= 1.0
+            self.sampled += 1
+            return True
+
+    def record(self, violated: bool) -> None:
+        """Feed back the outcome of a sampled validation"""
+        policy = self.policy
+        with self._lock:
+            if violated:
+                self.violations += 1
+                self.rate = min(policy.max_rate, max(self.rate * policy.boost, policy.rate))
+                # Check the very next payload too
+                self._credit = max(self._credit, 1.0 - self.rate)
+            else:
+                self.rate = max(policy.rate, self.rate * policy.decay)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "seen": self.seen,
+                "sampled": self.sampled,
+                "violations": self.violations,
+                "rate": self.rate,
+            }
+
+
+class ResponseSampler:
+    """Per-key adaptive samplers; keys are operation keys or contract schema keys"""
+
+    def __init__(
+        self,
+        default: SamplingPolicy = SamplingPolicy(),
+        rates: Mapping[str, float] | None = None,
+        registry: ContractRegistry | None = None,
+    ):
+        self.default = default
+        self.rates = dict(rates or {})
+        for rate in (default.rate, *self.rates.values()):
+            if not 0.0 <= rate <= default.max_rate <= 1.0:
+                raise ValueError(f"Invalid sample rate: {rate} (max {default.max_rate})")
+        self._registry = registry
+        self._samplers: dict[str, AdaptiveSampler] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def registry(self) -> ContractRegistry:
+        if self._registry is None:
+            self._registry = get_registry()
+        return self._registry
+
+    def sampler(self, key: str) -> AdaptiveSampler:
+        """The sampler for a key, created with its configured base rate on first use"""
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            with self._lock:
+                sampler = self._samplers.get(key)
+                if sampler is None:
+                    policy = self.default
+                    if key in self.rates:
+                        policy = policy._replace(rate=self.rates[key])
+                    sampler = AdaptiveSampler(policy)
+                    self._samplers[key] = sampler
+        return sampler
+
+    def should_sample(self, key: str) -> bool:
+        return self.sampler(key).should_sample()
+
+    def record(self, key: str, violated: bool) -> None:
+        self.sampler(key).record(violated)
+
+    def validate(self, key: str, instance: Any) -> str | None:
+        """Sampled check against a contract schema; first error message, None if clean or skipped"""
+        sampler = self.sampler(key)
+        if not sampler.should_sample():
+            return None
+        error = next(self.registry.iter_errors(key, instance), None)
+        sampler.record(error is not None)
+        return None if error is None else f"{error.json_path}: {error.message}"
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Counters and current rate per key"""
+        return {key: sampler.snapshot() for key, sampler in sorted(self._samplers.items())}
+
+
+def load_sampler(pyproject: Path = BASE_DIR / "pyproject.toml",
+                 registry: ContractRegistry | None = None) -> ResponseSampler:
+    """Sampler configured from `[tool.tarlaanaliz.sampling]`; defaults when absent"""
+    config: dict[str, Any] = {}
+    if tomllib is not None and pyproject.exists():
+        with open(pyproject, "rb") as f:
+            config = tomllib.load(f).get("tool", {}).get("tarlaanaliz", {}).get("sampling", {})
+
+    defaults = SamplingPolicy()
+    policy = SamplingPolicy(**{
+        name: float(config.get(name, getattr(defaults, name))) for name in SamplingPolicy._fields
+    })
+    rates = {key: float(rate) for key, rate in config.get("rates", {}).items()}
+    return ResponseSampler(policy, rates, registry)
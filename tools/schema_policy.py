@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Schema Policy Linter
+
+Checks contract schemas against the `[tool.tarlaanaliz.schema]` policy block
+in pyproject.toml. Each schema tree is walked once; at every subschema the
+visitor runs all registered rules:
+
+- forbidden-field: property names (`properties`, `required`,
+  `dependentRequired`) matching the forbidden PII fields (KR-050), compared
+  case-insensitively on the name itself, not as a substring of the document
+- unevaluated-properties: every object schema, nested ones and `$defs`
+  included, closes itself with `unevaluatedProperties: false` (errors at the
+  root and for `$defs` types, warnings for inline objects; objects that
+  declare `additionalProperties` are deliberate maps and only warn below)
+- required-properties / schema-standard: root keywords (`$schema`, `$id`,
+  `title`, ...) and the Draft 2020-12 dialect
+- warning-features: keywords that are allowed but discouraged
+  (`additionalProperties`) are reported as warnings
+
+Only schema positions are visited; instance data under `const`, `enum`,
+`default` and `examples` is never inspected. `fail_on_warning` turns warnings
+into a failing exit code.
+
+Usage:
+    from schema_policy import lint_schema, load_policy
+
+    findings = lint_schema(schema, load_policy())
+
+    python3 tools/schema_policy.py                         # every schema under schemas/
+    python3 tools/schema_policy.py schemas/core/field.v1.schema.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+try:
+    import tomllib  # type: ignore[import-not-found]
+except ImportError:
+    try:
+        import tomli as tomllib  # type: ignore[import-not-found,no-redef]
+    except ImportError:
+        tomllib = None
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Always forbidden regardless of pyproject (KR-050: NO email, NO TCKN, NO OTP)
+KR050_FORBIDDEN_FIELDS = ("email", "e_mail", "tckn", "tc_kimlik_no", "otp", "one_time_password")
+
+# Keywords whose value is a single subschema
+SCHEMA_KEYWORDS = (
+    "additionalProperties", "unevaluatedProperties", "items", "unevaluatedItems",
+    "contains", "propertyNames", "not", "if", "then", "else", "contentSchema",
+)
+# Keywords whose value is a list of subschemas
+SCHEMA_LIST_KEYWORDS = ("allOf", "anyOf", "oneOf", "prefixItems")
+# Keywords whose value maps names to subschemas
+SCHEMA_MAP_KEYWORDS = ("properties", "patternProperties", "$defs", "dependentSchemas")
+
+# Pointer of a named type directly under the root `$defs`
+_DEFS_ENTRY = re.compile(r"/\$defs/[^/]+")
+
+ERROR = "error"
+WARNING = "warning"
+
+
+class Finding(NamedTuple):
+    """One policy violation, addressed by JSON pointer into the schema"""
+
+    pointer: str
+    rule: str
+    message: str
+    severity: str = ERROR
+
+
+class SchemaPolicy(NamedTuple):
+    """Settings from `[tool.tarlaanaliz.schema]`"""
+
+    schema_standard: str = "https://json-schema.org/draft/2020-12/schema"
+    forbidden_fields: frozenset[str] = frozenset(KR050_FORBIDDEN_FIELDS)
+    required_properties: tuple[str, ...] = ("$schema", "$id", "title", "type")
+    enforce_unevaluated_properties: bool = True
+    warning_features: tuple[str, ...] = ("additionalProperties",)
+    fail_on_warning: bool = False
+
+
+def load_policy(pyproject: Path = BASE_DIR / "pyproject.toml") -> SchemaPolicy:
+    """Read the policy block; defaults apply when the file, block or TOML parser is missing"""
+    if tomllib is None or not pyproject.exists():
+        return SchemaPolicy()
+    with open(pyproject, "rb") as f:
+        config = tomllib.load(f).get("tool", {}).get("tarlaanaliz", {}).get("schema", {})
+
+    defaults = SchemaPolicy()
+    return SchemaPolicy(
+        schema_standard=config.get("schema_standard", defaults.schema_standard),
+        forbidden_fields=frozenset(
+            name.lower() for name in (*KR050_FORBIDDEN_FIELDS, *config.get("forbidden_fields", ()))
+        ),
+        required_properties=tuple(
+            config.get("required_properties", defaults.required_properties)
+        ),
+        enforce_unevaluated_properties=config.get(
+            "enforce_unevaluated_properties", defaults.enforce_unevaluated_properties
+        ),
+        warning_features=tuple(config.get("warning_features", defaults.warning_features)),
+        fail_on_warning=config.get("fail_on_warning", defaults.fail_on_warning),
+    )
+
+
+# A rule sees one subschema at a time: (node, pointer, policy) -> findings
+Rule = Callable[[dict[str, Any], str, SchemaPolicy], Iterator[Finding]]
+RULES: dict[str, Rule] = {}
+
+
+def rule(name: str) -> Callable[[Rule], Rule]:
+    """Register a rule under `name`; every registered rule runs on every subschema"""
+    def register(func: Rule) -> Rule:
+        RULES[name] = func
+        return func
+    return register
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+@rule("schema-standard")
+def _schema_standard(node: dict[str, Any], pointer: str, policy: SchemaPolicy) -> Iterator[Finding]:
+    if pointer or "$schema" not in node:
+        return
+    if node["$schema"] != policy.schema_standard:
+        yield Finding("/$schema", "schema-standard",
+                      f"$schema must be {policy.schema_standard}, got {node['$schema']}")
+
+
+@rule("required-properties")
+def _required_properties(node: dict[str, Any], pointer: str,
+                         policy: SchemaPolicy) -> Iterator[Finding]:
+    if pointer:
+        return
+    for keyword in policy.required_properties:
+        if keyword not in node:
+            yield Finding("", "required-properties", f"Missing required keyword {keyword}")
+
+
+@rule("forbidden-field")
+def _forbidden_field(node: dict[str, Any], pointer: str, policy: SchemaPolicy) -> Iterator[Finding]:
+    forbidden = policy.forbidden_fields
+    properties = node.get("properties")
+    if isinstance(properties, dict):
+        for name in properties:
+            if name.lower() in forbidden:
+                yield Finding(f"{pointer}/properties/{_escape(name)}", "forbidden-field",
+                              f"FORBIDDEN field '{name}' (KR-050 PII minimization)")
+    for keyword in ("required", "dependentRequired"):
+        names = node.get(keyword)
+        if isinstance(names, (list, dict)):
+            for i, name in enumerate(names):
+                if isinstance(name, str) and name.lower() in forbidden:
+                    at = f"{pointer}/{keyword}/{i if isinstance(names, list) else _escape(name)}"
+                    yield Finding(at, "forbidden-field",
+                                  f"FORBIDDEN field '{name}' (KR-050 PII minimization)")
+
+
+@rule("unevaluated-properties")
+def _unevaluated_properties(node: dict[str, Any], pointer: str,
+                            policy: SchemaPolicy) -> Iterator[Finding]:
+    if not policy.enforce_unevaluated_properties:
+        return
+    kind = node.get("type")
+    if kind != "object" and not (isinstance(kind, list) and "object" in kind):
+        return
+    if "additionalProperties" in node and "unevaluatedProperties" not in node:
+        # Deliberate open or typed map (metadata, exif_data); warning-features reports it
+        return
+    if "unevaluatedProperties" not in node:
+        # Root and $defs entries are contract types; inline objects only warn for now
+        top_level = pointer == "" or _DEFS_ENTRY.fullmatch(pointer) is not None
+        yield Finding(pointer, "unevaluated-properties", "Missing unevaluatedProperties",
+                      ERROR if top_level else WARNING)
+    elif node["unevaluatedProperties"] is not False:
+        yield Finding(f"{pointer}/unevaluatedProperties", "unevaluated-properties",
+                      "unevaluatedProperties must be false")
+
+
+@rule("warning-features")
+def _warning_features(node: dict[str, Any], pointer: str,
+                      policy: SchemaPolicy) -> Iterator[Finding]:
+    for keyword in policy.warning_features:
+        if keyword in node:
+            yield Finding(f"{pointer}/{_escape(keyword)}", "warning-features",
+                          f"{keyword} is discouraged; prefer unevaluatedProperties", WARNING)
+
+
+def iter_subschemas(schema: Any) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield (pointer, subschema) for every schema position, depth first, root first"""
+    stack: list[tuple[str, Any]] = [("", schema)]
+    while stack:
+        pointer, node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        yield pointer, node
+
+        children: list[tuple[str, Any]] = []
+        for keyword in SCHEMA_KEYWORDS:
+            if keyword in node:
+                children.append((f"{pointer}/{keyword}", node[keyword]))
+        for keyword in SCHEMA_LIST_KEYWORDS:
+            value = node.get(keyword)
+            if isinstance(value, list):
+                children.extend((f"{pointer}/{keyword}/{i}", sub) for i, sub in enumerate(value))
+        for keyword in SCHEMA_MAP_KEYWORDS:
+            value = node.get(keyword)
+            if isinstance(value, dict):
+                children.extend(
+                    (f"{pointer}/{keyword}/{_escape(name)}", sub) for name, sub in value.items()
+                )
+        # Reverse so the stack pops children in document order
+        stack.extend(reversed(children))
+
+
+def lint_schema(schema: Any, policy: SchemaPolicy | None = None,
+                rules: dict[str, Rule] | None = None) -> list[Finding]:
+    """Run every rule over every subschema in one traversal"""
+    policy = policy or SchemaPolicy()
+    active = tuple((rules or RULES).values())
+    findings: list[Finding] = []
+    for pointer, node in iter_subschemas(schema):
+        for check in active:
+            findings.extend(check(node, pointer, policy))
+    return findings
+
+
+def lint_source(data: bytes | str, policy: SchemaPolicy | None = None) -> list[Finding]:
+    """Lint raw schema JSON; unparseable input is reported as a `parse` finding"""
+    try:
+        schema = json.loads(data)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        return [Finding("", "parse", f"JSON parse error: {exc}")]
+    return lint_schema(schema, policy)
+
+
+def lint_file(path: Path, policy: SchemaPolicy | None = None) -> list[Finding]:
+    """Lint one schema file"""
+    try:
+        data = Path(path).read_bytes()
+    except OSError as exc:
+        return [Finding("", "parse", f"Cannot read file: {exc}")]
+    return lint_source(data, policy)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Lint schemas against the contract policy")
+    parser.add_argument("files", nargs="*", type=Path, help="Schema files (default: schemas/)")
+    parser.add_argument("--pyproject", type=Path, default=BASE_DIR / "pyproject.toml",
+                        help="pyproject.toml holding [tool.tarlaanaliz.schema]")
+    parser.add_argument("--quiet", action="store_true", help="Hide warnings")
+    args = parser.parse_args()
+
+    policy = load_policy(args.pyproject)
+    files = args.files or sorted((BASE_DIR / "schemas").rglob("*.json"))
+
+    started = time.perf_counter()
+    errors = warnings = 0
+    for path in files:
+        findings = lint_file(path, policy)
+        for finding in findings:
+            if finding.severity == WARNING:
+                warnings += 1
+                if args.quiet:
+                    continue
+            else:
+                errors += 1
+            icon = "⚠️ " if finding.severity == WARNING else "❌"
+            print(f"{icon} {path}#{finding.pointer}: [{finding.rule}] {finding.message}")
+    elapsed = time.perf_counter() - started
+
+    print(f"⏱  {len(files)} schemas, {errors} errors, {warnings} warnings "
+          f"in {elapsed * 1000:.1f} ms")
+    if errors or (warnings and policy.fail_on_warning):
+        return 1
+    print("✅ Schema policy satisfied")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
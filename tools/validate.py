@@ -1,73 +1,229 @@
 #!/usr/bin/env python3
 """
 TarlaAnaliz Contracts Validator
-Validates all JSON Schema and OpenAPI files
+Validates all JSON Schema and enum files against the [tool.tarlaanaliz.schema] policy
+(see tools/schema_policy.py for the rules) and the OpenAPI specs in api/
+(see tools/openapi_loader.py)
+
+Results are cached in build/validate_cache.json, keyed by each file's SHA-256
+plus a fingerprint of the linter, this tool and the active policy; unchanged
+files are not re-checked. The OpenAPI specs are cached as one entry keyed by
+every api/ and contract file, since their refs cross files. Cache misses can
+be checked in parallel.
+
+Usage:
+    python3 tools/validate.py
+    python3 tools/validate.py --jobs 0        # one process per CPU for cache misses
+    python3 tools/validate.py --no-cache      # full run (the cache is still refreshed)
 """
+import argparse
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, List, Optional, Tuple
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from schema_policy import (  # noqa: E402
+    KR050_FORBIDDEN_FIELDS,
+    WARNING,
+    SchemaPolicy,
+    lint_source,
+    load_policy,
+)
+
+BASE_DIR = TOOLS_DIR.parent
+CONTRACT_DIRS = ('schemas', 'enums')
+CACHE_FILE = BASE_DIR / 'build' / 'validate_cache.json'
+API_DIR = BASE_DIR / 'api'
+
+# Cache entry holding the OpenAPI results
+API_ENTRY = 'api/'
 
-# Forbidden fields (per KR-050: NO email, NO TCKN, NO OTP)
-FORBIDDEN_FIELDS = ['email', 'e_mail', 'tckn', 'tc_kimlik_no', 'otp', 'one_time_password']
+# Forbidden fields (per KR-050: NO email, NO TCKN, NO OTP); pyproject may add more
+FORBIDDEN_FIELDS = list(KR050_FORBIDDEN_FIELDS)
 
-def validate_json_schema(schema_path: Path) -> List[str]:
-    """Validate JSON Schema file"""
+Result = Tuple[List[str], List[str]]
+
+
+def check_source(display: str, data: bytes, policy: SchemaPolicy) -> Result:
+    """Lint raw file contents; returns (errors, warnings)"""
     errors = []
-    
+    warnings = []
+
+    for finding in lint_source(data, policy):
+        message = f"[{finding.rule}] {finding.message} in {display}#{finding.pointer}"
+        if finding.severity == WARNING:
+            warnings.append(message)
+        else:
+            errors.append(message)
+
+    return errors, warnings
+
+
+def validate_json_schema(schema_path: Path, policy: Optional[SchemaPolicy] = None) -> Result:
+    """Validate JSON Schema file; returns (errors, warnings)"""
+    return check_source(str(schema_path), Path(schema_path).read_bytes(), policy or load_policy())
+
+
+def cache_key(policy: SchemaPolicy) -> str:
+    """Validator/policy version: linter and tool sources plus the active policy"""
+    digest = hashlib.sha256()
+    for source in ('schema_policy.py', 'openapi_loader.py', 'validate.py'):
+        digest.update((TOOLS_DIR / source).read_bytes())
+    settings = {
+        name: sorted(value) if isinstance(value, frozenset) else value
+        for name, value in policy._asdict().items()
+    }
+    digest.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_cache(path: Path, key: str) -> Dict[str, dict]:
+    """Cached results per file; empty when missing, unreadable or for another key"""
     try:
-        with open(schema_path) as f:
-            schema = json.load(f)
-        
-        # Check $schema
-        if '$schema' not in schema:
-            errors.append(f"Missing $schema in {schema_path}")
-        elif 'draft/2020-12' not in schema['$schema']:
-            errors.append(f"Wrong draft version in {schema_path} (must be 2020-12)")
-        
-        # Check unevaluatedProperties
-        if schema.get('type') == 'object':
-            if 'unevaluatedProperties' not in schema:
-                errors.append(f"Missing unevaluatedProperties in {schema_path}")
-            elif schema['unevaluatedProperties'] != False:
-                errors.append(f"unevaluatedProperties must be false in {schema_path}")
-        
-        # Check for forbidden fields
-        schema_str = json.dumps(schema).lower()
-        for field in FORBIDDEN_FIELDS:
-            if f'"{field}"' in schema_str:
-                errors.append(f"FORBIDDEN field '{field}' found in {schema_path}")
-    
-    except json.JSONDecodeError as e:
-        errors.append(f"JSON parse error in {schema_path}: {e}")
-    except Exception as e:
-        errors.append(f"Error validating {schema_path}: {e}")
-    
-    return errors
+        cache = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('key') != key:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(path: Path, key: str, entries: Dict[str, dict]) -> None:
+    """Write the cache atomically; a read-only checkout just runs uncached"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp.write_text(json.dumps({'key': key, 'files': entries}, indent=1), encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def validate_files(
+    files: List[Path],
+    policy: SchemaPolicy,
+    cached: Dict[str, dict],
+    jobs: int = 1,
+) -> Tuple[Dict[str, dict], int]:
+    """Check files whose hash is not in `cached`; returns (entries for all files, hits)"""
+    entries: Dict[str, dict] = {}
+    misses: List[Tuple[str, str, bytes]] = []
+    hits = 0
+
+    for path in files:
+        rel = path.relative_to(BASE_DIR).as_posix()
+        data = path.read_bytes()
+        sha256 = hashlib.sha256(data).hexdigest()
+        entry = cached.get(rel)
+        if entry is not None and entry.get('sha256') == sha256:
+            entries[rel] = entry
+            hits += 1
+        else:
+            misses.append((rel, sha256, data))
+
+    if jobs > 1 and len(misses) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(misses))) as pool:
+            results = list(pool.map(
+                check_source,
+                [rel for rel, _, _ in misses],
+                [data for _, _, data in misses],
+                [policy] * len(misses),
+            ))
+    else:
+        results = [check_source(rel, data, policy) for rel, _, data in misses]
+
+    for (rel, sha256, _), (errors, warnings) in zip(misses, results):
+        entries[rel] = {'sha256': sha256, 'errors': errors, 'warnings': warnings}
+    # Report in path order regardless of which files came from the cache
+    return dict(sorted(entries.items())), hits
+
+
+def check_api_specs(api_dir: Path) -> Result:
+    """Load and validate the OpenAPI specs; returns (errors, warnings)"""
+    try:
+        import openapi_loader
+    except ImportError as exc:
+        return [], [f"OpenAPI specs not checked ({exc.name} is not installed)"]
+    if openapi_loader.yaml is None:
+        return [], ["OpenAPI specs not checked (PyYAML is not installed)"]
+
+    try:
+        loader = openapi_loader.OpenApiLoader(api_dir)
+    except openapi_loader.OpenApiError as exc:
+        return [f"[openapi] {exc}"], []
+    errors = [
+        f"[openapi] {issue.message} in {issue.file}#{issue.pointer}"
+        for issue in loader.validate_all()
+    ]
+    return errors, []
+
+
+def validate_api(entries: Dict[str, dict], cached: Dict[str, dict]) -> Tuple[dict, bool]:
+    """OpenAPI results, reused while no api/ or contract file changed; returns (entry, hit)"""
+    digest = hashlib.sha256()
+    for path in sorted(API_DIR.rglob('*.yaml')):
+        digest.update(path.relative_to(BASE_DIR).as_posix().encode('utf-8'))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    for rel, entry in entries.items():
+        digest.update(f'{rel}:{entry["sha256"]}'.encode('utf-8'))
+    sha256 = digest.hexdigest()
+
+    entry = cached.get(API_ENTRY)
+    if entry is not None and entry.get('sha256') == sha256:
+        return entry, True
+    errors, warnings = check_api_specs(API_DIR)
+    return {'sha256': sha256, 'errors': errors, 'warnings': warnings}, False
+
 
 def main():
     """Main validation"""
+    parser = argparse.ArgumentParser(description='Validate contract schemas against the policy')
+    parser.add_argument('--no-cache', action='store_true', help='Re-check every file')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Processes for cache misses (0 = one per CPU)')
+    parser.add_argument('--cache-file', type=Path, default=CACHE_FILE, help='Result cache path')
+    args = parser.parse_args()
+
     print("🔍 TarlaAnaliz Contracts Validator\n")
-    
-    base_dir = Path(__file__).parent.parent
-    schemas_dir = base_dir / 'schemas'
-    
+
+    policy = load_policy(BASE_DIR / 'pyproject.toml')
+    key = cache_key(policy)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    files = [
+        path for dirname in CONTRACT_DIRS for path in sorted((BASE_DIR / dirname).rglob('*.json'))
+    ]
+    cached = {} if args.no_cache else load_cache(args.cache_file, key)
+    entries, hits = validate_files(files, policy, cached, jobs)
+    entries[API_ENTRY], api_hit = validate_api(entries, cached)
+    hits += api_hit
+    save_cache(args.cache_file, key, entries)
+
     all_errors = []
-    total_files = 0
-    
-    # Validate all JSON Schema files
-    for schema_file in schemas_dir.rglob('*.json'):
-        total_files += 1
-        print(f"Validating {schema_file.relative_to(base_dir)}...")
-        errors = validate_json_schema(schema_file)
-        all_errors.extend(errors)
-    
+    all_warnings = []
+    for rel, entry in entries.items():
+        print(f"Validating {rel}...{' (cached)' if cached.get(rel) is entry else ''}")
+        all_errors.extend(entry['errors'])
+        all_warnings.extend(entry['warnings'])
+
     # Print results
     print(f"\n{'='*60}")
-    print(f"Total files validated: {total_files}")
+    print(f"Total files validated: {len(files)} (+ OpenAPI specs)")
+    print(f"Cache: {hits} hits, {len(entries) - hits} misses")
     print(f"Total errors: {len(all_errors)}")
-    
-    if all_errors:
+    print(f"Total warnings: {len(all_warnings)}")
+
+    for warning in all_warnings:
+        print(f"  ⚠️  {warning}")
+
+    if all_errors or (all_warnings and policy.fail_on_warning):
         print("\n❌ VALIDATION FAILED\n")
         for error in all_errors:
             print(f"  • {error}")
@@ -77,4 +233,4 @@ def main():
         sys.exit(0)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Contract Data Validator
+
+Validates payloads (not schema files) against the contracts. Reads NDJSON
+files, single JSON documents or whole directories line-by-line with constant
+memory, routes every record to its schema, and writes valid/invalid splits
+plus a per-schema error histogram.
+
+Routing:
+- `--schema KEY` validates every record against one schema
+- otherwise records are routed by (`event_type`, `event_version`) to schemas/events/
+
+Usage:
+    python3 tools/validate_data.py events.ndjson
+    python3 tools/validate_data.py archive/ --out-dir build/validation
+    python3 tools/validate_data.py results.ndjson --schema worker/analysis_result.v1.schema.json
+    cat events.ndjson | python3 tools/validate_data.py -
+    python3 tools/validate_data.py jobs.ndjson --schema worker/analysis_job.v1.schema.json --workers 32
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, get_registry  # noqa: E402
+from generate_validators import UnsupportedSchemaError, compile_validator  # noqa: E402
+
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    _loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+JSON_SUFFIXES = {".json"}
+
+# Upper bound on errors kept per record (keeps memory flat for pathological inputs)
+MAX_ERRORS_PER_RECORD = 20
+
+# Records shipped to a worker per task; large enough to amortize pickling and IPC
+DEFAULT_CHUNK_SIZE = 500
+
+UNROUTABLE = "<unroutable>"
+UNPARSEABLE = "<unparseable>"
+
+_INDEX_RE = re.compile(r"\[\d+\]")
+
+
+def build_event_routes(registry: ContractRegistry) -> dict[tuple[str, str], str]:
+    """Map (event_type, event_version) consts to schemas/events/ paths"""
+    routes: dict[tuple[str, str], str] = {}
+    for rel in registry.paths:
+        if not rel.startswith("schemas/events/"):
+            continue
+        properties = registry.schema(rel).get("properties", {})
+        event_type = properties.get("event_type", {}).get("const")
+        event_version = properties.get("event_version", {}).get("const")
+        if isinstance(event_type, str) and isinstance(event_version, str):
+            routes[(event_type, event_version)] = rel
+    return routes
+
+
+def iter_records(
+    inputs: Iterable[str], exclude: Path | None = None
+) -> Iterator[tuple[str, bytes]]:
+    """Yield (source, raw record bytes) from files, directories or '-' (stdin)
+
+    Files under `exclude` (the output directory) are skipped so a run never reads its own splits.
+    """
+    excluded = exclude.resolve() if exclude is not None else None
+    for name in inputs:
+        if name == "-":
+            yield from _iter_lines("<stdin>", sys.stdin.buffer)
+            continue
+
+        path = Path(name)
+        if path.is_dir():
+            files = sorted(
+                p for p in path.rglob("*")
+                if p.is_file() and p.suffix in NDJSON_SUFFIXES | JSON_SUFFIXES
+                and not (excluded and p.resolve().is_relative_to(excluded))
+            )
+        else:
+            files = [path]
+
+        for file_path in files:
+            if file_path.suffix in JSON_SUFFIXES:
+                # A .json file holds a single document (small by nature); read it whole
+                yield str(file_path), file_path.read_bytes()
+            else:
+                with open(file_path, "rb") as f:
+                    yield from _iter_lines(str(file_path), f)
+
+
+def _iter_lines(source: str, stream: IO[bytes]) -> Iterator[tuple[str, bytes]]:
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if line:
+            yield f"{source}:{line_no}", line
+
+
+def _error_key(error: Any) -> str:
+    """Histogram bucket: failing keyword plus JSON path with array indices collapsed"""
+    return f"{error.validator} at {_INDEX_RE.sub('[*]', error.json_path)}"
+
+
+class DataValidator:
+    """Routes records to schemas and validates them (fast predicate first, details on failure)"""
+
+    def __init__(self, registry: ContractRegistry | None = None, schema: str | None = None,
+                 fast: bool = True):
+        self.registry = registry or get_registry()
+        self.schema = self.registry.resolve(schema) if schema else None
+        self.routes = build_event_routes(self.registry)
+        self.fast = fast
+        self._predicates: dict[str, Callable[[Any], bool] | None] = {}
+
+    def route(self, record: Any) -> str | None:
+        """Return the schema path for a record, or None when it cannot be routed"""
+        if self.schema is not None:
+            return self.schema
+        if isinstance(record, dict):
+            event_type, event_version = record.get("event_type"), record.get("event_version")
+            if isinstance(event_type, str) and isinstance(event_version, str):
+                return self.routes.get((event_type, event_version))
+        return None
+
+    def _predicate(self, rel: str) -> Callable[[Any], bool] | None:
+        if rel not in self._predicates:
+            try:
+                self._predicates[rel] = compile_validator(rel, self.registry) if self.fast else None
+            except UnsupportedSchemaError:
+                self._predicates[rel] = None
+        return self._predicates[rel]
+
+    def check(self, raw: bytes) -> tuple[str, list[tuple[str, str]]]:
+        """Validate one raw record; returns (schema, [(histogram key, message), ...])"""
+        try:
+            record = _loads(raw)
+        except ValueError as e:
+            return UNPARSEABLE, [("json", f"JSON parse error: {e}")]
+        return self.check_document(record)
+
+    def check_document(self, record: Any) -> tuple[str, list[tuple[str, str]]]:
+        """Validate one parsed record; same result shape as `check`"""
+        rel = self.route(record)
+        if rel is None:
+            return UNROUTABLE, [("route", "No schema matches event_type/event_version")]
+
+        predicate = self._predicate(rel)
+        if predicate is not None and predicate(record):
+            return rel, []
+
+        errors = []
+        for error in self.registry.iter_errors(rel, record):
+            errors.append((_error_key(error), f"{error.json_path}: {error.message}"))
+            if len(errors) >= MAX_ERRORS_PER_RECORD:
+                break
+        return rel, errors
+
+
+class ValidationReport:
+    """Running counts and error histogram for a validation run"""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.total = 0
+        self.valid = 0
+        self.schemas: dict[str, dict[str, Any]] = {}
+
+    def add(self, schema: str, errors: list[tuple[str, str]]) -> None:
+        self.total += 1
+        stats = self.schemas.get(schema)
+        if stats is None:
+            stats = self.schemas[schema] = {"valid": 0, "invalid": 0, "errors": {}}
+        if not errors:
+            self.valid += 1
+            stats["valid"] += 1
+            return
+        stats["invalid"] += 1
+        histogram = stats["errors"]
+        for key, _ in errors:
+            histogram[key] = histogram.get(key, 0) + 1
+
+    def finish(self) -> None:
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def invalid(self) -> int:
+        return self.total - self.valid
+
+    @property
+    def records_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "valid": self.valid,
+            "invalid": self.invalid,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "records_per_second": round(self.records_per_second, 1),
+            "schemas": {
+                schema: {
+                    **stats,
+                    "errors": dict(sorted(stats["errors"].items(), key=lambda kv: -kv[1])),
+                }
+                for schema, stats in sorted(self.schemas.items())
+            },
+        }
+
+
+class SplitWriter:
+    """Writes valid/invalid NDJSON splits and per-record error details"""
+
+    def __init__(self, out_dir: Path):
+        out_dir.mkdir(parents=True, exist_ok=True)
+        self.out_dir = out_dir
+        self.valid = open(out_dir / "valid.ndjson", "wb")
+        self.invalid = open(out_dir / "invalid.ndjson", "wb")
+        self.errors = open(out_dir / "errors.ndjson", "w", encoding="utf-8")
+
+    def write(self, source: str, raw: bytes, schema: str, errors: list[tuple[str, str]]) -> None:
+        if b"\n" in raw:
+            if schema == UNPARSEABLE:
+                # Kept as-is for inspection, with line breaks escaped to stay on one line
+                raw = raw.replace(b"\r", b"\\r").replace(b"\n", b"\\n")
+            else:
+                # Pretty-printed .json documents are re-encoded to fit on one NDJSON line
+                raw = json.dumps(json.loads(raw), ensure_ascii=False,
+                                 separators=(",", ":")).encode()
+        if not errors:
+            self.valid.write(raw + b"\n")
+            return
+        self.invalid.write(raw + b"\n")
+        detail = {"source": source, "schema": schema, "errors": [msg for _, msg in errors]}
+        self.errors.write(json.dumps(detail, ensure_ascii=False) + "\n")
+
+    def close(self, report: ValidationReport) -> None:
+        for f in (self.valid, self.invalid, self.errors):
+            f.close()
+        with open(self.out_dir / "report.json", "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+# ----------------------------------------------------------------------
+# Process-pool engine
+# ----------------------------------------------------------------------
+
+# Per-process validator, built once by the pool initializer and reused for every chunk
+_worker_validator: DataValidator | None = None
+
+
+def _init_worker(base_dir: str, schema: str | None, fast: bool) -> None:
+    global _worker_validator
+    registry = get_registry()
+    if registry.base_dir != Path(base_dir):
+        registry = ContractRegistry(Path(base_dir))
+    _worker_validator = DataValidator(registry, schema=schema, fast=fast)
+
+
+def _check_raw_chunk(raws: list[bytes]) -> list[tuple[str, list[tuple[str, str]]]]:
+    assert _worker_validator is not None
+    return [_worker_validator.check(raw) for raw in raws]
+
+
+def _check_document_chunk(documents: list[Any]) -> list[tuple[str, list[tuple[str, str]]]]:
+    assert _worker_validator is not None
+    return [_worker_validator.check_document(document) for document in documents]
+
+
+def resolve_workers(workers: int) -> int:
+    """`--workers 0` (or negative) means one worker per CPU"""
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be >= 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _map_ordered(
+    pool: ProcessPoolExecutor,
+    func: Callable[[list[Any]], list[Any]],
+    chunks: Iterable[list[Any]],
+    max_in_flight: int,
+    payload: Callable[[list[Any]], list[Any]] | None = None,
+) -> Iterator[tuple[list[Any], list[Any]]]:
+    """Like pool.map, but with a bounded submission window so huge inputs stay in constant memory
+
+    Yields (chunk, results) in submission order, which preserves input ordering. `payload`
+    selects what is actually pickled to the worker for each chunk.
+    """
+    pending: deque[tuple[list[Any], Future[list[Any]]]] = deque()
+    for chunk in chunks:
+        pending.append((chunk, pool.submit(func, payload(chunk) if payload else chunk)))
+        if len(pending) >= max_in_flight:
+            done_chunk, future = pending.popleft()
+            yield done_chunk, future.result()
+    while pending:
+        done_chunk, future = pending.popleft()
+        yield done_chunk, future.result()
+
+
+def _pool(validator: DataValidator, workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(str(validator.registry.base_dir), validator.schema, validator.fast),
+    )
+
+
+def check_records(
+    records: Iterable[tuple[str, bytes]],
+    validator: DataValidator,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, bytes, str, list[tuple[str, str]]]]:
+    """Yield (source, raw, schema, errors) per record in input order, serially or across a pool"""
+    _check_chunk_size(chunk_size)
+    if workers <= 1:
+        for source, raw in records:
+            yield (source, raw, *validator.check(raw))
+        return
+
+    with _pool(validator, workers) as pool:
+        # Only raw bytes cross the process boundary; sources stay in this process
+        ordered = _map_ordered(
+            pool, _check_raw_chunk, _chunks(records, chunk_size), workers * 2,
+            payload=lambda chunk: [raw for _, raw in chunk],
+        )
+        for chunk, results in ordered:
+            for (source, raw), (schema, errors) in zip(chunk, results):
+                yield source, raw, schema, errors
+
+
+def validate_batch(
+    documents: Iterable[Any],
+    schema: str | None = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    registry: ContractRegistry | None = None,
+) -> list[tuple[str, list[str]]]:
+    """Validate parsed documents; returns (schema, error messages) per document in input order
+
+    With workers > 1 the documents are sharded across a process pool whose workers
+    each build their validator cache once at startup.
+    """
+    _check_chunk_size(chunk_size)
+    validator = DataValidator(registry, schema=schema)
+    if workers <= 1:
+        results = [validator.check_document(document) for document in documents]
+    else:
+        with _pool(validator, workers) as pool:
+            results = [
+                result
+                for _, chunk_results in _map_ordered(
+                    pool, _check_document_chunk, _chunks(documents, chunk_size), workers * 2
+                )
+                for result in chunk_results
+            ]
+    return [(rel, [message for _, message in errors]) for rel, errors in results]
+
+
+def validate_stream(
+    records: Iterable[tuple[str, bytes]],
+    validator: DataValidator,
+    writer: SplitWriter | None = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ValidationReport:
+    """Validate a record stream, feeding results to the report (and writer) in input order"""
+    report = ValidationReport()
+    for source, raw, schema, errors in check_records(records, validator, workers, chunk_size):
+        report.add(schema, errors)
+        if writer is not None:
+            writer.write(source, raw, schema, errors)
+    report.finish()
+    if writer is not None:
+        writer.close(report)
+    return report
+
+
+def print_report(report: ValidationReport, top: int = 10) -> None:
+    print(f"\n{'='*60}")
+    print(f"Records: {report.total}  valid: {report.valid}  invalid: {report.invalid}")
+    for schema, stats in report.to_dict()["schemas"].items():
+        print(f"\n{schema}: {stats['valid']} valid, {stats['invalid']} invalid")
+        for key, count in list(stats["errors"].items())[:top]:
+            print(f"  {count:>8}  {key}")
+    print(f"\n⏱  {report.elapsed:.2f}s, {report.records_per_second:,.0f} records/second")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate NDJSON/JSON payloads against contracts")
+    parser.add_argument("inputs", nargs="+", help="NDJSON/JSON files, directories, or '-' for stdin")
+    parser.add_argument("--schema", help="Validate every record against this schema ($id or path)")
+    parser.add_argument("--out-dir", type=Path, help="Write valid/invalid splits and report.json here")
+    parser.add_argument("--no-fast", action="store_true",
+                        help="Skip generated predicates; always run the full validator")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Validation processes (0 = one per CPU; default: 1, in-process)")
+    parser.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Records per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    print("🔍 TarlaAnaliz Contract Data Validator\n")
+
+    validator = DataValidator(schema=args.schema, fast=not args.no_fast)
+    writer = SplitWriter(args.out_dir) if args.out_dir else None
+    workers = resolve_workers(args.workers)
+    report = validate_stream(
+        iter_records(args.inputs, args.out_dir), validator, writer, workers, args.chunk_size
+    )
+    print_report(report)
+
+    if report.invalid:
+        print("\n❌ VALIDATION FAILED")
+        return 1
+    print("\n✅ ALL RECORDS VALID")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
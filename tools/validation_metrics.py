@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Validation Metrics
+
+Counters and latency histograms for contract validation, labeled by:
+
+- `schema`: the contract `$id` (plus `#/$defs/Name` for fragments), or the
+  repo-relative path of documents without one
+- `version`: the contracts pack version pinned in CONTRACTS_VERSION.md
+- `outcome`: `valid`, `invalid`, or `error` (the validator raised)
+
+`ValidationMetrics` wraps the registry calls (`is_valid`, `validate`,
+`first_error`) and offers `track(key)` for any other validator, e.g. a
+generated fast predicate. Everything is exported as Prometheus text
+(`render()`, served on `/metrics` by `start_http_server`) and as a plain dict
+(`snapshot()`, served on `/metrics.json`).
+
+Histogram updates are lock-light: every thread writes to its own shard of
+each series, so `observe()` takes no lock once a thread has seen a series.
+Exports add the shards up; shards of finished threads are folded into one
+retired shard so thread-per-request servers do not grow the shard list.
+
+Usage:
+    from validation_metrics import get_metrics, start_http_server
+
+    metrics = get_metrics()
+    metrics.is_valid("worker/analysis_result.v1.schema.json", payload)
+    with metrics.track("platform/payment_intent.v2.schema.json") as outcome:
+        outcome.valid = fast_check(payload)
+    server = start_http_server(metrics, port=9464)     # GET /metrics, /metrics.json
+
+    python3 tools/validation_metrics.py core/field.v1.schema.json field.json
+    python3 tools/validation_metrics.py core/field.v1.schema.json field.json --serve 9464
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, contracts_lock, get_registry  # noqa: E402
+from jsonschema import ValidationError  # noqa: E402
+
+# Upper bounds (seconds) of the latency histogram buckets; `+Inf` is implied
+LATENCY_BUCKETS = (
+    0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5,
+)
+
+OUTCOMES = ("valid", "invalid", "error")
+
+COUNTER_NAME = "tarlaanaliz_contract_validations_total"
+HISTOGRAM_NAME = "tarlaanaliz_contract_validation_duration_seconds"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Bucketed durations, sharded per thread so updates need no lock"""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self._width = len(self.bounds) + 3          # buckets, +Inf, sum, count
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, list[float]]] = []
+        self._retired = [0.0] * self._width
+        self._lock = threading.Lock()
+
+    def _shard(self) -> list[float]:
+        shard = [0.0] * self._width
+        with self._lock:
+            self._retire()
+            self._shards.append((threading.current_thread(), shard))
+        self._local.shard = shard
+        return shard
+
+    def _retire(self) -> None:
+        """Fold shards of finished threads into the retired totals (caller holds the lock)"""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+            else:
+                for i, value in enumerate(shard):
+                    self._retired[i] += value
+        self._shards = alive
+
+    def observe(self, seconds: float) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard[bisect_left(self.bounds, seconds)] += 1
+        shard[-2] += seconds
+        shard[-1] += 1
+
+    def totals(self) -> list[float]:
+        """Per-bucket counts (non-cumulative, `+Inf` last), then sum and count"""
+        with self._lock:
+            self._retire()
+            totals = list(self._retired)
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            for i, value in enumerate(shard):
+                totals[i] += value
+        return totals
+
+    def snapshot(self) -> dict[str, Any]:
+        totals = self.totals()
+        buckets: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip((*map(repr, self.bounds), "+Inf"), totals):
+            cumulative += int(count)
+            buckets[bound] = cumulative
+        return {"count": int(totals[-1]), "sum_seconds": totals[-2], "buckets": buckets}
+
+
+class Outcome:
+    """Result holder for `ValidationMetrics.track`; set `valid` inside the block"""
+
+    __slots__ = ("valid",)
+
+    def __init__(self) -> None:
+        self.valid: bool | None = None
+
+
+def _label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class ValidationMetrics:
+    """Validation counters and latency histograms per (schema, version, outcome)"""
+
+    def __init__(self, registry: ContractRegistry | None = None, version: str | None = None,
+                 bounds: Sequence[float] = LATENCY_BUCKETS):
+        self._registry = registry
+        self._version = version
+        self.bounds = tuple(bounds)
+        self._series: dict[tuple[str, str, str], Histogram] = {}
+        self._schemas: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def registry(self) -> ContractRegistry:
+        if self._registry is None:
+            self._registry = get_registry()
+        return self._registry
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            self._version = contracts_lock(self.registry.base_dir)["version"] or "unversioned"
+        return self._version
+
+    def schema_label(self, key: str) -> str:
+        """`$id` (or repo-relative path) of a schema key, keeping any `#fragment`"""
+        label = self._schemas.get(key)
+        if label is None:
+            base, sep, fragment = key.partition("#")
+            try:
+                rel = self.registry.resolve(base)
+                label = self.registry.schema(rel).get("$id") or rel
+            except KeyError:
+                label = base
+            label = f"{label}{sep}{fragment}"
+            self._schemas[key] = label
+        return label
+
+    def histogram(self, schema: str, outcome: str, version: str | None = None) -> Histogram:
+        """The series for one label set, created on first use"""
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown outcome {outcome!r}; expected one of {', '.join(OUTCOMES)}")
+        key = (schema, version or self.version, outcome)
+        histogram = self._series.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._series.get(key)
+                if histogram is None:
+                    histogram = Histogram(self.bounds)
+                    self._series[key] = histogram
+        return histogram
+
+    def observe(self, key: str, outcome: str, seconds: float, version: str | None = None) -> None:
+        """Record one validation of schema key `key`"""
+        self.histogram(self.schema_label(key), outcome, version).observe(seconds)
+
+    @contextmanager
+    def track(self, key: str, version: str | None = None) -> Iterator[Outcome]:
+        """Time a block that validates against `key`; an exception counts as `error`"""
+        outcome = Outcome()
+        started = time.perf_counter()
+        try:
+            yield outcome
+        except Exception:
+            self.observe(key, "error", time.perf_counter() - started, version)
+            raise
+        result = "invalid" if outcome.valid is False else "valid"
+        self.observe(key, result, time.perf_counter() - started, version)
+
+    def is_valid(self, key: str, instance: Any) -> bool:
+        with self.track(key) as outcome:
+            outcome.valid = self.registry.is_valid(key, instance)
+        return bool(outcome.valid)
+
+    def first_error(self, key: str, instance: Any) -> str | None:
+        """`json_path: message` of the first error, None when valid"""
+        with self.track(key) as outcome:
+            error = next(self.registry.iter_errors(key, instance), None)
+            outcome.valid = error is None
+        return None if error is None else f"{error.json_path}: {error.message}"
+
+    def validate(self, key: str, instance: Any) -> None:
+        """Raise `ValidationError` (best match) when invalid; recorded as `invalid`"""
+        started = time.perf_counter()
+        try:
+            self.registry.validate(key, instance)
+        except ValidationError:
+            self.observe(key, "invalid", time.perf_counter() - started)
+            raise
+        except Exception:
+            self.observe(key, "error", time.perf_counter() - started)
+            raise
+        self.observe(key, "valid", time.perf_counter() - started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series = {}
+
+    def snapshot(self) -> dict[str, Any]:
+        """Every series as a plain dict, sorted by labels"""
+        with self._lock:
+            series = sorted(self._series.items())
+        return {
+            "series": [
+                {"schema": schema, "version": version, "outcome": outcome,
+                 **histogram.snapshot()}
+                for (schema, version, outcome), histogram in series
+            ],
+        }
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        counters = [
+            f"# HELP {COUNTER_NAME} Contract validations by schema, contract version and outcome",
+            f"# TYPE {COUNTER_NAME} counter",
+        ]
+        histograms = [
+            f"# HELP {HISTOGRAM_NAME} Time spent validating contract payloads",
+            f"# TYPE {HISTOGRAM_NAME} histogram",
+        ]
+        for series in self.snapshot()["series"]:
+            labels = ",".join(
+                f'{name}="{_label_value(series[name])}"'
+                for name in ("schema", "version", "outcome")
+            )
+            counters.append(f"{COUNTER_NAME}{{{labels}}} {series['count']}")
+            for bound, count in series["buckets"].items():
+                histograms.append(f'{HISTOGRAM_NAME}_bucket{{{labels},le="{bound}"}} {count}')
+            histograms.append(f"{HISTOGRAM_NAME}_sum{{{labels}}} {series['sum_seconds']!r}")
+            histograms.append(f"{HISTOGRAM_NAME}_count{{{labels}}} {series['count']}")
+        return "\n".join(counters + histograms) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    metrics: ValidationMetrics
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body, content_type = self.metrics.render().encode(), PROMETHEUS_CONTENT_TYPE
+        elif path == "/metrics.json":
+            body, content_type = json.dumps(self.metrics.snapshot()).encode(), "application/json"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def start_http_server(metrics: ValidationMetrics | None = None, port: int = 9464,
+                      host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve `/metrics` and `/metrics.json` from a daemon thread; `.shutdown()` stops it"""
+    handler = type("MetricsHandler", (_MetricsHandler,), {"metrics": metrics or get_metrics()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="validation-metrics", daemon=True).start()
+    return server
+
+
+_metrics: ValidationMetrics | None = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> ValidationMetrics:
+    """Return the process-wide metrics, backed by the shared registry"""
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = ValidationMetrics()
+    return _metrics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate documents and export the metrics")
+    parser.add_argument("schema", help="Schema path or $id (optionally #/$defs/Name)")
+    parser.add_argument("documents", nargs="+", type=Path, help="JSON documents to validate")
+    parser.add_argument("--json", action="store_true", help="Print the dict snapshot instead")
+    parser.add_argument("--serve", type=int, metavar="PORT",
+                        help="Keep serving /metrics on this port until interrupted")
+    args = parser.parse_args()
+
+    metrics = get_metrics()
+    for path in args.documents:
+        error = metrics.first_error(args.schema, json.loads(path.read_text(encoding="utf-8")))
+        print(f"❌ {path}: {error}" if error else f"✅ {path}", file=sys.stderr)
+
+    print(json.dumps(metrics.snapshot(), indent=2) if args.json else metrics.render(), end="")
+    if args.serve:
+        server = start_http_server(metrics, args.serve)
+        print(f"\n🔍 Serving http://127.0.0.1:{args.serve}/metrics (Ctrl-C to stop)",
+              file=sys.stderr)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Validation Profiler
+
+Opt-in, per-keyword instrumentation of the contract validators. When
+validating an analysis_result gets slow, it shows whether `pattern`,
+`format`, `$ref` resolution or `unevaluatedProperties` tracking is to blame.
+
+`ValidationProfiler.validator(key)` returns an instrumented copy of the
+registry validator: a `ContractValidator` subclass whose keyword functions
+are wrapped to record, per schema location (`file#/json/pointer/keyword`):
+
+- calls
+- self time (excluding the keywords it descends into)
+- total time (including them; recursion is counted once, as in cProfile)
+
+Stacks of nested keyword frames are kept as well, for flamegraph tools.
+The shared validators from `contract_registry` are never touched, so with
+profiling off the hot path runs exactly the code it always runs.
+
+Reports aggregate by keyword (`pattern`, `$ref`, ...), by schema location
+(e.g. `worker/analysis_result.v1.schema.json#/$defs/Detection/properties/bbox`)
+or by keyword at location. `write_collapsed()` writes the collapsed-stack
+format read by flamegraph.pl, inferno and speedscope, weighted by self time
+in microseconds.
+
+Usage:
+    from validation_profiler import ValidationProfiler
+
+    profiler = ValidationProfiler()
+    validator = profiler.validator("worker/analysis_result.v1.schema.json")
+    validator.is_valid(payload)
+    print(profiler.report(by="keyword"))
+    profiler.write_collapsed("build/analysis_result.folded")
+
+    python3 tools/validation_profiler.py worker/analysis_result.v1.schema.json payload.json
+    python3 tools/validation_profiler.py worker/analysis_result.v1.schema.json \\
+        --fixtures 50 --size layers=100 --by location --collapsed build/result.folded
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, ContractValidator, get_registry  # noqa: E402
+from jsonschema import validators  # noqa: E402
+
+# Report groupings
+GROUPINGS = ("keyword", "location", "frame")
+
+# Label of schemas that are not part of a contract document (e.g. fragment wrappers)
+ANONYMOUS = "<schema>"
+
+
+class KeywordStats(NamedTuple):
+    """Aggregated timings of one report row"""
+
+    name: str
+    calls: int
+    self_ns: int
+    total_ns: int
+
+
+def _escape(token: str) -> str:
+    """RFC 6901 escaping of one pointer token"""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _index_schemas(node: Any, rel: str, pointer: str, index: dict[int, tuple[Any, str]]) -> None:
+    """id(subschema) -> (subschema, `rel#pointer`) for every object in a document"""
+    if isinstance(node, dict):
+        index.setdefault(id(node), (node, f"{rel}#{pointer}"))
+        for key, value in node.items():
+            _index_schemas(value, rel, f"{pointer}/{_escape(key)}", index)
+    elif isinstance(node, list):
+        for i, item in enumerate(node):
+            _index_schemas(item, rel, f"{pointer}/{i}", index)
+
+
+class ValidationProfiler:
+    """Builds instrumented validators and accumulates their keyword timings"""
+
+    def __init__(self, registry: ContractRegistry | None = None,
+                 clock: Callable[[], int] = time.perf_counter_ns):
+        self.registry = registry if registry is not None else get_registry()
+        self.clock = clock
+        self._locations: dict[int, tuple[Any, str]] = {}
+        for rel in self.registry.paths:
+            _index_schemas(self.registry.schema(rel), rel.split("/", 1)[1], "", self._locations)
+        self._labels: dict[tuple[int, str], str] = {}
+        self._validator_class = validators.extend(ContractValidator, {
+            keyword: self._instrument(keyword, function)
+            for keyword, function in ContractValidator.VALIDATORS.items()
+        })
+        self._validators: dict[str, Any] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop the recorded timings (instrumented validators stay usable)"""
+        self._stack: list[list[Any]] = []        # [label, segment start, child time]
+        self._active: dict[str, int] = {}        # label -> frames of it on the stack
+        self._calls: dict[str, int] = {}
+        self._self: dict[str, int] = {}
+        self._total: dict[str, int] = {}
+        self._stacks: dict[tuple[str, ...], int] = {}
+
+    # -- instrumentation ----------------------------------------------------
+
+    def _label(self, schema: Any, keyword: str) -> str:
+        key = (id(schema), keyword)
+        label = self._labels.get(key)
+        if label is None:
+            entry = self._locations.get(id(schema))
+            location = entry[1] if entry is not None and entry[0] is schema else f"{ANONYMOUS}#"
+            label = f"{location}/{_escape(keyword)}"
+            self._labels[key] = label
+        return label
+
+    def _enter(self, label: str) -> None:
+        self._stack.append([label, self.clock(), 0])
+        self._active[label] = self._active.get(label, 0) + 1
+
+    def _exit(self) -> None:
+        label, started, children = self._stack.pop()
+        elapsed = self.clock() - started
+        self._self[label] = self._self.get(label, 0) + elapsed - children
+        self._active[label] -= 1
+        if not self._active[label]:
+            # Outermost frame of this label: recursion is counted once
+            self._total[label] = self._total.get(label, 0) + elapsed
+        path = tuple(frame[0] for frame in self._stack) + (label,)
+        self._stacks[path] = self._stacks.get(path, 0) + elapsed - children
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def _instrument(self, keyword: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a keyword function; time spent by the consumer of its errors is excluded"""
+        profiler = self
+
+        def timed(validator: Any, value: Any, instance: Any, schema: Any) -> Iterator[Any]:
+            label = profiler._label(schema, keyword)
+            profiler._calls[label] = profiler._calls.get(label, 0) + 1
+            profiler._enter(label)
+            running = True
+            try:
+                for error in function(validator, value, instance, schema) or ():
+                    profiler._exit()
+                    running = False
+                    yield error
+                    profiler._enter(label)
+                    running = True
+            finally:
+                if running:
+                    profiler._exit()
+
+        return timed
+
+    def validator(self, key: str) -> Any:
+        """Instrumented validator for a schema (path, `$id` or `path#/$defs/Name`)"""
+        validator = self._validators.get(key)
+        if validator is None:
+            shared = self.registry.validator(key)
+            validator = self._validator_class(
+                shared.schema, registry=self.registry.ref_registry,
+                format_checker=self.registry.format_checker,
+            )
+            self._validators[key] = validator
+        return validator
+
+    # -- reporting ----------------------------------------------------------
+
+    def stats(self, by: str = "frame") -> list[KeywordStats]:
+        """Rows grouped by keyword, location or frame (keyword at location), by self time"""
+        if by not in GROUPINGS:
+            raise ValueError(f"Unknown grouping {by!r}; expected one of {', '.join(GROUPINGS)}")
+        rows: dict[str, list[int]] = {}
+        for label, calls in self._calls.items():
+            location, _, keyword = label.rpartition("/")
+            name = {"keyword": keyword.replace("~1", "/").replace("~0", "~"),
+                    "location": location, "frame": label}[by]
+            row = rows.setdefault(name, [0, 0, 0])
+            row[0] += calls
+            row[1] += self._self.get(label, 0)
+            # Totals of different labels may nest, so grouped totals can exceed wall time
+            row[2] += self._total.get(label, 0)
+        return sorted(
+            (KeywordStats(name, *row) for name, row in rows.items()),
+            key=lambda row: (-row.self_ns, row.name),
+        )
+
+    def snapshot(self, by: str = "frame") -> list[dict[str, Any]]:
+        """`stats()` as plain dicts with microsecond timings"""
+        return [
+            {"name": row.name, "calls": row.calls,
+             "self_us": round(row.self_ns / 1000, 1), "total_us": round(row.total_ns / 1000, 1)}
+            for row in self.stats(by)
+        ]
+
+    def report(self, by: str = "frame", top: int = 25) -> str:
+        """Text table of the `top` rows by self time"""
+        rows = self.stats(by)
+        overall = sum(row.self_ns for row in rows) or 1
+        width = max([len(by)] + [len(row.name) for row in rows[:top]])
+        lines = [f"{by:<{width}}  {'calls':>9}  {'self ms':>9}  {'self %':>6}  {'total ms':>9}"]
+        for row in rows[:top]:
+            lines.append(
+                f"{row.name:<{width}}  {row.calls:>9,}  {row.self_ns / 1e6:>9.2f}  "
+                f"{row.self_ns / overall:>6.1%}  {row.total_ns / 1e6:>9.2f}"
+            )
+        if len(rows) > top:
+            lines.append(f"... {len(rows) - top} more")
+        return "\n".join(lines)
+
+    def collapsed(self) -> Iterator[str]:
+        """Collapsed-stack lines (`frame;frame;frame self_us`), heaviest first"""
+        for path, self_ns in sorted(self._stacks.items(), key=lambda item: -item[1]):
+            weight = self_ns // 1000
+            if weight > 0:
+                yield f"{';'.join(frame.replace(';', ',') for frame in path)} {weight}"
+
+    def write_collapsed(self, path: Path | str) -> int:
+        """Write `collapsed()` to a file; returns the number of stacks written"""
+        lines = list(self.collapsed())
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+        return len(lines)
+
+
+def _size(text: str) -> tuple[str, int]:
+    name, sep, value = text.partition("=")
+    if not sep or not value.isdigit():
+        raise argparse.ArgumentTypeError(f"Expected NAME=COUNT, got {text!r}")
+    return name, int(value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile contract validation per keyword")
+    parser.add_argument("schema", help="Schema path or $id (optionally #/$defs/Name)")
+    parser.add_argument("documents", nargs="*", type=Path, help="JSON documents to validate")
+    parser.add_argument("--fixtures", type=int, default=0,
+                        help="Also validate this many generated documents")
+    parser.add_argument("--size", type=_size, action="append", default=[], metavar="NAME=COUNT",
+                        help="Array length for generated documents, e.g. layers=100")
+    parser.add_argument("--repeat", type=int, default=1, help="Validate each document N times")
+    parser.add_argument("--by", choices=GROUPINGS, default="keyword", help="Report grouping")
+    parser.add_argument("--top", type=int, default=25, help="Rows in the report")
+    parser.add_argument("--collapsed", type=Path, help="Write a collapsed-stack flamegraph file")
+    args = parser.parse_args()
+
+    documents = [json.loads(path.read_text(encoding="utf-8")) for path in args.documents]
+    if args.fixtures:
+        from generate_fixtures import FixtureGenerator
+
+        generator = FixtureGenerator(sizes=dict(args.size), optional=1.0)
+        documents += list(generator.iter_fixtures(args.schema, args.fixtures))
+    if not documents:
+        parser.error("Nothing to validate: pass documents or --fixtures N")
+
+    profiler = ValidationProfiler()
+    validator = profiler.validator(args.schema)
+    invalid = 0
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for document in documents:
+            invalid += not validator.is_valid(document)
+    elapsed = time.perf_counter() - started
+
+    print(f"⏱  {len(documents) * args.repeat} validation(s) of {args.schema} "
+          f"in {elapsed * 1000:.1f} ms (instrumented), {invalid} invalid\n")
+    print(profiler.report(args.by, args.top))
+    if args.collapsed:
+        count = profiler.write_collapsed(args.collapsed)
+        print(f"\n✅ {count} stack(s) written to {args.collapsed}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Validation Sidecar
+
+A local HTTP service that validates payloads against the contracts, so the
+kiosk (api/edge_local.v1.yaml on localhost:5000) and services written in
+other languages share one warm validator instead of each loading schemas.
+Stdlib only (asyncio + a process pool); it never touches the network beyond
+its own socket, so it runs fully offline.
+
+Endpoints:
+- `POST /validate/{schema}`: one JSON document; `{schema}` is a repo path
+  (`worker/analysis_result.v1.schema.json`) or URL-encoded `$id`. Answers
+  `{"schema", "valid", "errors"}`.
+- `POST /validate-batch[?schema=KEY]`: NDJSON in, NDJSON out with one
+  `{"line", "schema", "valid", "errors"}` per record, in input order. Without
+  `schema`, records are routed by (`event_type`, `event_version`) as in
+  validate_data.py. Request and response bodies are streamed.
+- `GET /status`: uptime, queue state, totals per schema, and throughput
+  (lifetime and over the last `RATE_WINDOW` seconds).
+
+Validation runs in a process pool whose workers compile every validator at
+startup and keep them (and the generated fast predicates) for their lifetime.
+Work is submitted in chunks of `chunk_size` records. At most `max_pending`
+chunks are queued or running at once:
+
+- a request that cannot get a slot within `queue_timeout` seconds gets a
+  503 with Retry-After
+- a batch that has started streaming waits for slots instead. It stops
+  reading its body meanwhile, which pushes back on the client through TCP.
+
+Connections are HTTP/1.1 keep-alive (chunked or Content-Length bodies,
+`Expect: 100-continue`), closed after `keep_alive_timeout` idle seconds.
+
+Usage:
+    python3 tools/validation_sidecar.py                        # 127.0.0.1:5001
+    python3 tools/validation_sidecar.py --port 5001 --workers 4 --max-pending 32
+
+    curl -s --data-binary @result.json \\
+        localhost:5001/validate/worker/analysis_result.v1.schema.json
+    curl -s --data-binary @events.ndjson localhost:5001/validate-batch
+    curl -s localhost:5001/status
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from contract_registry import ContractRegistry, get_registry  # noqa: E402
+from validate_data import (  # noqa: E402
+    UNPARSEABLE,
+    DataValidator,
+    ValidationReport,
+    resolve_workers,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5001
+
+# Records per pool task; smaller than validate_data's default to keep batch latency low
+DEFAULT_CHUNK_SIZE = 200
+
+# Seconds of history behind `recent_records_per_second`
+RATE_WINDOW = 10
+
+# Bytes read from a request body at a time
+_BLOCK = 64 * 1024
+
+_REASONS = {
+    100: "Continue", 200: "OK", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class SidecarError(ValueError):
+    """A request the sidecar answers with an error status"""
+
+    def __init__(self, status: int, message: str, headers: dict[str, str] | None = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class Request(NamedTuple):
+    """Parsed request line and headers (names lowercased)"""
+
+    method: str
+    path: str
+    query: dict[str, list[str]]
+    version: str
+    headers: dict[str, str]
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return "keep-alive" in connection
+        return "close" not in connection
+
+
+def parse_head(head: bytes) -> Request:
+    """Parse the request line and headers of one HTTP/1.x request"""
+    try:
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise SidecarError(400, "Malformed request line") from None
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        raise SidecarError(400, f"Unsupported protocol: {version}")
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            raise SidecarError(400, f"Malformed header: {line}")
+        headers[name.strip().lower()] = value.strip()
+    url = urlsplit(target)
+    return Request(method, url.path, parse_qs(url.query), version, headers)
+
+
+class _Body:
+    """Request body reader for Content-Length and chunked transfer encoding"""
+
+    def __init__(self, reader: asyncio.StreamReader, headers: dict[str, str]):
+        self.reader = reader
+        self.chunked = "chunked" in headers.get("transfer-encoding", "").lower()
+        try:
+            self.remaining = 0 if self.chunked else int(headers.get("content-length", "0"))
+        except ValueError:
+            raise SidecarError(400, "Invalid Content-Length") from None
+        if self.remaining < 0:
+            raise SidecarError(400, "Invalid Content-Length")
+        self.done = not self.chunked and not self.remaining
+
+    async def read_some(self) -> bytes:
+        """Next block of the body; b"" once it is exhausted"""
+        if self.done:
+            return b""
+        if self.chunked and not self.remaining:
+            size_line = await self.reader.readline()
+            try:
+                self.remaining = int(size_line.split(b";", 1)[0].strip(), 16)
+            except ValueError:
+                raise SidecarError(400, "Malformed chunked body") from None
+            if not self.remaining:
+                while (await self.reader.readline()).strip():
+                    pass                                    # trailers
+                self.done = True
+                return b""
+        data = await self.reader.read(min(self.remaining, _BLOCK))
+        if not data:
+            raise ConnectionResetError("Client closed the connection mid-body")
+        self.remaining -= len(data)
+        if not self.remaining:
+            if self.chunked:
+                await self.reader.readexactly(2)            # CRLF after the chunk
+            else:
+                self.done = True
+        return data
+
+    async def read_all(self, limit: int) -> bytes:
+        parts: list[bytes] = []
+        size = 0
+        while data := await self.read_some():
+            size += len(data)
+            if size > limit:
+                raise SidecarError(413, f"Body larger than {limit} bytes")
+            parts.append(data)
+        return b"".join(parts)
+
+    async def lines(self, limit: int) -> AsyncIterator[bytes]:
+        """Body split on newlines; a line longer than `limit` is rejected"""
+        buffer = bytearray()
+        while data := await self.read_some():
+            buffer += data
+            start = 0
+            while (end := buffer.find(b"\n", start)) >= 0:
+                yield bytes(buffer[start:end])
+                start = end + 1
+            del buffer[:start]
+            if len(buffer) > limit:
+                raise SidecarError(413, f"Record larger than {limit} bytes")
+        if buffer:
+            yield bytes(buffer)
+
+
+# ----------------------------------------------------------------------
+# Pool workers
+# ----------------------------------------------------------------------
+
+# Per-process registry and validators, built by the pool initializer and kept warm
+_worker_registry: ContractRegistry | None = None
+_worker_validators: dict[str | None, DataValidator] = {}
+
+
+def _init_worker(base_dir: str) -> None:
+    global _worker_registry
+    registry = get_registry()
+    if registry.base_dir != Path(base_dir):
+        registry = ContractRegistry(Path(base_dir))
+    registry.compile_all()
+    _worker_registry = registry
+    _worker_validators[None] = DataValidator(registry)
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _check_chunk(schema: str | None, raws: list[bytes]) -> list[tuple[str, list[tuple[str, str]]]]:
+    """(schema, [(histogram key, message), ...]) per raw record"""
+    validator = _worker_validators.get(schema)
+    if validator is None:
+        validator = _worker_validators[schema] = DataValidator(_worker_registry, schema=schema)
+    return [validator.check(raw) for raw in raws]
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+class ValidationSidecar:
+    """HTTP front end over a warm validation process pool"""
+
+    def __init__(
+        self,
+        registry: ContractRegistry | None = None,
+        workers: int = 0,
+        max_pending: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        queue_timeout: float = 1.0,
+        keep_alive_timeout: float = 15.0,
+        max_body: int = 64 * 1024 * 1024,
+        max_record: int = 16 * 1024 * 1024,
+    ):
+        self.registry = registry or get_registry()
+        self.workers = resolve_workers(workers)
+        self.max_pending = max_pending or self.workers * 4
+        self.chunk_size = chunk_size
+        self.queue_timeout = queue_timeout
+        self.keep_alive_timeout = keep_alive_timeout
+        self.max_body = max_body
+        self.max_record = max_record
+        self.report = ValidationReport()
+        self.requests = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self._recent: deque[list[int]] = deque()            # [second, records]
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._server: asyncio.Server | None = None
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker,
+            initargs=(str(self.registry.base_dir),),
+        )
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.Server:
+        """Start the pool, wait until every worker is warm, then listen"""
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._pool = self._new_pool()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._pool, _worker_ready) for _ in range(self.workers)
+        ))
+        self.report = ValidationReport()
+        self._server = await asyncio.start_server(
+            self._handle, host, port, limit=self.max_record + _BLOCK,
+        )
+        return self._server
+
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace a pool whose worker died (e.g. killed by the OOM killer)
+
+        Every chunk in flight fails when a worker dies; only the first failure
+        replaces `broken`, later ones must not shut down the fresh pool.
+        """
+        if self._pool is not broken:
+            return
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._pool = self._new_pool()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def port(self) -> int:
+        assert self._server is not None
+        return self._server.sockets[0].getsockname()[1]
+
+    # -- pool access --------------------------------------------------------
+
+    def _release(self, pool: ProcessPoolExecutor, future: asyncio.Future[Any] | None) -> None:
+        """Free the chunk's slot; replace the pool if the chunk found it broken"""
+        assert self._slots is not None
+        self.in_flight -= 1
+        self._slots.release()
+        # Checked here rather than by the caller, which may be mid-stream and only
+        # able to drop the connection
+        if (future is not None and not future.cancelled()
+                and isinstance(future.exception(), BrokenProcessPool)):
+            self._restart_pool(pool)
+
+    async def _submit(self, schema: str | None, raws: list[bytes],
+                      timeout: float | None) -> asyncio.Future[Any]:
+        """Queue one chunk; waits for a slot (503 after `timeout`, forever when None)"""
+        assert self._slots is not None
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise SidecarError(503, "Validation queue is full", {"Retry-After": "1"}) from None
+        self.in_flight += 1
+        pool = self._pool
+        assert pool is not None
+        try:
+            future = asyncio.get_running_loop().run_in_executor(pool, _check_chunk, schema, raws)
+        except BrokenProcessPool:
+            self._release(pool, None)
+            self._restart_pool(pool)
+            raise SidecarError(503, "Validation workers restarted", {"Retry-After": "1"}) from None
+        future.add_done_callback(partial(self._release, pool))
+        return future
+
+    def _record(self, results: list[tuple[str, list[tuple[str, str]]]]) -> None:
+        for schema, errors in results:
+            self.report.add(schema, errors)
+        now = int(time.monotonic())
+        if self._recent and self._recent[-1][0] == now:
+            self._recent[-1][1] += len(results)
+        else:
+            self._recent.append([now, len(results)])
+        while self._recent[0][0] <= now - RATE_WINDOW:
+            self._recent.popleft()
+
+    def _resolve(self, key: str) -> str:
+        try:
+            return self.registry.resolve(key)
+        except KeyError as e:
+            raise SidecarError(404, str(e.args[0])) from None
+
+    # -- endpoints ----------------------------------------------------------
+
+    def status(self) -> dict[str, Any]:
+        """Queue state, totals and throughput"""
+        self.report.finish()
+        totals = self.report.to_dict()
+        horizon = int(time.monotonic()) - RATE_WINDOW
+        recent = sum(count for second, count in self._recent if second > horizon)
+        return {
+            "status": "ok",
+            "uptime_seconds": totals.pop("elapsed_seconds"),
+            "workers": self.workers,
+            "chunk_size": self.chunk_size,
+            "queue": {
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "rejected": self.rejected,
+            },
+            "requests": self.requests,
+            "records": totals.pop("total"),
+            "recent_records_per_second": round(recent / RATE_WINDOW, 1),
+            **totals,
+        }
+
+    async def _validate_one(self, key: str, body: _Body) -> dict[str, Any]:
+        schema = self._resolve(key)
+        raw = await body.read_all(self.max_body)
+        future = await self._submit(schema, [raw], self.queue_timeout)
+        results = await future
+        self._record(results)
+        rel, errors = results[0]
+        if rel == UNPARSEABLE:
+            raise SidecarError(400, errors[0][1])
+        return {"schema": rel, "valid": not errors, "errors": [message for _, message in errors]}
+
+    async def _validate_batch(self, request: Request, body: _Body,
+                              writer: asyncio.StreamWriter, keep_alive: bool) -> None:
+        keys = request.query.get("schema")
+        schema = self._resolve(keys[0]) if keys else None
+        pending: deque[tuple[list[int], asyncio.Future[Any]]] = deque()
+        started = False
+
+        async def flush() -> None:
+            lines, future = pending.popleft()
+            results = await future
+            self._record(results)
+            out = b"".join(
+                json.dumps({
+                    "line": line, "schema": rel, "valid": not errors,
+                    "errors": [message for _, message in errors],
+                }, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+                for line, (rel, errors) in zip(lines, results)
+            )
+            writer.write(b"%x\r\n%s\r\n" % (len(out), out))
+            await writer.drain()
+
+        async def submit(lines: list[int], raws: list[bytes]) -> None:
+            nonlocal started
+            # Only the first chunk may be refused; afterwards the stream waits for capacity
+            future = await self._submit(schema, raws, None if started else self.queue_timeout)
+            if not started:
+                _write_head(writer, 200, "application/x-ndjson", keep_alive,
+                            {"Transfer-Encoding": "chunked"})
+                started = True
+            pending.append((lines, future))
+            while pending and (pending[0][1].done() or len(pending) > self.workers * 2):
+                await flush()
+
+        lines: list[int] = []
+        raws: list[bytes] = []
+        line_no = 0
+        try:
+            async for raw in body.lines(self.max_record):
+                line_no += 1
+                raw = raw.strip()
+                if raw:
+                    lines.append(line_no)
+                    raws.append(raw)
+                if len(raws) >= self.chunk_size:
+                    await submit(lines, raws)
+                    lines, raws = [], []
+            if raws:
+                await submit(lines, raws)
+            if not started:
+                _write_head(writer, 200, "application/x-ndjson", keep_alive,
+                            {"Transfer-Encoding": "chunked"})
+            while pending:
+                await flush()
+        except Exception:
+            if not started:
+                raise
+            # Too late for an error status: end the stream early and drop the connection
+            for _, future in pending:
+                future.cancel()
+            raise ConnectionAbortedError from None
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    # -- connection handling ------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while await self._serve_one(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _serve_one(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Answer one request; returns whether the connection stays open"""
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keep_alive_timeout)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return False
+        self.requests += 1
+        keep_alive = True
+        body: _Body | None = None
+        try:
+            request = parse_head(head)
+            keep_alive = request.keep_alive
+            body = _Body(reader, request.headers)
+            if request.headers.get("expect", "").lower() == "100-continue" and not body.done:
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            if request.path == "/status":
+                _allow(request, "GET")
+                payload = self.status()
+            elif request.path == "/validate-batch":
+                _allow(request, "POST")
+                await self._validate_batch(request, body, writer, keep_alive)
+                return keep_alive
+            elif request.path.startswith("/validate/"):
+                _allow(request, "POST")
+                payload = await self._validate_one(unquote(request.path[len("/validate/"):]), body)
+            else:
+                raise SidecarError(404, f"No route for {request.path}")
+            _respond(writer, 200, payload, keep_alive)
+        except SidecarError as e:
+            # An unread body would be parsed as the next request; close instead
+            keep_alive = keep_alive and body is not None and body.done
+            _respond(writer, e.status, {"error": str(e)}, keep_alive, e.headers)
+        except ConnectionError:
+            return False
+        except Exception as e:  # noqa: BLE001 - report worker failures, keep serving
+            # A BrokenProcessPool has already replaced the pool in _release
+            keep_alive = False
+            _respond(writer, 500, {"error": f"{type(e).__name__}: {e}"}, keep_alive)
+        await writer.drain()
+        return keep_alive
+
+
+def _allow(request: Request, method: str) -> None:
+    if request.method != method:
+        raise SidecarError(405, f"{request.method} not allowed on {request.path}",
+                           {"Allow": method})
+
+
+def _write_head(writer: asyncio.StreamWriter, status: int, content_type: str, keep_alive: bool,
+                headers: dict[str, str]) -> None:
+    lines = [
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+        f"Content-Type: {content_type}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        *(f"{name}: {value}" for name, value in headers.items()),
+    ]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+
+def _respond(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool,
+             headers: dict[str, str] | None = None) -> None:
+    body = json.dumps(payload, ensure_ascii=False).encode()
+    _write_head(writer, status, "application/json", keep_alive,
+                {**(headers or {}), "Content-Length": str(len(body))})
+    writer.write(body)
+
+
+async def serve(sidecar: ValidationSidecar, host: str, port: int) -> None:
+    server = await sidecar.start(host, port)
+    print(f"✅ Validation sidecar on http://{host}:{sidecar.port} "
+          f"({sidecar.workers} worker(s), {len(sidecar.registry)} contracts)", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await sidecar.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve contract validation over local HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST,
+                        help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help=f"Port (default: {DEFAULT_PORT}; the kiosk API owns 5000)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Validation processes (default: 0, one per CPU)")
+    parser.add_argument("--max-pending", type=int,
+                        help="Chunks queued or running at once (default: 4 per worker)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Batch records per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--queue-timeout", type=float, default=1.0,
+                        help="Seconds a request waits for a queue slot before a 503")
+    args = parser.parse_args()
+
+    print("🔍 TarlaAnaliz Validation Sidecar\n")
+    sidecar = ValidationSidecar(
+        workers=args.workers, max_pending=args.max_pending, chunk_size=args.chunk_size,
+        queue_timeout=args.queue_timeout,
+    )
+    try:
+        asyncio.run(serve(sidecar, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+TarlaAnaliz Intake Integrity Verifier
+
+Verifies an edge/intake_manifest.v1 document against the files on a memory
+card before the batch is released from quarantine:
+
+- every `FileEntry.size_bytes` matches the file on disk (SIZE_ANOMALY)
+- every `FileEntry.sha256` matches the file contents (HASH_MISMATCH)
+- listed files exist and are readable under the card root, and every entry has
+  a path, size and hash (FAILED_INTEGRITY_CHECK); none escape it (POLICY_VIOLATION)
+- `total_files` / `total_size_bytes` agree with the `files` list (SIZE_ANOMALY)
+
+Findings are ThreatDetail objects (file_path, threat_name, threat_type,
+severity) with severities taken from enums/threat_type.enum.v1.json, so they
+can be dropped straight into `av_scan_result.threat_details`.
+
+Files are hashed concurrently by a bounded thread pool. Each worker reads
+in large blocks into one reusable buffer (or hashes an mmap of the file);
+hashlib releases the GIL while digesting, so threads scale with the disk.
+Results stream back as files complete, with a progress callback.
+
+Usage:
+    python3 tools/verify_intake.py manifest.json --root /media/card
+    python3 tools/verify_intake.py manifest.json --root /media/card --workers 8 --json
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, NamedTuple
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from enum_index import get_enum_index  # noqa: E402
+
+HASH_MISMATCH = "HASH_MISMATCH"
+SIZE_ANOMALY = "SIZE_ANOMALY"
+FAILED_INTEGRITY_CHECK = "FAILED_INTEGRITY_CHECK"
+POLICY_VIOLATION = "POLICY_VIOLATION"
+
+# Large reads keep syscalls and GIL hand-offs rare; 1 MiB saturates SD/USB readers
+BLOCK_SIZE = 1024 * 1024
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+
+class FileResult(NamedTuple):
+    """Outcome of checking one FileEntry"""
+
+    path: str
+    size_bytes: int
+    actual_size: int | None
+    sha256: str
+    actual_sha256: str | None
+    threat_type: str | None
+    threat_name: str | None
+
+
+class Progress(NamedTuple):
+    """Snapshot passed to the progress callback after each file"""
+
+    files_done: int
+    files_total: int
+    bytes_done: int
+    bytes_total: int
+    path: str
+
+
+def hash_file(path: Path, block_size: int = BLOCK_SIZE, use_mmap: bool = False) -> str:
+    """SHA-256 of a file using large reads into a reusable buffer, or an mmap"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if use_mmap:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+            return digest.hexdigest()
+
+        buffer = bytearray(block_size)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def _resolve(root: Path, rel: str) -> Path | None:
+    """Map a manifest path onto the card root; None when it escapes the root"""
+    candidate = (root / rel).resolve()
+    if candidate != root and root not in candidate.parents:
+        return None
+    return candidate
+
+
+def _listed_size(entry: dict[str, Any]) -> int:
+    """size_bytes of a FileEntry, 0 when missing or not an integer"""
+    size = entry.get("size_bytes")
+    return size if isinstance(size, int) and not isinstance(size, bool) else 0
+
+
+def check_entry(entry: dict[str, Any], root: Path, block_size: int = BLOCK_SIZE,
+                use_mmap: bool = False) -> FileResult:
+    """Check one FileEntry: containment, existence, size, then hash
+
+    Never raises for a bad entry or an unreadable file; those become findings so one
+    broken card sector does not abort verification of the rest of the batch.
+    """
+    rel = entry.get("path")
+    size = entry.get("size_bytes")
+    expected = entry.get("sha256")
+    size_ok = isinstance(size, int) and not isinstance(size, bool)
+    if not (isinstance(rel, str) and isinstance(size, int) and size_ok
+            and isinstance(expected, str)):
+        malformed = [key for key, ok in (("path", isinstance(rel, str)), ("size_bytes", size_ok),
+                                         ("sha256", isinstance(expected, str))) if not ok]
+        return FileResult(rel if isinstance(rel, str) else "", _listed_size(entry), None,
+                          expected if isinstance(expected, str) else "", None,
+                          FAILED_INTEGRITY_CHECK,
+                          f"FileEntry is missing or has invalid {', '.join(malformed)}")
+    expected = expected.lower()
+
+    def result(actual_size: int | None = None, actual_sha: str | None = None,
+               threat: str | None = None, name: str | None = None) -> FileResult:
+        return FileResult(rel, size, actual_size, expected, actual_sha, threat, name)
+
+    def unreadable(exc: OSError) -> FileResult:
+        return result(threat=FAILED_INTEGRITY_CHECK,
+                      name=f"Cannot read file: {exc.strerror or exc}")
+
+    try:
+        path = _resolve(root, rel)
+    except (OSError, ValueError) as exc:
+        # Symlink loops, embedded NUL bytes and similar unresolvable paths
+        return result(threat=FAILED_INTEGRITY_CHECK, name=f"Cannot resolve path: {exc}")
+    if path is None:
+        return result(threat=POLICY_VIOLATION, name="Path escapes card root")
+    try:
+        actual_size = path.stat().st_size
+        is_file = path.is_file()
+    except FileNotFoundError:
+        return result(threat=FAILED_INTEGRITY_CHECK, name="File listed in manifest is missing")
+    except OSError as exc:
+        # NotADirectoryError, PermissionError, EIO from a failing card, ...
+        return unreadable(exc)
+    if not is_file:
+        return result(threat=FAILED_INTEGRITY_CHECK, name="Manifest path is not a regular file")
+    if actual_size != size:
+        # Contents cannot match either; skip hashing a file that is already rejected
+        return result(actual_size, threat=SIZE_ANOMALY,
+                      name=f"Size {actual_size} bytes, manifest says {size}")
+
+    try:
+        actual_sha = hash_file(path, block_size, use_mmap)
+    except OSError as exc:
+        return unreadable(exc)
+    if actual_sha != expected:
+        return result(actual_size, actual_sha, HASH_MISMATCH, "SHA-256 does not match manifest")
+    return result(actual_size, actual_sha)
+
+
+def iter_verify(
+    manifest: dict[str, Any],
+    root: Path,
+    workers: int = DEFAULT_WORKERS,
+    progress: Callable[[Progress], None] | None = None,
+    block_size: int = BLOCK_SIZE,
+    use_mmap: bool = False,
+) -> Iterator[FileResult]:
+    """Yield FileResults as files finish hashing (completion order, not manifest order)"""
+    root = Path(root).resolve()
+    entries = manifest.get("files") or []
+    files_total = len(entries)
+    bytes_total = sum(_listed_size(entry) for entry in entries)
+    files_done = bytes_done = 0
+
+    # Bound in-flight work so tens of thousands of entries do not queue up at once
+    max_in_flight = max(1, workers) * 2
+    pending: set[Future[FileResult]] = set()
+    queue = iter(entries)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while True:
+            for entry in queue:
+                pending.add(pool.submit(check_entry, entry, root, block_size, use_mmap))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_result = future.result()
+                files_done += 1
+                bytes_done += file_result.size_bytes
+                if progress is not None:
+                    progress(Progress(files_done, files_total, bytes_done, bytes_total,
+                                      file_result.path))
+                yield file_result
+
+
+class IntakeReport:
+    """Aggregated verification outcome for one manifest"""
+
+    def __init__(self, manifest: dict[str, Any]):
+        self.manifest_id = manifest.get("id")
+        self.files_checked = 0
+        self.bytes_checked = 0
+        self.threats: list[dict[str, str]] = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self._severity = get_enum_index().threat_severity
+        self._check_totals(manifest)
+
+    def _threat(self, file_path: str, threat_type: str, threat_name: str) -> None:
+        self.threats.append({
+            "file_path": file_path,
+            "threat_name": threat_name,
+            "threat_type": threat_type,
+            "severity": self._severity.get(threat_type, "HIGH"),
+        })
+
+    def _check_totals(self, manifest: dict[str, Any]) -> None:
+        """Manifest-level consistency; reported with an empty file_path"""
+        entries = manifest.get("files") or []
+        listed_bytes = sum(_listed_size(entry) for entry in entries)
+        if manifest.get("total_files") != len(entries):
+            self._threat("", SIZE_ANOMALY,
+                         f"total_files is {manifest.get('total_files')}, "
+                         f"manifest lists {len(entries)}")
+        if manifest.get("total_size_bytes") != listed_bytes:
+            self._threat("", SIZE_ANOMALY,
+                         f"total_size_bytes is {manifest.get('total_size_bytes')}, "
+                         f"files sum to {listed_bytes}")
+
+    def add(self, result: FileResult) -> None:
+        self.files_checked += 1
+        if result.actual_size is not None:
+            self.bytes_checked += result.actual_size
+        if result.threat_type is not None:
+            self._threat(result.path, result.threat_type, result.threat_name or result.threat_type)
+
+    def finish(self) -> IntakeReport:
+        self.elapsed = time.perf_counter() - self.started
+        # Completion order varies between runs; keep the report deterministic
+        self.threats.sort(key=lambda threat: (threat["file_path"], threat["threat_type"]))
+        return self
+
+    @property
+    def ok(self) -> bool:
+        return not self.threats
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "manifest_id": self.manifest_id,
+            "ok": self.ok,
+            "files_checked": self.files_checked,
+            "bytes_checked": self.bytes_checked,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "threat_details": self.threats,
+        }
+
+
+def verify_manifest(
+    manifest: dict[str, Any],
+    root: Path,
+    workers: int = DEFAULT_WORKERS,
+    progress: Callable[[Progress], None] | None = None,
+    block_size: int = BLOCK_SIZE,
+    use_mmap: bool = False,
+) -> IntakeReport:
+    """Verify every FileEntry plus the manifest totals; returns the full report"""
+    report = IntakeReport(manifest)
+    for result in iter_verify(manifest, root, workers, progress, block_size, use_mmap):
+        report.add(result)
+    return report.finish()
+
+
+def _print_progress(p: Progress) -> None:
+    percent = 100 * p.bytes_done / p.bytes_total if p.bytes_total else 100.0
+    print(f"\r⏱  {p.files_done}/{p.files_total} files, {percent:5.1f}% of bytes",
+          end="", file=sys.stderr, flush=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Verify intake manifest files on a memory card")
+    parser.add_argument("manifest", type=Path, help="IntakeManifest JSON document")
+    parser.add_argument("--root", type=Path, required=True, help="Card mount point")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Hashing threads")
+    parser.add_argument("--mmap", action="store_true", help="Hash via mmap instead of reads")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    with open(args.manifest, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    progress = None if args.json else _print_progress
+    report = verify_manifest(manifest, args.root, args.workers, progress, use_mmap=args.mmap)
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+        return 0 if report.ok else 1
+
+    print(file=sys.stderr)
+    rate = report.bytes_checked / report.elapsed / 1e6 if report.elapsed else 0.0
+    print(f"🔍 {report.files_checked} files, {report.bytes_checked} bytes "
+          f"in {report.elapsed:.2f}s ({rate:.1f} MB/s)")
+    for threat in report.threats:
+        print(f"  ❌ [{threat['severity']}] {threat['threat_type']} "
+              f"{threat['file_path'] or '(manifest)'}: {threat['threat_name']}")
+    if report.ok:
+        print("✅ All files match the manifest")
+        return 0
+    print(f"❌ {len(report.threats)} integrity findings")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())